@@ -50,6 +50,7 @@ class Config:
 
         # Database path
         self.database_path = self.data_dir / self.config_data["database"]["filename"]
+        self.archive_dir = Path(dirs.get("archive", self.data_dir / "archive"))
 
     def _setup_headers(self):
         """Set up HTTP headers with GitHub token from multiple sources."""
@@ -195,6 +196,14 @@ class Config:
     def enable_history(self) -> bool:
         return self.config_data["database"]["enable_history"]
 
+    @property
+    def history_mode(self) -> str:
+        return self.config_data["database"].get("history_mode", "snapshot")
+
+    @property
+    def archive_history(self) -> bool:
+        return self.config_data["database"].get("archive_history", False)
+
     @property
     def request_timeout(self) -> int:
         return self.config_data["http"]["timeout_seconds"]
@@ -3,8 +3,8 @@
 Backfill Trend Data from Git History
 
 This script extracts historical extension data from git commits and populates
-the trend tables (extension_metrics_daily and extension_trends_summary) with
-historical data from all daily analysis runs.
+extension_trends_summary with historical data from all daily analysis runs.
+Per-extension metrics (extension_metrics_daily) are not backfilled.
 """
 
 import re
@@ -67,6 +67,7 @@ def cli(ctx, version, cache_info):
       status core                          # Quick check if core extensions are fresh
       status community h3 prql bigquery   # Check specific community extensions
       database save                        # Save analysis to database
+      search geospatial                    # Find extensions by what they do
     """
     if version:
         click.echo(f"DuckDB Extensions Analysis Tool v{config.version}")
@@ -344,7 +345,7 @@ def analyze_all(cache_hours, with_issues, with_compatibility_testing):
     type=int,
     default=25,
     show_default=True,
-    help="Maximum number of community extensions to include in compatibility testing (only used with --with-compatibility-testing)",
+    help="Maximum number of community extensions to schedule per run, picked by what changed since their last result (only used with --with-compatibility-testing)",
 )
 @click.option(
     "--compat-per-test-timeout-seconds",
@@ -353,6 +354,24 @@ def analyze_all(cache_hours, with_issues, with_compatibility_testing):
     show_default=True,
     help="Timeout for an individual extension install/load test (only used with --with-compatibility-testing)",
 )
+@click.option(
+    "--compat-max-workers",
+    type=int,
+    default=None,
+    help="Number of parallel test workers (default: CPU count; only used with --with-compatibility-testing)",
+)
+@click.option(
+    "--compat-max-result-age-days",
+    type=int,
+    default=None,
+    help="Re-test unchanged, passing extension/version pairs whose last result is older than this (default: never; only used with --with-compatibility-testing)",
+)
+@click.option(
+    "--compat-benchmark-runs",
+    type=int,
+    default=None,
+    help="Benchmark mode: also time this many repeated LOADs per extension (p50/p95 latency, RSS growth, binary size; only used with --with-compatibility-testing)",
+)
 @click.option(
     "--compat-duckdb-version",
     "compat_duckdb_versions",
@@ -381,6 +400,9 @@ def report_generate(
     compat_max_runtime_seconds,
     compat_max_extensions,
     compat_per_test_timeout_seconds,
+    compat_max_workers,
+    compat_max_result_age_days,
+    compat_benchmark_runs,
     compat_duckdb_versions,
     cache_hours,
     as_of_date,
@@ -403,6 +425,9 @@ def report_generate(
             compat_max_runtime_seconds=compat_max_runtime_seconds,
             compat_max_extensions=compat_max_extensions,
             compat_per_test_timeout_seconds=compat_per_test_timeout_seconds,
+            compat_max_workers=compat_max_workers,
+            compat_max_result_age_days=compat_max_result_age_days,
+            compat_benchmark_runs=compat_benchmark_runs,
             compat_duckdb_versions=list(compat_duckdb_versions)
             if compat_duckdb_versions
             else None,
@@ -423,6 +448,219 @@ def database_save(cache_hours):
     asyncio.run(_run_database_save(cache_hours))
 
 
+@database.command("reclassify-issues")
+def database_reclassify_issues():
+    """Re-apply conf/issue_classification.toml to all stored GitHub issues."""
+    from src.analyzers import DatabaseManager
+    from src.analyzers.issue_classification import IssueClassificationRules
+
+    try:
+        rules = IssueClassificationRules(config.config_dir)
+        updated = DatabaseManager(config).reclassify_github_issues(rules)
+    except Exception as e:
+        logger.error(f"Issue reclassification failed: {e}")
+        raise click.ClickException(f"Issue reclassification failed: {e}")
+    click.echo(f"✅ Reclassified {updated} stored GitHub issues")
+
+
+@database.command("archive")
+@click.option(
+    "--date",
+    "dates",
+    multiple=True,
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Analysis day to archive (repeatable; default: every day)",
+)
+def database_archive(dates):
+    """Export analysis history to the hive-partitioned Parquet archive."""
+    from src.analyzers import DatabaseManager
+
+    days = [d.date() for d in dates] or None
+    try:
+        counts = DatabaseManager(config).archive_history(days)
+    except Exception as e:
+        logger.error(f"History archive failed: {e}")
+        raise click.ClickException(f"History archive failed: {e}")
+    for table, rows in counts.items():
+        click.echo(f"  {table}: {rows} rows")
+    click.echo(f"✅ Archived history to {config.archive_dir}")
+
+
+@database.command("benchmark")
+@click.option(
+    "--extensions", type=int, default=1000, help="Synthetic community extensions"
+)
+@click.option("--core", type=int, default=25, help="Synthetic core extensions")
+@click.option("--days", type=int, default=3 * 365, help="Days of synthetic history")
+@click.option("--platforms", type=int, default=5, help="Platforms per release")
+@click.option("--repeat", type=int, default=3, help="Timed runs per view and query")
+@click.option(
+    "--database",
+    "database_path",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Benchmark database (default: data/benchmark/extensions.duckdb)",
+)
+@click.option(
+    "--reuse",
+    is_flag=True,
+    help="Time an existing benchmark database instead of regenerating it",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Results JSON (default: reports/benchmarks/query_benchmark.json)",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Earlier results JSON to check for regressions",
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=1.5,
+    help="Slowdown over the baseline that counts as a regression",
+)
+def database_benchmark(
+    extensions,
+    core,
+    days,
+    platforms,
+    repeat,
+    database_path,
+    reuse,
+    output,
+    baseline,
+    threshold,
+):
+    """Time every view and query against synthetic multi-year history."""
+    import copy
+    import json
+
+    from src.analyzers import DatabaseManager
+    from src.analyzers.query_benchmark import QueryBenchmark, SyntheticScale
+
+    database_path = database_path or config.data_dir / "benchmark" / "extensions.duckdb"
+    output = output or config.reports_dir / "benchmarks" / "query_benchmark.json"
+    if database_path.resolve() == config.database_path.resolve():
+        raise click.ClickException(
+            "The benchmark replaces its database; pass a path other than the "
+            "analysis database"
+        )
+
+    bench_config = copy.copy(config)
+    bench_config.database_path = database_path
+    database_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        scale = SyntheticScale(extensions, core, days, platforms)
+        benchmark = QueryBenchmark(DatabaseManager(bench_config), repeat)
+        if reuse and database_path.exists():
+            scale = None
+        else:
+            database_path.unlink(missing_ok=True)
+            for table, rows in benchmark.load_synthetic_history(scale).items():
+                click.echo(f"  {table}: {rows} rows")
+        timings = benchmark.run()
+        results = benchmark.write_results(output, timings, scale)
+    except Exception as e:
+        logger.error(f"Query benchmark failed: {e}")
+        raise click.ClickException(f"Query benchmark failed: {e}")
+
+    for timing in timings:
+        if timing.error:
+            click.echo(f"  ❌ {timing.name}: {timing.error}")
+        else:
+            click.echo(
+                f"  {timing.name}: {timing.median_seconds * 1000:.1f} ms, "
+                f"{timing.rows} rows"
+            )
+    click.echo(f"✅ Wrote query benchmark results to {output}")
+
+    if baseline:
+        regressions = QueryBenchmark.compare(
+            results, json.loads(baseline.read_text()), threshold
+        )
+        for regression in regressions:
+            if regression["slowdown"] is None:
+                click.echo(f"  ❌ {regression['name']} now fails: {regression['error']}")
+            else:
+                click.echo(
+                    f"  🐢 {regression['name']}: {regression['slowdown']:.1f}x slower "
+                    f"({regression['baseline_seconds'] * 1000:.1f} ms → "
+                    f"{regression['median_seconds'] * 1000:.1f} ms)"
+                )
+        if regressions:
+            raise click.ClickException(
+                f"{len(regressions)} views or queries regressed against {baseline}"
+            )
+        click.echo(f"✅ No regressions against {baseline}")
+
+
+@database.command("search-index")
+def database_search_index():
+    """Install the fts extension and rebuild the extension search index."""
+    from src.analyzers import DatabaseManager
+
+    try:
+        indexed = DatabaseManager(config).build_search_index()
+    except Exception as e:
+        logger.error(f"Search index build failed: {e}")
+        raise click.ClickException(f"Search index build failed: {e}")
+    click.echo(f"✅ Indexed {indexed} extensions for full-text search")
+
+
+@cli.command("search")
+@click.argument("terms", nargs=-1, required=True)
+@click.option("--limit", type=int, default=10, help="Number of results (default: 10)")
+@click.option("--json", "output_json", is_flag=True, help="Output results as JSON")
+def search(terms, limit, output_json):
+    """Search extensions by what they do.
+
+    Matches names, descriptions, GitHub topics and READMEs, best match first.
+
+    Examples:
+      search geospatial
+      search "excel spreadsheet" --limit 5
+    """
+    import json
+    import time
+
+    from src.analyzers import DatabaseManager, ExtensionQueries
+
+    started = time.perf_counter()
+    try:
+        with ExtensionQueries.open(DatabaseManager(config), size=1) as queries:
+            ranked = queries.search_extensions(" ".join(terms), limit)
+    except Exception as e:
+        logger.error(f"Search failed: {e}")
+        raise click.ClickException(f"Search failed: {e}")
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    results = [
+        {
+            "extension": name,
+            "type": extension_type,
+            "description": description,
+            "score": round(score, 3),
+        }
+        for name, extension_type, description, score in ranked
+    ]
+    if output_json:
+        click.echo(json.dumps(results, indent=2))
+        return
+    if not results:
+        click.echo(f"No extensions match: {' '.join(terms)}")
+        return
+    for rank, result in enumerate(results, 1):
+        click.echo(f"{rank:>2}. {result['extension']} ({result['type']})")
+        if result["description"]:
+            click.echo(f"    {result['description']}")
+    click.echo(f"({len(results)} results in {elapsed_ms:.0f} ms)")
+
+
 # Shortcut commands (for backward compatibility and convenience)
 @cli.command("quick")
 @click.option(
@@ -466,8 +704,7 @@ async def _run_analysis(
     )
 
     try:
-        analysis_result = await orchestrator.run_analysis_mode(mode)
-        await orchestrator.save_to_database(analysis_result)
+        analysis_result = await orchestrator.run_analysis_and_save(mode)
         logger.info(f"Analysis saved to database: {config.database_path}")
         orchestrator.print_analysis_summary(analysis_result)
     except Exception as e:
@@ -485,6 +722,9 @@ async def _run_report_generation(
     compat_max_runtime_seconds: int = 900,
     compat_max_extensions: int = 25,
     compat_per_test_timeout_seconds: int = 120,
+    compat_max_workers: Optional[int] = None,
+    compat_max_result_age_days: Optional[int] = None,
+    compat_benchmark_runs: Optional[int] = None,
     compat_duckdb_versions: Optional[List[str]] = None,
 ):
     """Generate reports in specified formats."""
@@ -504,6 +744,9 @@ async def _run_report_generation(
         compatibility_max_runtime_seconds=compat_max_runtime_seconds,
         compatibility_max_extensions=compat_max_extensions,
         compatibility_per_test_timeout_seconds=compat_per_test_timeout_seconds,
+        compatibility_max_workers=compat_max_workers,
+        compatibility_max_result_age_days=compat_max_result_age_days,
+        compatibility_benchmark_runs=compat_benchmark_runs,
         compatibility_duckdb_versions=compat_duckdb_versions,
     )
 
@@ -25,6 +25,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 import csv
 import pickle
+import sqlite3
 
 import httpx
 from loguru import logger
@@ -36,6 +37,9 @@ logger.add(
     format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | {message}\n",
 )
 
+# Maximum README size downloaded for indicator scanning
+README_MAX_BYTES = 200_000
+
 # Deprecation indicators to look for in repository content
 DEPRECATION_KEYWORDS = [
     "deprecated",
@@ -86,13 +90,141 @@ ACTIVE_KEYWORDS = [
 ]
 
 
+class KeywordScanner:
+    """Single-pass scanner for keyword indicators and their surrounding context.
+
+    All keyword classes are compiled into one alternation, so a text is scanned
+    once regardless of how many keywords or classes there are.
+    Context windows follow the semantics of ``findall(".{0,50}keyword.{0,50}")``:
+    they stay on one line, do not overlap, and at most ``max_matches`` windows are
+    reported per keyword.
+    """
+
+    def __init__(
+        self,
+        keyword_classes: Dict[str, List[str]],
+        context_chars: int = 50,
+        max_matches: int = 3,
+    ):
+        self.keyword_classes = {
+            name: list(keywords) for name, keywords in keyword_classes.items()
+        }
+        self.context_chars = context_chars
+        self.max_matches = max_matches
+
+        # Longest first, so the alternation reports the longest keyword at a position;
+        # shorter keywords that are prefixes of it are recorded alongside.
+        keywords = sorted(
+            {k.lower() for ks in self.keyword_classes.values() for k in ks},
+            key=len,
+            reverse=True,
+        )
+        self._prefixes = {
+            keyword: [
+                other
+                for other in keywords
+                if other != keyword and keyword.startswith(other)
+            ]
+            for keyword in keywords
+        }
+        alternation = "|".join(re.escape(k) for k in keywords)
+        self._pattern = re.compile(alternation)
+        self._pattern_ignorecase = re.compile(alternation, re.IGNORECASE)
+
+    def scan(self, text: str, source: str) -> Dict[str, List[Dict]]:
+        """Return indicators per keyword class, in keyword list order."""
+        results: Dict[str, List[Dict]] = {name: [] for name in self.keyword_classes}
+        if not text:
+            return results
+
+        # Matching the lowercased text case-sensitively is much faster than an
+        # IGNORECASE search; fall back when lowercasing changes string offsets.
+        text_lower = text.lower()
+        if len(text_lower) == len(text):
+            pattern, haystack = self._pattern, text_lower
+        else:
+            pattern, haystack = self._pattern_ignorecase, text
+
+        # Restart one character after each match so overlapping keywords are found
+        positions: Dict[str, List[int]] = {}
+        match = pattern.search(haystack)
+        while match:
+            keyword = match.group().lower()
+            for found in [keyword, *self._prefixes.get(keyword, [])]:
+                positions.setdefault(found, []).append(match.start())
+            match = pattern.search(haystack, match.start() + 1)
+
+        for name, keywords in self.keyword_classes.items():
+            for keyword in keywords:
+                keyword_positions = positions.get(keyword.lower())
+                if not keyword_positions:
+                    continue
+                for context in self._context_windows(
+                    text, keyword_positions, len(keyword)
+                ):
+                    results[name].append(
+                        {"keyword": keyword, "source": source, "context": context}
+                    )
+
+        return results
+
+    def _context_windows(
+        self, text: str, positions: List[int], length: int
+    ) -> List[str]:
+        """Build non-overlapping single-line context windows for sorted positions."""
+        windows = []
+        end = 0
+        i = 0
+        while i < len(positions) and len(windows) < self.max_matches:
+            position = positions[i]
+            if position < end:
+                i += 1
+                continue
+
+            line_start = text.rfind("\n", 0, position) + 1
+            line_end = text.find("\n", position)
+            if line_end == -1:
+                line_end = len(text)
+            start = max(end, line_start, position - self.context_chars)
+
+            # Greedy leading context extends to the last occurrence still in reach
+            while (
+                i + 1 < len(positions)
+                and positions[i + 1] <= start + self.context_chars
+                and positions[i + 1] < line_end
+            ):
+                i += 1
+
+            end = min(line_end, positions[i] + length + self.context_chars)
+            windows.append(text[start:end].strip())
+            i += 1
+
+        return windows
+
+
+INDICATOR_SCANNER = KeywordScanner(
+    {
+        "deprecation": DEPRECATION_KEYWORDS,
+        "warning": WARNING_KEYWORDS,
+        "active": ACTIVE_KEYWORDS,
+    }
+)
+
+
 class RepositoryCache:
-    """Cache manager for repository data to reduce API calls."""
+    """Cache manager for repository data to reduce API calls.
+
+    Entries live in a single SQLite key-value table with an index on the time
+    they were stored, so expiry checks and cleanup are indexed queries rather
+    than a stat() or directory scan per file.
+    """
+
+    DB_NAME = "cache.sqlite3"
 
     def __init__(
         self,
         cache_dir: Optional[Path] = None,
-        cache_days: int = 7,
+        cache_days: float = 7,
         enabled: bool = True,
     ):
         self.enabled = enabled
@@ -102,105 +234,133 @@ class RepositoryCache:
         self.cache_dir = cache_dir or Path(".cache/deprecation_detector")
         self.cache_days = cache_days
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._preloaded: Dict[str, Any] = {}
+
+        self.conn = sqlite3.connect(
+            str(self.cache_dir / self.DB_NAME), check_same_thread=False
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_stored_at "
+                "ON cache_entries (stored_at)"
+            )
 
         logger.info(f"Using cache directory: {self.cache_dir} (TTL: {cache_days} days)")
 
         # Clean old cache entries on startup
         self._cleanup_old_entries()
 
-    def _get_cache_path(self, cache_key: str) -> Path:
-        """Get the cache file path for a given key."""
-        return self.cache_dir / f"{cache_key}.pkl"
-
-    def _is_cache_valid(self, cache_path: Path) -> bool:
-        """Check if a cache entry is still valid."""
-        if not cache_path.exists():
-            return False
-
-        cache_age = datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)
-        return cache_age.days < self.cache_days
+    def _cutoff(self) -> float:
+        """Timestamp before which entries are expired."""
+        return (datetime.now() - timedelta(days=self.cache_days)).timestamp()
 
     def get(self, cache_key: str) -> Optional[Any]:
         """Get data from cache if available and valid."""
         if not self.enabled:
             return None
 
-        cache_path = self._get_cache_path(cache_key)
+        if cache_key in self._preloaded:
+            logger.debug(f"Cache hit for {cache_key}")
+            return self._preloaded.pop(cache_key)
 
-        if not self._is_cache_valid(cache_path):
-            return None
+        return self.get_many([cache_key]).get(cache_key)
 
-        try:
-            with open(cache_path, "rb") as f:
-                cached_data = pickle.load(f)
-                logger.debug(f"Cache hit for {cache_key}")
-                return cached_data
-        except Exception as e:
-            logger.debug(f"Cache read error for {cache_key}: {e}")
-            return None
+    def get_many(self, cache_keys: List[str]) -> Dict[str, Any]:
+        """Get all valid entries for the given keys in one query."""
+        if not self.enabled or not cache_keys:
+            return {}
+
+        placeholders = ", ".join("?" for _ in cache_keys)
+        rows = self.conn.execute(
+            f"SELECT key, value FROM cache_entries "
+            f"WHERE key IN ({placeholders}) AND stored_at >= ?",
+            [*cache_keys, self._cutoff()],
+        ).fetchall()
+
+        found = {}
+        for key, value in rows:
+            try:
+                found[key] = pickle.loads(value)
+                logger.debug(f"Cache hit for {key}")
+            except Exception as e:
+                logger.debug(f"Cache read error for {key}: {e}")
+        return found
+
+    def preload(self, cache_keys: List[str]) -> int:
+        """Fetch entries in one batch so later get() calls skip the database."""
+        if not self.enabled:
+            return 0
+
+        self._preloaded.update(self.get_many(cache_keys))
+        return len(self._preloaded)
 
     def set(self, cache_key: str, data: Any) -> None:
         """Store data in cache."""
-        if not self.enabled:
-            return
+        self.set_many({cache_key: data})
 
-        cache_path = self._get_cache_path(cache_key)
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Store several entries in a single transaction."""
+        if not self.enabled or not items:
+            return
 
+        now = datetime.now().timestamp()
         try:
-            with open(cache_path, "wb") as f:
-                pickle.dump(data, f)
-                logger.debug(f"Cached data for {cache_key}")
+            rows = [(key, pickle.dumps(data), now) for key, data in items.items()]
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, stored_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+            for key in items:
+                self._preloaded.pop(key, None)
+                logger.debug(f"Cached data for {key}")
         except Exception as e:
-            logger.debug(f"Cache write error for {cache_key}: {e}")
+            logger.debug(f"Cache write error for {list(items)}: {e}")
 
     def _cleanup_old_entries(self) -> None:
         """Remove expired cache entries."""
-        if not self.enabled or not self.cache_dir.exists():
+        if not self.enabled:
             return
 
-        cutoff_time = datetime.now() - timedelta(days=self.cache_days)
-        removed_count = 0
-
-        for cache_file in self.cache_dir.glob("*.pkl"):
-            try:
-                file_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if file_time < cutoff_time:
-                    cache_file.unlink()
-                    removed_count += 1
-            except Exception as e:
-                logger.debug(f"Error cleaning up {cache_file}: {e}")
+        with self.conn:
+            removed_count = self.conn.execute(
+                "DELETE FROM cache_entries WHERE stored_at < ?", [self._cutoff()]
+            ).rowcount
 
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} expired cache entries")
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        if not self.enabled or not self.cache_dir.exists():
+        if not self.enabled:
             return
 
-        removed_count = 0
-        for cache_file in self.cache_dir.glob("*.pkl"):
-            try:
-                cache_file.unlink()
-                removed_count += 1
-            except Exception as e:
-                logger.debug(f"Error removing {cache_file}: {e}")
+        with self.conn:
+            removed_count = self.conn.execute("DELETE FROM cache_entries").rowcount
+        self._preloaded.clear()
 
         logger.info(f"Cleared {removed_count} cache entries")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        if not self.enabled or not self.cache_dir.exists():
+        if not self.enabled:
             return {"enabled": False}
 
-        cache_files = list(self.cache_dir.glob("*.pkl"))
-        total_size = sum(f.stat().st_size for f in cache_files if f.exists())
+        entry_count, total_size = self.conn.execute(
+            "SELECT count(*), coalesce(sum(length(value)), 0) FROM cache_entries"
+        ).fetchone()
 
         return {
             "enabled": True,
             "cache_dir": str(self.cache_dir),
             "cache_days": self.cache_days,
-            "entry_count": len(cache_files),
+            "entry_count": entry_count,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
         }
 
@@ -288,26 +448,8 @@ class DeprecationDetector:
         try:
             # Check official description from description.yml for deprecation indicators first
             if result["official_description"]:
-                result["deprecation_indicators"].extend(
-                    self._find_indicators(
-                        result["official_description"],
-                        DEPRECATION_KEYWORDS,
-                        "official_description",
-                    )
-                )
-                result["warning_indicators"].extend(
-                    self._find_indicators(
-                        result["official_description"],
-                        WARNING_KEYWORDS,
-                        "official_description",
-                    )
-                )
-                result["active_indicators"].extend(
-                    self._find_indicators(
-                        result["official_description"],
-                        ACTIVE_KEYWORDS,
-                        "official_description",
-                    )
+                self._add_indicators(
+                    result, result["official_description"], "official_description"
                 )
 
             # Get repository metadata
@@ -319,43 +461,19 @@ class DeprecationDetector:
 
                 # Check repository description for indicators
                 if result["description"]:
-                    result["deprecation_indicators"].extend(
-                        self._find_indicators(
-                            result["description"],
-                            DEPRECATION_KEYWORDS,
-                            "repo_description",
-                        )
-                    )
-                    result["warning_indicators"].extend(
-                        self._find_indicators(
-                            result["description"], WARNING_KEYWORDS, "repo_description"
-                        )
-                    )
-                    result["active_indicators"].extend(
-                        self._find_indicators(
-                            result["description"], ACTIVE_KEYWORDS, "repo_description"
-                        )
+                    self._add_indicators(
+                        result, result["description"], "repo_description"
                     )
 
             # Get README content
             readme_content = await self._get_readme_content(client, owner, repo)
             if readme_content:
-                result["readme_content"] = readme_content[
-                    :1000
-                ]  # First 1000 chars for reference
+                # Kept whole for the search index; downloads are capped at
+                # README_MAX_BYTES
+                result["readme_content"] = readme_content
 
                 # Analyze README for indicators
-                result["deprecation_indicators"].extend(
-                    self._find_indicators(
-                        readme_content, DEPRECATION_KEYWORDS, "readme"
-                    )
-                )
-                result["warning_indicators"].extend(
-                    self._find_indicators(readme_content, WARNING_KEYWORDS, "readme")
-                )
-                result["active_indicators"].extend(
-                    self._find_indicators(readme_content, ACTIVE_KEYWORDS, "readme")
-                )
+                self._add_indicators(result, readme_content, "readme")
 
             # Calculate deprecation score
             result["deprecation_score"] = self._calculate_deprecation_score(result)
@@ -428,6 +546,19 @@ class DeprecationDetector:
         self, client: httpx.AsyncClient, owner: str, repo: str
     ) -> Optional[str]:
         """Get README content from repository with caching."""
+        # Use GitHubAPIClient if available (respects rate limiting, ETag caching)
+        if self.github_api_client:
+            try:
+                return await self.github_api_client.get_readme(
+                    client, f"{owner}/{repo}", max_bytes=README_MAX_BYTES
+                )
+            except Exception as e:
+                logger.debug(
+                    f"Error fetching README via GitHubAPIClient for {owner}/{repo}: {e}"
+                )
+                return None
+
+        # Fallback to a direct API call (standalone script, no rate limiting)
         cache_key = f"readme_{owner}_{repo}"
 
         # Try cache first
@@ -436,31 +567,36 @@ class DeprecationDetector:
             logger.debug(f"Using cached README for {owner}/{repo}")
             return cached_data if cached_data != "_not_found" else None
 
-        # Fetch from API
-        readme_files = ["README.md", "README.rst", "README.txt", "README", "readme.md"]
-
-        for readme_file in readme_files:
-            try:
-                url = f"https://api.github.com/repos/{owner}/{repo}/contents/{readme_file}"
-                response = await client.get(url, headers=self.headers)
-
+        # The /readme endpoint resolves the README filename, and the raw media
+        # type returns the file itself rather than base64-encoded JSON.
+        try:
+            url = f"https://api.github.com/repos/{owner}/{repo}/readme"
+            headers = {**self.headers, "Accept": "application/vnd.github.raw"}
+            async with client.stream("GET", url, headers=headers) as response:
                 if response.status_code == 200:
-                    content = response.json()
-                    if content.get("encoding") == "base64":
-                        import base64
+                    content = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        content.extend(chunk)
+                        if len(content) >= README_MAX_BYTES:
+                            break
+                    readme_text = bytes(content[:README_MAX_BYTES]).decode(
+                        "utf-8", errors="ignore"
+                    )
+                    logger.debug(f"Fetched README for {owner}/{repo} from API")
 
-                        readme_text = base64.b64decode(content["content"]).decode(
-                            "utf-8", errors="ignore"
-                        )
-                        logger.debug(f"Fetched README for {owner}/{repo} from API")
+                    # Cache the result
+                    self.cache.set(cache_key, readme_text)
+                    return readme_text
 
-                        # Cache the result
-                        self.cache.set(cache_key, readme_text)
-                        return readme_text
+                if response.status_code != 404:
+                    logger.debug(
+                        f"Failed to fetch README for {owner}/{repo}: HTTP {response.status_code}"
+                    )
+                    return None
 
-            except Exception as e:
-                logger.debug(f"Error fetching {readme_file} for {owner}/{repo}: {e}")
-                continue
+        except Exception as e:
+            logger.debug(f"Error fetching README for {owner}/{repo}: {e}")
+            return None
 
         logger.debug(f"No README found for {owner}/{repo}")
 
@@ -468,30 +604,14 @@ class DeprecationDetector:
         self.cache.set(cache_key, "_not_found")
         return None
 
-    def _find_indicators(
-        self, text: str, keywords: List[str], source: str
-    ) -> List[Dict]:
-        """Find keyword indicators in text."""
-        if not text:
-            return []
-
-        text_lower = text.lower()
-        indicators = []
-
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                # Find the context around the keyword
-                pattern = re.compile(
-                    rf".{{0,50}}{re.escape(keyword.lower())}.{{0,50}}", re.IGNORECASE
-                )
-                matches = pattern.findall(text)
-
-                for match in matches[:3]:  # Limit to first 3 matches
-                    indicators.append(
-                        {"keyword": keyword, "source": source, "context": match.strip()}
-                    )
+    def _find_indicators(self, text: str, source: str) -> Dict[str, List[Dict]]:
+        """Find deprecation, warning and active indicators in text."""
+        return INDICATOR_SCANNER.scan(text, source)
 
-        return indicators
+    def _add_indicators(self, result: Dict, text: str, source: str) -> None:
+        """Scan text once and append every indicator class to the result."""
+        for indicator_class, indicators in self._find_indicators(text, source).items():
+            result[f"{indicator_class}_indicators"].extend(indicators)
 
     def _calculate_deprecation_score(self, result: Dict) -> float:
         """Calculate a deprecation score based on various indicators."""
@@ -562,6 +682,21 @@ async def analyze_all_extensions(detector: DeprecationDetector) -> List[Dict]:
 
         logger.info(f"Found {len(extensions_data)} community extensions to analyze")
 
+        # Load every cached repository lookup in one query
+        cache_keys = []
+        for extension_info in extensions_data.values():
+            url = (
+                extension_info
+                if isinstance(extension_info, str)
+                else extension_info["url"]
+            )
+            repo_match = re.search(r"github\.com/([^/]+)/([^/]+)", url)
+            if repo_match:
+                owner, repo = repo_match.groups()
+                repo = repo.rstrip(".git")
+                cache_keys += [f"repo_info_{owner}_{repo}", f"readme_{owner}_{repo}"]
+        detector.cache.preload(cache_keys)
+
         results = []
         for ext_name, extension_info in extensions_data.items():
             try:
@@ -6,143 +6,46 @@ This script demonstrates querying the historical extension data stored in the Du
 It also provides back-filling capabilities for historical data.
 """
 
+import argparse
 import duckdb
 from pathlib import Path
 import sys
 from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Optional
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# SQL query directory
-SQL_QUERIES_DIR = Path(__file__).parent.parent / "sql" / "queries"
+from src.analyzers.database_manager import DatabaseManager
+from src.analyzers.extension_queries import TREND_PERIODS, ExtensionQueries
 
 
-def load_sql_query(query_name: str, **params) -> str:
-    """Load SQL query from file and substitute parameters."""
-    query_file = SQL_QUERIES_DIR / f"{query_name}.sql"
-    if not query_file.exists():
-        raise FileNotFoundError(f"SQL query file not found: {query_file}")
-
-    query = query_file.read_text()
-
-    # Substitute parameters
-    for key, value in params.items():
-        query = query.replace(f"{{{key}}}", str(value))
-
-    return query
-
-
-def get_ecosystem_growth_trends(db_path: str = "data/extensions.duckdb") -> list:
-    """Get ecosystem growth trends over time."""
-    conn = duckdb.connect(db_path)
-    query = load_sql_query("ecosystem_growth_trends")
-    result = conn.execute(query).fetchall()
-    conn.close()
-    return result
-
-
-def get_recent_extensions(
-    db_path: str = "data/extensions.duckdb", days: int = 30
-) -> list:
-    """Get extensions first seen in the last N days."""
-    conn = duckdb.connect(db_path)
-    query = load_sql_query("recent_extensions", days=days)
-    result = conn.execute(query).fetchall()
-    conn.close()
-    return result
-
-
-def get_trending_extensions(
-    db_path: str = "data/extensions.duckdb", limit: int = 10
-) -> list:
-    """Get extensions with highest star growth in recent period."""
-    conn = duckdb.connect(db_path)
-    query = load_sql_query("trending_extensions", limit=limit)
-    result = conn.execute(query).fetchall()
-    conn.close()
-    return result
-
-
-def get_extension_trend_summary(db_path: str = "data/extensions.duckdb") -> dict:
-    """Get latest trend summary with deltas."""
-    conn = duckdb.connect(db_path)
-    query = load_sql_query("latest_trend_summary")
-    result = conn.execute(query).fetchall()
-    conn.close()
-
-    if not result:
-        return {}
-
-    latest = result[0]
-    previous = result[1] if len(result) > 1 else None
-
-    summary = {
-        "date": latest[0],
-        "total_extensions": latest[1],
-        "core_count": latest[2],
-        "community_count": latest[3],
-        "active_30d": latest[4],
-        "active_7d": latest[5],
-        "new_extensions": latest[6] or [],
-        "removed_extensions": latest[7] or [],
-        "avg_days_since_update": latest[8],
-        "total_stars": latest[9],
-        "total_forks": latest[10],
-        "archived_count": latest[11],
-    }
-
-    # Calculate deltas if we have previous data
-    if previous:
-        summary["total_delta"] = latest[1] - previous[1]
-        summary["community_delta"] = latest[3] - previous[3]
-        summary["active_30d_delta"] = latest[4] - previous[4]
-        summary["stars_delta"] = (
-            latest[9] - previous[9] if latest[9] and previous[9] else None
+def open_queries(
+    db_path: str = "data/extensions.duckdb", archive_dir: Optional[str] = None
+) -> ExtensionQueries:
+    """Open the query API on the live database, or on the Parquet archive."""
+    manager = DatabaseManager(
+        SimpleNamespace(
+            project_root=Path(__file__).parent.parent, database_path=Path(db_path)
         )
-
-    return summary
-
-
-def get_extension_star_history(
-    extension_name: str, db_path: str = "data/extensions.duckdb"
-) -> list:
-    """Get star growth history for a specific extension."""
-    conn = duckdb.connect(db_path)
-    query = load_sql_query("extension_star_history", extension_name=extension_name)
-    result = conn.execute(query).fetchall()
-    conn.close()
-    return result
-
-
-def get_activity_changes(
-    db_path: str = "data/extensions.duckdb", days: int = 7
-) -> list:
-    """Get extensions that changed activity status recently."""
-    conn = duckdb.connect(db_path)
-    query = load_sql_query("activity_changes", days=days)
-    result = conn.execute(query).fetchall()
-    conn.close()
-    return result
-
-
-def get_top_extensions_by_stars(
-    db_path: str = "data/extensions.duckdb", limit: int = 20
-) -> list:
-    """Get top community extensions by stars."""
-    conn = duckdb.connect(db_path)
-    query = load_sql_query("top_extensions_by_stars", limit=limit)
-    result = conn.execute(query).fetchall()
-    conn.close()
-    return result
+    )
+    return ExtensionQueries.open(manager, archive_dir)
 
 
-def query_database(db_path: str = "data/extensions.duckdb"):
-    """Run example queries on the extensions database."""
-    if not Path(db_path).exists():
+def query_database(
+    db_path: str = "data/extensions.duckdb",
+    archive_dir: Optional[str] = None,
+    period: str = "daily",
+):
+    """Run example queries on the extensions database or its Parquet archive."""
+    if archive_dir is None and not Path(db_path).exists():
         print(f"❌ Database not found: {db_path}")
         print("Run 'just database' first to create the database")
         return
 
-    conn = duckdb.connect(db_path)
+    queries = open_queries(db_path, archive_dir)
+    conn = queries.pool.acquire()
 
     print("🔍 DuckDB Extensions Database Analysis")
     print("=" * 50)
@@ -257,7 +160,7 @@ def query_database(db_path: str = "data/extensions.duckdb"):
     print("\n📈 Ecosystem Growth Trends:")
     print("-" * 40)
     try:
-        trends = get_ecosystem_growth_trends(db_path)
+        trends = queries.ecosystem_growth_trends(period)
         if trends:
             print(
                 f"{'Date':<12} {'Total':<7} {'Delta':<7} {'Active 30d':<12} {'Avg Days':<10}"
@@ -296,7 +199,7 @@ def query_database(db_path: str = "data/extensions.duckdb"):
     print("\n🆕 Recently Added Extensions (Last 30 Days):")
     print("-" * 45)
     try:
-        recent = get_recent_extensions(db_path, days=30)
+        recent = queries.recent_extensions(days=30)
         if recent:
             for row in recent[:10]:
                 ext_name = row[0]
@@ -313,7 +216,7 @@ def query_database(db_path: str = "data/extensions.duckdb"):
     print("\n🔥 Trending Extensions (Star Growth):")
     print("-" * 40)
     try:
-        trending = get_trending_extensions(db_path, limit=10)
+        trending = queries.trending_extensions(limit=10, period=period)
         if trending:
             for row in trending:
                 ext_name = row[0]
@@ -329,7 +232,7 @@ def query_database(db_path: str = "data/extensions.duckdb"):
     print("\n📊 Latest Trend Summary:")
     print("-" * 30)
     try:
-        summary = get_extension_trend_summary(db_path)
+        summary = queries.trend_summary()
         if summary:
             print(f"Date: {summary['date']}")
             print(f"Total Extensions: {summary['total_extensions']}")
@@ -360,7 +263,7 @@ def query_database(db_path: str = "data/extensions.duckdb"):
     except Exception as e:
         print(f"⚠️  Trend summary not available: {e}")
 
-    conn.close()
+    queries.close()
 
 
 def simulate_historical_backfill(db_path: str = "data/extensions.duckdb"):
@@ -454,10 +357,26 @@ def simulate_historical_backfill(db_path: str = "data/extensions.duckdb"):
 
 def main():
     """Main function with command line interface."""
-    if len(sys.argv) > 1 and sys.argv[1] == "backfill":
-        simulate_historical_backfill()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", nargs="?", choices=["backfill"])
+    parser.add_argument("--db", default="data/extensions.duckdb", help="Database path")
+    parser.add_argument(
+        "--archive",
+        metavar="DIR",
+        help="Query the Parquet history archive in DIR instead of the database",
+    )
+    parser.add_argument(
+        "--period",
+        choices=list(TREND_PERIODS),
+        default="daily",
+        help="Grain of the growth and trending sections (weekly/monthly read rollups)",
+    )
+    args = parser.parse_args()
+
+    if args.command == "backfill":
+        simulate_historical_backfill(args.db)
     else:
-        query_database()
+        query_database(args.db, args.archive, args.period)
 
 
 if __name__ == "__main__":
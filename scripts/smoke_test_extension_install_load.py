@@ -1,12 +1,17 @@
 import argparse
 import json
 import re
+import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
 
 import duckdb
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.extension_store import ExtensionBinaryStore  # noqa: E402
+
 
 GITHUB_REPO_RE = re.compile(r"^(?P<owner>[^/]+)/(?P<repo>[^/]+)$")
 
@@ -98,16 +103,24 @@ def duckdb_smoke_test(
     ext_name_candidates: list[str],
     sleep_seconds: float,
     verbose: bool,
+    binary_store: ExtensionBinaryStore | None = None,
 ) -> SmokeTestResult:
     start = time.time()
     last_error: str | None = None
+    platform = con.execute("PRAGMA platform").fetchone()[0]
 
     for name in ext_name_candidates:
         try:
             if verbose:
                 print(f"  Trying INSTALL/LOAD {name}")
 
-            con.execute(f"INSTALL {name}")
+            if binary_store is not None:
+                # INSTALL from the local store when the binary was prefetched
+                con.execute(
+                    binary_store.install_sql(duckdb.__version__, platform, name)
+                )
+            else:
+                con.execute(f"INSTALL {name}")
             con.execute(f"LOAD {name}")
 
             elapsed = time.time() - start
@@ -168,6 +181,17 @@ def main() -> int:
         default=".cache/duckdb_extension_smoke",
         help="Local extension directory used for installs (keeps test installs isolated)",
     )
+    parser.add_argument(
+        "--binary-store-dir",
+        default=".cache/extension_binaries",
+        help="Local extension binary store; candidates are prefetched into it concurrently",
+    )
+    parser.add_argument(
+        "--no-binary-store",
+        action="store_true",
+        default=False,
+        help="Always INSTALL from the remote repository",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -187,6 +211,23 @@ def main() -> int:
     # Keep installs isolated to the repo.
     con.execute(f"SET extension_directory='{ext_dir.as_posix()}'")
 
+    repos = [
+        repo
+        for repo in dict.fromkeys(normalise_repo(r.get("repo")) for r in rows)
+        if repo
+    ][: args.max]
+
+    binary_store = None
+    if not args.no_binary_store:
+        # One concurrent download pass for every name the smoke tests may try
+        binary_store = ExtensionBinaryStore(Path(args.binary_store_dir))
+        platform = con.execute("PRAGMA platform").fetchone()[0]
+        binary_store.populate_sync(
+            (duckdb.__version__, platform, name)
+            for repo in repos
+            for name in guess_extension_names_from_repo(repo)
+        )
+
     results: list[dict] = []
 
     tested = 0
@@ -209,6 +250,7 @@ def main() -> int:
             ext_name_candidates=candidates,
             sleep_seconds=args.sleep,
             verbose=args.verbose,
+            binary_store=binary_store,
         )
         res.repo = repo
 
@@ -6,6 +6,7 @@ import json
 import os
 import re
 import subprocess
+import sys
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,6 +15,10 @@ from urllib.parse import quote
 import duckdb
 import requests
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.analyzers.extension_store import ExtensionBinaryStore  # noqa: E402
+
 
 GITHUB_API_VERSION = "2022-11-28"
 DEFAULT_ACCEPT_HEADER = "application/vnd.github+json"
@@ -30,6 +35,8 @@ DEFAULT_RELEASE_DOWNLOAD = False
 DEFAULT_RELEASE_DOWNLOAD_DIR = ".cache/extension_candidate_validation/assets"
 DEFAULT_RELEASE_MAX_MB = 80
 
+DEFAULT_BINARY_STORE_DIR = ".cache/extension_binaries"
+
 GITHUB_REPO_RE = re.compile(r"^(?P<owner>[^/]+)/(?P<repo>[^/]+)$")
 GITHUB_REPO_IN_URL_RE = re.compile(r"github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)")
 
@@ -559,14 +566,22 @@ def duckdb_install_load_smoke_test(
     *,
     candidates: list[str],
     verbose: bool,
+    binary_store: ExtensionBinaryStore | None = None,
 ) -> tuple[bool, bool, str | None, str | None]:
     last_error: str | None = None
+    platform = con.execute("PRAGMA platform").fetchone()[0]
 
     for name in candidates:
         try:
             if verbose:
                 print(f"    DuckDB: INSTALL/LOAD {name}")
-            con.execute(f"INSTALL {name}")
+            if binary_store is not None:
+                # INSTALL from the local store when the binary was prefetched
+                con.execute(
+                    binary_store.install_sql(duckdb.__version__, platform, name)
+                )
+            else:
+                con.execute(f"INSTALL {name}")
             con.execute(f"LOAD {name}")
             return True, True, name, None
         except Exception as exc:
@@ -742,6 +757,18 @@ def main() -> int:
         help="Extension directory for DuckDB smoke tests",
     )
 
+    parser.add_argument(
+        "--binary-store",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Prefetch candidate extension binaries concurrently into a local store and INSTALL from it",
+    )
+    parser.add_argument(
+        "--binary-store-dir",
+        default=DEFAULT_BINARY_STORE_DIR,
+        help="Directory of the local extension binary store",
+    )
+
     parser.add_argument("--verbose", action="store_true", default=False)
 
     args = parser.parse_args()
@@ -777,6 +804,22 @@ def main() -> int:
         except Exception:
             pass
 
+    binary_store = None
+    if args.duckdb_smoke_test and args.binary_store:
+        # One concurrent download pass for every name the smoke tests may try
+        binary_store = ExtensionBinaryStore(Path(args.binary_store_dir))
+        platform = con.execute("PRAGMA platform").fetchone()[0]
+        smoke_repos = [
+            repo
+            for repo in dict.fromkeys(normalise_repo(r.get("repo")) for r in rows)
+            if repo and repo not in already_done
+        ][: min(args.max, args.duckdb_smoke_max)]
+        binary_store.populate_sync(
+            (duckdb.__version__, platform, name)
+            for repo in smoke_repos
+            for name in guess_extension_names_from_repo(repo)
+        )
+
     validated = 0
     smoke_tested = 0
 
@@ -1072,6 +1115,7 @@ def main() -> int:
                     con,
                     candidates=candidates,
                     verbose=args.verbose,
+                    binary_store=binary_store,
                 )
             )
 
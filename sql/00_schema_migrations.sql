@@ -0,0 +1,7 @@
+-- Tracks which numbered schema files have been applied to this database.
+-- Each file NN_*.sql is migration version NN and runs once, in order.
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    filename VARCHAR NOT NULL,
+    applied_at TIMESTAMP NOT NULL DEFAULT current_timestamp
+);
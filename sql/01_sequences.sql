@@ -6,3 +6,4 @@ CREATE SEQUENCE IF NOT EXISTS ext_availability_hist_seq;
 CREATE SEQUENCE IF NOT EXISTS github_issues_seq;
 CREATE SEQUENCE IF NOT EXISTS ext_issues_mapping_seq;
 CREATE SEQUENCE IF NOT EXISTS installation_test_seq;
+CREATE SEQUENCE IF NOT EXISTS deprecation_signals_seq;
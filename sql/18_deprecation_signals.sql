@@ -0,0 +1,54 @@
+-- Raw deprecation signals collected by the deprecation detector.
+-- Scores and recommendations are derived in SQL (see 19_deprecation_views.sql)
+-- so a new weighting can be applied to all history without rescanning READMEs.
+
+-- One row per analysed extension per run: repository-level facts
+CREATE TABLE IF NOT EXISTS deprecation_analysis_history (
+    extension_name VARCHAR NOT NULL,
+    repository VARCHAR,
+    repository_archived BOOLEAN NOT NULL DEFAULT FALSE,
+    last_push TIMESTAMP,
+    analysis_date TIMESTAMP NOT NULL,
+    PRIMARY KEY (extension_name, analysis_date)
+);
+
+-- One row per keyword indicator found in a source
+CREATE TABLE IF NOT EXISTS deprecation_signals_history (
+    id INTEGER PRIMARY KEY DEFAULT nextval('deprecation_signals_seq'),
+    extension_name VARCHAR NOT NULL,
+    indicator_class VARCHAR NOT NULL, -- 'deprecation', 'warning', 'active'
+    keyword VARCHAR NOT NULL,
+    source VARCHAR NOT NULL, -- 'official_description', 'repo_description', 'readme'
+    context TEXT,
+    analysis_date TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_deprecation_signals_ext_date
+    ON deprecation_signals_history(extension_name, analysis_date);
+
+-- Scoring weights; edit these rows to re-score every analysis
+CREATE TABLE IF NOT EXISTS deprecation_score_weights (
+    signal VARCHAR PRIMARY KEY,
+    weight DOUBLE NOT NULL
+);
+
+INSERT OR IGNORE INTO deprecation_score_weights VALUES
+    ('archived', 10.0),
+    ('deprecation', 3.0),
+    ('warning', 1.0),
+    ('active', -2.0),
+    ('inactive_365_days', 2.0),
+    ('inactive_180_days', 1.0);
+
+-- Recommendation thresholds, highest first
+CREATE TABLE IF NOT EXISTS deprecation_recommendation_thresholds (
+    min_score DOUBLE PRIMARY KEY,
+    recommendation VARCHAR NOT NULL
+);
+
+INSERT OR IGNORE INTO deprecation_recommendation_thresholds VALUES
+    (8.0, 'LIKELY DEPRECATED - High confidence'),
+    (5.0, 'POSSIBLY DEPRECATED - Manual review recommended'),
+    (3.0, 'REVIEW - Some deprecation indicators found'),
+    (1.0, 'MONITOR - Minor concerns detected'),
+    (0.0, 'ACTIVE - No significant deprecation indicators');
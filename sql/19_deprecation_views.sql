@@ -0,0 +1,72 @@
+-- Deprecation scores derived from the stored signals and current weights
+
+-- Score and recommendation for every analysed extension in every run
+CREATE OR REPLACE VIEW deprecation_scores AS
+WITH signal_counts AS (
+    SELECT
+        extension_name,
+        analysis_date,
+        COUNT(*) FILTER (WHERE indicator_class = 'deprecation') AS deprecation_count,
+        COUNT(*) FILTER (WHERE indicator_class = 'warning') AS warning_count,
+        COUNT(*) FILTER (WHERE indicator_class = 'active') AS active_count
+    FROM deprecation_signals_history
+    GROUP BY extension_name, analysis_date
+),
+weights AS (
+    SELECT
+        MAX(weight) FILTER (WHERE signal = 'archived') AS archived,
+        MAX(weight) FILTER (WHERE signal = 'deprecation') AS deprecation,
+        MAX(weight) FILTER (WHERE signal = 'warning') AS warning,
+        MAX(weight) FILTER (WHERE signal = 'active') AS active,
+        MAX(weight) FILTER (WHERE signal = 'inactive_365_days') AS inactive_365_days,
+        MAX(weight) FILTER (WHERE signal = 'inactive_180_days') AS inactive_180_days
+    FROM deprecation_score_weights
+),
+scored AS (
+    SELECT
+        a.extension_name,
+        a.repository,
+        a.repository_archived,
+        a.last_push,
+        a.analysis_date,
+        COALESCE(s.deprecation_count, 0) AS deprecation_count,
+        COALESCE(s.warning_count, 0) AS warning_count,
+        COALESCE(s.active_count, 0) AS active_count,
+        FLOOR(EPOCH(a.analysis_date - a.last_push) / 86400) AS days_since_push,
+        GREATEST(
+            0.0,
+            CASE WHEN a.repository_archived THEN w.archived ELSE 0.0 END
+            + COALESCE(s.deprecation_count, 0) * w.deprecation
+            + COALESCE(s.warning_count, 0) * w.warning
+            + COALESCE(s.active_count, 0) * w.active
+            + CASE
+                WHEN days_since_push > 365 THEN w.inactive_365_days
+                WHEN days_since_push > 180 THEN w.inactive_180_days
+                ELSE 0.0
+            END
+        ) AS deprecation_score
+    FROM deprecation_analysis_history a
+    CROSS JOIN weights w
+    LEFT JOIN signal_counts s
+        ON s.extension_name = a.extension_name
+        AND s.analysis_date = a.analysis_date
+)
+SELECT
+    scored.*,
+    CASE
+        WHEN repository_archived THEN 'DEPRECATED - Repository is archived'
+        ELSE (
+            SELECT t.recommendation
+            FROM deprecation_recommendation_thresholds t
+            WHERE scored.deprecation_score >= t.min_score
+            ORDER BY t.min_score DESC
+            LIMIT 1
+        )
+    END AS recommendation
+FROM scored;
+
+-- Latest score per extension
+CREATE OR REPLACE VIEW current_deprecation_scores AS
+SELECT DISTINCT ON (extension_name) *
+FROM deprecation_scores
+ORDER BY extension_name, analysis_date DESC;
@@ -0,0 +1,20 @@
+-- Change-tracking columns for compatibility matrix scheduling
+-- Results record what was tested so the next run can skip unchanged, passing pairs
+
+ALTER TABLE installation_test_history ADD COLUMN IF NOT EXISTS extension_version VARCHAR;
+
+ALTER TABLE installation_test_history ADD COLUMN IF NOT EXISTS artifact_last_modified VARCHAR;
+
+-- Latest compatibility result per extension, platform and DuckDB version
+CREATE OR REPLACE VIEW latest_compatibility_results AS
+SELECT DISTINCT ON (extension_name, platform, duckdb_version)
+    extension_name,
+    platform,
+    duckdb_version,
+    success,
+    error_type,
+    extension_version,
+    artifact_last_modified,
+    test_timestamp
+FROM installation_test_history
+ORDER BY extension_name, platform, duckdb_version, test_timestamp DESC;
@@ -0,0 +1,113 @@
+-- Extension load-performance benchmarks
+-- Benchmark mode times repeated LOADs on fresh connections; results are stored
+-- per DuckDB version and platform alongside the install test result
+
+ALTER TABLE installation_test_history ADD COLUMN IF NOT EXISTS benchmark_runs INTEGER;
+
+ALTER TABLE installation_test_history ADD COLUMN IF NOT EXISTS load_time_p50_seconds DOUBLE;
+
+ALTER TABLE installation_test_history ADD COLUMN IF NOT EXISTS load_time_p95_seconds DOUBLE;
+
+ALTER TABLE installation_test_history ADD COLUMN IF NOT EXISTS rss_growth_bytes BIGINT;
+
+ALTER TABLE installation_test_history ADD COLUMN IF NOT EXISTS functional_test_p50_seconds DOUBLE;
+
+-- Include benchmark coverage in the latest results used for scheduling
+CREATE OR REPLACE VIEW latest_compatibility_results AS
+SELECT DISTINCT ON (extension_name, platform, duckdb_version)
+    extension_name,
+    platform,
+    duckdb_version,
+    success,
+    error_type,
+    extension_version,
+    artifact_last_modified,
+    benchmark_runs,
+    test_timestamp
+FROM installation_test_history
+ORDER BY extension_name, platform, duckdb_version, test_timestamp DESC;
+
+-- Latest benchmark per extension, platform and DuckDB version
+CREATE OR REPLACE VIEW extension_load_benchmarks AS
+SELECT DISTINCT ON (extension_name, platform, duckdb_version)
+    extension_name,
+    platform,
+    duckdb_version,
+    benchmark_runs,
+    load_time_p50_seconds,
+    load_time_p95_seconds,
+    rss_growth_bytes,
+    file_size_bytes,
+    functional_test_p50_seconds,
+    test_timestamp
+FROM installation_test_history
+WHERE success = true AND benchmark_runs IS NOT NULL
+ORDER BY extension_name, platform, duckdb_version, test_timestamp DESC;
+
+-- Load cost compared with the previous benchmarked DuckDB release
+CREATE OR REPLACE VIEW extension_load_benchmark_trends AS
+WITH compared AS (
+    SELECT
+        *,
+        LAG(duckdb_version) OVER releases AS previous_duckdb_version,
+        LAG(load_time_p50_seconds) OVER releases AS previous_load_time_p50_seconds,
+        LAG(load_time_p95_seconds) OVER releases AS previous_load_time_p95_seconds,
+        LAG(rss_growth_bytes) OVER releases AS previous_rss_growth_bytes,
+        LAG(file_size_bytes) OVER releases AS previous_file_size_bytes,
+        LAG(functional_test_p50_seconds) OVER releases AS previous_functional_test_p50_seconds
+    FROM extension_load_benchmarks
+    WINDOW releases AS (
+        PARTITION BY extension_name, platform
+        -- Numeric version order, so 1.10 sorts after 1.9
+        ORDER BY list_transform(
+            string_split(ltrim(duckdb_version, 'v'), '.'),
+            part -> TRY_CAST(part AS INTEGER)
+        )
+    )
+),
+ratios AS (
+    SELECT
+        *,
+        load_time_p50_seconds / NULLIF(previous_load_time_p50_seconds, 0) AS load_time_p50_ratio,
+        load_time_p95_seconds / NULLIF(previous_load_time_p95_seconds, 0) AS load_time_p95_ratio,
+        rss_growth_bytes - previous_rss_growth_bytes AS rss_growth_change_bytes,
+        file_size_bytes - previous_file_size_bytes AS file_size_change_bytes,
+        functional_test_p50_seconds / NULLIF(previous_functional_test_p50_seconds, 0) AS functional_test_p50_ratio
+    FROM compared
+)
+SELECT
+    extension_name,
+    platform,
+    duckdb_version,
+    previous_duckdb_version,
+    load_time_p50_seconds,
+    previous_load_time_p50_seconds,
+    ROUND(load_time_p50_ratio, 2) AS load_time_p50_ratio,
+    load_time_p95_seconds,
+    previous_load_time_p95_seconds,
+    ROUND(load_time_p95_ratio, 2) AS load_time_p95_ratio,
+    rss_growth_bytes,
+    rss_growth_change_bytes,
+    file_size_bytes,
+    file_size_change_bytes,
+    functional_test_p50_seconds,
+    ROUND(functional_test_p50_ratio, 2) AS functional_test_p50_ratio,
+    CASE
+        WHEN previous_duckdb_version IS NULL THEN 'BASELINE'
+        WHEN load_time_p50_ratio > 1.25
+            OR load_time_p95_ratio > 1.5
+            OR rss_growth_change_bytes > GREATEST(1048576, 0.25 * previous_rss_growth_bytes)
+            THEN 'REGRESSED'
+        WHEN load_time_p50_ratio < 0.8 THEN 'IMPROVED'
+        ELSE 'STABLE'
+    END AS load_trend,
+    test_timestamp
+FROM ratios
+ORDER BY extension_name, platform, test_timestamp;
+
+-- Extensions whose load cost regressed in a DuckDB release
+CREATE OR REPLACE VIEW extension_load_regressions AS
+SELECT *
+FROM extension_load_benchmark_trends
+WHERE load_trend = 'REGRESSED'
+ORDER BY load_time_p50_ratio DESC NULLS LAST, extension_name;
@@ -0,0 +1,110 @@
+-- Latest-state tables maintained on every save, so "current" views read one
+-- row per extension instead of scanning the full history.
+
+CREATE TABLE IF NOT EXISTS core_extensions_latest (
+    id INTEGER, -- id of the history row this snapshot was taken from
+    name VARCHAR PRIMARY KEY,
+    development_stage VARCHAR,
+    status VARCHAR,
+    last_updated_date TIMESTAMP,
+    last_commit_date TIMESTAMP,
+    last_commit_sha VARCHAR,
+    last_commit_message VARCHAR,
+    repository VARCHAR,
+    duckdb_version VARCHAR,
+    platform_availability JSON,
+    earliest_availability_date TIMESTAMP,
+    available_platforms VARCHAR[],
+    analysis_date TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS community_extensions_latest (
+    id INTEGER, -- id of the history row this snapshot was taken from
+    name VARCHAR PRIMARY KEY,
+    repository VARCHAR,
+    status VARCHAR,
+    last_push_date TIMESTAMP,
+    last_push_days INTEGER,
+    stars INTEGER,
+    forks INTEGER,
+    language VARCHAR,
+    description TEXT,
+    improved_description TEXT,
+    homepage VARCHAR,
+    license VARCHAR,
+    topics VARCHAR[],
+    archived BOOLEAN,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    featured BOOLEAN DEFAULT FALSE,
+    github_url VARCHAR,
+    community_repo_url VARCHAR,
+    install_url VARCHAR,
+    duckdb_version VARCHAR,
+    analysis_date TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS extension_metrics_latest (
+    extension_name VARCHAR NOT NULL,
+    extension_type VARCHAR NOT NULL,
+    analysis_date DATE NOT NULL,
+    stars INTEGER,
+    forks INTEGER,
+    days_since_update INTEGER,
+    status VARCHAR,
+    is_active BOOLEAN,
+    is_archived BOOLEAN DEFAULT FALSE,
+    repository VARCHAR,
+    PRIMARY KEY (extension_name, extension_type)
+);
+
+-- Backfill from existing history
+INSERT OR IGNORE INTO core_extensions_latest BY NAME
+SELECT DISTINCT ON (name) *
+FROM core_extensions_history
+ORDER BY name, analysis_date DESC, id DESC;
+
+INSERT OR IGNORE INTO community_extensions_latest BY NAME
+SELECT DISTINCT ON (name) *
+FROM community_extensions_history
+ORDER BY name, analysis_date DESC, id DESC;
+
+INSERT OR IGNORE INTO extension_metrics_latest BY NAME
+SELECT DISTINCT ON (extension_name, extension_type)
+    extension_name,
+    extension_type,
+    analysis_date,
+    stars,
+    forks,
+    days_since_update,
+    status,
+    is_active,
+    is_archived,
+    repository
+FROM extension_metrics_daily
+ORDER BY extension_name, extension_type, analysis_date DESC;
+
+-- Point the current views at the latest-state tables
+CREATE OR REPLACE VIEW core_extensions AS
+SELECT *
+FROM core_extensions_latest
+ORDER BY name;
+
+CREATE OR REPLACE VIEW community_extensions AS
+SELECT *
+FROM community_extensions_latest
+ORDER BY name;
+
+CREATE OR REPLACE VIEW v_extension_popularity AS
+SELECT 
+    eml.extension_name,
+    eml.extension_type,
+    eml.stars,
+    eml.forks,
+    eml.is_active,
+    eml.days_since_update,
+    ROW_NUMBER() OVER (PARTITION BY eml.extension_type ORDER BY eml.stars DESC NULLS LAST) as popularity_rank
+FROM extension_metrics_latest eml
+WHERE eml.analysis_date = (SELECT MAX(analysis_date) FROM extension_metrics_latest)
+    AND eml.extension_type = 'community'  -- Only rank community extensions (core don't have separate repos)
+ORDER BY eml.stars DESC NULLS LAST;
@@ -0,0 +1,138 @@
+-- Validity intervals for the history tables (SCD type 2).
+-- A row is the state of its key from valid_from until valid_to (exclusive);
+-- an open row (valid_to IS NULL) is the current state. In the default
+-- "snapshot" history mode every run writes a new version of every row; in
+-- "changes" mode a run only writes rows whose tracked attributes changed.
+-- Either way, the *_as_of macros reconstruct the snapshot at any time.
+
+ALTER TABLE core_extensions_history ADD COLUMN IF NOT EXISTS valid_from TIMESTAMP;
+ALTER TABLE core_extensions_history ADD COLUMN IF NOT EXISTS valid_to TIMESTAMP;
+ALTER TABLE community_extensions_history ADD COLUMN IF NOT EXISTS valid_from TIMESTAMP;
+ALTER TABLE community_extensions_history ADD COLUMN IF NOT EXISTS valid_to TIMESTAMP;
+ALTER TABLE extension_availability_history ADD COLUMN IF NOT EXISTS valid_from TIMESTAMP;
+ALTER TABLE extension_availability_history ADD COLUMN IF NOT EXISTS valid_to TIMESTAMP;
+ALTER TABLE extension_metrics_daily ADD COLUMN IF NOT EXISTS valid_from DATE;
+ALTER TABLE extension_metrics_daily ADD COLUMN IF NOT EXISTS valid_to DATE;
+
+-- Backfill existing snapshot rows: each row is valid until the next run
+UPDATE core_extensions_history h
+SET valid_from = h.analysis_date, valid_to = runs.next_date
+FROM (
+    SELECT analysis_date, LEAD(analysis_date) OVER (ORDER BY analysis_date) AS next_date
+    FROM (SELECT DISTINCT analysis_date FROM core_extensions_history)
+) runs
+WHERE h.analysis_date = runs.analysis_date AND h.valid_from IS NULL;
+
+UPDATE community_extensions_history h
+SET valid_from = h.analysis_date, valid_to = runs.next_date
+FROM (
+    SELECT analysis_date, LEAD(analysis_date) OVER (ORDER BY analysis_date) AS next_date
+    FROM (SELECT DISTINCT analysis_date FROM community_extensions_history)
+) runs
+WHERE h.analysis_date = runs.analysis_date AND h.valid_from IS NULL;
+
+UPDATE extension_availability_history h
+SET valid_from = h.check_timestamp, valid_to = runs.next_date
+FROM (
+    SELECT
+        extension_type,
+        check_timestamp,
+        LEAD(check_timestamp) OVER (PARTITION BY extension_type ORDER BY check_timestamp) AS next_date
+    FROM (SELECT DISTINCT extension_type, check_timestamp FROM extension_availability_history)
+) runs
+WHERE h.extension_type = runs.extension_type
+    AND h.check_timestamp = runs.check_timestamp
+    AND h.valid_from IS NULL;
+
+UPDATE extension_metrics_daily h
+SET valid_from = h.analysis_date, valid_to = runs.next_date
+FROM (
+    SELECT analysis_date, LEAD(analysis_date) OVER (ORDER BY analysis_date) AS next_date
+    FROM (SELECT DISTINCT analysis_date FROM extension_metrics_daily)
+) runs
+WHERE h.analysis_date = runs.analysis_date AND h.valid_from IS NULL;
+
+-- Snapshots at any point in time
+CREATE OR REPLACE MACRO core_extensions_as_of(ts) AS TABLE
+SELECT * EXCLUDE (valid_from, valid_to)
+FROM core_extensions_history
+WHERE valid_from <= ts AND (valid_to IS NULL OR valid_to > ts);
+
+CREATE OR REPLACE MACRO community_extensions_as_of(ts) AS TABLE
+SELECT * EXCLUDE (valid_from, valid_to)
+    REPLACE (CAST(date_diff('day', last_push_date, CAST(ts AS TIMESTAMP)) AS INTEGER) AS last_push_days)
+FROM community_extensions_history
+WHERE valid_from <= ts AND (valid_to IS NULL OR valid_to > ts);
+
+CREATE OR REPLACE MACRO extension_availability_as_of(ts) AS TABLE
+SELECT * EXCLUDE (valid_from, valid_to)
+FROM extension_availability_history
+WHERE valid_from <= ts AND (valid_to IS NULL OR valid_to > ts);
+
+-- days_since_update is stored as of valid_from and aged to the snapshot date
+CREATE OR REPLACE MACRO extension_metrics_as_of(d) AS TABLE
+SELECT * EXCLUDE (valid_from, valid_to)
+    REPLACE (
+        CAST(d AS DATE) AS analysis_date,
+        days_since_update + date_diff('day', valid_from, CAST(d AS DATE)) AS days_since_update
+    )
+FROM extension_metrics_daily
+WHERE valid_from <= CAST(d AS DATE) AND (valid_to IS NULL OR valid_to > CAST(d AS DATE));
+
+-- Every day an analysis recorded metrics, including days with no changes
+CREATE OR REPLACE VIEW extension_metrics_snapshot_dates AS
+SELECT DISTINCT CAST(run_timestamp AS DATE) AS analysis_date FROM analysis_runs
+UNION
+SELECT DISTINCT valid_from FROM extension_metrics_daily;
+
+-- One row per extension per analysis day, as extension_metrics_daily held
+-- before change-only storage
+CREATE OR REPLACE VIEW extension_metrics_daily_snapshots AS
+SELECT
+    m.id,
+    m.extension_name,
+    m.extension_type,
+    s.analysis_date,
+    m.stars,
+    m.forks,
+    m.days_since_update + date_diff('day', m.valid_from, s.analysis_date) AS days_since_update,
+    m.status,
+    m.is_active,
+    m.is_archived,
+    m.repository,
+    m.created_at
+FROM extension_metrics_daily m
+JOIN extension_metrics_snapshot_dates s
+    ON m.valid_from <= s.analysis_date
+    AND (m.valid_to IS NULL OR m.valid_to > s.analysis_date);
+
+-- Trend views read the reconstructed daily metrics
+CREATE OR REPLACE VIEW v_extension_star_trends AS
+SELECT 
+    extension_name,
+    extension_type,
+    analysis_date,
+    stars,
+    LAG(stars) OVER (PARTITION BY extension_name ORDER BY analysis_date) as prev_stars,
+    stars - LAG(stars) OVER (PARTITION BY extension_name ORDER BY analysis_date) as star_delta
+FROM extension_metrics_daily_snapshots
+WHERE stars IS NOT NULL
+ORDER BY extension_name, analysis_date;
+
+CREATE OR REPLACE VIEW v_extension_activity_trends AS
+SELECT 
+    extension_name,
+    extension_type,
+    analysis_date,
+    days_since_update,
+    is_active,
+    LAG(is_active) OVER (PARTITION BY extension_name ORDER BY analysis_date) as prev_active,
+    CASE 
+        WHEN is_active AND NOT LAG(is_active, 1, FALSE) OVER (PARTITION BY extension_name ORDER BY analysis_date) 
+            THEN 'became_active'
+        WHEN NOT is_active AND LAG(is_active, 1, TRUE) OVER (PARTITION BY extension_name ORDER BY analysis_date) 
+            THEN 'became_inactive'
+        ELSE 'no_change'
+    END as activity_change
+FROM extension_metrics_daily_snapshots
+ORDER BY extension_name, analysis_date;
@@ -0,0 +1,83 @@
+-- Platform availability is stored only in the normalised, typed
+-- extension_availability_history table; the per-row JSON copy on the core
+-- extension tables is dropped (by the next migration). core_extensions_*
+-- keep the typed summary columns (available_platforms,
+-- earliest_availability_date).
+
+-- Backfill availability rows that only exist in the JSON blob, one row per
+-- platform key, with the history row's validity interval
+INSERT INTO extension_availability_history (
+    extension_name, extension_type, platform, duckdb_version, is_available,
+    availability_date, check_timestamp, http_status_code, file_size_bytes,
+    error_message, valid_from, valid_to
+)
+SELECT
+    extension_name,
+    'core',
+    platform,
+    duckdb_version,
+    is_available,
+    CASE
+        WHEN NOT is_available THEN NULL
+        WHEN regexp_matches(date_text, '(Z|[+-]\d\d:?\d\d)$')
+            THEN timezone('UTC', TRY_CAST(date_text AS TIMESTAMPTZ))
+        ELSE TRY_CAST(date_text AS TIMESTAMP)
+    END,
+    check_timestamp,
+    http_status_code,
+    file_size_bytes,
+    error_message,
+    valid_from,
+    valid_to
+FROM (
+    SELECT
+        h.name AS extension_name,
+        p.platform,
+        h.duckdb_version,
+        COALESCE(TRY_CAST(h.platform_availability -> p.platform ->> 'available' AS BOOLEAN), false) AS is_available,
+        h.platform_availability -> p.platform ->> 'date' AS date_text,
+        h.analysis_date AS check_timestamp,
+        TRY_CAST(h.platform_availability -> p.platform ->> 'http_status' AS INTEGER) AS http_status_code,
+        TRY_CAST(h.platform_availability -> p.platform ->> 'file_size' AS BIGINT) AS file_size_bytes,
+        h.platform_availability -> p.platform ->> 'error' AS error_message,
+        h.valid_from,
+        h.valid_to
+    FROM core_extensions_history h,
+        unnest(json_keys(h.platform_availability)) AS p(platform)
+    WHERE h.platform_availability IS NOT NULL
+        AND h.duckdb_version IS NOT NULL
+) blob
+WHERE NOT EXISTS (
+    SELECT 1
+    FROM extension_availability_history a
+    WHERE a.extension_name = blob.extension_name
+        AND a.platform = blob.platform
+        AND a.duckdb_version = blob.duckdb_version
+        AND a.check_timestamp = blob.check_timestamp
+);
+
+-- DuckDB cannot drop a column while an index depends on a later column,
+-- even one dropped earlier in the same transaction, so the indexes are
+-- dropped here and rebuilt by 25_drop_platform_availability_json.sql
+DROP INDEX IF EXISTS idx_core_ext_hist_name_date;
+DROP INDEX IF EXISTS idx_core_ext_hist_duckdb_version;
+
+CREATE INDEX IF NOT EXISTS idx_ext_availability_version_platform
+    ON extension_availability_history(duckdb_version, platform);
+
+-- Platform coverage per DuckDB version: one set-based aggregate over the
+-- typed availability columns
+CREATE OR REPLACE VIEW platform_coverage_by_version AS
+SELECT
+    duckdb_version,
+    extension_type,
+    platform,
+    COUNT(*) FILTER (WHERE is_available) AS available_extensions,
+    COUNT(*) AS checked_extensions,
+    ROUND(100.0 * COUNT(*) FILTER (WHERE is_available) / COUNT(*), 2) AS coverage_percentage,
+    LIST(extension_name ORDER BY extension_name) FILTER (WHERE NOT is_available) AS unavailable_extensions,
+    MIN(availability_date) FILTER (WHERE is_available) AS first_available,
+    MAX(availability_date) FILTER (WHERE is_available) AS last_available
+FROM current_extension_availability
+GROUP BY duckdb_version, extension_type, platform
+ORDER BY duckdb_version, extension_type, platform;
@@ -0,0 +1,6 @@
+-- Drop the platform availability JSON blob; see 24_typed_platform_availability.sql
+ALTER TABLE core_extensions_history DROP COLUMN IF EXISTS platform_availability;
+ALTER TABLE core_extensions_latest DROP COLUMN IF EXISTS platform_availability;
+
+CREATE INDEX IF NOT EXISTS idx_core_ext_hist_name_date ON core_extensions_history(name, analysis_date);
+CREATE INDEX IF NOT EXISTS idx_core_ext_hist_duckdb_version ON core_extensions_history(duckdb_version);
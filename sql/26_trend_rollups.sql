@@ -0,0 +1,95 @@
+-- Weekly and monthly trend rollups, maintained at save time.
+-- Each row holds a period's state as of its last analysis day and the change
+-- from the extension's (or ecosystem's) previous period, so long-range trends
+-- read one row per period instead of windowing over every daily row.
+-- period is 'week' (starting Monday) or 'month'.
+
+CREATE TABLE IF NOT EXISTS extension_metrics_rollup (
+    period VARCHAR NOT NULL,
+    period_start DATE NOT NULL,
+    extension_name VARCHAR NOT NULL,
+    extension_type VARCHAR NOT NULL,
+    last_analysis_date DATE NOT NULL, -- last analysis day in the period
+    stars INTEGER,
+    prev_stars INTEGER, -- stars at the end of the last earlier period with stars
+    star_delta INTEGER,
+    forks INTEGER,
+    days_since_update INTEGER,
+    is_active BOOLEAN,
+    prev_active BOOLEAN,
+    activity_change VARCHAR, -- 'became_active', 'became_inactive' or 'no_change'
+    PRIMARY KEY (period, period_start, extension_name, extension_type)
+);
+
+CREATE TABLE IF NOT EXISTS ecosystem_growth_rollup (
+    period VARCHAR NOT NULL,
+    period_start DATE NOT NULL,
+    last_analysis_date DATE NOT NULL,
+    total_extensions INTEGER,
+    core_count INTEGER,
+    community_count INTEGER,
+    active_30d INTEGER,
+    active_7d INTEGER,
+    avg_days_since_update FLOAT,
+    total_stars INTEGER,
+    prev_total INTEGER,
+    total_delta INTEGER,
+    prev_community INTEGER,
+    community_delta INTEGER,
+    prev_active_30d INTEGER,
+    active_30d_delta INTEGER,
+    stars_delta INTEGER,
+    PRIMARY KEY (period, period_start)
+);
+
+-- Rollup views have the daily trend views' columns, with analysis_date being
+-- the last analysis day of the period, so trend queries work at any grain
+CREATE OR REPLACE VIEW v_extension_star_trends_weekly AS
+SELECT extension_name, extension_type, last_analysis_date AS analysis_date,
+    stars, prev_stars, star_delta, period_start
+FROM extension_metrics_rollup
+WHERE period = 'week' AND stars IS NOT NULL
+ORDER BY extension_name, analysis_date;
+
+CREATE OR REPLACE VIEW v_extension_star_trends_monthly AS
+SELECT extension_name, extension_type, last_analysis_date AS analysis_date,
+    stars, prev_stars, star_delta, period_start
+FROM extension_metrics_rollup
+WHERE period = 'month' AND stars IS NOT NULL
+ORDER BY extension_name, analysis_date;
+
+CREATE OR REPLACE VIEW v_extension_activity_trends_weekly AS
+SELECT extension_name, extension_type, last_analysis_date AS analysis_date,
+    days_since_update, is_active, prev_active, activity_change, period_start
+FROM extension_metrics_rollup
+WHERE period = 'week'
+ORDER BY extension_name, analysis_date;
+
+CREATE OR REPLACE VIEW v_extension_activity_trends_monthly AS
+SELECT extension_name, extension_type, last_analysis_date AS analysis_date,
+    days_since_update, is_active, prev_active, activity_change, period_start
+FROM extension_metrics_rollup
+WHERE period = 'month'
+ORDER BY extension_name, analysis_date;
+
+CREATE OR REPLACE VIEW v_ecosystem_growth_weekly AS
+SELECT last_analysis_date AS analysis_date, total_extensions, core_count,
+    community_count, active_30d, active_7d, prev_total, total_delta,
+    prev_community, community_delta, prev_active_30d, active_30d_delta,
+    avg_days_since_update,
+    ROUND(CAST(active_30d AS FLOAT) / NULLIF(total_extensions, 0) * 100, 1) AS active_percentage,
+    total_stars, stars_delta, period_start
+FROM ecosystem_growth_rollup
+WHERE period = 'week'
+ORDER BY analysis_date;
+
+CREATE OR REPLACE VIEW v_ecosystem_growth_monthly AS
+SELECT last_analysis_date AS analysis_date, total_extensions, core_count,
+    community_count, active_30d, active_7d, prev_total, total_delta,
+    prev_community, community_delta, prev_active_30d, active_30d_delta,
+    avg_days_since_update,
+    ROUND(CAST(active_30d AS FLOAT) / NULLIF(total_extensions, 0) * 100, 1) AS active_percentage,
+    total_stars, stars_delta, period_start
+FROM ecosystem_growth_rollup
+WHERE period = 'month'
+ORDER BY analysis_date;
@@ -0,0 +1,127 @@
+-- Per-run extension membership and the change log derived from it.
+-- A run's changes are found with anti-joins against the previous run that
+-- covered the same extension type, so a core-only run does not report every
+-- community extension as removed.
+
+CREATE TABLE IF NOT EXISTS analysis_run_extensions (
+    run_id INTEGER NOT NULL, -- analysis_runs.id
+    extension_name VARCHAR NOT NULL,
+    extension_type VARCHAR NOT NULL,
+    status VARCHAR,
+    PRIMARY KEY (run_id, extension_name, extension_type)
+);
+
+CREATE TABLE IF NOT EXISTS extension_changelog (
+    run_id INTEGER NOT NULL,
+    previous_run_id INTEGER, -- NULL for the first run covering the type
+    run_timestamp TIMESTAMP NOT NULL,
+    extension_name VARCHAR NOT NULL,
+    extension_type VARCHAR NOT NULL,
+    change_type VARCHAR NOT NULL, -- 'added', 'removed' or 'status_changed'
+    previous_status VARCHAR,
+    status VARCHAR,
+    PRIMARY KEY (run_id, extension_name, extension_type, change_type)
+);
+
+-- Membership changes of every run at or after `since` against, per extension
+-- type the run covered, the latest earlier run that covered that type. With
+-- `by_day` the earlier run must be from an earlier day, not just earlier.
+-- Columns are in extension_changelog order.
+CREATE OR REPLACE MACRO extension_membership_changes(since, by_day) AS TABLE
+WITH run_types AS (
+    SELECT DISTINCT m.run_id, m.extension_type, r.run_timestamp
+    FROM analysis_run_extensions m
+    JOIN analysis_runs r ON r.id = m.run_id
+),
+previous_runs AS (
+    SELECT
+        t.run_id,
+        t.extension_type,
+        t.run_timestamp,
+        arg_max(e.run_id, e.run_timestamp) AS previous_run_id
+    FROM run_types t
+    LEFT JOIN run_types e
+        ON e.extension_type = t.extension_type
+        AND e.run_timestamp < CASE
+            WHEN by_day THEN CAST(CAST(t.run_timestamp AS DATE) AS TIMESTAMP)
+            ELSE t.run_timestamp
+        END
+    WHERE t.run_timestamp >= since
+    GROUP BY t.run_id, t.extension_type, t.run_timestamp
+),
+cur AS (
+    SELECT p.run_id, p.previous_run_id, p.run_timestamp,
+        m.extension_name, m.extension_type, m.status
+    FROM previous_runs p
+    JOIN analysis_run_extensions m
+        ON m.run_id = p.run_id AND m.extension_type = p.extension_type
+),
+prev AS (
+    SELECT p.run_id, p.previous_run_id, p.run_timestamp,
+        m.extension_name, m.extension_type, m.status
+    FROM previous_runs p
+    JOIN analysis_run_extensions m
+        ON m.run_id = p.previous_run_id AND m.extension_type = p.extension_type
+)
+SELECT
+    c.run_id,
+    c.previous_run_id,
+    c.run_timestamp,
+    c.extension_name,
+    c.extension_type,
+    'added' AS change_type,
+    NULL AS previous_status,
+    c.status
+FROM cur c
+ANTI JOIN prev p
+    ON p.run_id = c.run_id
+    AND p.extension_name = c.extension_name
+    AND p.extension_type = c.extension_type
+UNION ALL
+SELECT
+    p.run_id,
+    p.previous_run_id,
+    p.run_timestamp,
+    p.extension_name,
+    p.extension_type,
+    'removed',
+    p.status,
+    NULL
+FROM prev p
+ANTI JOIN cur c
+    ON c.run_id = p.run_id
+    AND c.extension_name = p.extension_name
+    AND c.extension_type = p.extension_type
+UNION ALL
+SELECT
+    c.run_id,
+    c.previous_run_id,
+    c.run_timestamp,
+    c.extension_name,
+    c.extension_type,
+    'status_changed',
+    p.status,
+    c.status
+FROM cur c
+JOIN prev p
+    ON p.run_id = c.run_id
+    AND p.extension_name = c.extension_name
+    AND p.extension_type = c.extension_type
+WHERE c.status IS DISTINCT FROM p.status;
+
+-- Backfill existing runs from the metrics valid on each run's day
+INSERT OR IGNORE INTO analysis_run_extensions
+SELECT r.id, m.extension_name, m.extension_type, m.status
+FROM analysis_runs r, extension_metrics_as_of(CAST(r.run_timestamp AS DATE)) m;
+
+INSERT OR IGNORE INTO extension_changelog
+SELECT * FROM extension_membership_changes(TIMESTAMP '-infinity', FALSE);
+
+-- Changes made by the most recent run
+CREATE OR REPLACE VIEW v_latest_extension_changes AS
+SELECT *
+FROM extension_changelog
+WHERE run_id = (
+    SELECT id FROM analysis_runs ORDER BY run_timestamp DESC, id DESC LIMIT 1
+)
+ORDER BY change_type, extension_type, extension_name;
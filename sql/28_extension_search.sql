@@ -0,0 +1,23 @@
+-- Searchable text per extension: its descriptions, topics and README, as of
+-- the latest run that saw it. Saves upsert the documents that changed and
+-- rebuild the full-text index over them (see create_search_index.sql).
+CREATE TABLE IF NOT EXISTS extension_documents (
+    extension_name VARCHAR PRIMARY KEY,
+    extension_type VARCHAR NOT NULL,
+    description TEXT, -- improved description shown in reports
+    repository_description TEXT,
+    topics TEXT, -- space separated, so the index tokenises each topic
+    readme TEXT, -- kept from earlier runs when a run did not fetch it
+    updated_at TIMESTAMP NOT NULL -- analysis that last changed the document
+);
+
+-- Backfill from the latest snapshots; READMEs arrive with the next save
+INSERT OR IGNORE INTO extension_documents BY NAME
+SELECT
+    name AS extension_name,
+    'community' AS extension_type,
+    improved_description AS description,
+    description AS repository_description,
+    array_to_string(topics, ' ') AS topics,
+    analysis_date AS updated_at
+FROM community_extensions_latest;
@@ -0,0 +1,17 @@
+-- End the rows a backfilled run wrote where the next later run begins, so a
+-- run saved out of order does not leave a second open version
+-- Parameter: $1 - valid_from of the rows the run wrote
+-- Placeholders: {table}, {same_scope} - restricts x (later rows) to n's scope
+UPDATE {table} n
+SET valid_to = (
+    SELECT MIN(x.valid_from)
+    FROM {table} x
+    WHERE x.valid_from > $1 {same_scope}
+)
+WHERE n.valid_from = $1
+    AND n.valid_to IS NULL
+    AND EXISTS (
+        SELECT 1
+        FROM {table} x
+        WHERE x.valid_from > $1 {same_scope}
+    );
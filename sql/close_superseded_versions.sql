@@ -0,0 +1,20 @@
+-- Close the versions that a run superseded in a versioned history table: the
+-- current ones, or for a backfilled run, the ones valid at the run's time
+-- Parameters: $1 - valid_from of the rows the run wrote
+--             $2 - TRUE (change-only history) to keep versions the run left unchanged
+-- Placeholders: {table}, {scope} - versions the run covered,
+--               {same_key} / {same_tracked} - match o (old) against n (new)
+UPDATE {table} o
+SET valid_to = $1
+WHERE (o.valid_to IS NULL OR o.valid_to > $1)
+    AND o.valid_from < $1
+    AND {scope}
+    AND NOT (
+        $2 AND EXISTS (
+            SELECT 1
+            FROM {table} n
+            WHERE n.valid_from = $1
+                AND {same_key}
+                AND {same_tracked}
+        )
+    );
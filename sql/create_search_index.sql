@@ -0,0 +1,14 @@
+-- Full-text index over extension_documents (fts extension)
+-- DuckDB's full-text indexes are not updated by writes to their table, so
+-- the index is rebuilt whenever a run changes a document. Building it reads
+-- every document, which takes milliseconds at the ecosystem's size.
+PRAGMA create_fts_index(
+    'extension_documents',
+    'extension_name',
+    'extension_name',
+    'description',
+    'repository_description',
+    'topics',
+    'readme',
+    overwrite = 1
+);
@@ -0,0 +1,14 @@
+-- Drop the rows a run wrote for keys whose current version it left unchanged
+-- Runs after close_superseded_versions.sql, so only unchanged versions are
+-- still valid at the run's time
+-- Parameter: $1 - valid_from of the rows the run wrote
+-- Placeholders: {table}, {same_key} - match o (old) against n (new)
+DELETE FROM {table} n
+WHERE n.valid_from = $1
+    AND EXISTS (
+        SELECT 1
+        FROM {table} o
+        WHERE (o.valid_to IS NULL OR o.valid_to > $1)
+            AND o.valid_from < $1
+            AND {same_key}
+    );
@@ -0,0 +1,371 @@
+-- Synthetic analysis history for query benchmarks, stored like the default
+-- "snapshot" history mode: one analysis run per day, each writing every
+-- extension it saw. Values are derived from hashes of the extension names,
+-- so a scale always produces the same history.
+-- Scale comes from variables set before running this script:
+--   synthetic_community - number of community extensions
+--   synthetic_core      - number of core extensions
+--   synthetic_days      - number of daily analysis runs
+--   synthetic_platforms - platform names (VARCHAR[])
+--   synthetic_start     - day of the first run
+-- Most community extensions exist from the first run; the rest are added
+-- over time and one in twenty is removed again. Latest-state tables, rollups
+-- and the change log are derived afterwards, like after a bulk import.
+
+CREATE OR REPLACE TEMP TABLE synthetic_runs AS
+SELECT
+    range AS day,
+    CAST(getvariable('synthetic_start') + CAST(range AS INTEGER) AS TIMESTAMP)
+        + INTERVAL 12 HOUR AS run_timestamp,
+    CAST(getvariable('synthetic_start') + CAST(range AS INTEGER) + 1 AS TIMESTAMP)
+        + INTERVAL 12 HOUR AS next_run_timestamp,
+    'v1.' || (range // 180) || '.0' AS duckdb_version
+FROM range(getvariable('synthetic_days'));
+
+UPDATE synthetic_runs
+SET next_run_timestamp = NULL
+WHERE day = getvariable('synthetic_days') - 1;
+
+CREATE OR REPLACE TEMP TABLE synthetic_extensions AS
+WITH community AS (
+    SELECT
+        'ext_' || lpad(CAST(range AS VARCHAR), 5, '0') AS name,
+        CASE
+            WHEN range % 5 < 3 THEN 0
+            ELSE CAST(hash('ext_first_' || range) % getvariable('synthetic_days') AS INTEGER)
+        END AS first_day
+    FROM range(getvariable('synthetic_community'))
+)
+SELECT
+    name,
+    'community' AS extension_type,
+    first_day,
+    CASE
+        WHEN hash(name || ':removed') % 20 = 0 THEN
+            first_day + CAST(
+                hash(name || ':lifetime') % (getvariable('synthetic_days') - first_day)
+                AS INTEGER
+            )
+        ELSE getvariable('synthetic_days') - 1
+    END AS last_day,
+    CAST(hash(name || ':stars') % 2000 AS INTEGER) AS base_stars,
+    CAST(hash(name || ':growth') % 4 AS INTEGER) AS star_growth,
+    CAST(hash(name || ':push') % 97 AS INTEGER) AS push_offset
+FROM community
+UNION ALL
+SELECT
+    'core_' || lpad(CAST(range AS VARCHAR), 3, '0'),
+    'core',
+    0,
+    getvariable('synthetic_days') - 1,
+    NULL,
+    NULL,
+    CAST(hash('core_' || range) % 97 AS INTEGER)
+FROM range(getvariable('synthetic_core'));
+
+-- Every extension's state on every run it was part of
+CREATE OR REPLACE TEMP TABLE synthetic_snapshots AS
+SELECT
+    r.day,
+    r.run_timestamp,
+    r.next_run_timestamp,
+    r.duckdb_version,
+    e.name,
+    e.extension_type,
+    e.first_day,
+    e.base_stars + e.star_growth * (r.day - e.first_day) AS stars,
+    (e.base_stars + e.star_growth * (r.day - e.first_day)) // 10 AS forks,
+    CAST((r.day + e.push_offset) % 120 AS INTEGER) AS days_since_update,
+    CASE
+        WHEN e.extension_type = 'core' THEN 'Stable'
+        WHEN hash(e.name || ':status:' || (r.day // 30)) % 40 = 0 THEN '❌ Error'
+        ELSE '✅ Active'
+    END AS status
+FROM synthetic_runs r
+JOIN synthetic_extensions e ON r.day BETWEEN e.first_day AND e.last_day;
+
+INSERT INTO analysis_runs (
+    run_timestamp, duckdb_version, script_version, total_core_extensions,
+    total_community_extensions, featured_extensions_count, notes
+)
+SELECT
+    r.run_timestamp,
+    r.duckdb_version,
+    'synthetic',
+    COUNT(*) FILTER (WHERE s.extension_type = 'core'),
+    COUNT(*) FILTER (WHERE s.extension_type = 'community'),
+    COUNT(*) FILTER (WHERE s.extension_type = 'community' AND hash(s.name) % 10 = 0),
+    'Synthetic benchmark history'
+FROM synthetic_runs r
+JOIN synthetic_snapshots s ON s.day = r.day
+GROUP BY r.run_timestamp, r.duckdb_version
+ORDER BY r.run_timestamp;
+
+INSERT INTO duckdb_releases (version, published_date, days_since_release, analysis_date)
+SELECT duckdb_version, MIN(run_timestamp), NULL, MAX(run_timestamp)
+FROM synthetic_runs
+GROUP BY duckdb_version;
+
+INSERT INTO core_extensions_history (
+    name, development_stage, status, last_updated_date, last_commit_date,
+    last_commit_sha, last_commit_message, repository, duckdb_version,
+    earliest_availability_date, available_platforms, analysis_date, valid_from,
+    valid_to
+)
+SELECT
+    name,
+    status,
+    '✅ Available',
+    run_timestamp - to_days(days_since_update),
+    run_timestamp - to_days(days_since_update),
+    md5(name || ':' || (day - days_since_update)),
+    'Synthetic commit',
+    'duckdb/duckdb',
+    duckdb_version,
+    CAST(getvariable('synthetic_start') AS TIMESTAMP),
+    getvariable('synthetic_platforms'),
+    run_timestamp,
+    run_timestamp,
+    next_run_timestamp
+FROM synthetic_snapshots
+WHERE extension_type = 'core';
+
+INSERT INTO community_extensions_history (
+    name, repository, status, last_push_date, last_push_days, stars, forks,
+    language, description, homepage, license, topics, archived, created_at,
+    updated_at, featured, github_url, community_repo_url, install_url,
+    duckdb_version, analysis_date, valid_from, valid_to
+)
+SELECT
+    name,
+    'synthetic/' || name,
+    status,
+    run_timestamp - to_days(days_since_update),
+    days_since_update,
+    stars,
+    forks,
+    'C++',
+    'Synthetic extension ' || name,
+    'https://example.com/' || name,
+    'MIT',
+    ['synthetic', 'benchmark'],
+    FALSE,
+    CAST(getvariable('synthetic_start') AS TIMESTAMP) + to_days(first_day),
+    run_timestamp - to_days(days_since_update),
+    hash(name) % 10 = 0,
+    'https://github.com/synthetic/' || name,
+    'https://duckdb.org/community_extensions/extensions/' || name,
+    'INSTALL ' || name || ' FROM community;',
+    duckdb_version,
+    run_timestamp,
+    run_timestamp,
+    next_run_timestamp
+FROM synthetic_snapshots
+WHERE extension_type = 'community';
+
+INSERT INTO extension_availability_history (
+    extension_name, extension_type, platform, duckdb_version, is_available,
+    availability_date, check_timestamp, http_status_code, file_size_bytes,
+    error_message, valid_from, valid_to
+)
+SELECT
+    s.name,
+    s.extension_type,
+    p.platform,
+    s.duckdb_version,
+    hash(s.name || ':' || p.platform || ':' || s.duckdb_version) % 13 <> 0,
+    s.run_timestamp - INTERVAL 1 DAY,
+    s.run_timestamp,
+    CASE
+        WHEN hash(s.name || ':' || p.platform || ':' || s.duckdb_version) % 13 <> 0
+            THEN 200
+        ELSE 404
+    END,
+    1000000 + CAST(hash(s.name || ':' || p.platform) % 9000000 AS BIGINT),
+    CASE
+        WHEN hash(s.name || ':' || p.platform || ':' || s.duckdb_version) % 13 = 0
+            THEN 'Not found'
+    END,
+    s.run_timestamp,
+    s.next_run_timestamp
+FROM synthetic_snapshots s,
+    (SELECT unnest(getvariable('synthetic_platforms')) AS platform) p;
+
+INSERT INTO extension_metrics_daily (
+    extension_name, extension_type, analysis_date, stars, forks,
+    days_since_update, status, is_active, is_archived, repository, valid_from,
+    valid_to
+)
+SELECT
+    name,
+    extension_type,
+    CAST(run_timestamp AS DATE),
+    stars,
+    forks,
+    days_since_update,
+    status,
+    days_since_update <= 30,
+    FALSE,
+    CASE WHEN extension_type = 'core' THEN 'duckdb/duckdb' ELSE 'synthetic/' || name END,
+    CAST(run_timestamp AS DATE),
+    CAST(next_run_timestamp AS DATE)
+FROM synthetic_snapshots;
+
+INSERT INTO extension_trends_summary (
+    analysis_date, total_extensions, core_count, community_count, active_30d,
+    active_7d, new_extensions_since_last, removed_extensions_since_last,
+    avg_days_since_update, total_stars, total_forks, archived_count
+)
+WITH removed AS (
+    SELECT e.last_day + 1 AS day, list(e.name ORDER BY e.name) AS names
+    FROM synthetic_extensions e
+    WHERE e.last_day < getvariable('synthetic_days') - 1
+    GROUP BY e.last_day
+)
+SELECT
+    CAST(s.run_timestamp AS DATE),
+    COUNT(*),
+    COUNT(*) FILTER (WHERE s.extension_type = 'core'),
+    COUNT(*) FILTER (WHERE s.extension_type = 'community'),
+    COUNT(*) FILTER (WHERE s.days_since_update <= 30),
+    COUNT(*) FILTER (WHERE s.days_since_update <= 7),
+    COALESCE(
+        list(s.name ORDER BY s.name) FILTER (WHERE s.first_day = s.day AND s.day > 0),
+        []
+    ),
+    COALESCE(ANY_VALUE(r.names), []),
+    AVG(s.days_since_update),
+    SUM(s.stars),
+    SUM(s.forks),
+    0
+FROM synthetic_snapshots s
+LEFT JOIN removed r ON r.day = s.day
+GROUP BY s.run_timestamp;
+
+INSERT INTO analysis_run_extensions (run_id, extension_name, extension_type, status)
+SELECT r.id, s.name, s.extension_type, s.status
+FROM synthetic_snapshots s
+JOIN analysis_runs r ON r.run_timestamp = s.run_timestamp;
+
+-- One issue for every twentieth extension, open for its first ninety days
+INSERT INTO github_issues_history (
+    issue_number, title, body, state, created_at, updated_at, closed_at, labels,
+    extension_names, platforms, issue_type, severity, html_url, analysis_date
+)
+WITH issues AS (
+    SELECT
+        name,
+        first_day,
+        CAST(row_number() OVER (ORDER BY name) AS INTEGER) AS issue_number,
+        getvariable('synthetic_platforms')[
+            CAST(hash(name || ':issue') % len(getvariable('synthetic_platforms')) AS INTEGER) + 1
+        ] AS platform
+    FROM synthetic_extensions
+    WHERE hash(name || ':issue') % 20 = 0
+)
+SELECT
+    i.issue_number,
+    'Cannot install ' || i.name || ' on ' || i.platform,
+    'Synthetic issue body for ' || i.name,
+    CASE WHEN s.day - i.first_day < 90 THEN 'open' ELSE 'closed' END,
+    CAST(getvariable('synthetic_start') AS TIMESTAMP) + to_days(i.first_day),
+    s.run_timestamp,
+    CASE
+        WHEN s.day - i.first_day >= 90 THEN
+            CAST(getvariable('synthetic_start') AS TIMESTAMP) + to_days(i.first_day + 90)
+    END,
+    ['bug', 'extension'],
+    [i.name],
+    [i.platform],
+    'installation',
+    'medium',
+    'https://github.com/duckdb/duckdb/issues/' || i.issue_number,
+    s.run_timestamp
+FROM issues i
+JOIN synthetic_snapshots s ON s.name = i.name;
+
+INSERT INTO extension_issues_mapping (
+    extension_name, extension_type, issue_number, relevance_score, analysis_date
+)
+SELECT
+    extension_names[1],
+    CASE WHEN extension_names[1] LIKE 'core_%' THEN 'core' ELSE 'community' END,
+    issue_number,
+    1.0,
+    analysis_date
+FROM github_issues_history;
+
+-- Weekly installation tests of every extension on every platform
+INSERT INTO installation_test_history (
+    extension_name, platform, success, installation_time_seconds,
+    load_time_seconds, error_message, error_type, duckdb_version,
+    test_timestamp, file_size_bytes, analysis_date, extension_version,
+    benchmark_runs, load_time_p50_seconds, load_time_p95_seconds,
+    rss_growth_bytes, functional_test_p50_seconds
+)
+SELECT
+    s.name,
+    p.platform,
+    hash(s.name || ':' || p.platform || ':' || s.duckdb_version) % 17 <> 0,
+    0.2 + (hash(s.name || ':' || s.day) % 300) / 1000.0,
+    0.01 + (hash(s.name || ':load:' || s.day) % 100) / 1000.0,
+    CASE
+        WHEN hash(s.name || ':' || p.platform || ':' || s.duckdb_version) % 17 = 0
+            THEN 'Extension failed to load'
+    END,
+    CASE
+        WHEN hash(s.name || ':' || p.platform || ':' || s.duckdb_version) % 17 = 0
+            THEN 'load'
+    END,
+    s.duckdb_version,
+    s.run_timestamp,
+    1000000 + CAST(hash(s.name || ':' || p.platform) % 9000000 AS BIGINT),
+    s.run_timestamp,
+    substr(md5(s.name || ':' || s.duckdb_version), 1, 7),
+    5,
+    0.01 + (hash(s.name || ':load:' || s.day) % 100) / 1000.0,
+    0.02 + (hash(s.name || ':load:' || s.day) % 100) / 500.0,
+    CAST(hash(s.name || ':rss') % 50000000 AS BIGINT),
+    0.001 + (hash(s.name || ':query:' || s.day) % 50) / 1000.0
+FROM synthetic_snapshots s,
+    (SELECT unnest(getvariable('synthetic_platforms')) AS platform) p
+WHERE s.day % 7 = 0;
+
+-- Search documents as of each extension's last run, with READMEs of a few
+-- hundred words drawn from a small vocabulary
+INSERT INTO extension_documents BY NAME
+WITH vocabulary AS (
+    SELECT [
+        'spatial', 'parquet', 'excel', 'http', 'json', 'vector', 'search',
+        'crypto', 'arrow', 'postgres', 'sqlite', 'geometry', 'timeseries',
+        'graph', 'text', 'compression', 'stream', 'embedding', 'regex', 'cloud'
+    ] AS words
+),
+readmes AS (
+    SELECT
+        e.name,
+        string_agg(
+            v.words[1 + CAST(hash(e.name || ':readme:' || w.range) % len(v.words) AS INTEGER)],
+            ' ' ORDER BY w.range
+        ) AS readme
+    FROM synthetic_extensions e, range(300) w, vocabulary v
+    GROUP BY e.name
+)
+SELECT
+    e.name AS extension_name,
+    e.extension_type,
+    'Synthetic extension ' || e.name AS description,
+    'Adds '
+        || v.words[1 + CAST(hash(e.name || ':topic') % len(v.words) AS INTEGER)]
+        || ' functions to DuckDB' AS repository_description,
+    CASE WHEN e.extension_type = 'community' THEN 'synthetic benchmark' END AS topics,
+    m.readme,
+    r.run_timestamp AS updated_at
+FROM synthetic_extensions e
+JOIN synthetic_runs r ON r.day = e.last_day
+JOIN readmes m ON m.name = e.name
+CROSS JOIN vocabulary v;
+
+DROP TABLE synthetic_snapshots;
+DROP TABLE synthetic_extensions;
+DROP TABLE synthetic_runs;
@@ -0,0 +1,32 @@
+-- Insert community extensions from the registered community_extension_rows relation
+-- Extensions with errors or no repository info only fill the identifying columns
+INSERT INTO community_extensions_history 
+(name, repository, status, last_push_date, last_push_days, stars, forks, 
+ language, description, improved_description, homepage, license, topics, archived, 
+ created_at, updated_at, featured, github_url, community_repo_url, install_url, 
+ duckdb_version, analysis_date, valid_from)
+SELECT
+    name,
+    CAST(repository AS VARCHAR),
+    status,
+    CAST(last_push_date AS TIMESTAMP),
+    CAST(last_push_days AS INTEGER),
+    CAST(stars AS INTEGER),
+    CAST(forks AS INTEGER),
+    CAST(language AS VARCHAR),
+    CAST(description AS TEXT),
+    CAST(improved_description AS TEXT),
+    CAST(homepage AS VARCHAR),
+    CAST(license AS VARCHAR),
+    CAST(topics AS VARCHAR[]),
+    CAST(archived AS BOOLEAN),
+    CAST(created_at AS TIMESTAMP),
+    CAST(updated_at AS TIMESTAMP),
+    CAST(featured AS BOOLEAN),
+    CAST(github_url AS VARCHAR),
+    CAST(community_repo_url AS VARCHAR),
+    CAST(install_url AS VARCHAR),
+    CAST(duckdb_version AS VARCHAR),
+    CAST(analysis_date AS TIMESTAMP),
+    CAST(analysis_date AS TIMESTAMP)
+FROM community_extension_rows;
@@ -1,6 +1,21 @@
--- Insert core extension into history table
+-- Insert core extensions into history table from the registered core_extension_rows relation
 INSERT INTO core_extensions_history 
 (name, development_stage, status, last_updated_date, last_commit_date, 
  last_commit_sha, last_commit_message, repository, duckdb_version, 
- platform_availability, earliest_availability_date, available_platforms, analysis_date)
-VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+ earliest_availability_date, available_platforms, analysis_date,
+ valid_from)
+SELECT
+    name,
+    development_stage,
+    status,
+    CAST(last_updated_date AS TIMESTAMP),
+    CAST(last_commit_date AS TIMESTAMP),
+    CAST(last_commit_sha AS VARCHAR),
+    CAST(last_commit_message AS VARCHAR),
+    repository,
+    CAST(duckdb_version AS VARCHAR),
+    CAST(earliest_availability_date AS TIMESTAMP),
+    CAST(available_platforms AS VARCHAR[]),
+    CAST(analysis_date AS TIMESTAMP),
+    CAST(analysis_date AS TIMESTAMP)
+FROM core_extension_rows;
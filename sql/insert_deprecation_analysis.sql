@@ -0,0 +1,14 @@
+INSERT OR REPLACE INTO deprecation_analysis_history (
+    extension_name,
+    repository,
+    repository_archived,
+    last_push,
+    analysis_date
+)
+SELECT
+    extension_name,
+    CAST(repository AS VARCHAR),
+    CAST(repository_archived AS BOOLEAN),
+    CAST(last_push AS TIMESTAMP),
+    CAST(analysis_date AS TIMESTAMP)
+FROM deprecation_analysis_rows;
@@ -0,0 +1,18 @@
+INSERT INTO deprecation_signals_history (
+    id,
+    extension_name,
+    indicator_class,
+    keyword,
+    source,
+    context,
+    analysis_date
+)
+SELECT
+    nextval('deprecation_signals_seq'),
+    extension_name,
+    indicator_class,
+    keyword,
+    source,
+    CAST(context AS TEXT),
+    CAST(analysis_date AS TIMESTAMP)
+FROM deprecation_signal_rows;
@@ -9,5 +9,20 @@ INSERT INTO extension_availability_history (
     http_status_code,
     file_size_bytes,
     error_message,
-    days_since_release
-) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
\ No newline at end of file
+    days_since_release,
+    valid_from
+)
+SELECT
+    extension_name,
+    extension_type,
+    platform,
+    CAST(duckdb_version AS VARCHAR),
+    CAST(is_available AS BOOLEAN),
+    CAST(availability_date AS TIMESTAMP),
+    CAST(check_timestamp AS TIMESTAMP),
+    CAST(http_status_code AS INTEGER),
+    CAST(file_size_bytes AS BIGINT),
+    CAST(error_message AS TEXT),
+    CAST(days_since_release AS INTEGER),
+    CAST(check_timestamp AS TIMESTAMP)
+FROM extension_availability_rows;
@@ -4,4 +4,11 @@ INSERT INTO extension_issues_mapping (
     issue_number,
     relevance_score,
     analysis_date
-) VALUES (?, ?, ?, ?, ?);
\ No newline at end of file
+)
+SELECT
+    extension_name,
+    extension_type,
+    CAST(issue_number AS INTEGER),
+    CAST(relevance_score AS DOUBLE),
+    CAST(analysis_date AS TIMESTAMP)
+FROM extension_issue_mapping_rows;
@@ -1,4 +1,4 @@
--- Insert or update extension metrics daily
+-- Insert or update extension metrics daily from the registered extension_metrics_rows relation
 INSERT INTO extension_metrics_daily (
     extension_name,
     extension_type,
@@ -9,8 +9,22 @@ INSERT INTO extension_metrics_daily (
     status,
     is_active,
     is_archived,
-    repository
-) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    repository,
+    valid_from
+)
+SELECT
+    extension_name,
+    extension_type,
+    CAST(analysis_date AS DATE),
+    CAST(stars AS INTEGER),
+    CAST(forks AS INTEGER),
+    CAST(days_since_update AS INTEGER),
+    CAST(status AS VARCHAR),
+    CAST(is_active AS BOOLEAN),
+    CAST(is_archived AS BOOLEAN),
+    CAST(repository AS VARCHAR),
+    CAST(analysis_date AS DATE)
+FROM extension_metrics_rows
 ON CONFLICT (extension_name, extension_type, analysis_date) 
 DO UPDATE SET
     stars = EXCLUDED.stars,
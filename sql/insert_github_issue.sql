@@ -13,4 +13,20 @@ INSERT INTO github_issues_history (
     severity,
     html_url,
     analysis_date
-) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
\ No newline at end of file
+)
+SELECT
+    CAST(issue_number AS INTEGER),
+    title,
+    CAST(body AS TEXT),
+    state,
+    CAST(created_at AS TIMESTAMP),
+    CAST(updated_at AS TIMESTAMP),
+    CAST(closed_at AS TIMESTAMP),
+    CAST(labels AS VARCHAR[]),
+    CAST(extension_names AS VARCHAR[]),
+    CAST(platforms AS VARCHAR[]),
+    issue_type,
+    severity,
+    html_url,
+    CAST(analysis_date AS TIMESTAMP)
+FROM github_issue_rows;
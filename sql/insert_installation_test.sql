@@ -8,8 +8,35 @@ INSERT INTO installation_test_history (
     error_message,
     error_type,
     duckdb_version,
-    test_timestamp
-) VALUES (
+    test_timestamp,
+    extension_version,
+    artifact_last_modified,
+    file_size_bytes,
+    extension_path,
+    benchmark_runs,
+    load_time_p50_seconds,
+    load_time_p95_seconds,
+    rss_growth_bytes,
+    functional_test_p50_seconds
+)
+SELECT
     nextval('installation_test_seq'),
-    $1, $2, $3, $4, $5, $6, $7, $8, $9
-);
+    extension_name,
+    platform,
+    CAST(success AS BOOLEAN),
+    CAST(installation_time_seconds AS DOUBLE),
+    CAST(load_time_seconds AS DOUBLE),
+    CAST(error_message AS TEXT),
+    CAST(error_type AS VARCHAR),
+    CAST(duckdb_version AS VARCHAR),
+    CAST(test_timestamp AS TIMESTAMP),
+    CAST(extension_version AS VARCHAR),
+    CAST(artifact_last_modified AS VARCHAR),
+    CAST(file_size_bytes AS BIGINT),
+    CAST(extension_path AS VARCHAR),
+    CAST(benchmark_runs AS INTEGER),
+    CAST(load_time_p50_seconds AS DOUBLE),
+    CAST(load_time_p95_seconds AS DOUBLE),
+    CAST(rss_growth_bytes AS BIGINT),
+    CAST(functional_test_p50_seconds AS DOUBLE)
+FROM installation_test_rows;
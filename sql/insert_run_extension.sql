@@ -0,0 +1,4 @@
+-- Insert a run's extension membership from the registered run_extension_rows relation
+INSERT INTO analysis_run_extensions (run_id, extension_name, extension_type, status)
+SELECT run_id, extension_name, extension_type, status
+FROM run_extension_rows;
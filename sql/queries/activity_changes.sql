@@ -1,5 +1,6 @@
 -- Get extensions that changed activity status recently
--- Parameter: {days} - number of days to look back
+-- Parameter: $days - number of days to look back
+-- Parameter: {rollup} - trend grain: '' (daily), '_weekly' or '_monthly'
 SELECT 
     extension_name,
     extension_type,
@@ -7,7 +8,7 @@ SELECT
     activity_change,
     is_active,
     days_since_update
-FROM v_extension_activity_trends
+FROM v_extension_activity_trends{rollup}
 WHERE activity_change != 'no_change'
-    AND analysis_date >= CURRENT_DATE - INTERVAL '{days} days'
+    AND analysis_date >= CURRENT_DATE - to_days(CAST($days AS INTEGER))
 ORDER BY analysis_date DESC;
@@ -1,4 +1,5 @@
 -- Get ecosystem growth trends over time
+-- Parameter: {rollup} - trend grain: '' (daily), '_weekly' or '_monthly'
 SELECT 
     analysis_date,
     total_extensions,
@@ -9,5 +10,5 @@ SELECT
     active_30d_delta,
     active_percentage,
     avg_days_since_update
-FROM v_ecosystem_growth
+FROM v_ecosystem_growth{rollup}
 ORDER BY analysis_date DESC;
@@ -0,0 +1,13 @@
+-- Latest stored compatibility result per DuckDB version and extension
+-- Parameter: $platform - platform the results were recorded on
+SELECT
+    duckdb_version,
+    extension_name,
+    success,
+    error_type,
+    extension_version,
+    artifact_last_modified,
+    benchmark_runs,
+    test_timestamp
+FROM latest_compatibility_results
+WHERE platform = $platform;
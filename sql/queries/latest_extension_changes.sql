@@ -0,0 +1,10 @@
+-- Get the extensions the latest analysis run added, removed or changed status of
+SELECT
+    change_type,
+    extension_type,
+    extension_name,
+    previous_status,
+    status,
+    run_timestamp
+FROM v_latest_extension_changes
+ORDER BY change_type, extension_type, extension_name;
@@ -1,5 +1,5 @@
 -- Get extensions first seen in the last N days
--- Parameter: {days} - number of days to look back
+-- Parameter: $days - number of days to look back
 SELECT 
     extension_name,
     extension_type,
@@ -8,5 +8,5 @@ SELECT
     repository,
     status
 FROM v_recent_extensions
-WHERE first_seen >= CURRENT_DATE - INTERVAL '{days} days'
+WHERE first_seen >= CURRENT_DATE - to_days(CAST($days AS INTEGER))
 ORDER BY first_seen DESC;
@@ -0,0 +1,20 @@
+-- Extensions ranked by BM25 relevance of their name, descriptions, topics and
+-- README to the search terms (needs the full-text index)
+-- Parameters: $search_terms - words to search for
+--             $row_limit - number of extensions to return
+SELECT
+    extension_name,
+    extension_type,
+    COALESCE(description, repository_description) AS description,
+    score
+FROM (
+    SELECT
+        *,
+        fts_main_extension_documents.match_bm25(
+            extension_name, CAST($search_terms AS VARCHAR)
+        ) AS score
+    FROM extension_documents
+)
+WHERE score IS NOT NULL
+ORDER BY score DESC, extension_name
+LIMIT $row_limit;
@@ -0,0 +1,31 @@
+-- Extensions ranked by how many search terms their name, descriptions,
+-- topics and README contain, for databases without the full-text index
+-- Parameters: $search_terms - words to search for
+--             $row_limit - number of extensions to return
+WITH terms AS (
+    SELECT DISTINCT unnest(
+        string_split_regex(lower(trim(CAST($search_terms AS VARCHAR))), '\s+')
+    ) AS term
+),
+scored AS (
+    SELECT
+        d.extension_name,
+        d.extension_type,
+        COALESCE(d.description, d.repository_description) AS description,
+        SUM(
+            3 * CAST(contains(lower(d.extension_name), t.term) AS INTEGER)
+            + 2 * CAST(contains(
+                lower(concat_ws(' ', d.description, d.repository_description, d.topics)),
+                t.term
+            ) AS INTEGER)
+            + CAST(contains(lower(COALESCE(d.readme, '')), t.term) AS INTEGER)
+        ) AS score
+    FROM extension_documents d, terms t
+    WHERE t.term <> ''
+    GROUP BY ALL
+)
+SELECT extension_name, extension_type, description, CAST(score AS DOUBLE) AS score
+FROM scored
+WHERE score > 0
+ORDER BY score DESC, extension_name
+LIMIT $row_limit;
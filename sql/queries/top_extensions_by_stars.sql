@@ -1,5 +1,5 @@
 -- Get top community extensions by stars
--- Parameter: {limit} - maximum number of results
+-- Parameter: $row_limit - maximum number of results
 SELECT 
     extension_name,
     extension_type,
@@ -11,4 +11,4 @@ SELECT
 FROM v_extension_popularity
 WHERE extension_type = 'community'
 ORDER BY popularity_rank
-LIMIT {limit};
+LIMIT $row_limit;
@@ -1,5 +1,6 @@
 -- Get extensions with highest star growth in recent period
--- Parameter: {limit} - maximum number of results
+-- Parameter: $row_limit - maximum number of results
+-- Parameter: {rollup} - trend grain: '' (daily), '_weekly' or '_monthly'
 WITH latest_trends AS (
     SELECT 
         extension_name,
@@ -7,11 +8,11 @@ WITH latest_trends AS (
         star_delta,
         stars,
         analysis_date
-    FROM v_extension_star_trends
+    FROM v_extension_star_trends{rollup}
     WHERE star_delta IS NOT NULL
         AND analysis_date >= CURRENT_DATE - INTERVAL '7 days'
     ORDER BY star_delta DESC
-    LIMIT {limit}
+    LIMIT $row_limit
 )
 SELECT * FROM latest_trends
 ORDER BY star_delta DESC;
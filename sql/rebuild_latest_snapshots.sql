@@ -0,0 +1,32 @@
+-- Rebuild the latest-state tables from the full history, e.g. after history
+-- was loaded in bulk instead of saved run by run
+DELETE FROM core_extensions_latest;
+
+INSERT INTO core_extensions_latest BY NAME
+SELECT DISTINCT ON (name) * EXCLUDE (valid_from, valid_to)
+FROM core_extensions_history
+ORDER BY name, analysis_date DESC, id DESC;
+
+DELETE FROM community_extensions_latest;
+
+INSERT INTO community_extensions_latest BY NAME
+SELECT DISTINCT ON (name) * EXCLUDE (valid_from, valid_to)
+FROM community_extensions_history
+ORDER BY name, analysis_date DESC, id DESC;
+
+DELETE FROM extension_metrics_latest;
+
+INSERT INTO extension_metrics_latest BY NAME
+SELECT DISTINCT ON (extension_name, extension_type)
+    extension_name,
+    extension_type,
+    analysis_date,
+    stars,
+    forks,
+    days_since_update,
+    status,
+    is_active,
+    is_archived,
+    repository
+FROM extension_metrics_daily
+ORDER BY extension_name, extension_type, analysis_date DESC;
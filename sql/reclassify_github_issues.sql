@@ -0,0 +1,62 @@
+-- Re-apply issue classification rules to all stored GitHub issues
+-- Requires a registered relation `issue_classification_rules`
+-- (rule_kind, category, priority, keyword) built from conf/issue_classification.toml.
+-- Mirrors IssueClassificationRules: first matching issue type wins, severity is
+-- decided by labels (in label order) before content, platforms collect all matches.
+UPDATE github_issues_history AS g
+SET
+    issue_type = c.issue_type,
+    severity = c.severity,
+    platforms = c.platforms
+FROM (
+    WITH issue_text AS (
+        SELECT id, lower(coalesce(title, '') || ' ' || coalesce(body, '')) AS text
+        FROM github_issues_history
+    ),
+    issue_labels AS (
+        SELECT
+            id,
+            lower(unnest(labels)) AS label,
+            generate_subscripts(labels, 1) AS label_position
+        FROM github_issues_history
+    ),
+    type_matches AS (
+        SELECT t.id, arg_min(r.category, r.priority) AS issue_type
+        FROM issue_text t
+        JOIN issue_classification_rules r
+            ON r.rule_kind = 'issue_type' AND contains(t.text, r.keyword)
+        GROUP BY t.id
+    ),
+    label_severity AS (
+        SELECT l.id, arg_min(r.category, [l.label_position, r.priority]) AS severity
+        FROM issue_labels l
+        JOIN issue_classification_rules r
+            ON r.rule_kind = 'severity_label' AND contains(l.label, r.keyword)
+        GROUP BY l.id
+    ),
+    content_severity AS (
+        SELECT t.id, arg_min(r.category, r.priority) AS severity
+        FROM issue_text t
+        JOIN issue_classification_rules r
+            ON r.rule_kind = 'severity_keyword' AND contains(t.text, r.keyword)
+        GROUP BY t.id
+    ),
+    platform_matches AS (
+        SELECT t.id, list(DISTINCT r.category ORDER BY r.category) AS platforms
+        FROM issue_text t
+        JOIN issue_classification_rules r
+            ON r.rule_kind = 'platform' AND contains(t.text, r.keyword)
+        GROUP BY t.id
+    )
+    SELECT
+        t.id,
+        coalesce(tm.issue_type, 'other') AS issue_type,
+        coalesce(ls.severity, cs.severity, 'medium') AS severity,
+        coalesce(pm.platforms, []::VARCHAR[]) AS platforms
+    FROM issue_text t
+    LEFT JOIN type_matches tm ON t.id = tm.id
+    LEFT JOIN label_severity ls ON t.id = ls.id
+    LEFT JOIN content_severity cs ON t.id = cs.id
+    LEFT JOIN platform_matches pm ON t.id = pm.id
+) AS c
+WHERE g.id = c.id;
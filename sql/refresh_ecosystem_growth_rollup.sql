@@ -0,0 +1,42 @@
+-- Recompute one period of ecosystem_growth_rollup from the period's last
+-- trend summary and the previous period's rollup row
+-- Parameters: $1 - 'week' or 'month'
+--             $2 - period start
+DELETE FROM ecosystem_growth_rollup
+WHERE period = $1 AND period_start = CAST($2 AS DATE);
+
+INSERT INTO ecosystem_growth_rollup BY NAME
+WITH period_end AS (
+    SELECT *
+    FROM extension_trends_summary
+    WHERE CAST(date_trunc($1, analysis_date) AS DATE) = CAST($2 AS DATE)
+    ORDER BY analysis_date DESC
+    LIMIT 1
+),
+prev AS (
+    SELECT *
+    FROM ecosystem_growth_rollup
+    WHERE period = $1 AND period_start < CAST($2 AS DATE)
+    ORDER BY period_start DESC
+    LIMIT 1
+)
+SELECT
+    $1 AS period,
+    CAST($2 AS DATE) AS period_start,
+    s.analysis_date AS last_analysis_date,
+    s.total_extensions,
+    s.core_count,
+    s.community_count,
+    s.active_30d,
+    s.active_7d,
+    s.avg_days_since_update,
+    s.total_stars,
+    p.total_extensions AS prev_total,
+    s.total_extensions - p.total_extensions AS total_delta,
+    p.community_count AS prev_community,
+    s.community_count - p.community_count AS community_delta,
+    p.active_30d AS prev_active_30d,
+    s.active_30d - p.active_30d AS active_30d_delta,
+    s.total_stars - p.total_stars AS stars_delta
+FROM period_end s
+LEFT JOIN prev p ON TRUE;
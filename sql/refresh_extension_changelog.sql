@@ -0,0 +1,11 @@
+-- Recompute the change log of a run and of every later run, whose previous
+-- runs may have changed if this run was saved out of order
+-- Parameter: $1 - analysis_runs.id of the saved run
+DELETE FROM extension_changelog
+WHERE run_timestamp >= (SELECT run_timestamp FROM analysis_runs WHERE id = $1);
+
+INSERT INTO extension_changelog
+SELECT *
+FROM extension_membership_changes(
+    (SELECT run_timestamp FROM analysis_runs WHERE id = $1), FALSE
+);
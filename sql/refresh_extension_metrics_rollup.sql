@@ -0,0 +1,53 @@
+-- Recompute one period of extension_metrics_rollup from the metrics valid on
+-- the period's last analysis day and the extensions' previous rollup rows
+-- Parameters: $1 - 'week' or 'month'
+--             $2 - period start
+DELETE FROM extension_metrics_rollup
+WHERE period = $1 AND period_start = CAST($2 AS DATE);
+
+INSERT INTO extension_metrics_rollup BY NAME
+WITH period_end AS (
+    SELECT MAX(analysis_date) AS last_analysis_date
+    FROM extension_metrics_snapshot_dates
+    WHERE CAST(date_trunc($1, analysis_date) AS DATE) = CAST($2 AS DATE)
+)
+SELECT
+    $1 AS period,
+    CAST($2 AS DATE) AS period_start,
+    m.extension_name,
+    m.extension_type,
+    m.analysis_date AS last_analysis_date,
+    m.stars,
+    prev_stars.stars AS prev_stars,
+    m.stars - prev_stars.stars AS star_delta,
+    m.forks,
+    m.days_since_update,
+    m.is_active,
+    prev.is_active AS prev_active,
+    CASE
+        WHEN m.is_active AND NOT COALESCE(prev.is_active, FALSE) THEN 'became_active'
+        WHEN NOT m.is_active AND COALESCE(prev.is_active, TRUE) THEN 'became_inactive'
+        ELSE 'no_change'
+    END AS activity_change
+FROM extension_metrics_as_of((SELECT last_analysis_date FROM period_end)) m
+LEFT JOIN LATERAL (
+    SELECT r.is_active
+    FROM extension_metrics_rollup r
+    WHERE r.period = $1
+        AND r.period_start < CAST($2 AS DATE)
+        AND r.extension_name = m.extension_name
+        AND r.extension_type = m.extension_type
+    ORDER BY r.period_start DESC
+    LIMIT 1
+) prev ON TRUE
+LEFT JOIN LATERAL (
+    SELECT r.stars
+    FROM extension_metrics_rollup r
+    WHERE r.period = $1
+        AND r.period_start < CAST($2 AS DATE)
+        AND r.extension_name = m.extension_name
+        AND r.extension_type = m.extension_type
+        AND r.stars IS NOT NULL
+    ORDER BY r.period_start DESC
+    LIMIT 1
+) prev_stars ON TRUE;
@@ -0,0 +1,7 @@
+-- Extensions a run added and removed since the last run of an earlier day
+-- Parameters: $1 - analysis_runs.id
+--             $2 - analysis date of the run
+SELECT change_type, list(extension_name ORDER BY extension_name)
+FROM extension_membership_changes(CAST(CAST($2 AS DATE) AS TIMESTAMP), TRUE)
+WHERE run_id = $1 AND change_type IN ('added', 'removed')
+GROUP BY change_type;
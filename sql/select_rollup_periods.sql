@@ -0,0 +1,11 @@
+-- Periods whose rollups a save on a given day affects: the day's period and
+-- every later one (their deltas depend on it), or every period while the
+-- rollups are still empty (first save after upgrading an existing database)
+-- Parameters: $1 - 'week' or 'month'
+--             $2 - analysis date
+SELECT DISTINCT CAST(date_trunc($1, analysis_date) AS DATE) AS period_start
+FROM extension_metrics_snapshot_dates
+WHERE analysis_date >= CAST(date_trunc($1, CAST($2 AS DATE)) AS DATE)
+    OR NOT EXISTS (SELECT 1 FROM extension_metrics_rollup WHERE period = $1)
+    OR NOT EXISTS (SELECT 1 FROM ecosystem_growth_rollup WHERE period = $1)
+ORDER BY period_start;
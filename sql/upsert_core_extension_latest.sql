@@ -0,0 +1,10 @@
+-- Refresh core_extensions_latest from the history rows of one analysis
+-- Parameter: $1 - analysis_date of the rows just saved
+-- Older snapshots (e.g. historical re-runs) never replace newer ones
+INSERT OR REPLACE INTO core_extensions_latest BY NAME
+SELECT DISTINCT ON (h.name) h.* EXCLUDE (valid_from, valid_to)
+FROM core_extensions_history h
+LEFT JOIN core_extensions_latest l ON l.name = h.name
+WHERE h.analysis_date = $1
+    AND (l.name IS NULL OR h.analysis_date >= l.analysis_date)
+ORDER BY h.name, h.id DESC;
@@ -0,0 +1,34 @@
+-- Upsert the search documents of one analysis from extension_document_rows
+-- Only documents whose text changed are written, so updated_at tells which
+-- documents a run changed. A run that did not fetch a README keeps the last
+-- one, and older snapshots (e.g. historical re-runs) never replace newer ones.
+INSERT OR REPLACE INTO extension_documents BY NAME
+WITH incoming AS (
+    SELECT
+        r.extension_name,
+        r.extension_type,
+        CAST(r.description AS TEXT) AS description,
+        CAST(r.repository_description AS TEXT) AS repository_description,
+        CAST(r.topics AS TEXT) AS topics,
+        COALESCE(CAST(r.readme AS TEXT), d.readme) AS readme,
+        CAST(r.updated_at AS TIMESTAMP) AS updated_at
+    FROM extension_document_rows r
+    LEFT JOIN extension_documents d ON d.extension_name = r.extension_name
+    WHERE d.extension_name IS NULL OR CAST(r.updated_at AS TIMESTAMP) >= d.updated_at
+)
+SELECT i.*
+FROM incoming i
+LEFT JOIN extension_documents d ON d.extension_name = i.extension_name
+WHERE (
+    d.extension_type,
+    d.description,
+    d.repository_description,
+    d.topics,
+    d.readme
+) IS DISTINCT FROM (
+    i.extension_type,
+    i.description,
+    i.repository_description,
+    i.topics,
+    i.readme
+);
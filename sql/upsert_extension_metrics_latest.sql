@@ -0,0 +1,20 @@
+-- Refresh extension_metrics_latest from one day's metrics
+-- Parameter: $1 - analysis_date of the metrics just saved
+INSERT OR REPLACE INTO extension_metrics_latest BY NAME
+SELECT
+    d.extension_name,
+    d.extension_type,
+    d.analysis_date,
+    d.stars,
+    d.forks,
+    d.days_since_update,
+    d.status,
+    d.is_active,
+    d.is_archived,
+    d.repository
+FROM extension_metrics_daily d
+LEFT JOIN extension_metrics_latest l
+    ON l.extension_name = d.extension_name
+    AND l.extension_type = d.extension_type
+WHERE d.analysis_date = $1
+    AND (l.extension_name IS NULL OR d.analysis_date >= l.analysis_date);
@@ -11,6 +11,7 @@ from .github_api import GitHubAPIClient
 from .core_analyzer import CoreExtensionAnalyzer
 from .community_analyzer import CommunityExtensionAnalyzer
 from .database_manager import DatabaseManager
+from .extension_queries import ExtensionQueries
 from .report_generator import ReportGenerator
 
 __all__ = [
@@ -19,5 +20,6 @@ __all__ = [
     "CoreExtensionAnalyzer",
     "CommunityExtensionAnalyzer",
     "DatabaseManager",
+    "ExtensionQueries",
     "ReportGenerator",
 ]
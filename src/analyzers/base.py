@@ -46,6 +46,7 @@ class AnalysisResult:
     github_issues: Optional[List[Any]] = None  # GitHub issues related to extensions
     installation_results: Optional[List[Any]] = None  # Installation test results
     trend_data: Optional[Dict[str, Any]] = None  # Historical trend metrics
+    report_timings: Optional[Dict[str, float]] = None  # Seconds per report format
 
     def __post_init__(self):
         if self.analysis_timestamp is None:
@@ -63,7 +63,13 @@ class CommunityExtensionAnalyzer(BaseAnalyzer):
         # Optional installation tester for the legacy (v1.3/v1.4) compatibility codepath
         # in this analyser (separate from the orchestrator-wide multi-version matrix).
         self.installation_tester = (
-            InstallationTester() if enable_compatibility_testing else None
+            InstallationTester(
+                env_cache_dir=config.cache_dir / "installation_envs"
+                if hasattr(config, "cache_dir")
+                else None
+            )
+            if enable_compatibility_testing
+            else None
         )
 
         # Caches for official extensions list and compatibility helpers.
@@ -377,6 +383,9 @@ class CommunityExtensionAnalyzer(BaseAnalyzer):
                     "repository_archived": deprecation_result.get(
                         "repository_archived", False
                     ),
+                    "repository": deprecation_result.get("repository"),
+                    "last_push": deprecation_result.get("last_push"),
+                    "readme_content": deprecation_result.get("readme_content"),
                     "analysis_timestamp": deprecation_result.get("analysis_timestamp"),
                 }
             else:
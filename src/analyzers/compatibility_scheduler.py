@@ -0,0 +1,164 @@
+"""
+Change-Driven Scheduling for the DuckDB Extensions Compatibility Matrix.
+
+Ranks (DuckDB version, extension) pairs by what changed since their last
+stored test result, so a fixed runtime budget is spent on pairs whose outcome
+may have changed and the whole ecosystem is covered over a few runs.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class CompatibilityCandidate:
+    """A (DuckDB version, extension) pair that could be tested."""
+
+    duckdb_version: str
+    extension_name: str
+    extension_type: str = "core"
+    extension_version: Optional[str] = None
+    artifact_last_modified: Optional[str] = None
+
+
+@dataclass
+class ScheduledTest:
+    """A candidate selected for testing, with the reasons it was selected."""
+
+    candidate: CompatibilityCandidate
+    reasons: List[str] = field(default_factory=list)
+    last_tested: Optional[datetime] = None
+
+
+class CompatibilityScheduler:
+    """Selects and orders compatibility tests from the last stored results."""
+
+    # Higher priority reasons are tested first.
+    REASON_PRIORITY = {
+        "new_artifact": 5,
+        "new_extension_version": 5,
+        "untested": 4,
+        "previous_failure": 3,
+        "not_benchmarked": 2,
+        "stale_result": 1,
+    }
+
+    def __init__(
+        self,
+        max_result_age_days: Optional[int] = None,
+        require_benchmark: bool = False,
+    ):
+        """
+        Args:
+            max_result_age_days: Re-test unchanged passing pairs whose last result
+                is older than this; None never re-tests them
+            require_benchmark: Re-test unchanged passing pairs whose last result
+                has no load-performance benchmark
+        """
+        self.max_result_age_days = max_result_age_days
+        self.require_benchmark = require_benchmark
+
+    def reasons(
+        self,
+        candidate: CompatibilityCandidate,
+        last_result: Optional[Dict[str, Any]],
+        now: datetime,
+    ) -> List[str]:
+        """Get why a candidate needs testing; an empty list means it can be skipped."""
+        if last_result is None:
+            return ["untested"]
+
+        reasons = []
+        if (
+            candidate.artifact_last_modified
+            and candidate.artifact_last_modified
+            != last_result.get("artifact_last_modified")
+        ):
+            reasons.append("new_artifact")
+        if (
+            candidate.extension_version
+            and candidate.extension_version != last_result.get("extension_version")
+        ):
+            reasons.append("new_extension_version")
+        if not last_result.get("success"):
+            reasons.append("previous_failure")
+        elif self.require_benchmark and last_result.get("benchmark_runs") is None:
+            reasons.append("not_benchmarked")
+
+        last_tested = last_result.get("test_timestamp")
+        if (
+            not reasons
+            and self.max_result_age_days is not None
+            and last_tested is not None
+            and now - last_tested > timedelta(days=self.max_result_age_days)
+        ):
+            reasons.append("stale_result")
+        return reasons
+
+    def schedule(
+        self,
+        candidates: List[CompatibilityCandidate],
+        last_results: Dict[Tuple[str, str], Dict[str, Any]],
+        *,
+        max_community_extensions: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> Tuple[List[ScheduledTest], List[CompatibilityCandidate]]:
+        """
+        Rank candidates by what changed since their last result.
+
+        Args:
+            candidates: Pairs that could be tested
+            last_results: Latest stored result per (duckdb_version, extension_name)
+            max_community_extensions: Cap on distinct community extensions
+                scheduled per run, picked in rank order
+            now: Reference time for stale results (defaults to now)
+
+        Returns:
+            (scheduled tests in priority order, unchanged passing candidates skipped)
+        """
+        now = now or datetime.now()
+        scheduled: List[ScheduledTest] = []
+        unchanged: List[CompatibilityCandidate] = []
+
+        for candidate in candidates:
+            last_result = last_results.get(
+                (candidate.duckdb_version, candidate.extension_name)
+            )
+            reasons = self.reasons(candidate, last_result, now)
+            if not reasons:
+                unchanged.append(candidate)
+                continue
+            scheduled.append(
+                ScheduledTest(
+                    candidate=candidate,
+                    reasons=reasons,
+                    last_tested=last_result.get("test_timestamp")
+                    if last_result
+                    else None,
+                )
+            )
+
+        # Most important change first, then the most changes, then the pair
+        # that has waited longest; ties keep the input order.
+        scheduled.sort(
+            key=lambda test: (
+                -max(self.REASON_PRIORITY[r] for r in test.reasons),
+                -len(test.reasons),
+                test.last_tested or datetime.min,
+            )
+        )
+
+        if max_community_extensions is not None:
+            allowed = set()
+            capped = []
+            for test in scheduled:
+                name = test.candidate.extension_name
+                if test.candidate.extension_type == "community" and name not in allowed:
+                    if len(allowed) >= max_community_extensions:
+                        continue
+                    allowed.add(name)
+                capped.append(test)
+            scheduled = capped
+
+        return scheduled, unchanged
@@ -4,14 +4,20 @@ Database Manager for DuckDB Extensions Analysis.
 Handles database schema creation and data persistence for analysis results.
 """
 
-from datetime import datetime
+from dataclasses import replace
+import re
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import duckdb
+import pandas as pd
 from loguru import logger
 
 from .base import BaseDatabaseManager, AnalysisResult
+from .history_archive import HistoryArchive
+from .issue_classification import IssueClassificationRules
+from .query_pool import QueryConnectionPool
 
 
 class DatabaseManager(BaseDatabaseManager):
@@ -22,6 +28,17 @@ class DatabaseManager(BaseDatabaseManager):
         self.database_path = config.database_path
         self.sql_dir = Path(config.project_root) / "sql"
         self._sql_cache: Dict[str, str] = {}
+        self.archive_dir = Path(
+            getattr(config, "archive_dir", Path(self.database_path).parent / "archive")
+        )
+        self.history_mode = getattr(config, "history_mode", "snapshot")
+        if self.history_mode not in self.HISTORY_MODES:
+            raise ValueError(
+                f"Unknown history mode: {self.history_mode} "
+                f"(expected one of {', '.join(self.HISTORY_MODES)})"
+            )
+        # Set once this process has brought the database schema up to date
+        self._schema_ready = False
 
     def _load_sql(self, filename: str) -> str:
         """Load SQL query from file, with caching."""
@@ -38,50 +55,194 @@ class DatabaseManager(BaseDatabaseManager):
         self._sql_cache[filename] = sql
         return sql
 
+    # Ordered schema migrations; the numeric prefix of each file is its version.
+    SCHEMA_MIGRATIONS = [
+        "01_sequences.sql",
+        "02_core_extensions_history.sql",
+        "03_community_extensions_history.sql",
+        "04_views.sql",
+        "05_duckdb_releases.sql",
+        "06_analysis_runs.sql",
+        "07_indexes.sql",
+        "08_extension_availability_history.sql",
+        "09_availability_views.sql",
+        "10_github_issues_history.sql",
+        "11_github_issues_views.sql",
+        "12_installation_test_history.sql",
+        "13_installation_test_views.sql",
+        "14_extension_trends_summary.sql",
+        "15_extension_metrics_daily.sql",
+        "16_trends_views.sql",
+        "17_duckdb_releases_enhancement.sql",
+        "18_deprecation_signals.sql",
+        "19_deprecation_views.sql",
+        "20_compatibility_schedule.sql",
+        "21_load_benchmarks.sql",
+        "22_latest_snapshots.sql",
+        "23_change_history.sql",
+        "24_typed_platform_availability.sql",
+        "25_drop_platform_availability_json.sql",
+        "26_trend_rollups.sql",
+        "27_extension_changelog.sql",
+        "28_extension_search.sql",
+    ]
+
+    HISTORY_MODES = ("snapshot", "changes")
+
+    # Trend rollup grains, as date_trunc() parts
+    ROLLUP_PERIODS = ("week", "month")
+    ROLLUP_REFRESH_SQL = (
+        "refresh_extension_metrics_rollup.sql",
+        "refresh_ecosystem_growth_rollup.sql",
+    )
+
+    # History tables with validity intervals. Key columns identify an entity
+    # within the table; a run changes an entity when any tracked column (or
+    # expression over table alias {t}) differs from its current version.
+    # Extensions are only compared within the scope column's values the run
+    # wrote, so e.g. a community-only run leaves core versions open.
+    VERSIONED_HISTORY_TABLES = {
+        "core_extensions_history": {
+            "key": ["name"],
+            "tracked": [
+                "development_stage",
+                "status",
+                "last_updated_date",
+                "last_commit_date",
+                "last_commit_sha",
+                "last_commit_message",
+                "repository",
+                "duckdb_version",
+                "earliest_availability_date",
+                "available_platforms",
+            ],
+        },
+        "community_extensions_history": {
+            "key": ["name"],
+            # last_push_days only ages; as-of queries derive it from last_push_date
+            "tracked": [
+                "repository",
+                "status",
+                "last_push_date",
+                "stars",
+                "forks",
+                "language",
+                "description",
+                "improved_description",
+                "homepage",
+                "license",
+                "topics",
+                "archived",
+                "created_at",
+                "updated_at",
+                "featured",
+                "github_url",
+                "community_repo_url",
+                "install_url",
+                "duckdb_version",
+            ],
+        },
+        "extension_availability_history": {
+            "key": ["extension_name", "platform", "duckdb_version"],
+            "tracked": [
+                "extension_type",
+                "is_available",
+                "availability_date",
+                "http_status_code",
+                "file_size_bytes",
+                "error_message",
+            ],
+            "scope": "extension_type",
+        },
+        "extension_metrics_daily": {
+            "key": ["extension_name", "extension_type"],
+            # days_since_update ages daily; compare the update date it implies
+            "tracked": [
+                "stars",
+                "forks",
+                "status",
+                "is_active",
+                "is_archived",
+                "repository",
+                "{t}.valid_from - {t}.days_since_update",
+            ],
+            "by_date": True,
+        },
+    }
+
+    @classmethod
+    def _migration_version(cls, filename: str) -> int:
+        return int(filename.split("_", 1)[0])
+
+    @property
+    def schema_version(self) -> int:
+        """Latest schema version known to this code."""
+        return self._migration_version(self.SCHEMA_MIGRATIONS[-1])
+
     def create_schema(self) -> None:
-        """Create the database schema for storing extension data with proper historical tracking."""
-        self.config.ensure_directories()
+        """Create or upgrade the database schema with proper historical tracking."""
+        conn = self._connect()
+        conn.close()
 
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        """Open a connection to a database whose schema is up to date."""
+        self.config.ensure_directories()
         conn = duckdb.connect(str(self.database_path))
         try:
-            logger.info("Creating database schema with historical tracking")
-
-            # Execute schema creation SQL files in order
-            schema_files = [
-                "01_sequences.sql",
-                "02_core_extensions_history.sql",
-                "03_community_extensions_history.sql",
-                "04_views.sql",
-                "05_duckdb_releases.sql",
-                "06_analysis_runs.sql",
-                "07_indexes.sql",
-                "08_extension_availability_history.sql",
-                "09_availability_views.sql",
-                "10_github_issues_history.sql",
-                "11_github_issues_views.sql",
-                "12_installation_test_history.sql",
-                "13_installation_test_views.sql",
-                "14_extension_trends_summary.sql",
-                "15_extension_metrics_daily.sql",
-                "16_trends_views.sql",
-                "17_duckdb_releases_enhancement.sql",
-            ]
-
-            for sql_file in schema_files:
-                try:
-                    sql = self._load_sql(sql_file)
-                    # Execute the complete SQL file content
-                    if sql.strip():
-                        conn.execute(sql)
-                    logger.debug(f"Successfully executed {sql_file}")
-                except Exception as e:
-                    logger.error(f"Failed to execute {sql_file}: {e}")
-                    raise
+            self._migrate(conn)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def _migrate(self, conn: duckdb.DuckDBPyConnection) -> int:
+        """Apply schema migrations the database has not seen yet.
+
+        Each migration runs in its own transaction together with its
+        ``schema_migrations`` row, so an interrupted upgrade resumes at the
+        first migration that did not commit. Databases created before version
+        tracking re-run every file once; the schema files are idempotent.
+
+        Returns:
+            Number of migrations applied
+        """
+        if self._schema_ready:
+            return 0
+
+        conn.execute(self._load_sql("00_schema_migrations.sql"))
+        current = conn.execute(
+            "SELECT COALESCE(MAX(version), 0) FROM schema_migrations"
+        ).fetchone()[0]
+
+        pending = [
+            sql_file
+            for sql_file in self.SCHEMA_MIGRATIONS
+            if self._migration_version(sql_file) > current
+        ]
+        if pending:
+            logger.info(
+                f"Migrating database schema from version {current} to {self.schema_version}"
+            )
 
-            logger.info("Database schema created successfully with historical tracking")
+        for sql_file in pending:
+            conn.begin()
+            try:
+                sql = self._load_sql(sql_file)
+                if sql.strip():
+                    conn.execute(sql)
+                conn.execute(
+                    "INSERT INTO schema_migrations (version, filename) VALUES (?, ?)",
+                    [self._migration_version(sql_file), sql_file],
+                )
+                conn.commit()
+                logger.debug(f"Successfully applied {sql_file}")
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"Failed to apply {sql_file}: {e}")
+                raise
 
-        finally:
-            conn.close()
+        self._schema_ready = True
+        return len(pending)
 
     def _parse_date_string(self, date_str: Optional[str]) -> Optional[datetime]:
         """Parse ISO date string to datetime object."""
@@ -92,86 +253,280 @@ class DatabaseManager(BaseDatabaseManager):
         except (ValueError, TypeError):
             return None
 
+    # Parts of a run in the order they are written. Each stage only reads the
+    # stages before it, so stages can be written as soon as they are analysed.
+    SAVE_STAGES = (
+        "core_extensions",
+        "community_extensions",
+        "github_issues",
+        "installation_results",
+        "summary",
+    )
+
     async def save_analysis(self, analysis_result: AnalysisResult) -> None:
         """Save analysis results to DuckDB database."""
         logger.info(f"Saving analysis results to database: {self.database_path}")
 
-        # Ensure schema exists
-        self.create_schema()
-
-        conn = duckdb.connect(str(self.database_path))
+        # One connection and one transaction per run, so a failed save leaves
+        # no partial snapshot behind
+        conn = self._connect()
         try:
-            # Insert/update DuckDB release info
-            if analysis_result.duckdb_version and analysis_result.duckdb_release_date:
-                days_since_release = (
-                    analysis_result.analysis_timestamp.replace(tzinfo=None)
-                    - analysis_result.duckdb_release_date.replace(tzinfo=None)
-                ).days
-                sql = self._load_sql("insert_duckdb_release.sql")
-                conn.execute(
-                    sql,
-                    [
-                        analysis_result.duckdb_version,
-                        analysis_result.duckdb_release_date,
-                        days_since_release,
-                        analysis_result.analysis_timestamp,
-                    ],
+            conn.begin()
+            for stage in self.SAVE_STAGES:
+                self.write_stage(
+                    conn, stage, self.stage_result(analysis_result, stage)
                 )
+            conn.commit()
+            logger.info(
+                f"Successfully saved {len(analysis_result.core_extensions)} core extensions and {len(analysis_result.community_extensions)} community extensions to database"
+            )
+
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def stage_result(analysis_result: AnalysisResult, stage: str) -> AnalysisResult:
+        """Restrict a result to what one save stage writes.
+
+        The extension stages each see only their own extensions; later stages
+        see everything written before them.
+        """
+        if stage == "core_extensions":
+            return replace(analysis_result, community_extensions=[])
+        if stage == "community_extensions":
+            return replace(analysis_result, core_extensions=[])
+        return analysis_result
 
-            # Insert analysis run record
-            sql = self._load_sql("insert_analysis_run.sql")
+    def write_stage(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        stage: str,
+        analysis_result: AnalysisResult,
+    ) -> None:
+        """Write one stage of a run inside the caller's transaction."""
+        if stage == "core_extensions":
+            # Insert core extensions (into history table for proper versioning)
+            self._save_core_extensions(conn, analysis_result)
+            self._refresh_latest(
+                conn,
+                "upsert_core_extension_latest.sql",
+                analysis_result.analysis_timestamp,
+            )
+            self._save_extension_availability(conn, analysis_result)
+            self._save_extension_documents(conn, analysis_result)
+
+        elif stage == "community_extensions":
+            self._save_community_extensions(conn, analysis_result)
+            self._refresh_latest(
+                conn,
+                "upsert_community_extension_latest.sql",
+                analysis_result.analysis_timestamp,
+            )
+            self._save_extension_availability(conn, analysis_result)
+            # Insert raw deprecation signals for SQL-side scoring
+            self._save_deprecation_signals(conn, analysis_result)
+            self._save_extension_documents(conn, analysis_result)
+
+        elif stage == "github_issues":
+            if analysis_result.github_issues:
+                self._save_github_issues(conn, analysis_result)
+
+        elif stage == "installation_results":
+            if analysis_result.installation_results:
+                self._save_installation_results(conn, analysis_result)
+
+        elif stage == "summary":
+            self._save_run_summary(conn, analysis_result)
+            self._reconcile_history(conn, analysis_result)
+            # Rollups read the reconciled metric versions
+            self._refresh_rollups(
+                conn, self._naive_utc(analysis_result.analysis_timestamp).date()
+            )
+            self._refresh_search_index(conn, analysis_result.analysis_timestamp)
+
+        else:
+            raise ValueError(f"Unknown save stage: {stage}")
+
+    def _save_run_summary(
+        self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
+    ) -> None:
+        """Save the release, run record and trend data of a complete run."""
+        # Insert/update DuckDB release info
+        if analysis_result.duckdb_version and analysis_result.duckdb_release_date:
+            days_since_release = (
+                analysis_result.analysis_timestamp.replace(tzinfo=None)
+                - analysis_result.duckdb_release_date.replace(tzinfo=None)
+            ).days
+            sql = self._load_sql("insert_duckdb_release.sql")
             conn.execute(
                 sql,
                 [
-                    analysis_result.analysis_timestamp,
                     analysis_result.duckdb_version,
-                    self.config.version_full,
-                    len(analysis_result.core_extensions),
-                    len(analysis_result.community_extensions),
-                    0,  # featured_count (deprecated)
-                    "Enhanced schema with CE metadata integration and deprecation analysis",
+                    analysis_result.duckdb_release_date,
+                    days_since_release,
+                    analysis_result.analysis_timestamp,
                 ],
             )
 
-            # Insert core extensions (into history table for proper versioning)
-            await self._save_core_extensions(conn, analysis_result)
+        # Insert analysis run record
+        sql = self._load_sql("insert_analysis_run.sql")
+        run_id = conn.execute(
+            sql,
+            [
+                analysis_result.analysis_timestamp,
+                analysis_result.duckdb_version,
+                self.config.version_full,
+                len(analysis_result.core_extensions),
+                len(analysis_result.community_extensions),
+                0,  # featured_count (deprecated)
+                "Enhanced schema with CE metadata integration and deprecation analysis",
+            ],
+        ).fetchone()[0]
 
-            # Insert community extensions
-            await self._save_community_extensions(conn, analysis_result)
+        # Calculate and save trend data
+        self._save_trend_data(conn, analysis_result, run_id)
 
-            # Insert extension availability history
-            await self._save_extension_availability(conn, analysis_result)
+    def _reconcile_history(
+        self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
+    ) -> None:
+        """Close the versions a run superseded in each versioned history table.
+
+        Rows of a run saved out of order end where the next later run begins.
+        In "changes" history mode, rows the run wrote for unchanged extensions
+        are dropped again, so only changes are stored.
+        """
+        changes_only = self.history_mode == "changes"
+        run_timestamp = self._naive_utc(analysis_result.analysis_timestamp)
+
+        for table, spec in self.VERSIONED_HISTORY_TABLES.items():
+            valid_from = run_timestamp.date() if spec.get("by_date") else run_timestamp
+            same_key = " AND ".join(f"n.{c} = o.{c}" for c in spec["key"])
+            same_tracked = "ROW({}) IS NOT DISTINCT FROM ROW({})".format(
+                *(
+                    ", ".join(
+                        c.format(t=alias) if "{t}" in c else f"{alias}.{c}"
+                        for c in spec["tracked"]
+                    )
+                    for alias in ("n", "o")
+                )
+            )
+            if spec.get("scope"):
+                scope = (
+                    f"o.{spec['scope']} IN (SELECT {spec['scope']} FROM {table} "
+                    "WHERE valid_from = $1)"
+                )
+                same_scope = f"AND x.{spec['scope']} = n.{spec['scope']}"
+            else:
+                scope = f"EXISTS (SELECT 1 FROM {table} WHERE valid_from = $1)"
+                same_scope = ""
 
-            # Insert GitHub issues if available
-            if (
-                hasattr(analysis_result, "github_issues")
-                and analysis_result.github_issues
-            ):
-                await self._save_github_issues(conn, analysis_result)
+            conn.execute(
+                self._load_sql("close_superseded_versions.sql").format(
+                    table=table,
+                    scope=scope,
+                    same_key=same_key,
+                    same_tracked=same_tracked,
+                ),
+                [valid_from, changes_only],
+            )
+            if changes_only:
+                conn.execute(
+                    self._load_sql("drop_unchanged_versions.sql").format(
+                        table=table, same_key=same_key
+                    ),
+                    [valid_from],
+                )
+            conn.execute(
+                self._load_sql("close_backfilled_versions.sql").format(
+                    table=table, same_scope=same_scope
+                ),
+                [valid_from],
+            )
 
-            # Insert installation test results if available
-            if (
-                hasattr(analysis_result, "installation_results")
-                and analysis_result.installation_results
-            ):
-                await self._save_installation_results(conn, analysis_result)
+    def _refresh_rollups(self, conn: duckdb.DuckDBPyConnection, analysis_date) -> None:
+        """Recompute the weekly and monthly rollup periods a save affected.
 
-            # Calculate and save trend data
-            await self._save_trend_data(conn, analysis_result)
+        Normally that is just the period containing the analysis date; older
+        (backfilled) dates also refresh the later periods whose deltas they
+        feed, and empty rollups are built from all history.
+        """
+        for period in self.ROLLUP_PERIODS:
+            period_starts = conn.execute(
+                self._load_sql("select_rollup_periods.sql"), [period, analysis_date]
+            ).fetchall()
+            for (period_start,) in period_starts:
+                for sql_file in self.ROLLUP_REFRESH_SQL:
+                    self._execute_script(conn, sql_file, [period, period_start])
 
-            logger.info(
-                f"Successfully saved {len(analysis_result.core_extensions)} core extensions and {len(analysis_result.community_extensions)} community extensions to database"
-            )
+    def _execute_script(
+        self, conn: duckdb.DuckDBPyConnection, sql_file: str, params: List[Any]
+    ) -> None:
+        """Run each statement of a SQL file with the same parameters.
 
+        DuckDB only binds parameters for a single statement per execute.
+        """
+        for statement in duckdb.extract_statements(self._load_sql(sql_file)):
+            conn.execute(statement.query, params)
+
+    def _insert_rows(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        sql_file: str,
+        relation: str,
+        columns: List[str],
+        rows: List[tuple],
+        key_columns: Optional[List[str]] = None,
+    ) -> int:
+        """Insert rows with a single INSERT ... SELECT from a registered DataFrame.
+
+        ``sql_file`` selects from ``relation``. DuckDB is columnar, so one
+        set-based insert per table is far cheaper than one ``execute`` per row.
+
+        Args:
+            key_columns: The ``ON CONFLICT`` key of an upsert. DuckDB rejects
+                an upsert that touches the same key twice, so only the last
+                row for each key is inserted.
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        frame = pd.DataFrame(
+            [tuple(self._naive_utc(value) for value in row) for row in rows],
+            columns=columns,
+        )
+        if key_columns:
+            frame = frame.drop_duplicates(subset=key_columns, keep="last")
+        conn.register(relation, frame)
+        try:
+            conn.execute(self._load_sql(sql_file))
         finally:
-            conn.close()
+            conn.unregister(relation)
+        return len(frame)
 
-    async def _save_core_extensions(
+    def _refresh_latest(
+        self, conn: duckdb.DuckDBPyConnection, sql_file: str, analysis_date: Any
+    ) -> None:
+        """Upsert a latest-state table from the history rows just saved."""
+        conn.execute(self._load_sql(sql_file), [self._naive_utc(analysis_date)])
+
+    @staticmethod
+    def _naive_utc(value: Any) -> Any:
+        """Convert timezone-aware datetimes to naive UTC so columns have one type."""
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def _save_core_extensions(
         self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
     ) -> None:
         """Save core extensions to database."""
-        import json
-
+        rows = []
         for ext in analysis_result.core_extensions:
             last_commit_date = None
             last_commit_sha = None
@@ -185,25 +540,12 @@ class DatabaseManager(BaseDatabaseManager):
                 last_commit_sha = ext.metadata.get("last_commit_sha")
                 last_commit_message = ext.metadata.get("last_commit_message")
 
-            # Prepare platform availability data
-            platform_availability_json = None
+            # Per-platform details are saved to extension_availability_history;
+            # the core row keeps a typed summary
             earliest_availability_date = None
             available_platforms = []
 
             if ext.platform_availability:
-                # Convert datetime objects to ISO strings for JSON serialization
-                serializable_platform_data = {}
-                for platform, info in ext.platform_availability.items():
-                    serializable_info = dict(info)
-                    if "date" in serializable_info and isinstance(
-                        serializable_info["date"], datetime
-                    ):
-                        serializable_info["date"] = serializable_info[
-                            "date"
-                        ].isoformat()
-                    serializable_platform_data[platform] = serializable_info
-
-                platform_availability_json = json.dumps(serializable_platform_data)
                 available_dates = []
 
                 for platform, info in ext.platform_availability.items():
@@ -221,10 +563,8 @@ class DatabaseManager(BaseDatabaseManager):
                 if available_dates:
                     earliest_availability_date = min(available_dates)
 
-            sql = self._load_sql("insert_core_extension.sql")
-            conn.execute(
-                sql,
-                [
+            rows.append(
+                (
                     ext.name,
                     ext.stage or "Stable",
                     "✅ Ongoing",
@@ -234,18 +574,42 @@ class DatabaseManager(BaseDatabaseManager):
                     last_commit_message,
                     ext.repository or f"{self.config.duckdb_repo}",
                     analysis_result.duckdb_version,
-                    platform_availability_json,
                     earliest_availability_date,
                     available_platforms,
                     analysis_result.analysis_timestamp,
-                ],
+                )
             )
 
-    async def _save_community_extensions(
+        self._insert_rows(
+            conn,
+            "insert_core_extension.sql",
+            "core_extension_rows",
+            [
+                "name",
+                "development_stage",
+                "status",
+                "last_updated_date",
+                "last_commit_date",
+                "last_commit_sha",
+                "last_commit_message",
+                "repository",
+                "duckdb_version",
+                "earliest_availability_date",
+                "available_platforms",
+                "analysis_date",
+            ],
+            rows,
+        )
+
+    def _save_community_extensions(
         self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
     ) -> None:
         """Save community extensions to database."""
+        rows = []
         for ext in analysis_result.community_extensions:
+            community_repo_url = ext.links.get("community_repo") if ext.links else None
+            install_url = ext.links.get("install") if ext.links else None
+
             if (
                 ext.metadata
                 and ext.metadata.get("status") != "❌ Error"
@@ -254,25 +618,12 @@ class DatabaseManager(BaseDatabaseManager):
                 # Extension with valid repository info
                 repo_info = ext.metadata["repo_info"]
 
-                last_push_date = self._parse_date_string(ext.last_push)
-                created_at = self._parse_date_string(repo_info.get("created_at"))
-                updated_at = self._parse_date_string(repo_info.get("updated_at"))
-
-                # Extract URLs from links
-                github_url = ext.links.get("github") if ext.links else None
-                community_repo_url = (
-                    ext.links.get("community_repo") if ext.links else None
-                )
-                install_url = ext.links.get("install") if ext.links else None
-
-                sql = self._load_sql("insert_community_extension_full.sql")
-                conn.execute(
-                    sql,
-                    [
+                rows.append(
+                    (
                         ext.name,
                         ext.repository,
                         ext.metadata["status"],
-                        last_push_date,
+                        self._parse_date_string(ext.last_push),
                         ext.days_ago,
                         ext.stars,
                         repo_info.get("forks"),
@@ -283,23 +634,18 @@ class DatabaseManager(BaseDatabaseManager):
                         repo_info.get("license"),
                         repo_info.get("topics", []),
                         repo_info.get("archived", False),
-                        created_at,
-                        updated_at,
+                        self._parse_date_string(repo_info.get("created_at")),
+                        self._parse_date_string(repo_info.get("updated_at")),
                         False,  # featured (deprecated)
-                        github_url,
+                        ext.links.get("github") if ext.links else None,
                         community_repo_url,
                         install_url,
                         analysis_result.duckdb_version,
                         analysis_result.analysis_timestamp,
-                    ],
+                    )
                 )
             else:
                 # Extension with errors or no repository info
-                community_repo_url = (
-                    ext.links.get("community_repo") if ext.links else None
-                )
-                install_url = ext.links.get("install") if ext.links else None
-
                 error_msg = (
                     ext.metadata.get("error")
                     if ext.metadata
@@ -309,29 +655,219 @@ class DatabaseManager(BaseDatabaseManager):
                     "❌ No Repo" if error_msg == "No repository found" else "❌ Error"
                 )
 
-                sql = self._load_sql("insert_community_extension_error.sql")
-                conn.execute(
-                    sql,
-                    [
+                rows.append(
+                    (
                         ext.name,
                         "N/A",
                         status,
+                        None,
+                        None,
+                        None,
+                        None,
+                        None,
                         error_msg,
                         ext.description,
+                        None,
+                        None,
+                        None,
+                        None,
+                        None,
+                        None,
                         False,  # featured (deprecated)
+                        None,
                         community_repo_url,
                         install_url,
                         analysis_result.duckdb_version,
                         analysis_result.analysis_timestamp,
-                    ],
+                    )
                 )
 
-    async def _save_extension_availability(
+        self._insert_rows(
+            conn,
+            "insert_community_extension.sql",
+            "community_extension_rows",
+            [
+                "name",
+                "repository",
+                "status",
+                "last_push_date",
+                "last_push_days",
+                "stars",
+                "forks",
+                "language",
+                "description",
+                "improved_description",
+                "homepage",
+                "license",
+                "topics",
+                "archived",
+                "created_at",
+                "updated_at",
+                "featured",
+                "github_url",
+                "community_repo_url",
+                "install_url",
+                "duckdb_version",
+                "analysis_date",
+            ],
+            rows,
+        )
+
+    def _save_deprecation_signals(
         self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
     ) -> None:
-        """Save extension platform availability data to database."""
-        availability_sql = self._load_sql("insert_extension_availability.sql")
+        """Save raw deprecation indicators so scores can be recomputed in SQL."""
+        analyses = {}
+        signals = []
+
+        for ext in analysis_result.community_extensions:
+            deprecation = (ext.metadata or {}).get("deprecation_analysis")
+            if not deprecation:
+                continue
+
+            # Keyed by extension: the table holds one row per extension per run
+            analyses[ext.name] = (
+                ext.name,
+                deprecation.get("repository"),
+                deprecation.get("repository_archived", False),
+                self._parse_date_string(deprecation.get("last_push")),
+                analysis_result.analysis_timestamp,
+            )
+
+            for indicator_class in ("deprecation", "warning", "active"):
+                for indicator in deprecation.get(f"{indicator_class}_indicators", []):
+                    signals.append(
+                        (
+                            ext.name,
+                            indicator_class,
+                            indicator["keyword"],
+                            indicator["source"],
+                            indicator.get("context"),
+                            analysis_result.analysis_timestamp,
+                        )
+                    )
+
+        self._insert_rows(
+            conn,
+            "insert_deprecation_analysis.sql",
+            "deprecation_analysis_rows",
+            [
+                "extension_name",
+                "repository",
+                "repository_archived",
+                "last_push",
+                "analysis_date",
+            ],
+            list(analyses.values()),
+        )
+        self._insert_rows(
+            conn,
+            "insert_deprecation_signal.sql",
+            "deprecation_signal_rows",
+            [
+                "extension_name",
+                "indicator_class",
+                "keyword",
+                "source",
+                "context",
+                "analysis_date",
+            ],
+            signals,
+        )
+
+    def _save_extension_documents(
+        self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
+    ) -> None:
+        """Save the searchable text of each extension that changed."""
+        rows = []
+        for ext in analysis_result.core_extensions:
+            rows.append(
+                (
+                    ext.name,
+                    "core",
+                    ext.description,
+                    (ext.metadata or {}).get("description"),
+                    None,
+                    None,
+                    analysis_result.analysis_timestamp,
+                )
+            )
+        for ext in analysis_result.community_extensions:
+            metadata = ext.metadata or {}
+            repo_info = metadata.get("repo_info") or {}
+            deprecation = metadata.get("deprecation_analysis") or {}
+            rows.append(
+                (
+                    ext.name,
+                    "community",
+                    ext.description,
+                    repo_info.get("description"),
+                    " ".join(repo_info.get("topics") or []) or None,
+                    deprecation.get("readme_content"),
+                    analysis_result.analysis_timestamp,
+                )
+            )
 
+        self._insert_rows(
+            conn,
+            "upsert_extension_documents.sql",
+            "extension_document_rows",
+            [
+                "extension_name",
+                "extension_type",
+                "description",
+                "repository_description",
+                "topics",
+                "readme",
+                "updated_at",
+            ],
+            rows,
+        )
+
+    @staticmethod
+    def _load_fts(conn: duckdb.DuckDBPyConnection) -> bool:
+        """Load the fts extension if it is installed.
+
+        Never installs it: a failed INSTALL would abort the caller's
+        transaction. See build_search_index().
+        """
+        installed, loaded = conn.execute(
+            "SELECT installed, loaded FROM duckdb_extensions() "
+            "WHERE extension_name = 'fts'"
+        ).fetchone() or (False, False)
+        if installed and not loaded:
+            conn.execute("LOAD fts")
+        return bool(installed)
+
+    def _refresh_search_index(
+        self, conn: duckdb.DuckDBPyConnection, analysis_date: Optional[datetime] = None
+    ) -> bool:
+        """Rebuild the full-text index if documents changed in an analysis.
+
+        Args:
+            analysis_date: Analysis to check for changed documents; None
+                rebuilds unconditionally
+
+        Returns:
+            Whether the index was rebuilt
+        """
+        if analysis_date is not None:
+            changed = conn.execute(
+                "SELECT COUNT(*) FROM extension_documents WHERE updated_at = ?",
+                [self._naive_utc(analysis_date)],
+            ).fetchone()[0]
+            if not changed:
+                return False
+        if not self._load_fts(conn):
+            logger.debug("fts extension not installed; search index not rebuilt")
+            return False
+        conn.execute(self._load_sql("create_search_index.sql"))
+        return True
+
+    def _save_extension_availability(
+        self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
+    ) -> None:
+        """Save extension platform availability data to database."""
         # Calculate days since release for this analysis
         days_since_release = None
         if analysis_result.duckdb_release_date:
@@ -340,9 +876,15 @@ class DatabaseManager(BaseDatabaseManager):
                 - analysis_result.duckdb_release_date.replace(tzinfo=None)
             ).days
 
-        # Save core extension availability data
-        for ext in analysis_result.core_extensions:
-            if ext.platform_availability:
+        rows = []
+        # Save core and community extension availability data (if they have platform info)
+        for extension_type, extensions in (
+            ("core", analysis_result.core_extensions),
+            ("community", analysis_result.community_extensions),
+        ):
+            for ext in extensions:
+                if not ext.platform_availability:
+                    continue
                 for platform, availability_info in ext.platform_availability.items():
                     # Determine availability date (when first became available)
                     availability_date = None
@@ -356,11 +898,10 @@ class DatabaseManager(BaseDatabaseManager):
                         else:
                             availability_date = availability_info["date"]
 
-                    conn.execute(
-                        availability_sql,
-                        [
+                    rows.append(
+                        (
                             ext.name,
-                            "core",
+                            extension_type,
                             platform,
                             analysis_result.duckdb_version,
                             availability_info.get("available", False),
@@ -370,42 +911,47 @@ class DatabaseManager(BaseDatabaseManager):
                             availability_info.get("file_size"),
                             availability_info.get("error"),
                             days_since_release,
-                        ],
+                        )
                     )
 
-        # Save community extension availability data (if they have platform info)
-        for ext in analysis_result.community_extensions:
-            if ext.platform_availability:
-                for platform, availability_info in ext.platform_availability.items():
-                    availability_date = None
-                    if availability_info.get("available") and availability_info.get(
-                        "date"
-                    ):
-                        if isinstance(availability_info["date"], str):
-                            availability_date = self._parse_date_string(
-                                availability_info["date"]
-                            )
-                        else:
-                            availability_date = availability_info["date"]
-
-                    conn.execute(
-                        availability_sql,
-                        [
-                            ext.name,
-                            "community",
-                            platform,
-                            analysis_result.duckdb_version,
-                            availability_info.get("available", False),
-                            availability_date,
-                            analysis_result.analysis_timestamp,
-                            availability_info.get("http_status"),
-                            availability_info.get("file_size"),
-                            availability_info.get("error"),
-                            days_since_release,
-                        ],
-                    )
+        self._insert_rows(
+            conn,
+            "insert_extension_availability.sql",
+            "extension_availability_rows",
+            [
+                "extension_name",
+                "extension_type",
+                "platform",
+                "duckdb_version",
+                "is_available",
+                "availability_date",
+                "check_timestamp",
+                "http_status_code",
+                "file_size_bytes",
+                "error_message",
+                "days_since_release",
+            ],
+            rows,
+        )
 
-    async def _save_github_issues(
+    GITHUB_ISSUE_COLUMNS = [
+        "issue_number",
+        "title",
+        "body",
+        "state",
+        "created_at",
+        "updated_at",
+        "closed_at",
+        "labels",
+        "extension_names",
+        "platforms",
+        "issue_type",
+        "severity",
+        "html_url",
+        "analysis_date",
+    ]
+
+    def _save_github_issues(
         self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
     ) -> None:
         """Save GitHub issues data to database."""
@@ -413,62 +959,351 @@ class DatabaseManager(BaseDatabaseManager):
             f"Saving {len(analysis_result.github_issues)} GitHub issues to database"
         )
 
-        issues_sql = self._load_sql("insert_github_issue.sql")
-        mapping_sql = self._load_sql("insert_extension_issue_mapping.sql")
-
         # Determine extension types for mapping
         core_extension_names = {ext.name for ext in analysis_result.core_extensions}
 
+        # Keyed like the tables' unique constraints, so a repeated issue or
+        # mention cannot fail the whole batch
+        issues = {}
+        mappings = {}
         for issue in analysis_result.github_issues:
-            try:
-                # Insert the issue
-                conn.execute(
-                    issues_sql,
-                    [
-                        issue.issue_number,
-                        issue.title,
-                        issue.body,
-                        issue.state,
-                        issue.created_at,
-                        issue.updated_at,
-                        issue.closed_at,
-                        list(issue.labels),
-                        list(issue.extension_names),
-                        list(issue.platforms),
-                        issue.issue_type,
-                        issue.severity,
-                        issue.html_url,
-                        analysis_result.analysis_timestamp,
-                    ],
+            issues[issue.issue_number] = (
+                issue.issue_number,
+                issue.title,
+                issue.body,
+                issue.state,
+                issue.created_at,
+                issue.updated_at,
+                issue.closed_at,
+                list(issue.labels),
+                list(issue.extension_names),
+                list(issue.platforms),
+                issue.issue_type,
+                issue.severity,
+                issue.html_url,
+                analysis_result.analysis_timestamp,
+            )
+
+            for ext_name in issue.extension_names:
+                ext_type = "core" if ext_name in core_extension_names else "community"
+
+                # Calculate relevance score based on how specifically the extension is mentioned
+                relevance_score = 1.0  # Default high relevance for named extensions
+
+                mappings[(ext_name, issue.issue_number)] = (
+                    ext_name,
+                    ext_type,
+                    issue.issue_number,
+                    relevance_score,
+                    analysis_result.analysis_timestamp,
                 )
 
-                # Insert extension-issue mappings
-                for ext_name in issue.extension_names:
-                    ext_type = (
-                        "core" if ext_name in core_extension_names else "community"
-                    )
+        self._insert_rows(
+            conn,
+            "insert_github_issue.sql",
+            "github_issue_rows",
+            self.GITHUB_ISSUE_COLUMNS,
+            list(issues.values()),
+        )
+        self._insert_rows(
+            conn,
+            "insert_extension_issue_mapping.sql",
+            "extension_issue_mapping_rows",
+            [
+                "extension_name",
+                "extension_type",
+                "issue_number",
+                "relevance_score",
+                "analysis_date",
+            ],
+            list(mappings.values()),
+        )
 
-                    # Calculate relevance score based on how specifically the extension is mentioned
-                    relevance_score = 1.0  # Default high relevance for named extensions
+        logger.info("Successfully saved GitHub issues to database")
 
-                    conn.execute(
-                        mapping_sql,
-                        [
-                            ext_name,
-                            ext_type,
-                            issue.issue_number,
-                            relevance_score,
-                            analysis_result.analysis_timestamp,
-                        ],
+    def reclassify_github_issues(self, rules: IssueClassificationRules) -> int:
+        """Re-apply issue classification rules to every stored GitHub issue.
+
+        Runs as a single vectorised pass in DuckDB, so tuned keyword lists take
+        effect on historical issues without refetching them from GitHub.
+
+        Returns:
+            Number of stored issue rows that were reclassified
+
+        Raises:
+            ValueError: If the rules define no issue types or severities, which
+                would overwrite every stored classification with the defaults
+        """
+        if not rules.issue_type_keywords or not (
+            rules.severity_label_words or rules.severity_keywords
+        ):
+            raise ValueError(
+                f"Refusing to reclassify issues: {rules.rules_file} defines no "
+                "issue types or severities"
+            )
+
+        rules_df = pd.DataFrame(
+            rules.to_rule_rows(),
+            columns=["rule_kind", "category", "priority", "keyword"],
+        )
+
+        conn = self._connect()
+        try:
+            conn.register("issue_classification_rules", rules_df)
+            updated = conn.execute(
+                self._load_sql("reclassify_github_issues.sql")
+            ).fetchone()[0]
+            logger.info(f"Reclassified {updated} stored GitHub issues")
+            return updated
+        finally:
+            conn.close()
+
+    def rebuild_derived_tables(self) -> None:
+        """Recompute the tables a save maintains incrementally from history.
+
+        Rebuilds the latest-state tables, the trend rollups, the extension
+        change log and the search index, for history that was loaded in bulk
+        rather than saved run by run.
+        """
+        conn = self._connect()
+        try:
+            conn.begin()
+            self._execute_script(conn, "rebuild_latest_snapshots.sql", [])
+            conn.execute("DELETE FROM extension_metrics_rollup")
+            conn.execute("DELETE FROM ecosystem_growth_rollup")
+            self._refresh_rollups(conn, date.min)
+            first_run = conn.execute(
+                "SELECT id FROM analysis_runs ORDER BY run_timestamp, id LIMIT 1"
+            ).fetchone()
+            if first_run:
+                self._execute_script(
+                    conn, "refresh_extension_changelog.sql", [first_run[0]]
+                )
+            self._refresh_search_index(conn)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def build_search_index(self) -> int:
+        """Install the fts extension if needed and rebuild the search index.
+
+        Saves keep the index current once fts is installed, so this only needs
+        to run once per machine (e.g. after copying the database to a new one).
+
+        Returns:
+            Number of indexed extensions
+        """
+        conn = self._connect()
+        try:
+            if not self._load_fts(conn):
+                conn.execute("INSTALL fts")
+            self._refresh_search_index(conn)
+            return conn.execute("SELECT COUNT(*) FROM extension_documents").fetchone()[
+                0
+            ]
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _classify_installation_error(
+        error_message: Optional[str], test_environment: Optional[str]
+    ) -> Optional[str]:
+        """Determine error type based on error message and test environment."""
+        if test_environment == "special_case":
+            return "special_case"
+        if not error_message:
+            return None
+
+        error_msg_lower = error_message.lower()
+        if "statically linked" in error_msg_lower or "built into" in error_msg_lower:
+            return "special_case"
+        elif "timeout" in error_msg_lower or "timed out" in error_msg_lower:
+            return "timeout"
+        elif "http" in error_msg_lower or "network" in error_msg_lower:
+            return "download"
+        elif "load" in error_msg_lower:
+            return "load"
+        elif "environment" in error_msg_lower:
+            return "environment"
+        return "install"
+
+    INSTALLATION_TEST_COLUMNS = [
+        "extension_name",
+        "platform",
+        "success",
+        "installation_time_seconds",
+        "load_time_seconds",
+        "error_message",
+        "error_type",
+        "duckdb_version",
+        "test_timestamp",
+        "extension_version",
+        "artifact_last_modified",
+        "file_size_bytes",
+        "extension_path",
+        "benchmark_runs",
+        "load_time_p50_seconds",
+        "load_time_p95_seconds",
+        "rss_growth_bytes",
+        "functional_test_p50_seconds",
+    ]
+
+    def save_compatibility_results(
+        self,
+        results: List[Dict[str, Any]],
+        platform: str,
+        test_timestamp: datetime,
+    ) -> int:
+        """Record compatibility matrix results so later runs can skip unchanged pairs.
+
+        Args:
+            results: Rendered results from the compatibility matrix
+            platform: Platform the tests ran on
+            test_timestamp: Timestamp shared by all results of the run
+
+        Returns:
+            Number of results saved
+        """
+        rows = [
+            (
+                result["extension_name"],
+                platform,
+                result["success"],
+                result.get("install_time_seconds"),
+                result.get("load_time_seconds"),
+                result.get("error_message"),
+                self._classify_installation_error(
+                    result.get("error_message"),
+                    result.get("test_environment"),
+                ),
+                result["duckdb_version"],
+                test_timestamp,
+                result.get("extension_version"),
+                result.get("artifact_last_modified"),
+                result.get("file_size_bytes"),
+                result.get("extension_path"),
+                result.get("benchmark_runs"),
+                result.get("load_time_p50_seconds"),
+                result.get("load_time_p95_seconds"),
+                result.get("rss_growth_bytes"),
+                result.get("functional_test_p50_seconds"),
+            )
+            for result in results
+        ]
+
+        conn = self._connect()
+        try:
+            saved = self._insert_rows(
+                conn,
+                "insert_installation_test.sql",
+                "installation_test_rows",
+                self.INSTALLATION_TEST_COLUMNS,
+                rows,
+            )
+        finally:
+            conn.close()
+
+        logger.info(f"Saved {saved} compatibility test results")
+        return saved
+
+    def archive_history(self, days: Optional[List[date]] = None) -> Dict[str, int]:
+        """Export analysis days to the Parquet archive (all days when None).
+
+        Returns:
+            Number of archived rows per table
+        """
+        conn = self._connect()
+        try:
+            return HistoryArchive(self.archive_dir).export(conn, days)
+        finally:
+            conn.close()
+
+    def connect_archive(
+        self, archive_dir: Optional[Path] = None
+    ) -> duckdb.DuckDBPyConnection:
+        """Open an in-memory connection that queries the Parquet archive.
+
+        Archived tables appear under their live names, with the schema's views
+        and as-of macros defined on top, so existing queries run unchanged.
+        The trend rollups are derived data and are rebuilt in memory.
+        """
+        archive = HistoryArchive(archive_dir or self.archive_dir)
+        conn = duckdb.connect()
+        attached = archive.attach(conn)
+        if not attached:
+            logger.warning(f"No archived tables found in {archive.archive_dir}")
+        self.create_views(conn)
+        if {"extension_metrics_daily", "extension_trends_summary"} <= set(attached):
+            conn.execute(self._load_sql("26_trend_rollups.sql"))
+            self._refresh_rollups(conn, date.min)
+        return conn
+
+    def query_pool(
+        self, archive_dir: Optional[Path] = None, size: int = 4
+    ) -> QueryConnectionPool:
+        """Open a pool of read-only connections for the queries in sql/queries.
+
+        With ``archive_dir`` the pool reads the Parquet archive instead of the
+        database. Otherwise pending schema migrations are applied first, since
+        the read-only connections cannot create the views the queries read.
+        """
+        queries_dir = self.sql_dir / "queries"
+        if archive_dir is not None:
+            return QueryConnectionPool(
+                self.connect_archive(Path(archive_dir)), queries_dir, size
+            )
+        self.create_schema()
+        return QueryConnectionPool.open(Path(self.database_path), queries_dir, size)
+
+    _VIEW_STATEMENT = re.compile(
+        r"^\s*(?:--[^\n]*\n\s*)*CREATE\s+OR\s+REPLACE\s+(?:VIEW|MACRO)\b",
+        re.IGNORECASE,
+    )
+
+    def create_views(self, conn: duckdb.DuckDBPyConnection) -> int:
+        """Define the schema's views and macros over whatever tables exist.
+
+        Definitions run in migration order, so a later definition replaces an
+        earlier one; definitions whose tables are missing are skipped.
+
+        Returns:
+            Number of views and macros created
+        """
+        created = 0
+        for sql_file in self.SCHEMA_MIGRATIONS:
+            for statement in duckdb.extract_statements(self._load_sql(sql_file)):
+                if not self._VIEW_STATEMENT.match(statement.query):
+                    continue
+                try:
+                    conn.execute(statement.query)
+                    created += 1
+                except duckdb.Error as e:
+                    logger.debug(
+                        f"Skipping a definition from {sql_file}: {str(e).splitlines()[0]}"
                     )
+        return created
 
-            except Exception as e:
-                logger.warning(f"Failed to save GitHub issue {issue.issue_number}: {e}")
-                continue
+    def get_latest_compatibility_results(
+        self, platform: str
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Get the latest stored result per (duckdb_version, extension_name)."""
+        if not Path(self.database_path).exists():
+            return {}
 
-        logger.info("Successfully saved GitHub issues to database")
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                self._load_sql("queries/latest_compatibility_results.sql"),
+                {"platform": platform},
+            )
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
+        return {(row["duckdb_version"], row["extension_name"]): row for row in rows}
 
-    async def _save_installation_results(
+    def _save_installation_results(
         self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
     ) -> None:
         """Save installation test results to database."""
@@ -476,62 +1311,52 @@ class DatabaseManager(BaseDatabaseManager):
             f"Saving {len(analysis_result.installation_results)} installation test results to database"
         )
 
-        install_sql = self._load_sql("insert_installation_test.sql")
-
-        for result in analysis_result.installation_results:
-            try:
-                # Determine error type based on error message and test environment
-                error_type = None
-                if result.test_environment == "special_case":
-                    error_type = "special_case"
-                elif result.error_message:
-                    error_msg_lower = result.error_message.lower()
-                    if (
-                        "statically linked" in error_msg_lower
-                        or "built into" in error_msg_lower
-                    ):
-                        error_type = "special_case"
-                    elif "timeout" in error_msg_lower:
-                        error_type = "timeout"
-                    elif "http" in error_msg_lower or "network" in error_msg_lower:
-                        error_type = "download"
-                    elif "load" in error_msg_lower:
-                        error_type = "load"
-                    elif "environment" in error_msg_lower:
-                        error_type = "environment"
-                    else:
-                        error_type = "install"
-
-                # Get platform from installation tester
-                from .installation_tester import InstallationTester
-
-                platform = InstallationTester()._get_current_platform()
-
-                conn.execute(
-                    install_sql,
-                    [
-                        result.extension_name,
-                        platform,
-                        result.success,
-                        result.install_time,
-                        result.load_time,
-                        result.error_message,
-                        error_type,
-                        analysis_result.duckdb_version,
-                        analysis_result.analysis_timestamp,
-                    ],
-                )
+        # Get platform from installation tester
+        from .installation_tester import InstallationTester
+
+        platform = InstallationTester()._get_current_platform()
+
+        rows = [
+            (
+                result.extension_name,
+                platform,
+                result.success,
+                result.install_time,
+                result.load_time,
+                result.error_message,
+                self._classify_installation_error(
+                    result.error_message, result.test_environment
+                ),
+                analysis_result.duckdb_version,
+                analysis_result.analysis_timestamp,
+                None,  # extension_version
+                None,  # artifact_last_modified
+                getattr(result, "file_size_bytes", None),
+                getattr(result, "extension_path", None),
+                getattr(result, "benchmark_runs", None),
+                getattr(result, "load_time_p50", None),
+                getattr(result, "load_time_p95", None),
+                getattr(result, "rss_growth_bytes", None),
+                getattr(result, "functional_test_time_p50", None),
+            )
+            for result in analysis_result.installation_results
+        ]
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to save installation test result for {result.extension_name}: {e}"
-                )
-                continue
+        self._insert_rows(
+            conn,
+            "insert_installation_test.sql",
+            "installation_test_rows",
+            self.INSTALLATION_TEST_COLUMNS,
+            rows,
+        )
 
         logger.info("Successfully saved installation test results to database")
 
-    async def _save_trend_data(
-        self, conn: duckdb.DuckDBPyConnection, analysis_result: AnalysisResult
+    def _save_trend_data(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        analysis_result: AnalysisResult,
+        run_id: int,
     ) -> None:
         """Calculate and save trend data for extensions."""
         logger.info("Calculating and saving trend data")
@@ -539,21 +1364,40 @@ class DatabaseManager(BaseDatabaseManager):
         analysis_date = analysis_result.analysis_timestamp.date()
 
         # Save daily metrics for each extension
-        await self._save_extension_metrics_daily(conn, analysis_result, analysis_date)
+        metric_rows = self._save_extension_metrics_daily(
+            conn, analysis_result, analysis_date
+        )
+        self._refresh_latest(conn, "upsert_extension_metrics_latest.sql", analysis_date)
+
+        # Record the run's extensions and what changed since the previous run
+        self._insert_rows(
+            conn,
+            "insert_run_extension.sql",
+            "run_extension_rows",
+            ["run_id", "extension_name", "extension_type", "status"],
+            [(run_id, row[0], row[1], row[6]) for row in metric_rows],
+        )
+        self._execute_script(conn, "refresh_extension_changelog.sql", [run_id])
 
         # Calculate and save summary trends
-        await self._save_trends_summary(conn, analysis_result, analysis_date)
+        self._save_trends_summary(conn, analysis_result, analysis_date, run_id)
 
         logger.info("Successfully saved trend data")
 
-    async def _save_extension_metrics_daily(
+    def _save_extension_metrics_daily(
         self,
         conn: duckdb.DuckDBPyConnection,
         analysis_result: AnalysisResult,
         analysis_date,
-    ) -> None:
-        """Save daily metrics for each extension."""
-        metrics_sql = self._load_sql("insert_extension_metrics_daily.sql")
+    ) -> List[tuple]:
+        """Save daily metrics for each extension.
+
+        Returns:
+            The saved rows, one per extension
+        """
+        # Keyed like the table's unique constraint; a later duplicate wins, as
+        # it did when each row was upserted separately
+        rows = {}
 
         # Save core extensions metrics
         for ext in analysis_result.core_extensions:
@@ -576,20 +1420,17 @@ class DatabaseManager(BaseDatabaseManager):
 
             is_active = days_since_update is not None and days_since_update <= 30
 
-            conn.execute(
-                metrics_sql,
-                [
-                    ext.name,
-                    "core",
-                    analysis_date,
-                    None,  # stars (core don't have individual stars)
-                    None,  # forks
-                    days_since_update,
-                    ext.stage or "Stable",
-                    is_active,
-                    False,  # is_archived
-                    ext.repository,
-                ],
+            rows[(ext.name, "core")] = (
+                ext.name,
+                "core",
+                analysis_date,
+                None,  # stars (core don't have individual stars)
+                None,  # forks
+                days_since_update,
+                ext.stage or "Stable",
+                is_active,
+                False,  # is_archived
+                ext.repository,
             )
 
         # Save community extensions metrics
@@ -605,89 +1446,59 @@ class DatabaseManager(BaseDatabaseManager):
                 repo_info = ext.metadata.get("repo_info") or {}
                 is_archived = bool(repo_info.get("archived", False))
 
-            conn.execute(
-                metrics_sql,
-                [
-                    ext.name,
-                    "community",
-                    analysis_date,
-                    ext.stars,
-                    repo_info.get("forks") if repo_info else None,
-                    days_since_update,
-                    ext.metadata.get("status", "❓ Unknown")
-                    if ext.metadata
-                    else "❓ Unknown",
-                    is_active,
-                    is_archived,
-                    ext.repository,
-                ],
+            rows[(ext.name, "community")] = (
+                ext.name,
+                "community",
+                analysis_date,
+                ext.stars,
+                repo_info.get("forks") if repo_info else None,
+                days_since_update,
+                ext.metadata.get("status", "❓ Unknown")
+                if ext.metadata
+                else "❓ Unknown",
+                is_active,
+                is_archived,
+                ext.repository,
             )
 
-    async def _save_trends_summary(
+        self._insert_rows(
+            conn,
+            "insert_extension_metrics_daily.sql",
+            "extension_metrics_rows",
+            [
+                "extension_name",
+                "extension_type",
+                "analysis_date",
+                "stars",
+                "forks",
+                "days_since_update",
+                "status",
+                "is_active",
+                "is_archived",
+                "repository",
+            ],
+            list(rows.values()),
+            key_columns=["extension_name", "extension_type", "analysis_date"],
+        )
+        return list(rows.values())
+
+    def _save_trends_summary(
         self,
         conn: duckdb.DuckDBPyConnection,
         analysis_result: AnalysisResult,
         analysis_date,
+        run_id: int,
     ) -> None:
         """Calculate and save aggregate trend summary."""
-        # Get previous analysis for comparison
-        previous_data = conn.execute(
-            """
-            SELECT 
-                total_extensions,
-                core_count,
-                community_count,
-                active_30d,
-                active_7d
-            FROM extension_trends_summary
-            WHERE analysis_date < ?
-            ORDER BY analysis_date DESC
-            LIMIT 1
-        """,
-            [analysis_date],
-        ).fetchone()
-
-        # Get list of extensions from previous analysis
-        previous_extensions = set()
-        if previous_data:
-            prev_core = conn.execute(
-                """
-                SELECT DISTINCT extension_name 
-                FROM extension_metrics_daily
-                WHERE analysis_date < ? AND extension_type = 'core'
-                ORDER BY analysis_date DESC
-                LIMIT (SELECT COUNT(DISTINCT extension_name) FROM extension_metrics_daily 
-                       WHERE extension_type = 'core' AND analysis_date = 
-                       (SELECT MAX(analysis_date) FROM extension_metrics_daily WHERE analysis_date < ?))
-            """,
-                [analysis_date, analysis_date],
-            ).fetchall()
-
-            prev_community = conn.execute(
-                """
-                SELECT DISTINCT extension_name
-                FROM extension_metrics_daily  
-                WHERE analysis_date < ? AND extension_type = 'community'
-                ORDER BY analysis_date DESC
-                LIMIT (SELECT COUNT(DISTINCT extension_name) FROM extension_metrics_daily
-                       WHERE extension_type = 'community' AND analysis_date =
-                       (SELECT MAX(analysis_date) FROM extension_metrics_daily WHERE analysis_date < ?))
-            """,
-                [analysis_date, analysis_date],
+        # New and removed extensions since the last run of an earlier day
+        changes = dict(
+            conn.execute(
+                self._load_sql("select_membership_changes.sql"),
+                [run_id, analysis_date],
             ).fetchall()
-
-            previous_extensions = {row[0] for row in prev_core + prev_community}
-
-        # Current extensions
-        current_extensions = {
-            ext.name
-            for ext in analysis_result.core_extensions
-            + analysis_result.community_extensions
-        }
-
-        # Calculate new and removed extensions
-        new_extensions = list(current_extensions - previous_extensions)
-        removed_extensions = list(previous_extensions - current_extensions)
+        )
+        new_extensions = changes.get("added", [])
+        removed_extensions = changes.get("removed", [])
 
         # Count active extensions
         active_30d = sum(
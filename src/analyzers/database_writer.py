@@ -0,0 +1,173 @@
+"""
+Background Database Writer for DuckDB Extensions Analysis.
+
+A dedicated thread owns the DuckDB connection and writes each stage of a run
+as soon as the orchestrator finishes analysing it, so persistence overlaps
+with the network-bound stages that follow instead of running after them.
+
+The whole run is still written in one transaction: it commits when the run
+finishes and rolls back if any stage fails or the run is aborted.
+"""
+
+import asyncio
+import queue
+import threading
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from loguru import logger
+
+from .base import AnalysisResult
+from .database_manager import DatabaseManager
+
+# Sentinels that end the writer thread
+_COMMIT = object()
+_ROLLBACK = object()
+
+
+class DatabaseWriter:
+    """Writes analysis stages to the database on a background thread."""
+
+    def __init__(self, database_manager: DatabaseManager):
+        self.database_manager = database_manager
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._run: Optional[AnalysisResult] = None
+        self._error: Optional[BaseException] = None
+        self.stage_batches: List[Tuple[str, int]] = []
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(
+        self,
+        duckdb_version: Optional[str],
+        duckdb_release_date: Optional[datetime],
+        analysis_timestamp: datetime,
+    ) -> None:
+        """Open the run's transaction and start accepting stages."""
+        if self._thread is not None:
+            raise RuntimeError("Database writer has already been started")
+
+        self._run = AnalysisResult(
+            core_extensions=[],
+            community_extensions=[],
+            duckdb_version=duckdb_version,
+            duckdb_release_date=duckdb_release_date,
+            analysis_timestamp=analysis_timestamp,
+        )
+        self._thread = threading.Thread(
+            target=self._write_loop, name="database-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, stage: str, records: List[Any]) -> None:
+        """Queue a finished stage's records for writing."""
+        if self._thread is None:
+            raise RuntimeError("Database writer has not been started")
+        if stage not in DatabaseManager.SAVE_STAGES or stage == "summary":
+            raise ValueError(f"Unknown save stage: {stage}")
+        self._queue.put((stage, list(records)))
+
+    async def finish(self, analysis_result: AnalysisResult) -> None:
+        """Write the run summary, commit, and wait for the writer to stop.
+
+        Raises:
+            The first error raised while writing any stage
+        """
+        self._queue.put(("summary", analysis_result))
+        self._queue.put(_COMMIT)
+        await asyncio.to_thread(self._thread.join)
+        if self._error is not None:
+            raise self._error
+
+    async def abort(self) -> None:
+        """Roll back everything written for this run."""
+        if self._thread is None:
+            return
+        self._queue.put(_ROLLBACK)
+        await asyncio.to_thread(self._thread.join)
+
+    def _next_batch(self) -> List[Any]:
+        """Block for the next item, then take everything else already queued."""
+        batch = [self._queue.get()]
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    @staticmethod
+    def _coalesce(batch: List[Any]) -> List[Any]:
+        """Merge consecutive submissions of the same stage into one write."""
+        merged: List[Any] = []
+        for item in batch:
+            if (
+                isinstance(item, tuple)
+                and item[0] != "summary"
+                and merged
+                and isinstance(merged[-1], tuple)
+                and merged[-1][0] == item[0]
+            ):
+                merged[-1] = (item[0], merged[-1][1] + item[1])
+            else:
+                merged.append(item)
+        return merged
+
+    def _stage_result(self, stage: str, records: Any) -> AnalysisResult:
+        """Build the result a stage is written from, recording what it adds."""
+        if stage == "summary":
+            return self.database_manager.stage_result(records, stage)
+
+        stage_result = self.database_manager.stage_result(
+            replace(self._run, **{stage: records}), stage
+        )
+        accumulated = getattr(self._run, stage) or []
+        setattr(self._run, stage, accumulated + records)
+        return stage_result
+
+    def _write_loop(self) -> None:
+        manager = self.database_manager
+        conn = None
+        try:
+            conn = manager._connect()
+            conn.begin()
+        except BaseException as e:
+            self._error = e
+            logger.error(f"Database writer could not open the database: {e}")
+
+        while True:
+            for item in self._coalesce(self._next_batch()):
+                if item is _COMMIT or item is _ROLLBACK:
+                    self._close(conn, commit=item is _COMMIT)
+                    return
+                if self._error is not None:
+                    continue  # drain the queue; the run will be rolled back
+
+                stage, records = item
+                try:
+                    manager.write_stage(conn, stage, self._stage_result(stage, records))
+                    count = 1 if stage == "summary" else len(records)
+                    self.stage_batches.append((stage, count))
+                    logger.debug(f"Database writer wrote {stage} ({count})")
+                except BaseException as e:
+                    self._error = e
+                    logger.error(f"Database writer failed on {stage}: {e}")
+
+    def _close(self, conn, commit: bool) -> None:
+        if conn is None:
+            return
+        try:
+            if commit and self._error is None:
+                conn.commit()
+                logger.info("Database writer committed the analysis run")
+            else:
+                conn.rollback()
+                logger.warning("Database writer rolled back the analysis run")
+        except BaseException as e:
+            if self._error is None:
+                self._error = e
+        finally:
+            conn.close()
@@ -0,0 +1,151 @@
+"""
+Query API for DuckDB Extensions Analysis.
+
+Trend, change and popularity queries over the extensions database or its
+Parquet archive, for reports and scripts. Every query runs a file from
+sql/queries with bound parameters on a pooled read-only connection, so a
+report's queries share one open database.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .database_manager import DatabaseManager
+from .query_pool import QueryConnectionPool
+
+# Trend view suffix per grain; weekly and monthly read the rollup tables
+TREND_PERIODS = {"daily": "", "weekly": "_weekly", "monthly": "_monthly"}
+
+
+def trend_rollup(period: str) -> str:
+    """Get the trend view suffix for a grain (daily, weekly or monthly)."""
+    if period not in TREND_PERIODS:
+        raise ValueError(
+            f"Unknown trend period: {period} (expected one of {', '.join(TREND_PERIODS)})"
+        )
+    return TREND_PERIODS[period]
+
+
+class ExtensionQueries:
+    """Named queries over a pool of read-only connections."""
+
+    def __init__(self, pool: QueryConnectionPool):
+        self.pool = pool
+
+    @classmethod
+    def open(
+        cls,
+        database_manager: DatabaseManager,
+        archive_dir: Optional[Path] = None,
+        size: int = 4,
+    ) -> "ExtensionQueries":
+        """Open queries over the manager's database, or its archive when given one.
+
+        The archive exposes the same tables and trend views, reading only the
+        analysis_date partitions a query filters on.
+        """
+        return cls(database_manager.query_pool(archive_dir, size))
+
+    def __enter__(self) -> "ExtensionQueries":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.pool.close()
+
+    def _trend_query(self, query_name: str, period: str, **params: Any) -> list:
+        return self.pool.execute(
+            query_name, identifiers={"rollup": trend_rollup(period)}, **params
+        )
+
+    def ecosystem_growth_trends(self, period: str = "daily") -> list:
+        """Get ecosystem growth trends over time, per analysis day, week or month."""
+        return self._trend_query("ecosystem_growth_trends", period)
+
+    def recent_extensions(self, days: int = 30) -> list:
+        """Get extensions first seen in the last N days."""
+        return self.pool.execute("recent_extensions", days=days)
+
+    def trending_extensions(self, limit: int = 10, period: str = "daily") -> list:
+        """Get extensions with highest star growth in recent period."""
+        return self._trend_query("trending_extensions", period, row_limit=limit)
+
+    def extension_star_history(
+        self, extension_name: str, period: str = "daily"
+    ) -> list:
+        """Get star growth history for a specific extension."""
+        return self._trend_query(
+            "extension_star_history", period, extension_name=extension_name
+        )
+
+    def activity_changes(self, days: int = 7, period: str = "daily") -> list:
+        """Get extensions that changed activity status recently."""
+        return self._trend_query("activity_changes", period, days=days)
+
+    def latest_extension_changes(self) -> list:
+        """Get extensions the latest run added, removed or changed status of."""
+        return self.pool.execute("latest_extension_changes")
+
+    def top_extensions_by_stars(self, limit: int = 20) -> list:
+        """Get top community extensions by stars."""
+        return self.pool.execute("top_extensions_by_stars", row_limit=limit)
+
+    def search_extensions(self, terms: str, limit: int = 10) -> list:
+        """Search extensions by name, descriptions, topics and README.
+
+        Ranks by BM25 over the full-text index when the fts extension and the
+        index are available, and by the number of matching terms otherwise.
+        """
+        query_name = (
+            "search_extensions"
+            if self.has_search_index()
+            else "search_extensions_by_terms"
+        )
+        return self.pool.execute(query_name, search_terms=terms, row_limit=limit)
+
+    def has_search_index(self) -> bool:
+        """Check whether the database has a full-text index fts can read here."""
+        with self.pool.connection() as conn:
+            return conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM duckdb_schemas() "
+                "WHERE schema_name = 'fts_main_extension_documents') "
+                "AND EXISTS (SELECT 1 FROM duckdb_extensions() "
+                "WHERE extension_name = 'fts' AND installed)"
+            ).fetchone()[0]
+
+    def trend_summary(self) -> Dict[str, Any]:
+        """Get latest trend summary with deltas."""
+        result: List[tuple] = self.pool.execute("latest_trend_summary")
+        if not result:
+            return {}
+
+        latest = result[0]
+        previous = result[1] if len(result) > 1 else None
+
+        summary = {
+            "date": latest[0],
+            "total_extensions": latest[1],
+            "core_count": latest[2],
+            "community_count": latest[3],
+            "active_30d": latest[4],
+            "active_7d": latest[5],
+            "new_extensions": latest[6] or [],
+            "removed_extensions": latest[7] or [],
+            "avg_days_since_update": latest[8],
+            "total_stars": latest[9],
+            "total_forks": latest[10],
+            "archived_count": latest[11],
+        }
+
+        # Calculate deltas if we have previous data
+        if previous:
+            summary["total_delta"] = latest[1] - previous[1]
+            summary["community_delta"] = latest[3] - previous[3]
+            summary["active_30d_delta"] = latest[4] - previous[4]
+            summary["stars_delta"] = (
+                latest[9] - previous[9] if latest[9] and previous[9] else None
+            )
+
+        return summary
@@ -0,0 +1,274 @@
+"""
+Local Extension Binary Store for DuckDB Extensions Analysis.
+
+Extension binaries are downloaded once per (DuckDB version, platform, extension)
+and revalidated by ETag, so install tests can INSTALL from local files instead
+of downloading the same binary again for every test, version and run.
+
+Binaries are stored once by content hash under ``blobs/`` and linked into a
+``repository/`` tree that uses DuckDB's local repository layout, so
+``INSTALL <name> FROM '<repository>'`` works against the store directly.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import httpx
+from loguru import logger
+
+
+@dataclass
+class StoredExtension:
+    """A locally stored extension binary."""
+
+    duckdb_version: str
+    platform: str
+    extension_name: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    sha256: str
+    size_bytes: int
+    path: Path
+
+
+class ExtensionBinaryStore:
+    """Content-addressed store of extension binaries keyed by version, platform and name."""
+
+    REPOSITORY_URLS = {
+        "core": "http://extensions.duckdb.org",
+        "community": "http://community-extensions.duckdb.org",
+    }
+
+    def __init__(self, store_dir: Path, max_concurrency: int = 8):
+        self.store_dir = Path(store_dir)
+        self.blob_dir = self.store_dir / "blobs"
+        self.repository_dir = self.store_dir / "repository"
+        self.index_path = self.store_dir / "index.json"
+        self.max_concurrency = max_concurrency
+        self._index: Dict[str, Dict] = self._load_index()
+
+    @staticmethod
+    def version_tag(duckdb_version: str) -> str:
+        """Get the repository path component for a DuckDB version (e.g. v1.3.2)."""
+        return (
+            duckdb_version if duckdb_version.startswith("v") else f"v{duckdb_version}"
+        )
+
+    def _key(self, duckdb_version: str, platform: str, extension_name: str) -> str:
+        return f"{self.version_tag(duckdb_version)}/{platform}/{extension_name}"
+
+    def _load_index(self) -> Dict[str, Dict]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            return json.loads(self.index_path.read_text())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable extension store index: {e}")
+            return {}
+
+    def _save_index(self) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._index, indent=2, sort_keys=True))
+        tmp_path.replace(self.index_path)
+
+    def local_path(
+        self, duckdb_version: str, platform: str, extension_name: str
+    ) -> Path:
+        """Path of an extension inside the local repository tree."""
+        return (
+            self.repository_dir
+            / self.version_tag(duckdb_version)
+            / platform
+            / f"{extension_name}.duckdb_extension"
+        )
+
+    def remote_url(
+        self,
+        duckdb_version: str,
+        platform: str,
+        extension_name: str,
+        repository: str = "core",
+    ) -> str:
+        """URL of an extension binary in a remote repository."""
+        return (
+            f"{self.REPOSITORY_URLS[repository]}/{self.version_tag(duckdb_version)}"
+            f"/{platform}/{extension_name}.duckdb_extension.gz"
+        )
+
+    def get(
+        self, duckdb_version: str, platform: str, extension_name: str
+    ) -> Optional[StoredExtension]:
+        """Get a stored extension, or None if it has not been downloaded."""
+        entry = self._index.get(self._key(duckdb_version, platform, extension_name))
+        path = self.local_path(duckdb_version, platform, extension_name)
+        if not entry or not path.exists():
+            return None
+        return StoredExtension(
+            duckdb_version=duckdb_version,
+            platform=platform,
+            extension_name=extension_name,
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
+            sha256=entry["sha256"],
+            size_bytes=entry["size_bytes"],
+            path=path,
+        )
+
+    def install_sql(
+        self, duckdb_version: str, platform: str, extension_name: str
+    ) -> str:
+        """INSTALL statement that uses the local copy when there is one."""
+        if self.get(duckdb_version, platform, extension_name):
+            return f"INSTALL {extension_name} FROM '{self.repository_dir.resolve().as_posix()}'"
+        return f"INSTALL {extension_name}"
+
+    def _store_blob(self, data: bytes) -> str:
+        """Write a binary to the blob directory once, returning its hash."""
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self.blob_dir / digest
+        if not blob_path.exists():
+            self.blob_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(blob_path)
+        return digest
+
+    def _link_blob(self, digest: str, path: Path) -> None:
+        """Point a repository path at a blob, hard-linking where possible."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)
+        try:
+            os.link(self.blob_dir / digest, path)
+        except OSError:
+            shutil.copyfile(self.blob_dir / digest, path)
+
+    async def fetch(
+        self,
+        client: httpx.AsyncClient,
+        duckdb_version: str,
+        platform: str,
+        extension_name: str,
+        repository: str = "core",
+    ) -> Optional[StoredExtension]:
+        """Download an extension unless the stored copy's ETag is still current.
+
+        Returns None when the repository has no such extension.
+        """
+        existing = self.get(duckdb_version, platform, extension_name)
+        url = self.remote_url(duckdb_version, platform, extension_name, repository)
+        headers = {}
+        if existing and existing.etag:
+            headers["If-None-Match"] = existing.etag
+
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304 and existing:
+            return existing
+        if response.status_code in (403, 404):
+            return None
+        response.raise_for_status()
+
+        data = response.content
+        if data[:2] == b"\x1f\x8b":
+            data = gzip.decompress(data)
+
+        digest = self._store_blob(data)
+        self._link_blob(
+            digest, self.local_path(duckdb_version, platform, extension_name)
+        )
+        self._index[self._key(duckdb_version, platform, extension_name)] = {
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "sha256": digest,
+            "size_bytes": len(data),
+            "repository": repository,
+        }
+        logger.debug(
+            f"Stored {extension_name} for {duckdb_version}/{platform} ({len(data)} bytes)"
+        )
+        return self.get(duckdb_version, platform, extension_name)
+
+    async def populate(
+        self,
+        items: Iterable[Tuple[str, str, str]],
+        repository: str = "core",
+    ) -> Dict[Tuple[str, str, str], Optional[StoredExtension]]:
+        """Download or revalidate many extensions in one concurrent pass.
+
+        Args:
+            items: (duckdb_version, platform, extension_name) tuples
+
+        Returns:
+            Stored extension (or None if unavailable) for each requested item
+        """
+        items = list(dict.fromkeys(items))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(
+            client: httpx.AsyncClient, item: Tuple[str, str, str]
+        ) -> Optional[StoredExtension]:
+            async with semaphore:
+                try:
+                    return await self.fetch(client, *item, repository=repository)
+                except Exception as e:
+                    logger.debug(f"Could not store extension {'/'.join(item)}: {e}")
+                    return self.get(*item)
+
+        async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
+            stored = await asyncio.gather(*(fetch_one(client, item) for item in items))
+
+        self._save_index()
+        available = sum(1 for s in stored if s is not None)
+        logger.info(
+            f"Extension binary store: {available}/{len(items)} binaries available locally"
+        )
+        return dict(zip(items, stored))
+
+    async def check_last_modified(
+        self,
+        items: Iterable[Tuple[str, str, str]],
+        repository: str = "core",
+    ) -> Dict[Tuple[str, str, str], Optional[str]]:
+        """Get each remote binary's Last-Modified header with concurrent HEAD requests.
+
+        Args:
+            items: (duckdb_version, platform, extension_name) tuples
+
+        Returns:
+            Last-Modified value for each item, or None if unavailable
+        """
+        items = list(dict.fromkeys(items))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def head_one(
+            client: httpx.AsyncClient, item: Tuple[str, str, str]
+        ) -> Optional[str]:
+            url = self.remote_url(*item, repository=repository)
+            async with semaphore:
+                try:
+                    response = await client.head(url)
+                except Exception as e:
+                    logger.debug(f"Could not check {'/'.join(item)}: {e}")
+                    return None
+            if response.status_code != 200:
+                return None
+            return response.headers.get("last-modified")
+
+        async with httpx.AsyncClient(timeout=30, follow_redirects=True) as client:
+            values = await asyncio.gather(*(head_one(client, item) for item in items))
+        return dict(zip(items, values))
+
+    def populate_sync(
+        self,
+        items: Iterable[Tuple[str, str, str]],
+        repository: str = "core",
+    ) -> Dict[Tuple[str, str, str], Optional[StoredExtension]]:
+        """Blocking wrapper around populate() for synchronous scripts."""
+        return asyncio.run(self.populate(items, repository=repository))
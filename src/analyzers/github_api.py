@@ -19,6 +19,29 @@ from tenacity import (
     wait_exponential,
 )
 
+# Retry policy shared by all cached GitHub API fetches
+_github_retry = retry(
+    stop=stop_after_attempt(
+        3
+    ),  # Reduced from 5 to avoid making abuse detection worse
+    wait=wait_exponential(
+        multiplier=3, min=5, max=120
+    ),  # Longer waits: 5s, 15s, 45s
+    retry=lambda retry_state: retry_state.outcome.failed
+    and (
+        retry_state.attempt_number == 1
+        or (
+            hasattr(retry_state.outcome.exception(), "response")
+            and retry_state.outcome.exception().response.status_code
+            in (403, 429, 500, 502, 503, 504)
+        )
+    ),
+    before_sleep=lambda retry_state: logger.warning(
+        f"Retry attempt {retry_state.attempt_number} for GitHub API after error: "
+        f"{retry_state.outcome.exception()}"
+    ),
+)
+
 
 class GitHubAPIClient:
     """GitHub API client with caching and retry logic."""
@@ -103,27 +126,7 @@ class GitHubAPIClient:
             return True
         return False
 
-    @retry(
-        stop=stop_after_attempt(
-            3
-        ),  # Reduced from 5 to avoid making abuse detection worse
-        wait=wait_exponential(
-            multiplier=3, min=5, max=120
-        ),  # Longer waits: 5s, 15s, 45s
-        retry=lambda retry_state: retry_state.outcome.failed
-        and (
-            retry_state.attempt_number == 1
-            or (
-                hasattr(retry_state.outcome.exception(), "response")
-                and retry_state.outcome.exception().response.status_code
-                in (403, 429, 500, 502, 503, 504)
-            )
-        ),
-        before_sleep=lambda retry_state: logger.warning(
-            f"Retry attempt {retry_state.attempt_number} for GitHub API after error: "
-            f"{retry_state.outcome.exception()}"
-        ),
-    )
+    @_github_retry
     async def fetch_cached(
         self, client: httpx.AsyncClient, url: str, cache_hours: Optional[int] = None
     ) -> dict:
@@ -279,6 +282,68 @@ class GitHubAPIClient:
             logger.warning(f"Failed to fetch repository info for {repo_path}: {e}")
             return None
 
+    @_github_retry
+    async def get_readme(
+        self,
+        client: httpx.AsyncClient,
+        repo_path: str,
+        max_bytes: int = 200_000,
+        cache_hours: Optional[int] = None,
+    ) -> Optional[str]:
+        """Get a repository's README as raw text in a single request.
+
+        Uses the /readme endpoint, which resolves whichever README file the
+        repository has, with the raw media type so the body is not base64 JSON.
+        Responses are cached with their ETag for conditional revalidation, and at
+        most ``max_bytes`` of the README are downloaded.
+        """
+        cache_hours = cache_hours or self.cache_hours
+        url = f"{self.github_api_base}/repos/{repo_path}/readme"
+        request_headers = self.headers.copy()
+        request_headers["Accept"] = "application/vnd.github.raw"
+        cache_key = self.get_cache_key(url, request_headers)
+
+        cached_data = self.cache.get(cache_key)
+        if cached_data:
+            cached_time, data = cached_data
+            if datetime.now() - cached_time < timedelta(hours=cache_hours):
+                logger.debug(f"✓ Cache hit: repos/{repo_path}/readme")
+                return data["text"]
+            if data.get("etag"):
+                request_headers["If-None-Match"] = data["etag"]
+
+        async with self.rate_limiter:
+            logger.info(f"→ API fetch: repos/{repo_path}/readme")
+            async with client.stream(
+                "GET", url, headers=request_headers, timeout=10, follow_redirects=True
+            ) as response:
+                # 304 and 404 responses report the rate limit too
+                self._update_rate_limit_state(response.headers)
+
+                if response.status_code == 304 and cached_data:
+                    data = cached_data[1]
+                elif response.status_code == 404:
+                    data = {"text": None}
+                else:
+                    response.raise_for_status()
+
+                    content = bytearray()
+                    async for chunk in response.aiter_bytes():
+                        content.extend(chunk)
+                        if len(content) >= max_bytes:
+                            break
+
+                    data = {
+                        "text": bytes(content[:max_bytes]).decode(
+                            "utf-8", errors="ignore"
+                        ),
+                        "etag": response.headers.get("etag"),
+                    }
+
+        await self._adaptive_throttle()
+        self.cache.set(cache_key, (datetime.now(), data))
+        return data["text"]
+
     async def get_repository_commits(
         self,
         client: httpx.AsyncClient,
@@ -19,6 +19,8 @@ from tenacity import (
     retry_if_exception_type,
 )
 
+from .issue_classification import IssueClassificationRules
+
 
 @dataclass
 class ExtensionIssue:
@@ -42,59 +44,21 @@ class ExtensionIssue:
 class GitHubIssuesTracker:
     """Tracks GitHub issues related to DuckDB extensions."""
 
-    def __init__(self, github_client, cache_hours: int = 6):
+    def __init__(
+        self,
+        github_client,
+        cache_hours: int = 6,
+        classification_rules: Optional[IssueClassificationRules] = None,
+    ):
         self.github_client = github_client
         self.cache_hours = cache_hours
         self.repo_owner = "duckdb"
         self.repo_name = "duckdb"
 
-        # Keywords to identify extension-related issues
-        self.extension_keywords = {
-            "installation": [
-                "install",
-                "loading",
-                "load",
-                "cannot load",
-                "failed to load",
-            ],
-            "availability": [
-                "missing",
-                "not found",
-                "unavailable",
-                "download",
-                "HTTP 404",
-                "HTTP 403",
-            ],
-            "platform": [
-                "macos",
-                "linux",
-                "windows",
-                "arm64",
-                "amd64",
-                "platform",
-                "architecture",
-            ],
-            "build": ["build", "compile", "cmake", "make", "CI/CD"],
-        }
-
-        # Platform identifiers
-        self.platform_keywords = {
-            "linux_amd64": ["linux", "ubuntu", "x64", "amd64"],
-            "linux_arm64": ["linux", "arm64", "aarch64"],
-            "osx_amd64": ["macos", "darwin", "osx", "x64", "amd64", "intel"],
-            "osx_arm64": [
-                "macos",
-                "darwin",
-                "osx",
-                "arm64",
-                "aarch64",
-                "m1",
-                "m2",
-                "m3",
-                "apple silicon",
-            ],
-            "windows_amd64": ["windows", "win32", "win64", "x64", "amd64"],
-        }
+        # Keyword rules for issue type, severity and platform classification
+        self.classification_rules = classification_rules or IssueClassificationRules(
+            github_client.config.config_dir
+        )
 
     async def fetch_extension_issues_from_repos(
         self,
@@ -452,16 +416,8 @@ class GitHubIssuesTracker:
 
     def _extract_mentioned_platforms(self, issue: ExtensionIssue) -> Set[str]:
         """Extract platforms mentioned in the issue."""
-        mentioned_platforms = set()
-        text = f"{issue.title} {issue.body}".lower()
-
-        for platform, keywords in self.platform_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in text:
-                    mentioned_platforms.add(platform)
-                    break
-
-        return mentioned_platforms
+        text = self.classification_rules.issue_text(issue.title, issue.body)
+        return self.classification_rules.extract_platforms(text)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -500,79 +456,13 @@ class GitHubIssuesTracker:
 
     def _classify_issue_type(self, issue: ExtensionIssue) -> str:
         """Classify the type of extension issue."""
-        text = f"{issue.title} {issue.body}".lower()
-
-        # Check for installation issues
-        for keyword in self.extension_keywords["installation"]:
-            if keyword in text:
-                return "installation"
-
-        # Check for availability issues
-        for keyword in self.extension_keywords["availability"]:
-            if keyword in text:
-                return "availability"
-
-        # Check for platform issues
-        for keyword in self.extension_keywords["platform"]:
-            if keyword in text:
-                return "platform"
-
-        # Check for build issues
-        for keyword in self.extension_keywords["build"]:
-            if keyword in text:
-                return "build"
-
-        return "other"
+        text = self.classification_rules.issue_text(issue.title, issue.body)
+        return self.classification_rules.classify_issue_type(text)
 
     def _determine_severity(self, issue: ExtensionIssue) -> str:
         """Determine the severity of the issue."""
-        text = f"{issue.title} {issue.body}".lower()
-
-        # High severity indicators
-        high_severity_keywords = [
-            "critical",
-            "urgent",
-            "crash",
-            "error",
-            "fail",
-            "broken",
-            "cannot",
-            "unable",
-            "not working",
-            "not available",
-        ]
-
-        # Low severity indicators
-        low_severity_keywords = [
-            "enhancement",
-            "feature request",
-            "documentation",
-            "typo",
-            "minor",
-            "improvement",
-            "suggestion",
-        ]
-
-        # Check labels
-        for label in issue.labels:
-            label_lower = label.lower()
-            if any(
-                word in label_lower for word in ["critical", "urgent", "bug", "high"]
-            ):
-                return "high"
-            elif any(word in label_lower for word in ["enhancement", "low", "minor"]):
-                return "low"
-
-        # Check content
-        for keyword in high_severity_keywords:
-            if keyword in text:
-                return "high"
-
-        for keyword in low_severity_keywords:
-            if keyword in text:
-                return "low"
-
-        return "medium"
+        text = self.classification_rules.issue_text(issue.title, issue.body)
+        return self.classification_rules.determine_severity(text, issue.labels)
 
     def _is_general_extension_issue(self, issue: ExtensionIssue) -> bool:
         """Check if this is a general extension-related issue."""
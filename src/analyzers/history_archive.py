@@ -0,0 +1,209 @@
+"""
+Parquet Archive of Analysis History for DuckDB Extensions Analysis.
+
+Each analysis day is exported as a snapshot of the history tables to
+``<archive>/<table>/analysis_date=YYYY-MM-DD/*.parquet``: hive-partitioned,
+zstd-compressed and sorted so row groups cluster by extension. Queries with
+an ``analysis_date`` range only read the partitions they need.
+
+The archive can stand in for the live database: ``attach()`` exposes the
+archived tables under their usual names, so the schema's views and as-of
+macros can be created on top of them.
+"""
+
+import shutil
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import duckdb
+from loguru import logger
+
+
+@dataclass(frozen=True)
+class ArchivedTable:
+    """How one history table is written to and read back from the archive."""
+
+    name: str
+    # Rows of one day's snapshot, with a DATE analysis_date partition column.
+    # $last_run is the day's last run timestamp, $day the day.
+    snapshot_sql: str
+    sort_columns: Tuple[str, ...]
+    # Select list restoring the live table's columns, in order, from the
+    # archived ones (hive partition columns are read back last)
+    restore_sql: str = "*"
+
+
+# Daily snapshots are valid for their whole day
+_VALID_FOR_DAY = (
+    "CAST(analysis_date AS TIMESTAMP) AS valid_from, "
+    "CAST(analysis_date + INTERVAL 1 DAY AS TIMESTAMP) AS valid_to"
+)
+
+
+class HistoryArchive:
+    """Hive-partitioned Parquet archive of the analysis history tables."""
+
+    TABLES = [
+        ArchivedTable(
+            "analysis_runs",
+            "SELECT *, CAST(run_timestamp AS DATE) AS analysis_date "
+            "FROM analysis_runs WHERE CAST(run_timestamp AS DATE) = $day",
+            ("run_timestamp",),
+            "* EXCLUDE (analysis_date)",
+        ),
+        # The exact run time is kept as analysis_timestamp, because the
+        # partition column takes over the analysis_date name
+        ArchivedTable(
+            "core_extensions_history",
+            "SELECT * EXCLUDE (analysis_date), CAST($last_run AS TIMESTAMP) AS analysis_timestamp, "
+            "CAST($day AS DATE) AS analysis_date FROM core_extensions_as_of(CAST($last_run AS TIMESTAMP))",
+            ("name",),
+            "* EXCLUDE (analysis_date, analysis_timestamp), "
+            f"analysis_timestamp AS analysis_date, {_VALID_FOR_DAY}",
+        ),
+        ArchivedTable(
+            "community_extensions_history",
+            "SELECT * EXCLUDE (analysis_date), CAST($last_run AS TIMESTAMP) AS analysis_timestamp, "
+            "CAST($day AS DATE) AS analysis_date FROM community_extensions_as_of(CAST($last_run AS TIMESTAMP))",
+            ("name",),
+            "* EXCLUDE (analysis_date, analysis_timestamp), "
+            f"analysis_timestamp AS analysis_date, {_VALID_FOR_DAY}",
+        ),
+        ArchivedTable(
+            "extension_availability_history",
+            "SELECT * REPLACE (CAST($last_run AS TIMESTAMP) AS check_timestamp), "
+            "CAST($day AS DATE) AS analysis_date "
+            "FROM extension_availability_as_of(CAST($last_run AS TIMESTAMP))",
+            ("extension_name", "platform", "duckdb_version"),
+            f"* EXCLUDE (analysis_date), {_VALID_FOR_DAY}",
+        ),
+        ArchivedTable(
+            "extension_metrics_daily",
+            "SELECT * FROM extension_metrics_as_of(CAST($day AS DATE))",
+            ("extension_type", "extension_name"),
+            "id, extension_name, extension_type, analysis_date, "
+            "* EXCLUDE (id, extension_name, extension_type, analysis_date), "
+            "analysis_date AS valid_from, analysis_date + 1 AS valid_to",
+        ),
+        ArchivedTable(
+            "extension_trends_summary",
+            "SELECT * FROM extension_trends_summary WHERE analysis_date = CAST($day AS DATE)",
+            ("analysis_date",),
+            "analysis_date, * EXCLUDE (analysis_date)",
+        ),
+    ]
+
+    def __init__(self, archive_dir: Path):
+        self.archive_dir = Path(archive_dir)
+
+    def table_dir(self, table: str) -> Path:
+        return self.archive_dir / table
+
+    def partition_dir(self, table: str, day: date) -> Path:
+        return self.table_dir(table) / f"analysis_date={day.isoformat()}"
+
+    def read_parquet_sql(self, table: str) -> str:
+        """read_parquet() call over every partition of an archived table."""
+        pattern = (self.table_dir(table) / "*" / "*.parquet").as_posix()
+        return (
+            f"read_parquet('{pattern}', hive_partitioning = true, "
+            "hive_types = {'analysis_date': DATE}, union_by_name = true)"
+        )
+
+    @staticmethod
+    def analysis_days(conn: duckdb.DuckDBPyConnection) -> List[Tuple[date, datetime]]:
+        """Every analysis day with the timestamp of its last run."""
+        return conn.execute(
+            """
+            SELECT CAST(run_timestamp AS DATE) AS day, MAX(run_timestamp)
+            FROM analysis_runs
+            GROUP BY day
+            ORDER BY day
+        """
+        ).fetchall()
+
+    def export(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        days: Optional[Iterable[date]] = None,
+    ) -> Dict[str, int]:
+        """Write (or rewrite) the snapshot of each analysis day to the archive.
+
+        Args:
+            conn: Connection to a live database with an up-to-date schema
+            days: Days to export; all analysis days when None
+
+        Returns:
+            Number of archived rows per table
+        """
+        wanted = set(days) if days is not None else None
+        runs = [
+            (day, last_run)
+            for day, last_run in self.analysis_days(conn)
+            if wanted is None or day in wanted
+        ]
+
+        counts = {table.name: 0 for table in self.TABLES}
+        for day, last_run in runs:
+            for table in self.TABLES:
+                counts[table.name] += self._export_table_day(conn, table, day, last_run)
+
+        logger.info(
+            f"Archived {len(runs)} analysis day(s) to {self.archive_dir}: "
+            + ", ".join(f"{name}={count}" for name, count in counts.items())
+        )
+        return counts
+
+    def _export_table_day(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        table: ArchivedTable,
+        day: date,
+        last_run: datetime,
+    ) -> int:
+        # A day is rewritten whole, so a later run on the same day replaces it
+        shutil.rmtree(self.partition_dir(table.name, day), ignore_errors=True)
+
+        # DuckDB rejects parameters a statement does not reference
+        params = {"last_run": last_run, "day": day}
+        params = {k: v for k, v in params.items() if f"${k}" in table.snapshot_sql}
+        rows = conn.execute(
+            f"SELECT COUNT(*) FROM ({table.snapshot_sql})", params
+        ).fetchone()[0]
+        if not rows:
+            return 0
+
+        self.table_dir(table.name).mkdir(parents=True, exist_ok=True)
+        conn.execute(
+            f"""
+            COPY ({table.snapshot_sql} ORDER BY {", ".join(table.sort_columns)})
+            TO '{self.table_dir(table.name).as_posix()}' (
+                FORMAT parquet,
+                COMPRESSION zstd,
+                PARTITION_BY (analysis_date),
+                OVERWRITE_OR_IGNORE true,
+                FILENAME_PATTERN 'snapshot_{{i}}'
+            )
+        """,
+            params,
+        )
+        return rows
+
+    def attach(self, conn: duckdb.DuckDBPyConnection) -> List[str]:
+        """Expose archived tables as views named like the live tables.
+
+        Returns:
+            Names of the tables found in the archive
+        """
+        attached = []
+        for table in self.TABLES:
+            if not any(self.table_dir(table.name).glob("*/*.parquet")):
+                continue
+            conn.execute(
+                f"CREATE OR REPLACE VIEW {table.name} AS "
+                f"SELECT {table.restore_sql} FROM {self.read_parquet_sql(table.name)}"
+            )
+            attached.append(table.name)
+        return attached
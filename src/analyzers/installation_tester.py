@@ -3,18 +3,30 @@ Real-time Extension Installation Tester for DuckDB Extensions Analysis.
 
 This module uses `uv` to create isolated testing environments and actually
 attempts to install and load extensions in DuckDB to verify they work correctly.
+One environment is built per DuckDB version and kept in a content-addressed
+cache, so it is reused by every extension tested against that version. Tests
+are served by a pool of long-lived worker processes, one test per worker at a
+time, so many (version, extension) pairs run in parallel.
 """
 
 import asyncio
-import tempfile
+import hashlib
 import json
+import os
 import platform
-from typing import List, Optional
+import shutil
+import sys
+import tempfile
+from collections import deque
+from time import monotonic
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
 from loguru import logger
 
+from .extension_store import ExtensionBinaryStore
+
 
 @dataclass
 class InstallationTestResult:
@@ -32,13 +44,209 @@ class InstallationTestResult:
     test_environment: str
     functional_test_passed: Optional[bool] = None
     test_query_used: Optional[str] = None
+    # Installed binary
+    file_size_bytes: Optional[int] = None
+    extension_path: Optional[str] = None
+    # Benchmark mode only
+    benchmark_runs: Optional[int] = None
+    load_time_p50: Optional[float] = None
+    load_time_p95: Optional[float] = None
+    rss_growth_bytes: Optional[int] = None
+    functional_test_time_p50: Optional[float] = None
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised when a test worker exits before returning a result."""
+
+
+class ExtensionTestWorker:
+    """Long-lived test process for one DuckDB version's environment.
+
+    Jobs are sent as JSON lines on stdin and results are read back from stdout,
+    so the interpreter start and ``import duckdb`` are paid once per worker
+    instead of once per test. Every job gets a fresh connection and its own
+    ``extension_directory``. The process is replaced after it crashes, times
+    out, or has served ``max_jobs`` jobs.
+    """
+
+    STARTUP_TIMEOUT_SECONDS = 60
+    STDERR_TAIL_LINES = 20
+
+    def __init__(self, env_dir: Path, python: Path, max_jobs: int = 50):
+        self.env_dir = env_dir
+        self.python = python
+        self.max_jobs = max_jobs
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        self._stderr_tail: deque = deque(maxlen=self.STDERR_TAIL_LINES)
+        self._jobs_served = 0
+        self._next_job_id = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def _drain_stderr(self) -> None:
+        """Keep the last lines of stderr so the pipe never fills up."""
+        async for line in self._process.stderr:
+            self._stderr_tail.append(line.decode(errors="replace").rstrip())
+
+    def _crash_message(self) -> str:
+        detail = "\n".join(self._stderr_tail)
+        return f"Test worker crashed: {detail}" if detail else "Test worker crashed"
+
+    async def _start(self) -> None:
+        """Start a worker process and wait until duckdb is imported."""
+        self._stderr_tail.clear()
+        self._jobs_served = 0
+        self._process = await asyncio.create_subprocess_exec(
+            str(self.python),
+            "test_extension.py",
+            "--worker",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self.env_dir,
+        )
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
+
+        try:
+            line = await asyncio.wait_for(
+                self._process.stdout.readline(), timeout=self.STARTUP_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            await self.close()
+            raise WorkerCrashedError(
+                f"Test worker did not start within {self.STARTUP_TIMEOUT_SECONDS} seconds"
+            )
+
+        if not line:
+            await self._wait_for_exit()
+            raise WorkerCrashedError(self._crash_message())
+
+        logger.debug(f"Started test worker for {self.env_dir.name}")
+
+    async def _wait_for_exit(self) -> None:
+        """Reap a dead or killed worker and collect the rest of its stderr."""
+        if self._process is None:
+            return
+        if self._process.returncode is None:
+            self._process.kill()
+        await self._process.wait()
+        if self._stderr_task:
+            try:
+                await asyncio.wait_for(self._stderr_task, timeout=1)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._stderr_task.cancel()
+        self._process = None
+        self._stderr_task = None
+
+    async def run_job(
+        self,
+        extension_name: str,
+        test_query: Optional[str],
+        timeout_seconds: int,
+        extension_repository: Optional[str] = None,
+        benchmark_runs: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Run one extension test in the worker and return its result dict.
+
+        ``extension_repository`` is a local repository to INSTALL from instead
+        of downloading the extension. ``benchmark_runs`` also times that many
+        repeated LOADs.
+
+        Raises:
+            asyncio.TimeoutError: the test did not finish in time (worker is killed)
+            WorkerCrashedError: the worker exited before returning a result
+        """
+        async with self._lock:
+            if not self.is_running:
+                await self._start()
+
+            self._next_job_id += 1
+            extension_directory = tempfile.mkdtemp(prefix=f"{extension_name}-")
+            job = {
+                "job_id": self._next_job_id,
+                "extension_name": extension_name,
+                "test_query": test_query,
+                "extension_directory": extension_directory,
+                "extension_repository": extension_repository,
+                "benchmark_runs": benchmark_runs,
+            }
+
+            try:
+                self._process.stdin.write((json.dumps(job) + "\n").encode())
+                await self._process.stdin.drain()
+                line = await asyncio.wait_for(
+                    self._process.stdout.readline(), timeout=timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                await self._wait_for_exit()
+                raise
+            except (BrokenPipeError, ConnectionResetError):
+                line = b""
+            finally:
+                shutil.rmtree(extension_directory, ignore_errors=True)
+
+            if not line:
+                await self._wait_for_exit()
+                raise WorkerCrashedError(self._crash_message())
+
+            self._jobs_served += 1
+            if self._jobs_served >= self.max_jobs:
+                await self._stop()
+
+            return json.loads(line)
+
+    async def _stop(self) -> None:
+        """Ask the worker to exit by closing its stdin."""
+        if not self.is_running:
+            return
+        self._process.stdin.close()
+        try:
+            await asyncio.wait_for(self._process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            pass
+        await self._wait_for_exit()
+
+    async def close(self) -> None:
+        """Stop the worker process if it is running."""
+        async with self._lock:
+            await self._stop()
 
 
 class InstallationTester:
     """Tests actual extension installation and loading using uv-managed environments."""
 
-    def __init__(self):
+    # Building an environment resolves and installs the DuckDB wheel, which can
+    # take far longer than a single extension test.
+    ENV_SETUP_TIMEOUT_SECONDS = 600
+
+    def __init__(
+        self,
+        env_cache_dir: Optional[Path] = None,
+        max_jobs_per_worker: int = 50,
+        max_workers: Optional[int] = None,
+        binary_store: Optional[ExtensionBinaryStore] = None,
+        benchmark_runs: Optional[int] = None,
+    ):
         self.platform = self._get_current_platform()
+        self.binary_store = binary_store
+        self.env_cache_dir = env_cache_dir or Path(".cache/installation_envs")
+        self.benchmark_runs = benchmark_runs
+        # Benchmarks get a fresh worker process per test, so RSS growth and
+        # LOAD latency are not skewed by extensions loaded by earlier tests.
+        self.max_jobs_per_worker = 1 if benchmark_runs else max_jobs_per_worker
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._env_locks: Dict[str, asyncio.Lock] = {}
+        self._env_info: Dict[str, Dict[str, str]] = {}
+
+        # Worker pool: at most max_workers tests run at once, and idle workers
+        # are kept per environment so the next test for that version reuses one.
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._idle_workers: Dict[str, List[ExtensionTestWorker]] = {}
+        self._busy_workers = 0
 
         # Extension-specific functional test queries
         self.extension_test_queries = {
@@ -75,12 +283,66 @@ class InstallationTester:
         # Test script template for running in isolated environment
         self.test_script_template = '''
 import duckdb
+import math
+import os
 import sys
 import json
 import time
 
-def test_extension(extension_name, test_query=None):
-    """Test extension installation, loading, and basic functionality."""
+def rss_bytes():
+    """Resident set size of this process, or None if it cannot be read."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+        # Peak RSS: kilobytes on Linux, bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+    except Exception:
+        return None
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+def benchmark_extension(extension_name, test_query, config, runs):
+    """Time LOAD and the test query on fresh connections to an installed extension."""
+    load_times = []
+    query_times = []
+    for _ in range(runs):
+        conn = duckdb.connect(":memory:", config=config)
+        try:
+            start = time.perf_counter()
+            conn.execute(f"LOAD {extension_name}")
+            load_times.append(time.perf_counter() - start)
+            if test_query:
+                start = time.perf_counter()
+                try:
+                    conn.execute(test_query).fetchall()
+                    query_times.append(time.perf_counter() - start)
+                except Exception:
+                    test_query = None
+        finally:
+            conn.close()
+
+    return {
+        "benchmark_runs": runs,
+        "load_time_p50": percentile(load_times, 0.50),
+        "load_time_p95": percentile(load_times, 0.95),
+        "functional_test_time_p50": percentile(query_times, 0.50) if query_times else None,
+    }
+
+def test_extension(extension_name, test_query=None, extension_directory=None, extension_repository=None, benchmark_runs=None):
+    """Test extension installation, loading, and basic functionality.
+
+    With benchmark_runs, LOAD and the test query are also timed over that many
+    fresh connections, and the RSS growth of the first LOAD is recorded.
+    """
     result = {
         "success": False,
         "install_time": 0.0,
@@ -98,24 +360,45 @@ def test_extension(extension_name, test_query=None):
     total_start = time.time()
     
     try:
-        # Create temporary database
-        conn = duckdb.connect(":memory:")
+        # Create temporary database, optionally with its own extension directory
+        config = {"extension_directory": extension_directory} if extension_directory else {}
+        conn = duckdb.connect(":memory:", config=config)
         
         # Install extension
         install_start = time.time()
         try:
-            conn.execute(f"INSTALL {extension_name}")
+            if extension_repository:
+                conn.execute(f"INSTALL {extension_name} FROM '{extension_repository}'")
+            else:
+                conn.execute(f"INSTALL {extension_name}")
             result["install_time"] = time.time() - install_start
         except Exception as e:
             result["error_message"] = str(e)
             result["total_time"] = time.time() - total_start
             return result
+
+        # Record the installed binary
+        try:
+            row = conn.execute(
+                "SELECT install_path FROM duckdb_extensions() WHERE extension_name = ?",
+                [extension_name],
+            ).fetchone()
+            if row and row[0] and os.path.exists(row[0]):
+                result["extension_path"] = row[0]
+                result["file_size_bytes"] = os.path.getsize(row[0])
+        except Exception:
+            pass
         
         # Load extension
+        rss_before = rss_bytes() if benchmark_runs else None
         load_start = time.time()
         try:
             conn.execute(f"LOAD {extension_name}")
             result["load_time"] = time.time() - load_start
+            if rss_before is not None:
+                rss_after = rss_bytes()
+                if rss_after is not None:
+                    result["rss_growth_bytes"] = rss_after - rss_before
         except Exception as e:
             result["error_message"] = str(e)
             result["total_time"] = time.time() - total_start
@@ -136,6 +419,11 @@ def test_extension(extension_name, test_query=None):
         
         conn.close()
         result["success"] = True
+
+        if benchmark_runs:
+            result.update(
+                benchmark_extension(extension_name, test_query, config, benchmark_runs)
+            )
         
     except Exception as e:
         result["error_message"] = str(e)
@@ -143,8 +431,39 @@ def test_extension(extension_name, test_query=None):
     result["total_time"] = time.time() - total_start
     return result
 
+def run_worker():
+    """Serve test jobs sent as JSON lines on stdin until stdin is closed."""
+    import os
+
+    # Keep the protocol on a private copy of stdout; anything an extension
+    # prints goes to stderr instead of corrupting the result stream.
+    protocol = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+
+    protocol.write(json.dumps({"ready": True}) + "\\n")
+    protocol.flush()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        result = test_extension(
+            job["extension_name"],
+            job.get("test_query"),
+            job.get("extension_directory"),
+            job.get("extension_repository"),
+            job.get("benchmark_runs"),
+        )
+        result["job_id"] = job["job_id"]
+        protocol.write(json.dumps(result) + "\\n")
+        protocol.flush()
+
 if __name__ == "__main__":
     import sys
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        run_worker()
+        sys.exit(0)
+
     extension_name = sys.argv[1]
     test_query = sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] != "None" else None
     
@@ -224,196 +543,304 @@ if __name__ == "__main__":
 
         return None
 
-    async def test_extensions_batch(
+    def _duckdb_requirement(self, duckdb_pypi_version: str = "") -> str:
+        """Get the pip requirement for the DuckDB version under test."""
+        return (
+            f"duckdb=={duckdb_pypi_version}" if duckdb_pypi_version else "duckdb>=1.0.0"
+        )
+
+    def _environment_dir(self, duckdb_pypi_version: str = "") -> Path:
+        """Get the cache directory for a DuckDB version's environment.
+
+        The directory name is derived from everything that determines the
+        environment's contents, so a changed requirement or test script never
+        reuses a stale environment.
+        """
+        requirement = self._duckdb_requirement(duckdb_pypi_version)
+        digest = hashlib.sha256(
+            "\n".join(
+                [requirement, self.platform, self.test_script_template]
+            ).encode()
+        ).hexdigest()[:16]
+        label = duckdb_pypi_version or "latest"
+        return self.env_cache_dir / f"duckdb-{label}-{digest}"
+
+    @staticmethod
+    def _environment_python(env_dir: Path) -> Path:
+        """Get the Python interpreter inside a cached environment."""
+        if sys.platform == "win32":
+            return env_dir / ".venv" / "Scripts" / "python.exe"
+        return env_dir / ".venv" / "bin" / "python"
+
+    async def _run_setup_command(self, cmd: List[str]) -> str:
+        """Run an environment setup command, returning its output or raising on failure."""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=self.ENV_SETUP_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise RuntimeError(
+                f"'{' '.join(cmd[:3])}' timed out after "
+                f"{self.ENV_SETUP_TIMEOUT_SECONDS} seconds"
+            )
+
+        if process.returncode != 0:
+            raise RuntimeError(stderr.decode().strip() or f"{cmd[:3]} failed")
+
+        return stdout.decode()
+
+    async def _ensure_environment(self, duckdb_pypi_version: str = "") -> Path:
+        """Get the cached environment for a DuckDB version, building it once.
+
+        The environment is built in a staging directory and renamed into place
+        when complete, so an interrupted build is never mistaken for a ready one.
+        """
+        env_dir = self._environment_dir(duckdb_pypi_version)
+        lock = self._env_locks.setdefault(env_dir.name, asyncio.Lock())
+
+        async with lock:
+            if (env_dir / ".ready").exists():
+                return env_dir
+
+            logger.info(f"Building test environment {env_dir.name}")
+            staging_dir = env_dir.with_name(env_dir.name + ".building")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            staging_dir.mkdir(parents=True)
+
+            try:
+                venv_dir = staging_dir / ".venv"
+                await self._run_setup_command(["uv", "venv", "--quiet", str(venv_dir)])
+                await self._run_setup_command(
+                    [
+                        "uv",
+                        "pip",
+                        "install",
+                        "--quiet",
+                        "--python",
+                        str(self._environment_python(staging_dir)),
+                        self._duckdb_requirement(duckdb_pypi_version),
+                    ]
+                )
+                probe = await self._run_setup_command(
+                    [
+                        str(self._environment_python(staging_dir)),
+                        "-c",
+                        "import duckdb, json; print(json.dumps({"
+                        "'duckdb_version': duckdb.__version__, "
+                        "'platform': duckdb.execute('PRAGMA platform').fetchone()[0]}))",
+                    ]
+                )
+                env_info = json.loads(probe)
+                env_info["requirement"] = self._duckdb_requirement(duckdb_pypi_version)
+
+                (staging_dir / "test_extension.py").write_text(
+                    self.test_script_template
+                )
+                (staging_dir / ".ready").write_text(json.dumps(env_info))
+
+                shutil.rmtree(env_dir, ignore_errors=True)
+                staging_dir.rename(env_dir)
+            except Exception:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+                raise
+
+            return env_dir
+
+    def _environment_info(self, env_dir: Path) -> Dict[str, str]:
+        """Get the DuckDB version and platform recorded when an environment was built."""
+        if env_dir.name not in self._env_info:
+            self._env_info[env_dir.name] = json.loads((env_dir / ".ready").read_text())
+        return self._env_info[env_dir.name]
+
+    def _local_repository(self, env_dir: Path, extension_name: str) -> Optional[str]:
+        """Get the local repository holding an extension for an environment, if stored."""
+        if self.binary_store is None:
+            return None
+        info = self._environment_info(env_dir)
+        if not self.binary_store.get(
+            info["duckdb_version"], info["platform"], extension_name
+        ):
+            return None
+        return str(self.binary_store.repository_dir.resolve())
+
+    async def prefetch_binaries(
         self,
-        extension_names: List[str],
-        duckdb_pypi_version: str = "",
-        *,
-        timeout_seconds: int = 120,
-    ) -> List[InstallationTestResult]:
+        pairs: List[Tuple[str, str]],
+        community_extensions: Iterable[str] = (),
+    ) -> None:
+        """Download every binary a test run needs in one concurrent pass.
+
+        Environments are built first so the store is keyed by the DuckDB
+        version and platform each environment actually reports.
+
+        Args:
+            pairs: DuckDB PyPI version and extension name for each test
+            community_extensions: Names served by the community repository
         """
-        Test installation of multiple extensions using uv-managed environments.
+        if self.binary_store is None or not pairs:
+            return
+
+        artifact_keys = await self._artifact_keys(pairs)
+        for repository, keys in self._keys_by_repository(
+            artifact_keys.values(), community_extensions
+        ).items():
+            if keys:
+                await self.binary_store.populate(keys, repository=repository)
+
+    @staticmethod
+    def _keys_by_repository(
+        keys: Iterable[Tuple[str, str, str]], community_extensions: Iterable[str]
+    ) -> Dict[str, List[Tuple[str, str, str]]]:
+        """Split store keys between the core and community extension repositories."""
+        community = set(community_extensions)
+        by_repository: Dict[str, List[Tuple[str, str, str]]] = {
+            "core": [],
+            "community": [],
+        }
+        for key in keys:
+            by_repository["community" if key[2] in community else "core"].append(key)
+        return by_repository
+
+    async def _artifact_keys(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Tuple[str, str, str]]:
+        """Map (version, extension) pairs to (duckdb_version, platform, extension) store keys.
+
+        Pairs whose environment could not be built and special cases are left out.
+        """
+        versions = list(dict.fromkeys(version for version, _ in pairs))
+        env_dirs = await asyncio.gather(
+            *(self._ensure_environment(version) for version in versions),
+            return_exceptions=True,
+        )
+        environments = {
+            version: self._environment_info(env_dir)
+            for version, env_dir in zip(versions, env_dirs)
+            if not isinstance(env_dir, Exception)
+        }
+
+        return {
+            (version, extension_name): (
+                environments[version]["duckdb_version"],
+                environments[version]["platform"],
+                extension_name,
+            )
+            for version, extension_name in pairs
+            if version in environments
+            and not self._handle_special_cases(extension_name)
+        }
+
+    async def artifact_last_modified(
+        self,
+        pairs: List[Tuple[str, str]],
+        community_extensions: Iterable[str] = (),
+    ) -> Dict[Tuple[str, str], Optional[str]]:
+        """Get the remote Last-Modified of each pair's extension binary.
 
         Args:
-            extension_names: List of extension names to test
+            pairs: DuckDB PyPI version and extension name for each test
+            community_extensions: Names served by the community repository
 
         Returns:
-            List of InstallationTestResult objects
+            Last-Modified per pair; pairs that could not be checked are omitted
         """
-        logger.info(f"Testing installation of {len(extension_names)} extensions")
+        if self.binary_store is None or not pairs:
+            return {}
 
-        results = []
+        artifact_keys = await self._artifact_keys(pairs)
+        last_modified: Dict[Tuple[str, str, str], Optional[str]] = {}
+        for repository, keys in self._keys_by_repository(
+            artifact_keys.values(), community_extensions
+        ).items():
+            last_modified.update(
+                await self.binary_store.check_last_modified(
+                    keys, repository=repository
+                )
+            )
+        return {pair: last_modified.get(key) for pair, key in artifact_keys.items()}
 
-        for extension_name in extension_names:
-            # Handle special cases
-            special_case_result = self._handle_special_cases(extension_name)
-            if special_case_result:
-                results.append(special_case_result)
-                continue
+    async def _get_worker(self, duckdb_pypi_version: str = "") -> ExtensionTestWorker:
+        """Check out a test worker for a DuckDB version, building its environment once.
 
-            try:
-                result = await self._test_single_extension_with_uv(
-                    extension_name,
-                    duckdb_pypi_version=duckdb_pypi_version,
-                    timeout_seconds=timeout_seconds,
+        Reuses an idle worker for the same environment when there is one. When
+        the pool is full, an idle worker for another version is retired so the
+        number of live processes never exceeds ``max_workers``.
+        """
+        env_dir = await self._ensure_environment(duckdb_pypi_version)
+
+        idle = self._idle_workers.setdefault(env_dir.name, [])
+        if idle:
+            worker = idle.pop()
+        else:
+            idle_count = sum(len(workers) for workers in self._idle_workers.values())
+            if self._busy_workers + idle_count >= self.max_workers:
+                retired = next(
+                    (w.pop() for w in self._idle_workers.values() if w), None
                 )
-                results.append(result)
+                if retired is not None:
+                    await retired.close()
+            worker = ExtensionTestWorker(
+                env_dir,
+                self._environment_python(env_dir),
+                max_jobs=self.max_jobs_per_worker,
+            )
 
-                # Brief pause between tests
-                await asyncio.sleep(1)
+        self._busy_workers += 1
+        return worker
 
-            except Exception as e:
-                logger.warning(f"Failed to test {extension_name}: {e}")
-                results.append(
-                    InstallationTestResult(
-                        extension_name=extension_name,
-                        success=False,
-                        install_time=None,
-                        load_time=None,
-                        functional_test_time=None,
-                        total_time=0.0,
-                        error_message=str(e),
-                        python_version=f"{platform.python_version()}",
-                        duckdb_version_used="unknown",
-                        test_environment="uv",
-                        functional_test_passed=None,
-                        test_query_used=None,
-                    )
-                )
+    def _return_worker(self, worker: ExtensionTestWorker) -> None:
+        """Return a checked-out worker to the idle pool."""
+        self._busy_workers -= 1
+        self._idle_workers.setdefault(worker.env_dir.name, []).append(worker)
 
-        return results
+    async def close(self) -> None:
+        """Stop all idle test workers."""
+        for workers in self._idle_workers.values():
+            for worker in workers:
+                await worker.close()
+        self._idle_workers.clear()
 
-    async def _test_single_extension_with_uv(
+    async def _run_test(
         self,
         extension_name: str,
         duckdb_pypi_version: str = "",
         *,
         timeout_seconds: int = 120,
-    ) -> InstallationTestResult:
-        """Test a single extension using uv-managed environment."""
-
-        # Create temporary directory for this test
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create pyproject.toml for uv
-            duckdb_dep = (
-                f"duckdb=={duckdb_pypi_version}"
-                if duckdb_pypi_version
-                else "duckdb>=1.0.0"
-            )
-            pyproject_content = f"""[project]
-name = "duckdb-extension-test"
-version = "0.1.0"
-dependencies = ["{duckdb_dep}"]
-
-[build-system]
-requires = ["setuptools"]
-build-backend = "setuptools.build_meta"
-"""
+        deadline: Optional[float] = None,
+    ) -> Optional[InstallationTestResult]:
+        """Run one test once a pool slot is free.
 
-            (temp_path / "pyproject.toml").write_text(pyproject_content)
+        Returns None when the runtime budget (a ``time.monotonic`` deadline) ran
+        out before the test could start. A test that starts close to the deadline
+        has its timeout shortened to the remaining budget.
+        """
+        # Handle special cases
+        special_case_result = self._handle_special_cases(extension_name)
+        if special_case_result:
+            return special_case_result
 
-            # Create test script
-            test_script_path = temp_path / "test_extension.py"
-            test_script_path.write_text(self.test_script_template)
+        async with self._slots:
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return None
+                timeout_seconds = min(timeout_seconds, max(1, int(remaining)))
 
             try:
-                # Get test query for this extension
-                test_query = self._get_test_query(extension_name)
-
-                # Run the test in uv environment
-                cmd = [
-                    "uv",
-                    "run",
-                    "--directory",
-                    str(temp_path),
-                    "python",
-                    "test_extension.py",
+                return await self._test_single_extension_with_uv(
                     extension_name,
-                    test_query or "None",
-                ]
-
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=temp_path,
+                    duckdb_pypi_version=duckdb_pypi_version,
+                    timeout_seconds=timeout_seconds,
                 )
-
-                try:
-                    stdout, stderr = await asyncio.wait_for(
-                        process.communicate(), timeout=timeout_seconds
-                    )
-
-                    if process.returncode == 0:
-                        # Parse JSON result
-                        result_data = json.loads(stdout.decode())
-                        return InstallationTestResult(
-                            extension_name=extension_name,
-                            success=result_data.get("success", False),
-                            install_time=result_data.get("install_time"),
-                            load_time=result_data.get("load_time"),
-                            functional_test_time=result_data.get(
-                                "functional_test_time"
-                            ),
-                            total_time=result_data.get("total_time", 0.0),
-                            error_message=result_data.get("error_message"),
-                            python_version=result_data.get("python_version", "unknown"),
-                            duckdb_version_used=result_data.get(
-                                "duckdb_version_used", "unknown"
-                            ),
-                            test_environment=result_data.get("test_environment", "uv"),
-                            functional_test_passed=result_data.get(
-                                "functional_test_passed"
-                            ),
-                            test_query_used=result_data.get("test_query_used"),
-                        )
-                    else:
-                        error_msg = stderr.decode() if stderr else "Process failed"
-                        logger.warning(
-                            f"Extension test failed for {extension_name}: {error_msg}"
-                        )
-
-                        return InstallationTestResult(
-                            extension_name=extension_name,
-                            success=False,
-                            install_time=None,
-                            load_time=None,
-                            functional_test_time=None,
-                            total_time=0.0,
-                            error_message=error_msg,
-                            python_version="unknown",
-                            duckdb_version_used="unknown",
-                            test_environment="uv",
-                            functional_test_passed=None,
-                            test_query_used=test_query,
-                        )
-
-                except asyncio.TimeoutError:
-                    process.kill()
-                    await process.wait()
-                    logger.warning(f"Extension test timed out for {extension_name}")
-
-                    return InstallationTestResult(
-                        extension_name=extension_name,
-                        success=False,
-                        install_time=None,
-                        load_time=None,
-                        functional_test_time=None,
-                        total_time=0.0,
-                        error_message=f"Test timed out after {timeout_seconds} seconds",
-                        python_version="unknown",
-                        duckdb_version_used="unknown",
-                        test_environment="uv",
-                        functional_test_passed=None,
-                        test_query_used=test_query,
-                    )
-
             except Exception as e:
-                logger.error(
-                    f"Failed to create uv environment for {extension_name}: {e}"
-                )
+                logger.warning(f"Failed to test {extension_name}: {e}")
                 return InstallationTestResult(
                     extension_name=extension_name,
                     success=False,
@@ -421,21 +848,192 @@ build-backend = "setuptools.build_meta"
                     load_time=None,
                     functional_test_time=None,
                     total_time=0.0,
-                    error_message=f"Environment setup failed: {str(e)}",
-                    python_version="unknown",
+                    error_message=str(e),
+                    python_version=f"{platform.python_version()}",
                     duckdb_version_used="unknown",
                     test_environment="uv",
                     functional_test_passed=None,
                     test_query_used=None,
                 )
 
+    async def test_extensions_batch(
+        self,
+        extension_names: List[str],
+        duckdb_pypi_version: str = "",
+        *,
+        timeout_seconds: int = 120,
+        max_runtime_seconds: Optional[float] = None,
+    ) -> List[InstallationTestResult]:
+        """
+        Test installation of multiple extensions using uv-managed environments.
+
+        Extensions are tested in parallel across the worker pool.
+
+        Args:
+            extension_names: List of extension names to test
+            duckdb_pypi_version: DuckDB version to test against (latest if empty)
+            timeout_seconds: Timeout for each individual test
+            max_runtime_seconds: Optional budget; tests not started in time are skipped
+
+        Returns:
+            List of InstallationTestResult objects, in input order
+        """
+        logger.info(f"Testing installation of {len(extension_names)} extensions")
+
+        results = await self.test_compatibility_matrix(
+            [(duckdb_pypi_version, name) for name in extension_names],
+            timeout_seconds=timeout_seconds,
+            max_runtime_seconds=max_runtime_seconds,
+        )
+        return [result for result in results if result is not None]
+
+    async def test_compatibility_matrix(
+        self,
+        pairs: List[Tuple[str, str]],
+        *,
+        timeout_seconds: int = 120,
+        max_runtime_seconds: Optional[float] = None,
+        community_extensions: Iterable[str] = (),
+    ) -> List[Optional[InstallationTestResult]]:
+        """
+        Test (duckdb_version, extension_name) pairs in parallel across the worker pool.
+
+        Args:
+            pairs: DuckDB PyPI version and extension name for each test
+            timeout_seconds: Timeout for each individual test
+            max_runtime_seconds: Optional budget for the whole matrix
+            community_extensions: Names served by the community repository
+
+        Returns:
+            One entry per pair, in input order; None for pairs that were skipped
+            because the runtime budget ran out before they started
+        """
+        deadline = (
+            monotonic() + max_runtime_seconds if max_runtime_seconds is not None else None
+        )
+
+        try:
+            await self.prefetch_binaries(pairs, community_extensions)
+        except Exception as e:
+            logger.warning(f"Could not prefetch extension binaries: {e}")
+
+        async def run_pair(
+            duckdb_version: str, extension_name: str
+        ) -> Optional[InstallationTestResult]:
+            result = await self._run_test(
+                extension_name,
+                duckdb_version,
+                timeout_seconds=timeout_seconds,
+                deadline=deadline,
+            )
+            if result is not None and duckdb_version:
+                # Attach the tested version explicitly (even if the underlying
+                # package reports something unexpected).
+                result.duckdb_version_used = duckdb_version
+            return result
+
+        return list(await asyncio.gather(*(run_pair(*pair) for pair in pairs)))
+
+    def _failed_result(
+        self,
+        extension_name: str,
+        error_message: str,
+        test_query: Optional[str] = None,
+        total_time: float = 0.0,
+    ) -> InstallationTestResult:
+        """Build the result for a test that produced no worker output."""
+        return InstallationTestResult(
+            extension_name=extension_name,
+            success=False,
+            install_time=None,
+            load_time=None,
+            functional_test_time=None,
+            total_time=total_time,
+            error_message=error_message,
+            python_version="unknown",
+            duckdb_version_used="unknown",
+            test_environment="uv",
+            functional_test_passed=None,
+            test_query_used=test_query,
+        )
+
+    async def _test_single_extension_with_uv(
+        self,
+        extension_name: str,
+        duckdb_pypi_version: str = "",
+        *,
+        timeout_seconds: int = 120,
+    ) -> InstallationTestResult:
+        """Test a single extension in the warm worker for its DuckDB version."""
+        try:
+            worker = await self._get_worker(duckdb_pypi_version)
+        except Exception as e:
+            logger.error(f"Failed to prepare uv environment for {extension_name}: {e}")
+            return self._failed_result(
+                extension_name, f"Environment setup failed: {str(e)}"
+            )
+
+        test_query = self._get_test_query(extension_name)
+        job_start = monotonic()
+
+        try:
+            result_data = await worker.run_job(
+                extension_name,
+                test_query,
+                timeout_seconds,
+                extension_repository=self._local_repository(
+                    worker.env_dir, extension_name
+                ),
+                benchmark_runs=self.benchmark_runs,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Extension test timed out for {extension_name}")
+            return self._failed_result(
+                extension_name,
+                f"Test timed out after {timeout_seconds} seconds",
+                test_query,
+                total_time=monotonic() - job_start,
+            )
+        except WorkerCrashedError as e:
+            logger.warning(f"Extension test failed for {extension_name}: {e}")
+            return self._failed_result(
+                extension_name, str(e), test_query, total_time=monotonic() - job_start
+            )
+        finally:
+            self._return_worker(worker)
+
+        return InstallationTestResult(
+            extension_name=extension_name,
+            success=result_data.get("success", False),
+            install_time=result_data.get("install_time"),
+            load_time=result_data.get("load_time"),
+            functional_test_time=result_data.get("functional_test_time"),
+            total_time=result_data.get("total_time", 0.0),
+            error_message=result_data.get("error_message"),
+            python_version=result_data.get("python_version", "unknown"),
+            duckdb_version_used=result_data.get("duckdb_version_used", "unknown"),
+            test_environment=result_data.get("test_environment", "uv"),
+            functional_test_passed=result_data.get("functional_test_passed"),
+            test_query_used=result_data.get("test_query_used"),
+            file_size_bytes=result_data.get("file_size_bytes"),
+            extension_path=result_data.get("extension_path"),
+            benchmark_runs=result_data.get("benchmark_runs"),
+            load_time_p50=result_data.get("load_time_p50"),
+            load_time_p95=result_data.get("load_time_p95"),
+            rss_growth_bytes=result_data.get("rss_growth_bytes"),
+            functional_test_time_p50=result_data.get("functional_test_time_p50"),
+        )
+
 
 # Simple test when run directly
 if __name__ == "__main__":
 
     async def test_main():
         tester = InstallationTester()
-        results = await tester.test_extensions_batch(["json", "parquet"])
+        try:
+            results = await tester.test_extensions_batch(["json", "parquet"])
+        finally:
+            await tester.close()
 
         for result in results:
             print(f"\n{result.extension_name}:")
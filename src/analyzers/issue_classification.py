@@ -0,0 +1,123 @@
+"""
+GitHub issue classification rules for DuckDB Extensions Analysis.
+
+The keyword lists used to classify issues live in conf/issue_classification.toml
+so they can be tuned without code changes. The same rules drive both the
+per-issue classification at fetch time and the vectorised re-classification of
+stored issues in DuckDB (see DatabaseManager.reclassify_github_issues).
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import toml
+from loguru import logger
+
+# Priority of severity categories when several keywords match (lower wins).
+SEVERITY_PRIORITY = {"high": 0, "low": 1}
+
+
+class IssueClassificationRules:
+    """Keyword rules for issue type, severity and platform classification."""
+
+    def __init__(self, config_dir: Path):
+        self.config_dir = config_dir
+        self.rules_file = config_dir / "issue_classification.toml"
+        rules = self._load_rules()
+
+        self.issue_type_keywords = self._normalise(rules.get("issue_types", {}))
+        severity = rules.get("severity", {})
+        self.severity_label_words = self._normalise(severity.get("labels", {}))
+        self.severity_keywords = self._normalise(severity.get("keywords", {}))
+        self.platform_keywords = self._normalise(rules.get("platforms", {}))
+
+    def _load_rules(self) -> Dict:
+        """Load classification rules from TOML configuration file.
+
+        Raises rather than falling back to no rules: classifying without them
+        would mark every issue as 'other'.
+        """
+        if not self.rules_file.exists():
+            raise FileNotFoundError(
+                f"Issue classification rules not found: {self.rules_file}"
+            )
+
+        try:
+            rules = toml.load(self.rules_file)
+        except Exception as e:
+            raise ValueError(
+                f"Invalid issue classification rules in {self.rules_file}: {e}"
+            ) from e
+        logger.debug(f"Loaded issue classification rules from {self.rules_file}")
+        return rules
+
+    @staticmethod
+    def _normalise(groups: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Lowercase keywords, since matching is done against lowercased text."""
+        return {
+            name: [keyword.lower() for keyword in keywords]
+            for name, keywords in groups.items()
+        }
+
+    @staticmethod
+    def issue_text(title: Optional[str], body: Optional[str]) -> str:
+        """Build the lowercased text that keywords are matched against."""
+        return f"{title or ''} {body or ''}".lower()
+
+    def classify_issue_type(self, text: str) -> str:
+        """Return the first issue type with a keyword present in the text."""
+        for issue_type, keywords in self.issue_type_keywords.items():
+            if any(keyword in text for keyword in keywords):
+                return issue_type
+        return "other"
+
+    def determine_severity(self, text: str, labels: Iterable[str]) -> str:
+        """Determine severity from labels first, then from content keywords."""
+        for label in labels:
+            label_lower = label.lower()
+            for severity in self._severity_order(self.severity_label_words):
+                if any(
+                    word in label_lower for word in self.severity_label_words[severity]
+                ):
+                    return severity
+
+        for severity in self._severity_order(self.severity_keywords):
+            if any(keyword in text for keyword in self.severity_keywords[severity]):
+                return severity
+
+        return "medium"
+
+    def extract_platforms(self, text: str) -> Set[str]:
+        """Return all platforms with at least one keyword present in the text."""
+        return {
+            platform
+            for platform, keywords in self.platform_keywords.items()
+            if any(keyword in text for keyword in keywords)
+        }
+
+    @staticmethod
+    def _severity_order(groups: Dict[str, List[str]]) -> List[str]:
+        return sorted(groups, key=lambda s: SEVERITY_PRIORITY.get(s, len(groups)))
+
+    def to_rule_rows(self) -> List[Tuple[str, str, int, str]]:
+        """Flatten the rules into (rule_kind, category, priority, keyword) rows.
+
+        This is the relation consumed by sql/reclassify_github_issues.sql.
+        """
+        rows = []
+        for priority, (issue_type, keywords) in enumerate(
+            self.issue_type_keywords.items()
+        ):
+            rows.extend(("issue_type", issue_type, priority, k) for k in keywords)
+
+        for rule_kind, groups in (
+            ("severity_label", self.severity_label_words),
+            ("severity_keyword", self.severity_keywords),
+        ):
+            for priority, severity in enumerate(self._severity_order(groups)):
+                rows.extend((rule_kind, severity, priority, k) for k in groups[severity])
+
+        for platform, keywords in self.platform_keywords.items():
+            rows.extend(("platform", platform, 0, k) for k in keywords)
+
+        return rows
@@ -4,8 +4,10 @@ Analysis Orchestrator for DuckDB Extensions Analysis.
 Coordinates all analysis modules and provides a unified interface.
 """
 
+import asyncio
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from time import perf_counter
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 
 import httpx
 from loguru import logger
@@ -15,8 +17,12 @@ from .github_api import GitHubAPIClient
 from .core_analyzer import CoreExtensionAnalyzer
 from .community_analyzer import CommunityExtensionAnalyzer
 from .database_manager import DatabaseManager
+from .database_writer import DatabaseWriter
+from .extension_queries import ExtensionQueries
+from .report_dataset import ReportDataset
 from .report_generator import ReportGenerator
 from .github_issues_tracker import GitHubIssuesTracker
+from .issue_classification import IssueClassificationRules
 from .url_validator import URLValidator
 
 
@@ -33,7 +39,10 @@ class AnalysisOrchestrator:
         compatibility_max_runtime_seconds: int = 900,
         compatibility_max_extensions: int = 25,
         compatibility_per_test_timeout_seconds: int = 120,
+        compatibility_max_workers: Optional[int] = None,
         compatibility_duckdb_versions: Optional[List[str]] = None,
+        compatibility_max_result_age_days: Optional[int] = None,
+        compatibility_benchmark_runs: Optional[int] = None,
     ):
         self.config = config
         self.cache_hours = cache_hours
@@ -45,7 +54,10 @@ class AnalysisOrchestrator:
         self.compatibility_per_test_timeout_seconds = (
             compatibility_per_test_timeout_seconds
         )
+        self.compatibility_max_workers = compatibility_max_workers
         self.compatibility_duckdb_versions = compatibility_duckdb_versions
+        self.compatibility_max_result_age_days = compatibility_max_result_age_days
+        self.compatibility_benchmark_runs = compatibility_benchmark_runs
 
         # Initialize all modules
         self.github_client = GitHubAPIClient(config, cache_hours)
@@ -58,7 +70,9 @@ class AnalysisOrchestrator:
         self.database_manager = DatabaseManager(config)
         self.report_generator = ReportGenerator(config)
         self.github_issues_tracker = GitHubIssuesTracker(
-            self.github_client, cache_hours
+            self.github_client,
+            cache_hours,
+            classification_rules=IssueClassificationRules(config.config_dir),
         )
         self.url_validator = URLValidator(timeout=10)
 
@@ -196,9 +210,16 @@ class AnalysisOrchestrator:
         )
         return historical_extensions
 
-    async def analyze_full(self) -> AnalysisResult:
-        """Perform full analysis of both core and community extensions."""
+    async def analyze_full(
+        self, writer: Optional[DatabaseWriter] = None
+    ) -> AnalysisResult:
+        """Perform full analysis of both core and community extensions.
+
+        Args:
+            writer: Database writer that persists each stage as it finishes
+        """
         logger.info("Starting DuckDB extensions analysis")
+        analysis_timestamp = datetime.now()
 
         async with httpx.AsyncClient() as client:
             # Get DuckDB release information
@@ -209,14 +230,20 @@ class AnalysisOrchestrator:
             logger.info(
                 f"Found latest DuckDB release: {duckdb_version} (published {duckdb_release_date.strftime('%Y-%m-%d')})"
             )
+            if writer:
+                writer.start(duckdb_version, duckdb_release_date, analysis_timestamp)
 
             # Analyze core extensions with platform availability checking
             core_extensions = await self.analyze_core_extensions(duckdb_version)
             logger.info(f"Analyzed {len(core_extensions)} core extensions")
+            if writer:
+                writer.submit("core_extensions", core_extensions)
 
             # Analyze community extensions
             community_extensions = await self.analyze_community_extensions()
             logger.info(f"Analyzed {len(community_extensions)} community extensions")
+            if writer:
+                writer.submit("community_extensions", community_extensions)
 
             # Analyze GitHub issues for all extensions (if enabled)
             github_issues = []
@@ -225,6 +252,8 @@ class AnalysisOrchestrator:
                     ext.name for ext in core_extensions + community_extensions
                 ]
                 github_issues = await self.analyze_github_issues(all_extension_names)
+                if writer:
+                    writer.submit("github_issues", github_issues)
             else:
                 logger.info(
                     "Skipping GitHub issues analysis (disabled in configuration)"
@@ -256,6 +285,7 @@ class AnalysisOrchestrator:
                 community_extensions=community_extensions,
                 duckdb_version=duckdb_version,
                 duckdb_release_date=duckdb_release_date,
+                analysis_timestamp=analysis_timestamp,
             )
 
             # Add GitHub issues, installation results, and URL validation to metadata
@@ -282,10 +312,16 @@ class AnalysisOrchestrator:
         per_test_timeout_seconds: int = 120,
         duckdb_versions: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
-        """Run best-effort compatibility tests across multiple DuckDB versions."""
+        """Run best-effort compatibility tests across multiple DuckDB versions.
+
+        The runtime budget starts before scheduling, so building environments
+        and checking artifacts for changes count against it; the tests get
+        whatever budget is left.
+        """
         from time import monotonic
 
         from .release_manager import DuckDBReleaseManager
+        from .extension_store import ExtensionBinaryStore
         from .installation_tester import InstallationTester
 
         release_manager = DuckDBReleaseManager(
@@ -299,58 +335,55 @@ class AnalysisOrchestrator:
             )
             versions_to_test = [r.version for r in releases]
 
-        tester = InstallationTester()
-
-        # Keep scope small for on-demand runs.
-        extension_names: List[str] = []
-        extension_names.extend([e.name for e in core_extensions])
-        extension_names.extend([e.name for e in community_extensions[:max_extensions]])
+        tester = InstallationTester(
+            env_cache_dir=self.config.cache_dir / "installation_envs",
+            max_workers=self.compatibility_max_workers,
+            benchmark_runs=self.compatibility_benchmark_runs,
+            binary_store=ExtensionBinaryStore(
+                self.config.cache_dir / "extension_binaries"
+            ),
+        )
 
-        results = []
         start = monotonic()
+        try:
+            scheduled, unchanged = await self._schedule_compatibility_tests(
+                tester,
+                versions_to_test,
+                core_extensions + community_extensions,
+                max_extensions,
+            )
 
-        attempted_pairs = 0
-        completed_pairs = 0
-        skipped_pairs_time_limit = 0
-        timed_out_tests = 0
-
-        for duckdb_version in versions_to_test:
-            for ext_name in extension_names:
-                if monotonic() - start > max_runtime_seconds:
-                    remaining = len(extension_names) - (
-                        attempted_pairs % len(extension_names)
-                    )
-                    skipped_pairs_time_limit += max(remaining, 0)
-                    break
-
-                attempted_pairs += 1
-
-                test_start = monotonic()
-                batch_results = await tester.test_extensions_batch(
-                    [ext_name],
-                    duckdb_pypi_version=duckdb_version,
-                    timeout_seconds=per_test_timeout_seconds,
-                )
-                test_duration_seconds = monotonic() - test_start
-
-                if batch_results:
-                    r = batch_results[0]
-                    # Attach the tested version explicitly (even if the underlying package
-                    # reports something unexpected).
-                    r.duckdb_version_used = duckdb_version
-
-                    # Best-effort detection of timeouts.
-                    if r.error_message and "timed out" in r.error_message.lower():
-                        timed_out_tests += 1
-
-                    # Preserve duration on the rendered payload (even if the underlying
-                    # test reported 0.0 due to timeout/early exit).
-                    r.total_time = max(r.total_time or 0.0, test_duration_seconds)
-                    results.append(r)
-                    completed_pairs += 1
+            # Pairs are handed to the worker pool in priority order, so the
+            # runtime budget is spent on the pairs most likely to have changed.
+            pairs = [
+                (test.candidate.duckdb_version, test.candidate.extension_name)
+                for test in scheduled
+            ]
+            pair_results = await tester.test_compatibility_matrix(
+                pairs,
+                timeout_seconds=per_test_timeout_seconds,
+                max_runtime_seconds=max(0, max_runtime_seconds - (monotonic() - start)),
+                community_extensions=[ext.name for ext in community_extensions],
+            )
+        finally:
+            await tester.close()
 
-            if monotonic() - start > max_runtime_seconds:
-                break
+        tested = [
+            (test, result)
+            for test, result in zip(scheduled, pair_results)
+            if result is not None
+        ]
+        results = [result for _, result in tested]
+        extension_names = list(dict.fromkeys(name for _, name in pairs))
+        attempted_pairs = len(pairs)
+        completed_pairs = len(results)
+        skipped_pairs_time_limit = len(pairs) - len(results)
+        # Best-effort detection of timeouts.
+        timed_out_tests = sum(
+            1
+            for r in results
+            if r.error_message and "timed out" in r.error_message.lower()
+        )
 
         runtime_seconds = int(monotonic() - start)
 
@@ -361,14 +394,35 @@ class AnalysisOrchestrator:
         rendered_results = [
             {
                 "extension_name": r.extension_name,
-                "duckdb_version": r.duckdb_version_used,
+                "duckdb_version": test.candidate.duckdb_version,
                 "success": r.success,
                 "error_message": r.error_message,
                 "total_time_seconds": r.total_time,
+                "install_time_seconds": r.install_time,
+                "load_time_seconds": r.load_time,
+                "test_environment": r.test_environment,
+                "extension_version": test.candidate.extension_version,
+                "artifact_last_modified": test.candidate.artifact_last_modified,
+                "schedule_reasons": test.reasons,
+                "file_size_bytes": r.file_size_bytes,
+                "extension_path": r.extension_path,
+                "benchmark_runs": r.benchmark_runs,
+                "load_time_p50_seconds": r.load_time_p50,
+                "load_time_p95_seconds": r.load_time_p95,
+                "rss_growth_bytes": r.rss_growth_bytes,
+                "functional_test_p50_seconds": r.functional_test_time_p50,
             }
-            for r in results
+            for test, r in tested
         ]
 
+        # Record results so the next run only re-tests what changed
+        try:
+            self.database_manager.save_compatibility_results(
+                rendered_results, tester.platform, datetime.now()
+            )
+        except Exception as e:
+            logger.warning(f"Could not save compatibility test results: {e}")
+
         return {
             "versions_tested": versions_to_test,
             "extensions_attempted_count": len(extension_names),
@@ -383,10 +437,78 @@ class AnalysisOrchestrator:
                 "failed": failed,
                 "timed_out_tests": timed_out_tests,
                 "skipped_pairs_time_limit": skipped_pairs_time_limit,
+                "skipped_pairs_unchanged": len(unchanged),
             },
             "results": rendered_results,
         }
 
+    async def _schedule_compatibility_tests(
+        self,
+        tester,
+        versions_to_test: List[str],
+        extensions: List[ExtensionInfo],
+        max_extensions: int,
+    ):
+        """Rank (version, extension) pairs by what changed since their last stored result.
+
+        Pairs that are unchanged and passed last time are skipped; at most
+        ``max_extensions`` community extensions are scheduled per run.
+        """
+        from .compatibility_scheduler import (
+            CompatibilityCandidate,
+            CompatibilityScheduler,
+        )
+
+        pairs = [
+            (duckdb_version, ext.name)
+            for duckdb_version in versions_to_test
+            for ext in extensions
+        ]
+
+        try:
+            last_modified = await tester.artifact_last_modified(
+                pairs,
+                community_extensions=[
+                    ext.name for ext in extensions if ext.type == "community"
+                ],
+            )
+        except Exception as e:
+            logger.warning(f"Could not check extension artifacts for changes: {e}")
+            last_modified = {}
+
+        try:
+            last_results = self.database_manager.get_latest_compatibility_results(
+                tester.platform
+            )
+        except Exception as e:
+            logger.warning(f"Could not read previous compatibility results: {e}")
+            last_results = {}
+
+        candidates = [
+            CompatibilityCandidate(
+                duckdb_version=duckdb_version,
+                extension_name=ext.name,
+                extension_type=ext.type,
+                extension_version=((ext.metadata or {}).get("ce_metadata") or {}).get(
+                    "version"
+                ),
+                artifact_last_modified=last_modified.get((duckdb_version, ext.name)),
+            )
+            for duckdb_version in versions_to_test
+            for ext in extensions
+        ]
+
+        scheduled, unchanged = CompatibilityScheduler(
+            max_result_age_days=self.compatibility_max_result_age_days,
+            require_benchmark=bool(self.compatibility_benchmark_runs),
+        ).schedule(candidates, last_results, max_community_extensions=max_extensions)
+
+        logger.info(
+            f"Scheduled {len(scheduled)} of {len(candidates)} compatibility pairs "
+            f"({len(unchanged)} unchanged and passing)"
+        )
+        return scheduled, unchanged
+
     async def validate_extension_urls(
         self, extensions: List[ExtensionInfo]
     ) -> Dict[str, Dict]:
@@ -582,33 +704,21 @@ class AnalysisOrchestrator:
     def _populate_trend_data(self, analysis_result: AnalysisResult) -> None:
         """Populate trend data from database for report generation."""
         try:
-            # Import query functions
-            import sys
-            from pathlib import Path
-
-            scripts_path = Path(self.config.project_root) / "scripts"
-            sys.path.insert(0, str(scripts_path))
-
-            from query_database import (
-                get_extension_trend_summary,
-                get_ecosystem_growth_trends,
-                get_recent_extensions,
-                get_trending_extensions,
-            )
+            with ExtensionQueries.open(self.database_manager) as queries:
+                # Get trend summary with deltas
+                trend_summary = queries.trend_summary()
 
-            db_path = str(Path(self.config.project_root) / "data" / "extensions.duckdb")
+                # Get ecosystem growth (last 30 weeks, from the weekly rollup)
+                ecosystem_trends = queries.ecosystem_growth_trends(period="weekly")
 
-            # Get trend summary with deltas
-            trend_summary = get_extension_trend_summary(db_path)
+                # Get recent extensions (last 30 days)
+                recent_extensions = queries.recent_extensions(days=30)
 
-            # Get ecosystem growth (last 30 days)
-            ecosystem_trends = get_ecosystem_growth_trends(db_path)
+                # Get trending extensions (star growth over the latest week)
+                trending = queries.trending_extensions(limit=10, period="weekly")
 
-            # Get recent extensions (last 30 days)
-            recent_extensions = get_recent_extensions(db_path, days=30)
-
-            # Get trending extensions
-            trending = get_trending_extensions(db_path, limit=10)
+                # Get extensions the latest run added, removed or changed status of
+                extension_changes = queries.latest_extension_changes()
 
             # Package everything into trend_data
             analysis_result.trend_data = {
@@ -616,6 +726,7 @@ class AnalysisOrchestrator:
                 "ecosystem_growth": ecosystem_trends[:30] if ecosystem_trends else [],
                 "recent_extensions": recent_extensions,
                 "trending_extensions": trending,
+                "extension_changes": extension_changes,
             }
 
             logger.info("Populated trend data for report generation")
@@ -628,64 +739,128 @@ class AnalysisOrchestrator:
     async def generate_reports(
         self, analysis_result: AnalysisResult, formats: List[str] = None
     ) -> Dict[str, str]:
-        """Generate reports in specified formats."""
+        """Generate reports in specified formats.
+
+        The format writers run concurrently in worker threads once the shared
+        extension rows are built. If the rows cannot be built, the formats that
+        read them are skipped and the others still run. Each format's wall time
+        is recorded in ``analysis_result.report_timings``.
+        """
         if formats is None:
             formats = ["markdown"]
 
         # Populate trend data from database before generating reports
         self._populate_trend_data(analysis_result)
 
-        results = {}
         timestamp = analysis_result.analysis_timestamp.strftime("%Y%m%d_%H%M%S")
 
+        # Extension rows are derived once and shared by every format
+        try:
+            dataset = self.report_generator.build_dataset(analysis_result)
+        except Exception as e:
+            logger.error(f"Failed to build report rows: {e}")
+            dataset = None
+
+        writers = {}
         for format_type in formats:
-            try:
-                if format_type.lower() == "markdown":
-                    # Try new template-based generation first, fall back to legacy if needed
-                    content = await self.report_generator.generate_markdown_template(
-                        analysis_result
-                    )
-                    filename = f"duckdb_extensions_report_{timestamp}.md"
-                    filepath = self.report_generator.save_report(content, filename)
-                    results[format_type] = filepath
-
-                    # If compatibility testing ran, publish a separate report with the full
-                    # detailed results, and link to it from the main report.
-                    if getattr(analysis_result, "compatibility_testing", None):
-                        compat_content = await self.report_generator.generate_markdown_template(
-                            analysis_result, template_name="compatibility_testing"
-                        )
-                        compat_path = self.report_generator.save_report(
-                            compat_content,
+            if dataset is None and format_type.lower() in ("markdown", "csv", "excel"):
+                logger.error(f"Skipping {format_type} report: no report rows")
+
+            elif format_type.lower() == "markdown":
+                # Try new template-based generation first, fall back to legacy if needed
+                writers[format_type] = self._generate_markdown_report(
+                    analysis_result,
+                    dataset,
+                    "full_analysis",
+                    f"duckdb_extensions_report_{timestamp}.md",
+                )
+
+                # If compatibility testing ran, publish a separate report with the full
+                # detailed results, and link to it from the main report.
+                if getattr(analysis_result, "compatibility_testing", None):
+                    writers["compatibility_testing_markdown"] = (
+                        self._generate_markdown_report(
+                            analysis_result,
+                            dataset,
+                            "compatibility_testing",
                             "compatibility_testing.md",
                             update_latest=False,
                         )
-                        results["compatibility_testing_markdown"] = compat_path
+                    )
 
-                elif format_type.lower() == "csv":
-                    filepath = await self.report_generator.generate_csv(analysis_result)
-                    results[format_type] = filepath
+            elif format_type.lower() == "csv":
+                writers[format_type] = self.report_generator.generate_csv(
+                    analysis_result, dataset
+                )
 
-                elif format_type.lower() == "excel":
-                    filepath = await self.report_generator.generate_excel(
-                        analysis_result
-                    )
-                    results[format_type] = filepath
+            elif format_type.lower() == "excel":
+                writers[format_type] = self.report_generator.generate_excel(
+                    analysis_result, dataset
+                )
 
-                elif format_type.lower() == "url_validation_csv":
-                    filepath = await self.report_generator.generate_url_validation_csv(
-                        analysis_result
-                    )
-                    if filepath:
-                        results[format_type] = filepath
+            elif format_type.lower() == "url_validation_csv":
+                writers[format_type] = (
+                    self.report_generator.generate_url_validation_csv(analysis_result)
+                )
 
-                else:
-                    logger.warning(f"Unsupported format: {format_type}")
+            else:
+                logger.warning(f"Unsupported format: {format_type}")
 
+        outcomes = await asyncio.gather(
+            *(
+                self._run_report_writer(format_type, writer)
+                for format_type, writer in writers.items()
+            )
+        )
+
+        results = {}
+        analysis_result.report_timings = {}
+        for format_type, (filepath, seconds) in zip(writers, outcomes):
+            analysis_result.report_timings[format_type] = seconds
+            if filepath:
+                results[format_type] = filepath
+
+        return results
+
+    async def _generate_markdown_report(
+        self,
+        analysis_result: AnalysisResult,
+        dataset: ReportDataset,
+        template_name: str,
+        filename: str,
+        *,
+        update_latest: bool = True,
+    ) -> str:
+        """Render a markdown report template and save it."""
+        content = await self.report_generator.generate_markdown_template(
+            analysis_result, template_name=template_name, dataset=dataset
+        )
+        return self.report_generator.save_report(
+            content, filename, update_latest=update_latest
+        )
+
+    @staticmethod
+    async def _run_report_writer(
+        format_type: str, writer: Coroutine[Any, Any, Optional[str]]
+    ) -> Tuple[Optional[str], float]:
+        """Run a report writer in a worker thread and time it.
+
+        Returns the report path (None if the writer failed or wrote nothing)
+        and the writer's wall time in seconds.
+        """
+
+        def run() -> Tuple[Optional[str], float]:
+            start = perf_counter()
+            try:
+                filepath = asyncio.run(writer)
             except Exception as e:
                 logger.error(f"Failed to generate {format_type} report: {e}")
+                filepath = None
+            seconds = perf_counter() - start
+            logger.info(f"Generated {format_type} report in {seconds:.2f}s")
+            return filepath, seconds
 
-        return results
+        return await asyncio.to_thread(run)
 
     async def save_to_database(self, analysis_result: AnalysisResult) -> None:
         """Save analysis results to database."""
@@ -752,10 +927,16 @@ class AnalysisOrchestrator:
         self, core_extensions: List, community_extensions: List
     ) -> List[Any]:
         """Run installation tests for selected extensions."""
+        from .extension_store import ExtensionBinaryStore
         from .installation_tester import InstallationTester
 
         logger.info("Starting installation testing...")
-        installation_tester = InstallationTester()
+        installation_tester = InstallationTester(
+            env_cache_dir=self.config.cache_dir / "installation_envs",
+            binary_store=ExtensionBinaryStore(
+                self.config.cache_dir / "extension_binaries"
+            ),
+        )
 
         # Select extensions to test: prioritize core extensions and featured community extensions
         extensions_to_test = set()
@@ -775,9 +956,12 @@ class AnalysisOrchestrator:
         )
 
         try:
-            installation_results = await installation_tester.test_extensions_batch(
-                extensions_to_test
-            )
+            try:
+                installation_results = await installation_tester.test_extensions_batch(
+                    extensions_to_test
+                )
+            finally:
+                await installation_tester.close()
             logger.info(
                 f"Installation testing completed. {len(installation_results)} results."
             )
@@ -807,9 +991,38 @@ class AnalysisOrchestrator:
         logger.info("Saving analysis to DuckDB database")
 
         # For database-only mode, we need to re-run the analysis
-        analysis_result = await self.analyze_full()
+        await self.run_analysis_and_save("full")
+
+    async def run_analysis_and_save(self, mode: str = "full") -> AnalysisResult:
+        """Run an analysis mode and save the result to the database.
+
+        A full analysis is written in the background as each stage finishes
+        and committed once the analysis completes, so persistence overlaps
+        with the network-bound stages instead of following them.
+        """
+        if mode != "full":
+            analysis_result = await self.run_analysis_mode(mode)
+            await self.save_to_database(analysis_result)
+            await self.archive_run(analysis_result)
+            return analysis_result
 
-        await self.save_to_database(analysis_result)
+        logger.info("Saving analysis to DuckDB database as stages complete")
+        writer = DatabaseWriter(self.database_manager)
+        try:
+            analysis_result = await self.analyze_full(writer=writer)
+            await writer.finish(analysis_result)
+        except BaseException:
+            await writer.abort()
+            raise
+        await self.archive_run(analysis_result)
+        return analysis_result
+
+    async def archive_run(self, analysis_result: AnalysisResult) -> None:
+        """Export the run's day to the Parquet archive when archiving is enabled."""
+        if not getattr(self.config, "archive_history", False):
+            return
+        day = analysis_result.analysis_timestamp.date()
+        await asyncio.to_thread(self.database_manager.archive_history, [day])
 
     def print_analysis_summary(self, analysis_result: AnalysisResult) -> None:
         """Print a summary of the analysis results."""
@@ -0,0 +1,303 @@
+"""
+Query Benchmarks for DuckDB Extensions Analysis.
+
+Loads synthetic analysis history at a configurable scale into the real
+database schema, then times every view the schema defines and every query in
+sql/queries against it. Results are written as JSON, so a run can be compared
+with an earlier one to find the views that slow down as history grows before
+production history gets there.
+"""
+
+import json
+import re
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import duckdb
+from loguru import logger
+
+from .database_manager import DatabaseManager
+from .extension_queries import TREND_PERIODS, trend_rollup
+from .query_pool import QueryConnectionPool
+
+SYNTHETIC_PLATFORMS = [
+    "linux_amd64",
+    "osx_arm64",
+    "windows_amd64",
+    "linux_arm64",
+    "osx_amd64",
+    "wasm_mvp",
+    "linux_amd64_musl",
+    "windows_arm64",
+]
+
+# Values for the $name parameters of the query files
+QUERY_PARAMETERS: Dict[str, Any] = {
+    "days": 30,
+    "row_limit": 10,
+    "extension_name": "ext_00000",
+    "platform": SYNTHETIC_PLATFORMS[0],
+    "search_terms": "spatial parquet",
+}
+
+_PARAMETER = re.compile(r"\$([A-Za-z_]\w*)")
+
+
+@dataclass
+class SyntheticScale:
+    """Size of the synthetic history to benchmark against."""
+
+    community_extensions: int = 1000
+    core_extensions: int = 25
+    days: int = 3 * 365
+    platforms: int = 5
+    start: Optional[date] = None  # default: the history ends today
+
+    def __post_init__(self):
+        if self.days < 1:
+            raise ValueError(
+                f"Synthetic history needs at least one day, got {self.days}"
+            )
+        if min(self.community_extensions, self.core_extensions) < 0:
+            raise ValueError("Extension counts cannot be negative")
+        if not 1 <= self.platforms <= len(SYNTHETIC_PLATFORMS):
+            raise ValueError(
+                f"Platforms must be between 1 and {len(SYNTHETIC_PLATFORMS)}, "
+                f"got {self.platforms}"
+            )
+        if self.start is None:
+            self.start = date.today() - timedelta(days=self.days - 1)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "start": self.start.isoformat()}
+
+
+@dataclass
+class QueryTiming:
+    """Timings of one view or query file."""
+
+    name: str
+    kind: str  # 'view' or 'query'
+    rows: Optional[int] = None
+    seconds: List[float] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def median_seconds(self) -> Optional[float]:
+        return statistics.median(self.seconds) if self.seconds else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "rows": self.rows,
+            "median_seconds": self.median_seconds,
+            "min_seconds": min(self.seconds) if self.seconds else None,
+            "seconds": self.seconds,
+            "error": self.error,
+        }
+
+
+class QueryBenchmark:
+    """Times the schema's views and query files against a database."""
+
+    def __init__(self, database_manager: DatabaseManager, repeat: int = 3):
+        if repeat < 1:
+            raise ValueError(f"Repeat must be at least 1, got {repeat}")
+        self.database_manager = database_manager
+        self.repeat = repeat
+
+    def load_synthetic_history(self, scale: SyntheticScale) -> Dict[str, int]:
+        """Fill an empty database with synthetic history and its derived tables.
+
+        Returns:
+            Row count per history table
+        """
+        manager = self.database_manager
+        conn = manager._connect()
+        try:
+            if conn.execute("SELECT COUNT(*) FROM analysis_runs").fetchone()[0]:
+                raise ValueError(
+                    f"{manager.database_path} already has analysis history; "
+                    "synthetic history needs an empty database"
+                )
+            variables = {
+                "synthetic_community": scale.community_extensions,
+                "synthetic_core": scale.core_extensions,
+                "synthetic_days": scale.days,
+                "synthetic_platforms": SYNTHETIC_PLATFORMS[: scale.platforms],
+                "synthetic_start": scale.start,
+            }
+            for name, value in variables.items():
+                conn.execute(f"SET VARIABLE {name} = ?", [value])
+
+            started = time.perf_counter()
+            conn.begin()
+            manager._execute_script(conn, "generate_synthetic_history.sql", [])
+            conn.commit()
+            logger.info(
+                f"Generated {scale.days} days of synthetic history in "
+                f"{time.perf_counter() - started:.1f}s"
+            )
+        finally:
+            conn.close()
+
+        started = time.perf_counter()
+        manager.rebuild_derived_tables()
+        logger.info(
+            f"Rebuilt latest snapshots, rollups, change log and search index in "
+            f"{time.perf_counter() - started:.1f}s"
+        )
+
+        conn = duckdb.connect(str(manager.database_path), read_only=True)
+        try:
+            return {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in (
+                    "analysis_runs",
+                    "core_extensions_history",
+                    "community_extensions_history",
+                    "extension_availability_history",
+                    "extension_metrics_daily",
+                    "installation_test_history",
+                    "github_issues_history",
+                )
+            }
+        finally:
+            conn.close()
+
+    def run(self) -> List[QueryTiming]:
+        """Time every view, then every query file."""
+        timings = []
+        with self.database_manager.query_pool(size=1) as pool:
+            with pool.connection() as conn:
+                views = [
+                    name
+                    for (name,) in conn.execute(
+                        "SELECT view_name FROM duckdb_views() "
+                        "WHERE NOT internal AND schema_name = 'main' ORDER BY view_name"
+                    ).fetchall()
+                ]
+                for view in views:
+                    timings.append(self._time_view(conn, view))
+            for query_file in sorted(pool.queries_dir.glob("*.sql")):
+                timings.extend(self._time_query(pool, query_file))
+        return timings
+
+    def _time_view(self, conn: duckdb.DuckDBPyConnection, view: str) -> QueryTiming:
+        """Time a full scan of a view; execute() runs the whole query."""
+        timing = QueryTiming(view, "view")
+        try:
+            for _ in range(self.repeat):
+                started = time.perf_counter()
+                conn.execute(f'SELECT * FROM "{view}"')
+                timing.seconds.append(time.perf_counter() - started)
+            timing.rows = conn.execute(f'SELECT COUNT(*) FROM "{view}"').fetchone()[0]
+        except duckdb.Error as e:
+            timing.error = str(e).splitlines()[0]
+        logger.debug(f"view {view}: {timing.median_seconds}s, {timing.rows} rows")
+        return timing
+
+    def _time_query(
+        self, pool: QueryConnectionPool, query_file: Path
+    ) -> List[QueryTiming]:
+        """Time a query file through the query API, once per trend grain."""
+        sql = query_file.read_text()
+        params = {}
+        for name in sorted(set(_PARAMETER.findall(sql))):
+            params[name] = QUERY_PARAMETERS.get(name)
+        variants = {
+            f"{query_file.stem}[{period}]": {"rollup": trend_rollup(period)}
+            for period in TREND_PERIODS
+        }
+        if "{rollup}" not in sql:
+            variants = {query_file.stem: {}}
+
+        timings = []
+        for name, identifiers in variants.items():
+            timing = QueryTiming(name, "query")
+            missing = [p for p, value in params.items() if value is None]
+            if missing:
+                timing.error = (
+                    f"No benchmark value for parameters: {', '.join(missing)}"
+                )
+                timings.append(timing)
+                continue
+            try:
+                for _ in range(self.repeat):
+                    started = time.perf_counter()
+                    rows = pool.execute(query_file.stem, identifiers, **params)
+                    timing.seconds.append(time.perf_counter() - started)
+                timing.rows = len(rows)
+            except duckdb.Error as e:
+                timing.error = str(e).splitlines()[0]
+            logger.debug(f"query {name}: {timing.median_seconds}s, {timing.rows} rows")
+            timings.append(timing)
+        return timings
+
+    def write_results(
+        self,
+        output_path: Path,
+        timings: List[QueryTiming],
+        scale: Optional[SyntheticScale] = None,
+    ) -> Dict[str, Any]:
+        """Write benchmark results as JSON.
+
+        Returns:
+            The written results
+        """
+        results = {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "duckdb_version": duckdb.__version__,
+            "database": str(self.database_manager.database_path),
+            "scale": scale.to_dict() if scale else None,
+            "repeat": self.repeat,
+            "results": [timing.to_dict() for timing in timings],
+        }
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(results, indent=2) + "\n")
+        return results
+
+    @staticmethod
+    def compare(
+        results: Dict[str, Any],
+        baseline: Dict[str, Any],
+        threshold: float = 1.5,
+        min_seconds: float = 0.005,
+    ) -> List[Dict[str, Any]]:
+        """Find views and queries that got slower, or broke, since a baseline.
+
+        Args:
+            results: Results as written by write_results
+            baseline: Earlier results to compare against
+            threshold: Slowdown factor of the median that counts as a regression
+            min_seconds: Medians below this are timer noise and never regress
+
+        Returns:
+            One entry per regression, slowest slowdown first
+        """
+        before = {(r["kind"], r["name"]): r for r in baseline["results"]}
+        regressions = []
+        for result in results["results"]:
+            previous = before.get((result["kind"], result["name"]))
+            if previous is None:
+                continue
+            if result["error"] and not previous["error"]:
+                regressions.append(
+                    {**result, "baseline_seconds": None, "slowdown": None}
+                )
+                continue
+            now, then = result["median_seconds"], previous["median_seconds"]
+            if now is None or then is None or now < min_seconds:
+                continue
+            slowdown = now / max(then, min_seconds)
+            if slowdown >= threshold:
+                regressions.append(
+                    {**result, "baseline_seconds": then, "slowdown": slowdown}
+                )
+        return sorted(regressions, key=lambda r: -(r["slowdown"] or float("inf")))
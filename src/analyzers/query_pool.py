@@ -0,0 +1,144 @@
+"""
+Read-only Query Connections for DuckDB Extensions Analysis.
+
+Reports and query scripts read the database through a small pool of
+connections to one read-only database instance, opened once, instead of
+opening the database file for every query. A query file from sql/queries is
+read once and run with its values bound as parameters.
+
+Query files take values as ``$name`` parameters. The few identifiers that vary
+between calls, such as a trend view suffix, are ``{name}`` placeholders that
+are substituted into the statement text when the file is read.
+"""
+
+import queue
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import duckdb
+from loguru import logger
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+class QueryConnectionPool:
+    """Pool of connections that run the queries in sql/queries.
+
+    Connections are cursors of one root connection, so they share its
+    database instance, catalog and buffer cache. DuckDB does not open a file
+    read-write while it is open read-only in the same process, so close the
+    pool before saving to the database again.
+    """
+
+    def __init__(
+        self, conn: duckdb.DuckDBPyConnection, queries_dir: Path, size: int = 4
+    ):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self.queries_dir = Path(queries_dir)
+        self.size = size
+        self._root = conn
+        self._idle: "queue.LifoQueue[duckdb.DuckDBPyConnection]" = queue.LifoQueue()
+        self._connections: List[duckdb.DuckDBPyConnection] = []
+        self._statements: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], str] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @classmethod
+    def open(
+        cls, database_path: Path, queries_dir: Path, size: int = 4
+    ) -> "QueryConnectionPool":
+        """Open a pool over a database file, read-only."""
+        database_path = Path(database_path)
+        if not database_path.exists():
+            raise FileNotFoundError(f"Database not found: {database_path}")
+        conn = duckdb.connect(str(database_path), read_only=True)
+        logger.debug(f"Opened read-only query pool on {database_path}")
+        return cls(conn, queries_dir, size)
+
+    def __enter__(self) -> "QueryConnectionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def acquire(self) -> duckdb.DuckDBPyConnection:
+        """Check out a connection, waiting if all of them are in use."""
+        if self._closed:
+            raise RuntimeError("Query connection pool is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._connections) < self.size:
+                conn = self._root.cursor()
+                self._connections.append(conn)
+                return conn
+        return self._idle.get()
+
+    def release(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Return a checked out connection to the pool."""
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Check out a connection for the duration of a ``with`` block."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def execute(
+        self,
+        query_name: str,
+        identifiers: Optional[Dict[str, str]] = None,
+        **params: Any,
+    ) -> List[tuple]:
+        """Run a query file with bound parameters and fetch its rows.
+
+        Args:
+            query_name: Query file name in sql/queries, without ``.sql``
+            identifiers: Values for the query's ``{name}`` placeholders; these
+                become part of the statement text, so never pass user input
+            **params: Values for the query's ``$name`` parameters
+        """
+        sql = self._statement(query_name, identifiers or {})
+        with self.connection() as conn:
+            if params:
+                return conn.execute(sql, params).fetchall()
+            return conn.execute(sql).fetchall()
+
+    def _statement(self, query_name: str, identifiers: Dict[str, str]) -> str:
+        """Get a query's SQL, loading it once."""
+        key = (query_name, tuple(sorted(identifiers.items())))
+        with self._lock:
+            if key not in self._statements:
+                self._statements[key] = self._render(query_name, identifiers)
+            return self._statements[key]
+
+    def _render(self, query_name: str, identifiers: Dict[str, str]) -> str:
+        query_file = self.queries_dir / f"{query_name}.sql"
+        if not query_file.exists():
+            raise FileNotFoundError(f"SQL query file not found: {query_file}")
+
+        def substitute(match: "re.Match[str]") -> str:
+            if match.group(1) not in identifiers:
+                raise ValueError(
+                    f"No value for {{{match.group(1)}}} in query {query_name}"
+                )
+            return identifiers[match.group(1)]
+
+        return _PLACEHOLDER.sub(substitute, query_file.read_text()).strip()
+
+    def close(self) -> None:
+        """Close the pool and every connection it handed out."""
+        if self._closed:
+            return
+        self._closed = True
+        self._root.close()
+        self._connections.clear()
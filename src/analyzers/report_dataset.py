@@ -0,0 +1,299 @@
+"""
+Report Dataset for DuckDB Extensions Analysis.
+
+One row per extension, built once per report run from an AnalysisResult.
+Fields the report formats share, such as last activity, status, repository
+and documentation links and descriptions, are derived column by column
+rather than per extension per format. The Markdown, CSV and Excel writers
+all read this dataset.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .base import AnalysisResult, ExtensionInfo
+from .extension_metadata import ExtensionMetadata
+
+COMMUNITY_DOCS_URL = "https://duckdb.org/community_extensions/extensions/"
+
+# Curated descriptions for core extensions the metadata file doesn't describe
+CORE_DESCRIPTIONS = {
+    "autocomplete": "Auto-completion support for DuckDB CLI",
+    "avro": "Apache Avro format support for reading and writing",
+    "aws": "AWS S3 integration and cloud services support",
+    "azure": "Azure Blob Storage integration and cloud services",
+    "delta": "Delta Lake format support for ACID transactions",
+    "ducklake": "Delta Lake support via DuckLake implementation",
+    "encodings": "Character encoding support for text processing",
+    "excel": "Microsoft Excel file format support",
+    "fts": "Full-text search functionality and indexing",
+    "httpfs": "HTTP/S3 filesystem support for remote data",
+    "iceberg": "Apache Iceberg format support for data lakes",
+    "icu": "International Components for Unicode support",
+    "inet": "Internet address data types and functions",
+    "jemalloc": "Memory allocator for improved performance",
+    "json": "JSON data format support and functions",
+    "mysql": "MySQL database connectivity and integration",
+    "parquet": "Apache Parquet columnar format support",
+    "postgres": "PostgreSQL database connectivity and integration",
+    "spatial": "Geospatial data types and spatial functions",
+    "sqlite": "SQLite database connectivity and integration",
+    "tpcds": "TPC-DS benchmark data generation",
+    "tpch": "TPC-H benchmark data generation",
+    "ui": "Browser-based user interface for DuckDB",
+    "vss": "Vector similarity search capabilities",
+}
+
+# Fields read from each extension; everything else is derived from these
+SOURCE_COLUMNS = [
+    "name",
+    "type",
+    "repository",
+    "repository_path",
+    "raw_status",
+    "stage",
+    "days_ago",
+    "last_commit_date",
+    "last_push",
+    "stars",
+    "language",
+    "description",
+    "metadata_description",
+    "topics",
+    "featured",
+]
+
+TEXT_COLUMNS = [
+    "name",
+    "type",
+    "repository",
+    "repository_path",
+    "raw_status",
+    "stage",
+    "language",
+    "description",
+    "metadata_description",
+]
+
+# CSV and Excel report columns, from dataset columns
+TABLE_COLUMNS = {
+    "name": "Extension",
+    "type_label": "Type",
+    "repository": "Repository",
+    "raw_status": "Status",
+    "stage": "Development Stage",
+    "last_push_days": "Last Push Days",
+    "stars": "Stars",
+    "language": "Language",
+    "description": "Description",
+    "featured": "Featured",
+}
+
+
+class ReportDataset:
+    """Extension rows and derived report fields, shared by every report format."""
+
+    def __init__(self, frame: pd.DataFrame, analysis_result: AnalysisResult):
+        self.frame = frame
+        self.analysis_result = analysis_result
+
+    @classmethod
+    def build(
+        cls,
+        analysis_result: AnalysisResult,
+        core_docs_urls: Optional[Dict[str, str]] = None,
+        metadata: Optional[ExtensionMetadata] = None,
+    ) -> "ReportDataset":
+        """Build the dataset for one analysis run.
+
+        Args:
+            analysis_result: Analysed extensions
+            core_docs_urls: Documentation URL per lower-case core extension name
+            metadata: Extension metadata, for core extension descriptions
+
+        Last activity is measured in days before the analysis timestamp, both
+        from a core extension's last commit and from the DuckDB release.
+        """
+        frame = pd.DataFrame(
+            [cls._core_source(ext) for ext in analysis_result.core_extensions]
+            + [
+                cls._community_source(ext)
+                for ext in analysis_result.community_extensions
+            ],
+            columns=SOURCE_COLUMNS,
+        )
+        text = frame.columns[frame.columns.isin(TEXT_COLUMNS)]
+        frame[text] = frame[text].astype("string")
+        is_core = frame["type"] == "core"
+
+        # Core extensions without a commit date of their own last changed
+        # with the DuckDB release
+        analysed_at = analysis_result.analysis_timestamp.replace(tzinfo=None)
+        release_date = analysis_result.duckdb_release_date
+        release_age_days = (
+            (analysed_at - release_date.replace(tzinfo=None)).days
+            if release_date
+            else 0
+        )
+        commit_dates = pd.to_datetime(
+            frame["last_commit_date"], utc=True, errors="coerce", format="ISO8601"
+        ).dt.tz_localize(None)
+        commit_days = (pd.Timestamp(analysed_at) - commit_dates).dt.days
+        # Release-based ages are estimates of when a core extension last changed
+        frame["last_push_estimated"] = is_core & commit_days.isna()
+        frame["last_push_days"] = (
+            commit_days.fillna(release_age_days)
+            .where(is_core, frame["days_ago"])
+            .astype("Int64")
+        )
+
+        frame["raw_status"] = (
+            frame["raw_status"].fillna("❌ Error").where(~is_core, "✅ Ongoing")
+        )
+        frame["status"] = np.select(
+            [
+                frame["raw_status"].str.contains("✅|Ongoing"),
+                frame["raw_status"].str.contains("🔴|Discontinued|Archived"),
+            ],
+            ["ongoing", "archived"],
+            "unknown",
+        )
+
+        # Core extensions live in duckdb/duckdb unless they have their own repository
+        external = frame["repository_path"].str.startswith("external:", na=False)
+        own_repository = frame["repository"].notna() & (
+            frame["repository"] != "integrated_core"
+        )
+        frame["repository"] = frame["repository"].where(
+            ~is_core,
+            np.where(
+                external,
+                frame["repository_path"].str.removeprefix("external:"),
+                frame["repository"].where(own_repository, "duckdb/duckdb"),
+            ),
+        )
+        frame["repo_url"] = "https://github.com/" + frame["repository"]
+        frame["docs_url"] = (COMMUNITY_DOCS_URL + frame["name"] + ".html").where(
+            ~is_core, frame["name"].str.lower().map(core_docs_urls or {})
+        )
+
+        description = cls._present(frame["description"])
+        core_description = (
+            description.fillna(cls._present(frame["metadata_description"]))
+            .fillna(
+                frame["name"].map(
+                    metadata.get_extension_description if metadata else lambda _: None
+                )
+            )
+            .fillna(frame["name"].str.lower().map(CORE_DESCRIPTIONS))
+            .fillna("Core DuckDB extension: " + frame["name"])
+        )
+        # Community extensions without a description stay missing; each
+        # format words the placeholder its own way
+        frame["description"] = description.where(~is_core, core_description)
+
+        frame["stage"] = frame["stage"].fillna("Stable").where(is_core)
+        frame["language"] = frame["language"].fillna("N/A").where(~is_core, "C++")
+        frame["stars"] = frame["stars"].astype("Int64")
+        frame["type_label"] = frame["type"].str.title()
+        frame["featured"] = frame["featured"].fillna(False).astype(bool)
+
+        return cls(
+            frame.drop(
+                columns=["repository_path", "last_commit_date", "metadata_description"]
+            ),
+            analysis_result,
+        )
+
+    @staticmethod
+    def _core_source(ext: ExtensionInfo) -> tuple:
+        metadata = ext.metadata or {}
+        return (
+            ext.name,
+            "core",
+            ext.repository,
+            metadata.get("repository_path"),
+            None,
+            ext.stage,
+            None,
+            metadata.get("last_commit_date"),
+            ext.last_push,
+            ext.stars,
+            None,
+            ext.description,
+            metadata.get("description"),
+            [],
+            False,
+        )
+
+    @staticmethod
+    def _community_source(ext: ExtensionInfo) -> tuple:
+        metadata = ext.metadata or {}
+        # repo_info can be None if the repository fetch failed upstream.
+        repo_info = metadata.get("repo_info") or {}
+        return (
+            ext.name,
+            "community",
+            ext.repository,
+            None,
+            metadata.get("status"),
+            None,
+            ext.days_ago,
+            None,
+            ext.last_push,
+            ext.stars,
+            repo_info.get("language"),
+            ext.description,
+            None,
+            repo_info.get("topics", []),
+            getattr(ext, "featured", False),
+        )
+
+    @staticmethod
+    def _present(values: pd.Series) -> pd.Series:
+        """Treat empty strings as missing, like ``value or default``."""
+        return values.where(values.str.len() > 0)
+
+    def extensions(self, extension_type: str) -> pd.DataFrame:
+        """Rows of one extension type ('core' or 'community')."""
+        return self.frame[self.frame["type"] == extension_type]
+
+    def template_records(self, extension_type: str) -> List[Dict[str, Any]]:
+        """Extensions of one type as the dicts the template engine renders."""
+        rows = self.extensions(extension_type)[
+            [
+                "name",
+                "repository",
+                "docs_url",
+                "status",
+                "last_push_days",
+                "last_push",
+                "stars",
+                "language",
+                "description",
+                "featured",
+                "topics",
+            ]
+        ].assign(version="")
+        if extension_type == "community":
+            rows = rows.fillna({"stars": 0, "description": "No description available"})
+        return rows.astype(object).where(rows.notna(), None).to_dict("records")
+
+    def table(self) -> pd.DataFrame:
+        """All extensions with the CSV and Excel report columns."""
+        frame = self.frame.assign(
+            stars=self.frame["stars"].where(
+                self.frame["type"] == "core", self.frame["stars"].fillna(0)
+            )
+        )
+        table = frame[list(TABLE_COLUMNS)].rename(columns=TABLE_COLUMNS)
+        return table.astype(object).fillna(
+            {
+                "Repository": "N/A",
+                "Development Stage": "N/A",
+                "Stars": "N/A",
+                "Description": "No description",
+            }
+        )
@@ -13,6 +13,7 @@ from loguru import logger
 
 from .base import BaseReportGenerator, AnalysisResult
 from .extension_metadata import ExtensionMetadata
+from .report_dataset import ReportDataset
 from ..templates import TemplateEngine
 
 
@@ -188,109 +189,14 @@ class ReportGenerator(BaseReportGenerator):
         self._core_extension_urls_cache = extension_urls
         return extension_urls
 
-    def _format_days_ago(self, date_str: Optional[str], fallback_days: int) -> str:
-        """Format a date string into 'X days ago' format."""
-        if not date_str:
-            return f"{fallback_days} days ago"
-
-        try:
-            from dateutil import parser
-
-            commit_date = parser.parse(date_str)
-            days_ago = (datetime.now(commit_date.tzinfo) - commit_date).days
-            return f"{days_ago} days ago"
-        except Exception as e:
-            logger.debug(f"Could not parse date {date_str}: {e}")
-            return f"{fallback_days} days ago"
-
-    def _get_days_from_date(self, date_str: Optional[str]) -> Optional[int]:
-        """Extract the number of days ago from a date string."""
-        if not date_str:
-            return None
-
-        try:
-            from dateutil import parser
-
-            commit_date = parser.parse(date_str)
-            days_ago = (datetime.now(commit_date.tzinfo) - commit_date).days
-            return days_ago
-        except Exception as e:
-            logger.debug(f"Could not parse date {date_str}: {e}")
-            return None
-
-    def _generate_core_extension_description(self, ext_name: str, stage: str) -> str:
-        """Generate description for core extensions based on name and metadata."""
-        descriptions = {
-            "autocomplete": "Auto-completion support for DuckDB CLI",
-            "avro": "Apache Avro format support for reading and writing",
-            "aws": "AWS S3 integration and cloud services support",
-            "azure": "Azure Blob Storage integration and cloud services",
-            "delta": "Delta Lake format support for ACID transactions",
-            "ducklake": "Delta Lake support via DuckLake implementation",
-            "encodings": "Character encoding support for text processing",
-            "excel": "Microsoft Excel file format support",
-            "fts": "Full-text search functionality and indexing",
-            "httpfs": "HTTP/S3 filesystem support for remote data",
-            "iceberg": "Apache Iceberg format support for data lakes",
-            "icu": "International Components for Unicode support",
-            "inet": "Internet address data types and functions",
-            "jemalloc": "Memory allocator for improved performance",
-            "json": "JSON data format support and functions",
-            "mysql": "MySQL database connectivity and integration",
-            "parquet": "Apache Parquet columnar format support",
-            "postgres": "PostgreSQL database connectivity and integration",
-            "spatial": "Geospatial data types and spatial functions",
-            "sqlite": "SQLite database connectivity and integration",
-            "tpcds": "TPC-DS benchmark data generation",
-            "tpch": "TPC-H benchmark data generation",
-            "ui": "Browser-based user interface for DuckDB",
-            "vss": "Vector similarity search capabilities",
-        }
-
-        return descriptions.get(ext_name.lower(), f"DuckDB core extension: {ext_name}")
-
-    def _determine_core_extension_status(self, ext, duckdb_lag_days: int) -> str:
-        """Determine status of core extension based on activity and metadata."""
-        # For now, all core extensions are considered active
-        # This could be enhanced later to detect deprecated extensions
-        return "✅ Active"
-
-    def _get_core_extension_repository_info(
-        self, ext_name: str, ext_metadata: dict
-    ) -> tuple[str, str, str]:
-        """Get repository link, stars, and language for core extension."""
-        # Check if extension has external repository from metadata
-        repo_path = ext_metadata.get("repository_path", "") if ext_metadata else ""
-
-        # Check extension metadata for external repositories
-        external_repos = self.metadata.metadata.get("core_extensions", {}).get(
-            "external_repositories", {}
+    def build_dataset(self, analysis_result: AnalysisResult) -> ReportDataset:
+        """Build the extension rows every report format of a run reads."""
+        core_docs_urls = (
+            self._discover_core_extension_urls()
+            if analysis_result.core_extensions
+            else {}
         )
-
-        if ext_name.lower() in external_repos:
-            # Extension has dedicated external repository
-            repo_name = external_repos[ext_name.lower()]["repository"]
-            repo_link = f"[{repo_name}](https://github.com/{repo_name})"
-
-            # Try to get stars from the extension's repository info if available
-            if ext_metadata and ext_metadata.get("repo_info"):
-                stars = str(ext_metadata["repo_info"].get("stargazers_count", "—"))
-            else:
-                stars = "—"  # Stars not fetched yet
-            language = "C++"  # Most DuckDB extensions are C++
-        elif repo_path and repo_path.startswith("external:"):
-            # Fallback: extract repo from external path
-            repo_name = repo_path.replace("external:", "")
-            repo_link = f"[{repo_name}](https://github.com/{repo_name})"
-            stars = "—"
-            language = "C++"
-        else:
-            # Extension is in main DuckDB repository
-            repo_link = "[duckdb/duckdb](https://github.com/duckdb/duckdb)"
-            stars = "—"  # Don't show main repo stars as it's not meaningful
-            language = "C++"
-
-        return repo_link, stars, language
+        return ReportDataset.build(analysis_result, core_docs_urls, self.metadata)
 
     async def generate(
         self, analysis_result: AnalysisResult, format_type: str = "markdown"
@@ -305,9 +211,14 @@ class ReportGenerator(BaseReportGenerator):
         else:
             raise ValueError(f"Unsupported report format: {format_type}")
 
-    async def generate_markdown(self, analysis_result: AnalysisResult) -> str:
+    async def generate_markdown(
+        self,
+        analysis_result: AnalysisResult,
+        dataset: Optional[ReportDataset] = None,
+    ) -> str:
         """Generate comprehensive markdown report."""
         logger.info("Generating markdown report")
+        dataset = dataset or self.build_dataset(analysis_result)
 
         timestamp = analysis_result.analysis_timestamp
         duckdb_version = analysis_result.duckdb_version
@@ -345,50 +256,19 @@ class ReportGenerator(BaseReportGenerator):
             ]
         )
 
-        # Discover core extension URLs
-        extension_urls = self._discover_core_extension_urls()
-
-        # Sort core extensions alphabetically
-        sorted_core_extensions = sorted(
-            analysis_result.core_extensions, key=lambda x: x.name.lower()
-        )
-
-        for idx, ext in enumerate(sorted_core_extensions, 1):
-            # Get extension details
-            status = self._determine_core_extension_status(ext, duckdb_lag_days)
-            description = self._generate_core_extension_description(
-                ext.name, ext.stage or "Stable"
-            )
-            repo_link, stars, language = self._get_core_extension_repository_info(
-                ext.name, ext.metadata
-            )
-
-            # Calculate last activity
-            if ext.metadata and ext.metadata.get("last_commit_date"):
-                repo_path = ext.metadata.get("repository_path", "")
-                if repo_path == "integrated_core":
-                    last_activity = f"{duckdb_lag_days} days ago"
-                elif repo_path.startswith("external:"):
-                    last_activity = self._format_days_ago(
-                        ext.metadata["last_commit_date"], duckdb_lag_days
-                    )
-                elif repo_path and repo_path != "not_found":
-                    last_activity = self._format_days_ago(
-                        ext.metadata["last_commit_date"], duckdb_lag_days
-                    )
-                else:
-                    last_activity = f"~{duckdb_lag_days} days ago"
-            else:
-                last_activity = f"~{duckdb_lag_days} days ago"
+        def by_name(rows: pd.DataFrame) -> pd.DataFrame:
+            return rows.sort_values("name", key=lambda names: names.str.lower())
 
+        for idx, ext in enumerate(by_name(dataset.extensions("core")).itertuples(), 1):
             # Create extension name with URL if available
-            extension_name = ext.name
-            extension_url = extension_urls.get(ext.name.lower())
-            if extension_url:
-                extension_name = f"[{ext.name}]({extension_url})"
+            extension_name = (
+                f"[{ext.name}]({ext.docs_url})" if pd.notna(ext.docs_url) else ext.name
+            )
+            stars = ext.stars if pd.notna(ext.stars) else "—"
+            approximate = "~" if ext.last_push_estimated else ""
 
             report.append(
-                f"| {idx} | **{extension_name}** | {repo_link} | {status} | {last_activity} | {stars} | {language} | {description} |"
+                f"| {idx} | **{extension_name}** | [{ext.repository}]({ext.repo_url}) | ✅ Active | {approximate}{ext.last_push_days} days ago | {stars} | {ext.language} | {ext.description} |"
             )
 
         report.extend(
@@ -407,43 +287,26 @@ class ReportGenerator(BaseReportGenerator):
             ]
         )
 
-        # Sort community extensions alphabetically
-        sorted_community_extensions = sorted(
-            analysis_result.community_extensions, key=lambda x: x.name.lower()
-        )
-
-        for idx, ext in enumerate(sorted_community_extensions, 1):
-            # Determine status with enhanced logic
-            if ext.metadata:
-                raw_status = ext.metadata.get("status", "❌ Issues")
-                if raw_status == "✅ Ongoing":
-                    status = "✅ Active"
-                elif raw_status == "🔴 Discontinued":
-                    status = "🔴 Archived"
-                else:
-                    status = "❌ Issues"
-            else:
-                status = "❌ Issues"
-
+        community = dataset.extensions("community")
+        status_labels = {"ongoing": "✅ Active", "archived": "🔴 Archived"}
+        for idx, ext in enumerate(by_name(community).itertuples(), 1):
             repo_link = (
-                f"[{ext.repository}](https://github.com/{ext.repository})"
-                if ext.repository
+                f"[{ext.repository}]({ext.repo_url})"
+                if pd.notna(ext.repository)
                 else "N/A"
             )
             last_activity = (
-                f"{ext.days_ago} days ago" if ext.days_ago is not None else "Unknown"
+                f"{ext.last_push_days} days ago"
+                if pd.notna(ext.last_push_days)
+                else "Unknown"
             )
-            stars = str(ext.stars) if ext.stars is not None else "N/A"
-
-            # Get language and description from metadata
-            language = "N/A"
-            description = ext.description or "No description"
 
-            if ext.metadata and ext.metadata.get("repo_info"):
-                repo_info = ext.metadata["repo_info"]
-                language = repo_info.get("language", "N/A") or "N/A"
+            stars = ext.stars if pd.notna(ext.stars) else "N/A"
 
             # Truncate description
+            description = (
+                ext.description if pd.notna(ext.description) else "No description"
+            )
             if len(description) > 50:
                 description = description[:50] + "..."
 
@@ -451,26 +314,14 @@ class ReportGenerator(BaseReportGenerator):
             description = description.replace("|", "\\|")
 
             report.append(
-                f"| {idx} | **{ext.name}** | {repo_link} | {status} | {last_activity} | {stars} | {language} | {description} |"
+                f"| {idx} | **{ext.name}** | {repo_link} | {status_labels.get(ext.status, '❌ Issues')} | {last_activity} | {stars} | {ext.language} | {description} |"
             )
 
         # Community extensions summary
-        active = sum(
-            1
-            for ext in analysis_result.community_extensions
-            if ext.metadata and ext.metadata.get("status") == "✅ Ongoing"
-        )
-        archived = sum(
-            1
-            for ext in analysis_result.community_extensions
-            if ext.metadata and ext.metadata.get("status") == "🔴 Discontinued"
-        )
-        issues = sum(
-            1
-            for ext in analysis_result.community_extensions
-            if ext.metadata and "❌" in ext.metadata.get("status", "")
-        )
-        total = len(analysis_result.community_extensions)
+        active = int((community["status"] == "ongoing").sum())
+        archived = int((community["status"] == "archived").sum())
+        issues = int(community["raw_status"].str.contains("❌").sum())
+        total = len(community)
 
         report.extend(
             [
@@ -501,59 +352,15 @@ class ReportGenerator(BaseReportGenerator):
 
         return "\n".join(report)
 
-    async def generate_csv(self, analysis_result: AnalysisResult) -> str:
+    async def generate_csv(
+        self,
+        analysis_result: AnalysisResult,
+        dataset: Optional[ReportDataset] = None,
+    ) -> str:
         """Generate CSV report data and return the filename."""
         logger.info("Generating CSV report")
 
-        rows = []
-
-        # Add core extensions
-        for ext in analysis_result.core_extensions:
-            rows.append(
-                {
-                    "Extension": ext.name,
-                    "Type": "Core",
-                    "Repository": ext.repository or "duckdb/duckdb",
-                    "Status": "✅ Ongoing",
-                    "Development Stage": ext.stage or "Stable",
-                    "Last Push Days": (
-                        analysis_result.analysis_timestamp.replace(tzinfo=None)
-                        - analysis_result.duckdb_release_date.replace(tzinfo=None)
-                    ).days
-                    if analysis_result.duckdb_release_date
-                    else 0,
-                    "Stars": "N/A",
-                    "Language": "C++",
-                    "Description": "Core DuckDB extension",
-                    "Featured": False,  # deprecated
-                }
-            )
-
-        # Add community extensions
-        for ext in analysis_result.community_extensions:
-            repo_info = ext.metadata.get("repo_info") if ext.metadata else {}
-
-            rows.append(
-                {
-                    "Extension": ext.name,
-                    "Type": "Community",
-                    "Repository": ext.repository or "N/A",
-                    "Status": ext.metadata.get("status", "❌ Error")
-                    if ext.metadata
-                    else "❌ Error",
-                    "Development Stage": "N/A",
-                    "Last Push Days": ext.days_ago,
-                    "Stars": ext.stars or 0,
-                    "Language": repo_info.get("language", "N/A")
-                    if repo_info
-                    else "N/A",
-                    "Description": ext.description or "No description",
-                    "Featured": False,  # deprecated
-                }
-            )
-
-        # Create DataFrame and save to CSV
-        df = pd.DataFrame(rows)
+        df = (dataset or self.build_dataset(analysis_result)).table()
         timestamp = analysis_result.analysis_timestamp.strftime("%Y%m%d_%H%M%S")
         csv_filename = f"duckdb_extensions_report_{timestamp}.csv"
         csv_path = self.reports_dir / csv_filename
@@ -564,60 +371,15 @@ class ReportGenerator(BaseReportGenerator):
         logger.info(f"CSV report saved: {csv_path}")
         return str(csv_path)
 
-    async def generate_excel(self, analysis_result: AnalysisResult) -> str:
+    async def generate_excel(
+        self,
+        analysis_result: AnalysisResult,
+        dataset: Optional[ReportDataset] = None,
+    ) -> str:
         """Generate Excel report data and return the filename."""
         logger.info("Generating Excel report")
 
-        # Use the same data as CSV
-        rows = []
-
-        # Add core extensions
-        for ext in analysis_result.core_extensions:
-            rows.append(
-                {
-                    "Extension": ext.name,
-                    "Type": "Core",
-                    "Repository": ext.repository or "duckdb/duckdb",
-                    "Status": "✅ Ongoing",
-                    "Development Stage": ext.stage or "Stable",
-                    "Last Push Days": (
-                        analysis_result.analysis_timestamp.replace(tzinfo=None)
-                        - analysis_result.duckdb_release_date.replace(tzinfo=None)
-                    ).days
-                    if analysis_result.duckdb_release_date
-                    else 0,
-                    "Stars": "N/A",
-                    "Language": "C++",
-                    "Description": "Core DuckDB extension",
-                    "Featured": False,  # deprecated
-                }
-            )
-
-        # Add community extensions
-        for ext in analysis_result.community_extensions:
-            repo_info = ext.metadata.get("repo_info") if ext.metadata else {}
-
-            rows.append(
-                {
-                    "Extension": ext.name,
-                    "Type": "Community",
-                    "Repository": ext.repository or "N/A",
-                    "Status": ext.metadata.get("status", "❌ Error")
-                    if ext.metadata
-                    else "❌ Error",
-                    "Development Stage": "N/A",
-                    "Last Push Days": ext.days_ago,
-                    "Stars": ext.stars or 0,
-                    "Language": repo_info.get("language", "N/A")
-                    if repo_info
-                    else "N/A",
-                    "Description": ext.description or "No description",
-                    "Featured": False,  # deprecated
-                }
-            )
-
-        # Create DataFrame and save to Excel
-        df = pd.DataFrame(rows)
+        df = (dataset or self.build_dataset(analysis_result)).table()
         timestamp = analysis_result.analysis_timestamp.strftime("%Y%m%d_%H%M%S")
         excel_filename = f"duckdb_extensions_report_{timestamp}.xlsx"
         excel_path = self.reports_dir / excel_filename
@@ -684,16 +446,20 @@ class ReportGenerator(BaseReportGenerator):
         return str(csv_path)
 
     async def generate_markdown_template(
-        self, analysis_result: AnalysisResult, template_name: str = "full_analysis"
+        self,
+        analysis_result: AnalysisResult,
+        template_name: str = "full_analysis",
+        dataset: Optional[ReportDataset] = None,
     ) -> str:
         """Generate markdown report using the new template system."""
         logger.info(f"Generating markdown report using template: {template_name}")
 
         try:
+            dataset = dataset or self.build_dataset(analysis_result)
             # Convert AnalysisResult to dict format expected by template engine
             analysis_data = {
-                "core_extensions": [],
-                "community_extensions": [],
+                "core_extensions": dataset.template_records("core"),
+                "community_extensions": dataset.template_records("community"),
                 "duckdb_version_info": {
                     "version": getattr(analysis_result, "duckdb_version", None),
                     "release_date": getattr(
@@ -708,105 +474,6 @@ class ReportGenerator(BaseReportGenerator):
                 "stats": {},
             }
 
-            # Convert core extensions
-            extension_urls = self._discover_core_extension_urls()
-            for ext in analysis_result.core_extensions:
-                # Calculate actual days ago from metadata if available
-                last_activity_days = 0  # Default for core extensions
-                if ext.metadata and ext.metadata.get("last_commit_date"):
-                    try:
-                        from dateutil import parser
-
-                        commit_date = parser.parse(ext.metadata["last_commit_date"])
-                        last_activity_days = (
-                            datetime.now(commit_date.tzinfo) - commit_date
-                        ).days
-                    except Exception:
-                        # If DuckDB release date is available, use that as reference
-                        if analysis_result.duckdb_release_date:
-                            last_activity_days = (
-                                analysis_result.analysis_timestamp.replace(tzinfo=None)
-                                - analysis_result.duckdb_release_date.replace(
-                                    tzinfo=None
-                                )
-                            ).days
-                        else:
-                            last_activity_days = 0
-                elif analysis_result.duckdb_release_date:
-                    # For core extensions without specific commit data, use DuckDB release age
-                    last_activity_days = (
-                        analysis_result.analysis_timestamp.replace(tzinfo=None)
-                        - analysis_result.duckdb_release_date.replace(tzinfo=None)
-                    ).days
-
-                # Get meaningful description from metadata or use the extension's description
-                description = ext.description
-                if not description and ext.metadata:
-                    # Try to get description from metadata
-                    description = ext.metadata.get("description")
-
-                # Use metadata system to get enhanced description if still not available
-                if not description:
-                    metadata_desc = self.metadata.get_extension_description(ext.name)
-                    if metadata_desc:
-                        description = metadata_desc
-                    else:
-                        description = f"Core DuckDB extension: {ext.name}"
-
-                # For core extensions, use the main DuckDB repository unless it's an external extension
-                repository_url = "duckdb/duckdb"
-                if ext.metadata and ext.metadata.get("repository_path", "").startswith(
-                    "external:"
-                ):
-                    repository_url = ext.metadata["repository_path"].replace(
-                        "external:", ""
-                    )
-                elif ext.repository and ext.repository != "integrated_core":
-                    repository_url = ext.repository
-
-                core_ext = {
-                    "name": ext.name,
-                    "repository": repository_url,
-                    "docs_url": extension_urls.get(ext.name.lower()),
-                    "status": "ongoing",
-                    "last_push_days": last_activity_days,
-                    "last_push": ext.last_push,  # Include actual datetime
-                    "stars": ext.stars,  # Include actual stars from external repos
-                    "language": "C++",
-                    "description": description,
-                    "featured": False,
-                    "version": "",
-                    "topics": [],
-                }
-                analysis_data["core_extensions"].append(core_ext)
-
-            # Convert community extensions
-            for ext in analysis_result.community_extensions:
-                # repo_info can be None if the repository fetch failed upstream.
-                repo_info = (
-                    (ext.metadata.get("repo_info") or {}) if ext.metadata else {}
-                )
-
-                community_ext = {
-                    "name": ext.name,
-                    "repository": ext.repository,
-                    "docs_url": f"https://duckdb.org/community_extensions/extensions/{ext.name}.html",
-                    "status": self._parse_status(
-                        ext.metadata.get("status", "❌ Error")
-                        if ext.metadata
-                        else "❌ Error"
-                    ),
-                    "last_push_days": ext.days_ago,
-                    "last_push": ext.last_push,  # Include actual datetime
-                    "stars": ext.stars or 0,
-                    "language": repo_info.get("language", "N/A"),
-                    "description": ext.description or "No description available",
-                    "featured": getattr(ext, "featured", False),
-                    "version": "",
-                    "topics": repo_info.get("topics", []),
-                }
-                analysis_data["community_extensions"].append(community_ext)
-
             # Compatibility testing results (optional)
             analysis_data["compatibility_testing"] = getattr(
                 analysis_result, "compatibility_testing", None
@@ -821,20 +488,7 @@ class ReportGenerator(BaseReportGenerator):
         except Exception as e:
             logger.error(f"Error generating template-based report: {e}")
             logger.info("Falling back to legacy report generation")
-            return await self.generate_markdown(analysis_result)
-
-    def _parse_status(self, raw_status: str) -> str:
-        """Parse status from raw format to standardized format."""
-        if "✅" in raw_status or "Ongoing" in raw_status:
-            return "ongoing"
-        elif (
-            "🔴" in raw_status
-            or "Discontinued" in raw_status
-            or "Archived" in raw_status
-        ):
-            return "archived"
-        else:
-            return "unknown"
+            return await self.generate_markdown(analysis_result, dataset)
 
     def save_report(
         self, content: str, filename: str, *, update_latest: bool = True
@@ -0,0 +1,277 @@
+"""
+Tests for change-driven scheduling of the compatibility matrix.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.analyzers.compatibility_scheduler import (
+    CompatibilityCandidate,
+    CompatibilityScheduler,
+)
+from src.analyzers.database_manager import DatabaseManager
+
+PROJECT_ROOT = Path(__file__).parent.parent
+NOW = datetime(2025, 6, 1, 12, 0)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    config = SimpleNamespace(
+        project_root=PROJECT_ROOT,
+        database_path=tmp_path / "extensions.duckdb",
+        ensure_directories=lambda: None,
+    )
+    return DatabaseManager(config)
+
+
+def last_result(
+    success=True, days_ago=1, version="1.0", last_modified="Mon", error_type=None
+):
+    return {
+        "success": success,
+        "error_type": error_type,
+        "extension_version": version,
+        "artifact_last_modified": last_modified,
+        "test_timestamp": NOW - timedelta(days=days_ago),
+    }
+
+
+class TestCompatibilityScheduler:
+    """Test ranking and skipping of (version, extension) pairs."""
+
+    def test_unchanged_passing_pairs_are_skipped(self):
+        candidate = CompatibilityCandidate(
+            "1.3.2",
+            "h3",
+            "community",
+            extension_version="1.0",
+            artifact_last_modified="Mon",
+        )
+        scheduled, unchanged = CompatibilityScheduler().schedule(
+            [candidate], {("1.3.2", "h3"): last_result()}, now=NOW
+        )
+
+        assert scheduled == []
+        assert unchanged == [candidate]
+
+    def test_changes_are_ranked_before_untested_and_failures(self):
+        candidates = [
+            CompatibilityCandidate("1.3.2", "failing", artifact_last_modified="Mon"),
+            CompatibilityCandidate("1.3.2", "new"),
+            CompatibilityCandidate("1.3.2", "rebuilt", artifact_last_modified="Tue"),
+            CompatibilityCandidate(
+                "1.3.2",
+                "bumped",
+                "community",
+                extension_version="2.0",
+                artifact_last_modified="Mon",
+            ),
+        ]
+        results = {
+            ("1.3.2", "failing"): last_result(success=False, error_type="timeout"),
+            ("1.3.2", "rebuilt"): last_result(days_ago=1),
+            ("1.3.2", "bumped"): last_result(days_ago=3),
+        }
+
+        scheduled, unchanged = CompatibilityScheduler().schedule(
+            candidates, results, now=NOW
+        )
+
+        assert [(t.candidate.extension_name, t.reasons) for t in scheduled] == [
+            ("bumped", ["new_extension_version"]),
+            ("rebuilt", ["new_artifact"]),
+            ("new", ["untested"]),
+            ("failing", ["previous_failure"]),
+        ]
+        assert unchanged == []
+
+    def test_unchanged_failures_are_retested(self):
+        candidates = [
+            CompatibilityCandidate("1.3.2", "h3", artifact_last_modified="Mon"),
+            CompatibilityCandidate("1.3.2", "jemalloc", artifact_last_modified="Mon"),
+        ]
+        results = {
+            ("1.3.2", "h3"): last_result(success=False, error_type="download"),
+            ("1.3.2", "jemalloc"): last_result(success=False, error_type="load"),
+        }
+
+        scheduled, unchanged = CompatibilityScheduler().schedule(
+            candidates, results, now=NOW
+        )
+
+        assert [(t.candidate.extension_name, t.reasons) for t in scheduled] == [
+            ("h3", ["previous_failure"]),
+            ("jemalloc", ["previous_failure"]),
+        ]
+        assert unchanged == []
+
+    def test_stale_results_are_retested_last(self):
+        candidates = [
+            CompatibilityCandidate("1.3.2", "old", artifact_last_modified="Mon"),
+            CompatibilityCandidate("1.3.2", "failing", artifact_last_modified="Mon"),
+        ]
+        results = {
+            ("1.3.2", "old"): last_result(days_ago=40),
+            ("1.3.2", "failing"): last_result(success=False, error_type="timeout"),
+        }
+
+        scheduled, _ = CompatibilityScheduler(max_result_age_days=30).schedule(
+            candidates, results, now=NOW
+        )
+
+        assert [t.reasons for t in scheduled] == [
+            ["previous_failure"],
+            ["stale_result"],
+        ]
+
+    def test_community_extension_cap_keeps_core_pairs(self):
+        candidates = [
+            CompatibilityCandidate(version, name, kind)
+            for version in ("1.3.2", "1.4.0")
+            for name, kind in (("json", "core"), ("a", "community"), ("b", "community"))
+        ]
+
+        scheduled, _ = CompatibilityScheduler().schedule(
+            candidates, {}, max_community_extensions=1, now=NOW
+        )
+
+        assert [
+            (t.candidate.duckdb_version, t.candidate.extension_name) for t in scheduled
+        ] == [("1.3.2", "json"), ("1.3.2", "a"), ("1.4.0", "json"), ("1.4.0", "a")]
+
+
+class TestStoredCompatibilityResults:
+    """Test that saved results drive the next schedule."""
+
+    def test_round_trip_skips_passing_and_retries_failures(self, db_manager):
+        assert db_manager.get_latest_compatibility_results("linux_amd64") == {}
+
+        db_manager.save_compatibility_results(
+            [
+                {
+                    "extension_name": "json",
+                    "duckdb_version": "1.3.2",
+                    "success": True,
+                    "artifact_last_modified": "Mon",
+                    "test_environment": "uv",
+                },
+                {
+                    "extension_name": "h3",
+                    "duckdb_version": "1.3.2",
+                    "success": False,
+                    "error_message": "IO Error: HTTP 404",
+                    "extension_version": "4.2",
+                    "test_environment": "uv",
+                },
+                {
+                    "extension_name": "spatial",
+                    "duckdb_version": "1.3.2",
+                    "success": False,
+                    "error_message": "Test timed out after 120 seconds",
+                    "test_environment": "uv",
+                },
+            ],
+            "linux_amd64",
+            NOW,
+        )
+
+        results = db_manager.get_latest_compatibility_results("linux_amd64")
+        assert results[("1.3.2", "json")]["success"] is True
+        assert results[("1.3.2", "h3")]["extension_version"] == "4.2"
+        assert results[("1.3.2", "h3")]["error_type"] == "download"
+        assert results[("1.3.2", "spatial")]["error_type"] == "timeout"
+        assert db_manager.get_latest_compatibility_results("osx_arm64") == {}
+
+        scheduled, unchanged = CompatibilityScheduler().schedule(
+            [
+                CompatibilityCandidate("1.3.2", "json", artifact_last_modified="Mon"),
+                CompatibilityCandidate(
+                    "1.3.2", "h3", "community", extension_version="4.2"
+                ),
+                CompatibilityCandidate("1.3.2", "spatial"),
+            ],
+            results,
+            now=NOW,
+        )
+
+        assert [t.candidate.extension_name for t in scheduled] == ["h3", "spatial"]
+        assert [c.extension_name for c in unchanged] == ["json"]
+
+
+class TestLoadBenchmarkTrends:
+    """Test the load-performance trend views over stored benchmarks."""
+
+    def _benchmark(self, version, p50, p95, rss, size=1000):
+        return {
+            "extension_name": "spatial",
+            "duckdb_version": version,
+            "success": True,
+            "test_environment": "uv",
+            "file_size_bytes": size,
+            "benchmark_runs": 10,
+            "load_time_p50_seconds": p50,
+            "load_time_p95_seconds": p95,
+            "rss_growth_bytes": rss,
+            "functional_test_p50_seconds": 0.001,
+        }
+
+    def test_regression_between_releases(self, db_manager):
+        import duckdb
+
+        db_manager.save_compatibility_results(
+            [
+                self._benchmark("1.9.0", 0.10, 0.12, 60_000_000),
+                self._benchmark("1.10.0", 0.20, 0.25, 50_000_000, size=1200),
+                self._benchmark("1.2.0", 0.10, 0.11, 40_000_000),
+            ],
+            "linux_amd64",
+            NOW,
+        )
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            trends = conn.execute(
+                "SELECT duckdb_version, previous_duckdb_version, load_time_p50_ratio, "
+                "file_size_change_bytes, load_trend FROM extension_load_benchmark_trends "
+                "ORDER BY load_time_p50_seconds, duckdb_version"
+            ).fetchall()
+            regressions = conn.execute(
+                "SELECT duckdb_version FROM extension_load_regressions"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        # Versions compare numerically: 1.2.0 < 1.9.0 < 1.10.0; 1.9.0 regressed
+        # on RSS growth and 1.10.0 on load latency
+        assert trends == [
+            ("1.2.0", None, None, None, "BASELINE"),
+            ("1.9.0", "1.2.0", 1.0, 0, "REGRESSED"),
+            ("1.10.0", "1.9.0", 2.0, 200, "REGRESSED"),
+        ]
+        assert regressions == [("1.10.0",), ("1.9.0",)]
+
+    def test_benchmark_mode_retests_unbenchmarked_results(self, db_manager):
+        db_manager.save_compatibility_results(
+            [
+                {
+                    "extension_name": "json",
+                    "duckdb_version": "1.3.2",
+                    "success": True,
+                    "test_environment": "uv",
+                }
+            ],
+            "linux_amd64",
+            NOW,
+        )
+        results = db_manager.get_latest_compatibility_results("linux_amd64")
+        candidate = CompatibilityCandidate("1.3.2", "json")
+
+        assert CompatibilityScheduler().schedule([candidate], results)[0] == []
+        scheduled, _ = CompatibilityScheduler(require_benchmark=True).schedule(
+            [candidate], results
+        )
+        assert scheduled[0].reasons == ["not_benchmarked"]
@@ -0,0 +1,1229 @@
+"""
+Tests for persisting analysis results with set-based inserts.
+"""
+
+import copy
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import duckdb
+import pytest
+
+from src.analyzers.base import AnalysisResult, ExtensionInfo
+from src.analyzers.database_manager import DatabaseManager
+from src.analyzers.database_writer import DatabaseWriter
+from src.analyzers.extension_queries import ExtensionQueries
+from src.analyzers.installation_tester import InstallationTestResult
+from src.analyzers.query_benchmark import QueryBenchmark, SyntheticScale
+
+PROJECT_ROOT = Path(__file__).parent.parent
+ANALYSIS_TIME = datetime(2025, 6, 1, 12, 0)
+
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+import blog_stats  # noqa: E402
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    config = SimpleNamespace(
+        project_root=PROJECT_ROOT,
+        database_path=tmp_path / "extensions.duckdb",
+        ensure_directories=lambda: None,
+        version_full="test",
+        duckdb_repo="duckdb/duckdb",
+    )
+    return DatabaseManager(config)
+
+
+HISTORY_TABLES = (
+    "analysis_runs",
+    "core_extensions_history",
+    "community_extensions_history",
+    "extension_availability_history",
+    "github_issues_history",
+    "extension_issues_mapping",
+    "installation_test_history",
+    "extension_metrics_daily",
+    "extension_trends_summary",
+)
+
+
+def table_counts(database_path):
+    conn = duckdb.connect(str(database_path))
+    try:
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in HISTORY_TABLES
+        }
+    finally:
+        conn.close()
+
+
+def apply_migrations_before(db_manager, conn, sql_file):
+    """Bring a database up to the migration before sql_file."""
+    conn.execute(db_manager._load_sql("00_schema_migrations.sql"))
+    pending = db_manager.SCHEMA_MIGRATIONS.index(sql_file)
+    for applied in db_manager.SCHEMA_MIGRATIONS[:pending]:
+        conn.execute(db_manager._load_sql(applied))
+        conn.execute(
+            "INSERT INTO schema_migrations (version, filename) VALUES (?, ?)",
+            [db_manager._migration_version(applied), applied],
+        )
+
+
+def make_analysis_result():
+    availability = {
+        "linux_amd64": {
+            "available": True,
+            "date": datetime(2025, 5, 1, tzinfo=timezone.utc),
+            "http_status": 200,
+            "file_size": 1024,
+        },
+        "osx_arm64": {"available": False, "http_status": 404, "error": "Not found"},
+    }
+    core = [
+        ExtensionInfo(
+            name="json",
+            type="core",
+            stage="Stable",
+            repository="duckdb/duckdb",
+            platform_availability=availability,
+            metadata={"last_commit_date": "2025-05-20T10:00:00Z"},
+        ),
+        ExtensionInfo(name="parquet", type="core"),
+    ]
+    community = [
+        ExtensionInfo(
+            name="h3",
+            type="community",
+            description="Hexagonal indexing",
+            repository="isaacbrodsky/h3-duckdb",
+            stars=200,
+            last_push="2025-05-30T00:00:00Z",
+            days_ago=2,
+            links={"github": "https://github.com/isaacbrodsky/h3-duckdb"},
+            metadata={
+                "status": "✅ Active",
+                "repo_info": {"forks": 10, "topics": ["geo"], "archived": False},
+            },
+        ),
+        ExtensionInfo(
+            name="broken",
+            type="community",
+            metadata={"status": "❌ Error", "error": "No repository found"},
+        ),
+    ]
+    result = AnalysisResult(
+        core_extensions=core,
+        community_extensions=community,
+        duckdb_version="v1.3.0",
+        duckdb_release_date=datetime(2025, 5, 21, tzinfo=timezone.utc),
+        analysis_timestamp=ANALYSIS_TIME,
+    )
+
+    issue = SimpleNamespace(
+        issue_number=42,
+        title="h3 fails to load",
+        body=None,
+        state="open",
+        created_at=datetime(2025, 5, 1),
+        updated_at=datetime(2025, 5, 2),
+        closed_at=None,
+        labels=[],
+        extension_names=["h3", "json"],
+        platforms=["linux_amd64"],
+        issue_type="installation",
+        severity="high",
+        html_url="https://github.com/duckdb/duckdb/issues/42",
+    )
+    result.github_issues = [issue, issue]  # duplicates must not fail the batch
+    result.installation_results = [
+        InstallationTestResult(
+            extension_name="json",
+            success=True,
+            install_time=0.1,
+            load_time=0.05,
+            functional_test_time=None,
+            total_time=0.2,
+            error_message=None,
+            python_version="3.12",
+            duckdb_version_used="1.3.0",
+            test_environment="uv",
+        )
+    ]
+    return result
+
+
+class TestSaveAnalysis:
+    """Test that every table is written from one set-based insert."""
+
+    @pytest.mark.asyncio
+    async def test_save_analysis_writes_every_table(self, db_manager):
+        await db_manager.save_analysis(make_analysis_result())
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            counts = {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in (
+                    "core_extensions_history",
+                    "community_extensions_history",
+                    "extension_availability_history",
+                    "github_issues_history",
+                    "extension_issues_mapping",
+                    "installation_test_history",
+                    "extension_metrics_daily",
+                )
+            }
+            core = conn.execute(
+                "SELECT c.available_platforms, c.earliest_availability_date, "
+                "a.error_message FROM core_extensions_history c "
+                "JOIN extension_availability_history a "
+                "ON a.extension_name = c.name AND a.platform = 'osx_arm64' "
+                "WHERE c.name = 'json'"
+            ).fetchone()
+            community = conn.execute(
+                "SELECT name, status, stars, topics, description "
+                "FROM community_extensions_history ORDER BY name"
+            ).fetchall()
+            availability = conn.execute(
+                "SELECT platform, is_available, http_status_code, days_since_release "
+                "FROM extension_availability_history ORDER BY platform"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        assert counts == {
+            "core_extensions_history": 2,
+            "community_extensions_history": 2,
+            "extension_availability_history": 2,
+            "github_issues_history": 1,
+            "extension_issues_mapping": 2,
+            "installation_test_history": 1,
+            "extension_metrics_daily": 4,
+        }
+        assert core == (["linux_amd64"], datetime(2025, 5, 1), "Not found")
+        assert community == [
+            ("broken", "❌ No Repo", None, None, "No repository found"),
+            ("h3", "✅ Active", 200, ["geo"], None),
+        ]
+        assert availability == [
+            ("linux_amd64", True, 200, 11),
+            ("osx_arm64", False, 404, 11),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_daily_metrics_are_upserted(self, db_manager):
+        result = make_analysis_result()
+        await db_manager.save_analysis(result)
+
+        # A later run on the same day replaces the day's metrics
+        result.analysis_timestamp = ANALYSIS_TIME.replace(hour=18)
+        result.community_extensions[0].stars = 250
+        await db_manager.save_analysis(result)
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            rows = conn.execute(
+                "SELECT stars FROM extension_metrics_daily WHERE extension_name = 'h3'"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        assert rows == [(250,)]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_extension_in_one_save(self, db_manager):
+        result = make_analysis_result()
+        duplicate = copy.deepcopy(result.community_extensions[0])
+        duplicate.stars = 250
+        result.community_extensions.append(duplicate)
+
+        await db_manager.save_analysis(result)
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            rows = conn.execute(
+                "SELECT stars FROM extension_metrics_daily WHERE extension_name = 'h3'"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        assert rows == [(250,)]
+
+    def test_upsert_rows_are_deduplicated_on_key(self, db_manager):
+        db_manager.create_schema()
+        row = ("h3", "community", date(2025, 6, 1), 200, 10, 2, "ok", True, False, None)
+        columns = [
+            "extension_name",
+            "extension_type",
+            "analysis_date",
+            "stars",
+            "forks",
+            "days_since_update",
+            "status",
+            "is_active",
+            "is_archived",
+            "repository",
+        ]
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            inserted = db_manager._insert_rows(
+                conn,
+                "insert_extension_metrics_daily.sql",
+                "extension_metrics_rows",
+                columns,
+                [row, row[:3] + (250,) + row[4:]],
+                key_columns=columns[:3],
+            )
+            rows = conn.execute("SELECT stars FROM extension_metrics_daily").fetchall()
+        finally:
+            conn.close()
+
+        assert inserted == 1
+        assert rows == [(250,)]
+
+
+class TestSchemaMigrations:
+    """Test versioned schema migrations and transactional saves."""
+
+    def test_migrations_run_once(self, db_manager):
+        db_manager.create_schema()
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            versions = conn.execute(
+                "SELECT version FROM schema_migrations ORDER BY version"
+            ).fetchall()
+            conn.execute("DROP VIEW latest_compatibility_results")
+        finally:
+            conn.close()
+        assert [v[0] for v in versions] == list(range(1, db_manager.schema_version + 1))
+
+        # A fresh process sees an up-to-date schema and runs no DDL
+        reopened = DatabaseManager(db_manager.config)
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            assert reopened._migrate(conn) == 0
+            assert (
+                conn.execute(
+                    "SELECT COUNT(*) FROM duckdb_views() "
+                    "WHERE view_name = 'latest_compatibility_results'"
+                ).fetchone()[0]
+                == 0
+            )
+        finally:
+            conn.close()
+
+    def test_pending_migrations_are_applied_in_order(self, db_manager):
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            conn.execute(db_manager._load_sql("00_schema_migrations.sql"))
+            for sql_file in db_manager.SCHEMA_MIGRATIONS[:19]:
+                conn.execute(db_manager._load_sql(sql_file))
+                conn.execute(
+                    "INSERT INTO schema_migrations (version, filename) VALUES (?, ?)",
+                    [db_manager._migration_version(sql_file), sql_file],
+                )
+            assert db_manager._migrate(conn) == len(db_manager.SCHEMA_MIGRATIONS) - 19
+            columns = {
+                row[0]
+                for row in conn.execute(
+                    "SELECT column_name FROM duckdb_columns() "
+                    "WHERE table_name = 'installation_test_history'"
+                ).fetchall()
+            }
+        finally:
+            conn.close()
+
+        assert {"artifact_last_modified", "benchmark_runs"} <= columns
+
+    @pytest.mark.asyncio
+    async def test_failed_save_leaves_no_partial_snapshot(
+        self, db_manager, monkeypatch
+    ):
+        def fail(conn, analysis_result, run_id):
+            raise RuntimeError("trend calculation failed")
+
+        monkeypatch.setattr(db_manager, "_save_trend_data", fail)
+        with pytest.raises(RuntimeError):
+            await db_manager.save_analysis(make_analysis_result())
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            counts = [
+                conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in (
+                    "analysis_runs",
+                    "core_extensions_history",
+                    "community_extensions_history",
+                    "github_issues_history",
+                )
+            ]
+        finally:
+            conn.close()
+
+        assert counts == [0, 0, 0, 0]
+
+
+class TestDatabaseWriter:
+    """Test writing a run's stages from the background writer thread."""
+
+    def _start(self, writer, result):
+        writer.start(
+            result.duckdb_version,
+            result.duckdb_release_date,
+            result.analysis_timestamp,
+        )
+
+    @pytest.mark.asyncio
+    async def test_staged_writes_match_save_analysis(self, db_manager, tmp_path):
+        expected_manager = DatabaseManager(
+            SimpleNamespace(
+                **{
+                    **vars(db_manager.config),
+                    "database_path": tmp_path / "expected.duckdb",
+                }
+            )
+        )
+        await expected_manager.save_analysis(make_analysis_result())
+
+        result = make_analysis_result()
+        writer = DatabaseWriter(db_manager)
+        self._start(writer, result)
+        writer.submit("core_extensions", result.core_extensions[:1])
+        writer.submit("core_extensions", result.core_extensions[1:])
+        writer.submit("community_extensions", result.community_extensions)
+        writer.submit("github_issues", result.github_issues)
+        writer.submit("installation_results", result.installation_results)
+        await writer.finish(result)
+
+        assert table_counts(db_manager.database_path) == table_counts(
+            expected_manager.database_path
+        )
+        stages = [stage for stage, _ in writer.stage_batches]
+        assert stages[-1] == "summary"
+        assert sum(n for s, n in writer.stage_batches if s == "core_extensions") == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_rolls_back_the_run(self, db_manager, monkeypatch):
+        def fail(conn, analysis_result):
+            raise RuntimeError("issue insert failed")
+
+        monkeypatch.setattr(db_manager, "_save_github_issues", fail)
+        result = make_analysis_result()
+        writer = DatabaseWriter(db_manager)
+        self._start(writer, result)
+        writer.submit("core_extensions", result.core_extensions)
+        writer.submit("github_issues", result.github_issues)
+        with pytest.raises(RuntimeError, match="issue insert failed"):
+            await writer.finish(result)
+
+        assert set(table_counts(db_manager.database_path).values()) == {0}
+
+    @pytest.mark.asyncio
+    async def test_abort_rolls_back_written_stages(self, db_manager):
+        result = make_analysis_result()
+        writer = DatabaseWriter(db_manager)
+        self._start(writer, result)
+        writer.submit("core_extensions", result.core_extensions)
+        await writer.abort()
+
+        assert not writer.running
+        assert set(table_counts(db_manager.database_path).values()) == {0}
+
+
+class TestLatestSnapshots:
+    """Test the latest-state tables behind the current views."""
+
+    @pytest.mark.asyncio
+    async def test_newer_runs_replace_and_older_runs_do_not(self, db_manager):
+        result = make_analysis_result()
+        await db_manager.save_analysis(result)
+
+        later = make_analysis_result()
+        later.analysis_timestamp = datetime(2025, 6, 2, 12, 0)
+        later.community_extensions[0].stars = 300
+        await db_manager.save_analysis(later)
+
+        # A historical re-run must not overwrite the current state
+        older = make_analysis_result()
+        older.analysis_timestamp = datetime(2025, 5, 1, 12, 0)
+        older.community_extensions[0].stars = 100
+        await db_manager.save_analysis(older)
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            community = conn.execute(
+                "SELECT name, stars, analysis_date FROM community_extensions"
+            ).fetchall()
+            core = conn.execute("SELECT name FROM core_extensions").fetchall()
+            popularity = conn.execute(
+                "SELECT extension_name, stars, popularity_rank FROM v_extension_popularity"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        assert community == [
+            ("broken", None, datetime(2025, 6, 2, 12, 0)),
+            ("h3", 300, datetime(2025, 6, 2, 12, 0)),
+        ]
+        assert core == [("json",), ("parquet",)]
+        assert popularity == [("h3", 300, 1), ("broken", None, 2)]
+
+    def test_migration_backfills_existing_history(self, db_manager):
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            apply_migrations_before(db_manager, conn, "22_latest_snapshots.sql")
+            conn.execute(
+                "INSERT INTO core_extensions_history (name, status, analysis_date) "
+                "VALUES ('json', 'old', '2025-01-01'), ('json', 'new', '2025-02-01')"
+            )
+            db_manager._migrate(conn)
+            rows = conn.execute("SELECT name, status FROM core_extensions").fetchall()
+        finally:
+            conn.close()
+
+        assert rows == [("json", "new")]
+
+
+class TestPlatformAvailability:
+    """Test typed platform availability storage."""
+
+    @pytest.mark.asyncio
+    async def test_coverage_by_version(self, db_manager):
+        await db_manager.save_analysis(make_analysis_result())
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            columns = [
+                row[0]
+                for row in conn.execute("DESCRIBE core_extensions_history").fetchall()
+            ]
+            coverage = conn.execute(
+                "SELECT duckdb_version, platform, available_extensions, "
+                "checked_extensions, coverage_percentage, unavailable_extensions "
+                "FROM platform_coverage_by_version"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        assert "platform_availability" not in columns
+        assert coverage == [
+            ("v1.3.0", "linux_amd64", 1, 1, 100.0, None),
+            ("v1.3.0", "osx_arm64", 0, 1, 0.0, ["json"]),
+        ]
+
+    def test_migration_moves_json_blob_to_availability_rows(self, db_manager):
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            apply_migrations_before(
+                db_manager, conn, "24_typed_platform_availability.sql"
+            )
+            conn.execute(
+                """
+                INSERT INTO core_extensions_history
+                    (name, duckdb_version, platform_availability, analysis_date,
+                     valid_from)
+                VALUES (
+                    'json', 'v1.2.0',
+                    '{"linux_amd64": {"available": true,
+                                      "date": "2025-05-01T02:00:00+02:00"},
+                      "osx_arm64": {"available": false, "date": null,
+                                    "error": "Not found", "http_status": 404}}',
+                    '2025-05-02', '2025-05-02'
+                )
+                """
+            )
+            db_manager._migrate(conn)
+            rows = conn.execute(
+                "SELECT extension_name, platform, duckdb_version, is_available, "
+                "availability_date, http_status_code, error_message "
+                "FROM extension_availability_as_of(TIMESTAMP '2025-05-03') "
+                "ORDER BY platform"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        assert rows == [
+            ("json", "linux_amd64", "v1.2.0", True, datetime(2025, 5, 1), None, None),
+            ("json", "osx_arm64", "v1.2.0", False, None, 404, "Not found"),
+        ]
+
+
+def make_daily_results():
+    """Three daily runs: nothing changes on day 2; on day 3 h3 gains stars and
+    the broken extension disappears."""
+    results = []
+    for day, stars in ((1, 200), (2, 200), (3, 300)):
+        result = make_analysis_result()
+        result.analysis_timestamp = datetime(2025, 6, day, 12, 0)
+        h3 = result.community_extensions[0]
+        h3.stars = stars
+        h3.days_ago = 1 + day  # last push stays 2025-05-30
+        if day == 3:
+            result.community_extensions = result.community_extensions[:1]
+        result.github_issues = []
+        results.append(result)
+    return results
+
+
+def as_of_snapshots(database_path, dates):
+    conn = duckdb.connect(str(database_path))
+    try:
+        return {
+            day: (
+                conn.execute(
+                    "SELECT name, stars, last_push_days FROM community_extensions_as_of(?) "
+                    "ORDER BY name",
+                    [day],
+                ).fetchall(),
+                conn.execute(
+                    "SELECT name FROM core_extensions_as_of(?) ORDER BY name", [day]
+                ).fetchall(),
+                conn.execute(
+                    "SELECT extension_name, platform, is_available "
+                    "FROM extension_availability_as_of(?) ORDER BY ALL",
+                    [day],
+                ).fetchall(),
+                conn.execute(
+                    "SELECT extension_name, stars, days_since_update "
+                    "FROM extension_metrics_as_of(?) ORDER BY ALL",
+                    [day],
+                ).fetchall(),
+            )
+            for day in dates
+        }
+    finally:
+        conn.close()
+
+
+class TestChangeOnlyHistory:
+    """Test change-only (SCD type 2) storage of the history tables."""
+
+    @pytest.fixture
+    def changes_manager(self, db_manager, tmp_path):
+        config = SimpleNamespace(
+            **{
+                **vars(db_manager.config),
+                "database_path": tmp_path / "changes.duckdb",
+                "history_mode": "changes",
+            }
+        )
+        return DatabaseManager(config)
+
+    @pytest.mark.asyncio
+    async def test_only_changes_are_stored(self, changes_manager):
+        for result in make_daily_results():
+            await changes_manager.save_analysis(result)
+
+        conn = duckdb.connect(str(changes_manager.database_path))
+        try:
+            community = conn.execute(
+                "SELECT name, stars, valid_from, valid_to "
+                "FROM community_extensions_history ORDER BY name, valid_from"
+            ).fetchall()
+            core_rows = conn.execute(
+                "SELECT COUNT(*) FROM core_extensions_history WHERE valid_to IS NULL"
+            ).fetchone()[0]
+            star_trends = conn.execute(
+                "SELECT analysis_date, stars, star_delta FROM v_extension_star_trends "
+                "WHERE extension_name = 'h3'"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        def day(d):
+            return datetime(2025, 6, d, 12, 0)
+
+        assert community == [
+            ("broken", None, day(1), day(3)),
+            ("h3", 200, day(1), day(3)),
+            ("h3", 300, day(3), None),
+        ]
+        assert core_rows == 2
+        assert [(d.day, s, delta) for d, s, delta in star_trends] == [
+            (1, 200, None),
+            (2, 200, 0),
+            (3, 300, 100),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_snapshots_match_snapshot_mode(self, db_manager, changes_manager):
+        for result in make_daily_results():
+            await db_manager.save_analysis(result)
+            await changes_manager.save_analysis(result)
+
+        dates = [datetime(2025, 6, day, 13, 0) for day in (1, 2, 3)]
+        snapshots = as_of_snapshots(db_manager.database_path, dates)
+
+        assert snapshots == as_of_snapshots(changes_manager.database_path, dates)
+        assert snapshots[dates[1]][0] == [("broken", None, None), ("h3", 200, 3)]
+        assert snapshots[dates[2]][0] == [("h3", 300, 4)]
+        assert (
+            table_counts(changes_manager.database_path)["community_extensions_history"]
+            < table_counts(db_manager.database_path)["community_extensions_history"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_blog_stats_count_unchanged_extensions(self, changes_manager):
+        for day, result in enumerate(make_daily_results(), 1):
+            result.community_extensions.append(
+                ExtensionInfo(
+                    name="lindel",
+                    type="community",
+                    repository="abc/lindel",
+                    stars=50,
+                    last_push="2025-05-31T00:00:00Z",
+                    days_ago=day,
+                    metadata={"status": "✅ Active", "repo_info": {}},
+                )
+            )
+            await changes_manager.save_analysis(result)
+
+        # Day 3 only stores a new version of h3; lindel's row dates from day 1
+        conn = duckdb.connect(str(changes_manager.database_path))
+        try:
+            top = blog_stats.top_extensions_by_stars(conn)
+            recent = blog_stats.recently_updated_extensions(conn)
+            languages = blog_stats.language_breakdown(conn)
+        finally:
+            conn.close()
+
+        assert [(name, stars) for name, stars, *_ in top] == [
+            ("h3", 300),
+            ("lindel", 50),
+        ]
+        assert [(name, days) for name, days, *_ in recent] == [
+            ("lindel", 3),
+            ("h3", 4),
+        ]
+        assert languages == [("Other", 2)]
+
+
+class TestHistoryArchive:
+    """Test the hive-partitioned Parquet archive of the history tables."""
+
+    TREND_QUERY = (
+        "SELECT extension_name, analysis_date, stars, star_delta "
+        "FROM v_extension_star_trends ORDER BY ALL"
+    )
+
+    @pytest.mark.asyncio
+    async def test_export_writes_daily_partitions(self, db_manager):
+        for result in make_daily_results():
+            await db_manager.save_analysis(result)
+
+        counts = db_manager.archive_history()
+
+        archive = db_manager.archive_dir
+        assert sorted(
+            p.name for p in (archive / "extension_metrics_daily").iterdir()
+        ) == [
+            "analysis_date=2025-06-01",
+            "analysis_date=2025-06-02",
+            "analysis_date=2025-06-03",
+        ]
+        assert counts["community_extensions_history"] == 5
+        parquet = next((archive / "community_extensions_history").rglob("*.parquet"))
+        conn = duckdb.connect()
+        try:
+            codecs = conn.execute(
+                "SELECT DISTINCT compression FROM parquet_metadata(?)",
+                [str(parquet)],
+            ).fetchall()
+        finally:
+            conn.close()
+        assert codecs == [("ZSTD",)]
+
+    @pytest.mark.asyncio
+    async def test_reexport_replaces_the_day(self, db_manager):
+        results = make_daily_results()
+        await db_manager.save_analysis(results[0])
+        db_manager.archive_history()
+
+        # A later run on the same day drops the broken extension
+        later = results[2]
+        later.analysis_timestamp = datetime(2025, 6, 1, 18, 0)
+        await db_manager.save_analysis(later)
+        db_manager.archive_history([later.analysis_timestamp.date()])
+
+        conn = db_manager.connect_archive()
+        try:
+            rows = conn.execute(
+                "SELECT name, stars, analysis_date FROM community_extensions_history"
+            ).fetchall()
+        finally:
+            conn.close()
+        assert rows == [("h3", 300, datetime(2025, 6, 1, 18, 0))]
+
+    @pytest.mark.asyncio
+    async def test_archive_views_match_live_database(self, db_manager):
+        for result in make_daily_results():
+            await db_manager.save_analysis(result)
+        db_manager.archive_history()
+
+        live = duckdb.connect(str(db_manager.database_path))
+        archived = db_manager.connect_archive()
+        try:
+            assert (
+                archived.execute(self.TREND_QUERY).fetchall()
+                == live.execute(self.TREND_QUERY).fetchall()
+            )
+            assert (
+                archived.execute(
+                    "SELECT * FROM extension_trends_summary ORDER BY analysis_date"
+                ).fetchall()
+                == live.execute(
+                    "SELECT * FROM extension_trends_summary ORDER BY analysis_date"
+                ).fetchall()
+            )
+            plan = archived.execute(
+                "EXPLAIN ANALYZE SELECT COUNT(*) FROM extension_metrics_daily "
+                "WHERE analysis_date = DATE '2025-06-02'"
+            ).fetchall()[0][1]
+        finally:
+            archived.close()
+            live.close()
+
+        assert "Scanning Files: 1/3" in plan
+
+
+def make_runs(stars_by_day):
+    """One run per day, with h3 at the given stars."""
+    results = []
+    for day, stars in stars_by_day:
+        result = make_analysis_result()
+        result.analysis_timestamp = datetime.combine(day, datetime.min.time()).replace(
+            hour=12
+        )
+        h3 = result.community_extensions[0]
+        h3.stars = stars
+        h3.days_ago = (day - date(2025, 5, 30)).days
+        result.github_issues = []
+        results.append(result)
+    return results
+
+
+def rollup_rows(database_path):
+    conn = duckdb.connect(str(database_path))
+    try:
+        return (
+            conn.execute(
+                "SELECT * FROM extension_metrics_rollup ORDER BY ALL"
+            ).fetchall(),
+            conn.execute(
+                "SELECT * FROM ecosystem_growth_rollup ORDER BY ALL"
+            ).fetchall(),
+        )
+    finally:
+        conn.close()
+
+
+class TestTrendRollups:
+    """Test the weekly and monthly trend rollups maintained at save time."""
+
+    RUNS = [
+        (date(2025, 5, 30), 150),  # Friday: week of 05-26, May
+        (date(2025, 6, 1), 200),  # Sunday: week of 05-26, June
+        (date(2025, 6, 2), 250),  # Monday: week of 06-02
+        (date(2025, 6, 9), 300),  # week of 06-09
+    ]
+
+    @pytest.mark.asyncio
+    async def test_weekly_and_monthly_star_trends(self, db_manager):
+        for result in make_runs(self.RUNS):
+            await db_manager.save_analysis(result)
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            weekly = conn.execute(
+                "SELECT period_start, analysis_date, stars, prev_stars, star_delta "
+                "FROM v_extension_star_trends_weekly WHERE extension_name = 'h3'"
+            ).fetchall()
+            monthly = conn.execute(
+                "SELECT period_start, analysis_date, stars, star_delta "
+                "FROM v_extension_star_trends_monthly WHERE extension_name = 'h3'"
+            ).fetchall()
+            activity = conn.execute(
+                "SELECT period_start, is_active, activity_change "
+                "FROM v_extension_activity_trends_weekly WHERE extension_name = 'json'"
+            ).fetchall()
+            growth = conn.execute(
+                "SELECT period_start, total_extensions, total_delta "
+                "FROM v_ecosystem_growth_monthly"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        assert weekly == [
+            (date(2025, 5, 26), date(2025, 6, 1), 200, None, None),
+            (date(2025, 6, 2), date(2025, 6, 2), 250, 200, 50),
+            (date(2025, 6, 9), date(2025, 6, 9), 300, 250, 50),
+        ]
+        assert monthly == [
+            (date(2025, 5, 1), date(2025, 5, 30), 150, None),
+            (date(2025, 6, 1), date(2025, 6, 9), 300, 150),
+        ]
+        assert [change for _, _, change in activity] == [
+            "became_inactive",
+            "no_change",
+            "no_change",
+        ]
+        assert growth == [(date(2025, 5, 1), 4, None), (date(2025, 6, 1), 4, 0)]
+
+    @pytest.mark.asyncio
+    async def test_backfilled_runs_refresh_later_periods(self, db_manager, tmp_path):
+        in_order = DatabaseManager(
+            SimpleNamespace(
+                **{**vars(db_manager.config), "database_path": tmp_path / "o.duckdb"}
+            )
+        )
+        for result in make_runs(self.RUNS):
+            await in_order.save_analysis(result)
+
+        runs = make_runs(self.RUNS)
+        for result in runs[2:] + runs[:2]:
+            await db_manager.save_analysis(result)
+
+        assert rollup_rows(db_manager.database_path) == rollup_rows(
+            in_order.database_path
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_rollups_are_built_from_history(self, db_manager):
+        runs = make_runs(self.RUNS)
+        for result in runs:
+            await db_manager.save_analysis(result)
+        expected = rollup_rows(db_manager.database_path)
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            conn.execute("DELETE FROM extension_metrics_rollup")
+            conn.execute("DELETE FROM ecosystem_growth_rollup")
+        finally:
+            conn.close()
+        # A later run on the last day rebuilds every period
+        rerun = make_runs(self.RUNS[-1:])[0]
+        rerun.analysis_timestamp = rerun.analysis_timestamp.replace(hour=18)
+        await db_manager.save_analysis(rerun)
+
+        assert rollup_rows(db_manager.database_path) == expected
+
+
+def fts_installed():
+    conn = duckdb.connect()
+    try:
+        return conn.execute(
+            "SELECT installed FROM duckdb_extensions() WHERE extension_name = 'fts'"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def changelog_rows(database_path):
+    conn = duckdb.connect(str(database_path))
+    try:
+        return conn.execute(
+            "SELECT run_id, previous_run_id, extension_name, change_type, "
+            "previous_status, status FROM extension_changelog ORDER BY ALL"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+class TestExtensionChangelog:
+    """Test the per-run membership table and the change log derived from it."""
+
+    @pytest.mark.asyncio
+    async def test_runs_record_added_removed_and_status_changes(self, db_manager):
+        results = make_daily_results()
+        results[1].community_extensions[1].metadata["status"] = "✅ Active"
+        for result in results:
+            await db_manager.save_analysis(result)
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            latest = conn.execute(
+                "SELECT extension_name, change_type FROM v_latest_extension_changes"
+            ).fetchall()
+            summary = conn.execute(
+                "SELECT new_extensions_since_last, removed_extensions_since_last "
+                "FROM extension_trends_summary WHERE analysis_date = '2025-06-03'"
+            ).fetchone()
+        finally:
+            conn.close()
+
+        assert changelog_rows(db_manager.database_path) == [
+            (1, None, "broken", "added", None, "❌ Error"),
+            (1, None, "h3", "added", None, "✅ Active"),
+            (1, None, "json", "added", None, "Stable"),
+            (1, None, "parquet", "added", None, "Stable"),
+            (2, 1, "broken", "status_changed", "❌ Error", "✅ Active"),
+            (3, 2, "broken", "removed", "✅ Active", None),
+        ]
+        assert latest == [("broken", "removed")]
+        assert summary == ([], ["broken"])
+
+    @pytest.mark.asyncio
+    async def test_partial_run_compares_against_last_run_of_each_type(self, db_manager):
+        results = make_daily_results()
+        # Day 2 only re-analyses core extensions, and parquet is gone
+        results[1].community_extensions = []
+        results[1].core_extensions = results[1].core_extensions[:1]
+        results[2].community_extensions = results[0].community_extensions
+        for result in results:
+            await db_manager.save_analysis(result)
+
+        assert [
+            row for row in changelog_rows(db_manager.database_path) if row[0] > 1
+        ] == [
+            (2, 1, "parquet", "removed", "Stable", None),
+            (3, 2, "parquet", "added", None, "Stable"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_migration_backfills_existing_runs(self, db_manager):
+        for result in make_daily_results():
+            await db_manager.save_analysis(result)
+        expected = changelog_rows(db_manager.database_path)
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            conn.execute("DROP TABLE extension_changelog")
+            conn.execute("DROP TABLE analysis_run_extensions")
+            # Later migrations are idempotent and re-run with it
+            conn.execute("DELETE FROM schema_migrations WHERE version >= 27")
+            db_manager._schema_ready = False
+            db_manager._migrate(conn)
+        finally:
+            conn.close()
+
+        assert changelog_rows(db_manager.database_path) == expected
+
+
+class TestExtensionQueries:
+    """Test the query API and its pool of read-only connections."""
+
+    @pytest.mark.asyncio
+    async def test_queries_read_saved_history(self, db_manager):
+        for result in make_runs(TestTrendRollups.RUNS):
+            await db_manager.save_analysis(result)
+
+        with ExtensionQueries.open(db_manager) as queries:
+            weekly = queries.extension_star_history("h3", period="weekly")
+            injected = queries.extension_star_history("h3' OR '1' = '1")
+            top = queries.top_extensions_by_stars(limit=1)
+            summary = queries.trend_summary()
+
+        assert weekly == [
+            (date(2025, 6, 9), 300, 250, 50),
+            (date(2025, 6, 2), 250, 200, 50),
+            (date(2025, 6, 1), 200, None, None),
+        ]
+        assert injected == []
+        assert [row[0] for row in top] == ["h3"]
+        assert (summary["date"], summary["total_extensions"]) == (date(2025, 6, 9), 4)
+        assert summary["total_delta"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pool_reuses_connections_and_statements(self, db_manager):
+        await db_manager.save_analysis(make_analysis_result())
+
+        with ExtensionQueries.open(db_manager) as queries:
+            for period in ("daily", "daily", "weekly"):
+                queries.ecosystem_growth_trends(period)
+            statements = list(queries.pool._statements)
+
+            # Concurrent callers never open more connections than the pool size
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda _: queries.trend_summary(), range(32)))
+            connections = len(queries.pool._connections)
+
+        assert statements == [
+            ("ecosystem_growth_trends", (("rollup", ""),)),
+            ("ecosystem_growth_trends", (("rollup", "_weekly"),)),
+        ]
+        assert connections <= queries.pool.size
+        with pytest.raises(RuntimeError):
+            queries.trend_summary()
+
+    def test_open_migrates_database(self, db_manager):
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            apply_migrations_before(db_manager, conn, "27_extension_changelog.sql")
+        finally:
+            conn.close()
+
+        with ExtensionQueries.open(db_manager) as queries:
+            changes = queries.latest_extension_changes()
+            summary = queries.trend_summary()
+
+        assert changes == []
+        assert summary == {}
+
+    @pytest.mark.asyncio
+    async def test_archive_queries_match_live_database(self, db_manager):
+        for result in make_daily_results():
+            await db_manager.save_analysis(result)
+        db_manager.archive_history()
+
+        with ExtensionQueries.open(db_manager) as live:
+            expected = live.extension_star_history("h3"), live.trend_summary()
+        with ExtensionQueries.open(db_manager, db_manager.archive_dir) as archived:
+            actual = archived.extension_star_history("h3"), archived.trend_summary()
+        # The closed pool no longer holds the database file read-only
+        later = make_analysis_result()
+        later.analysis_timestamp = datetime(2025, 6, 4, 12, 0)
+        await db_manager.save_analysis(later)
+
+        assert actual == expected
+
+
+class TestQueryBenchmark:
+    """Test the query benchmark over synthetic history."""
+
+    SCALE = SyntheticScale(
+        community_extensions=12, core_extensions=3, days=20, platforms=2
+    )
+
+    def test_every_view_and_query_runs_on_synthetic_history(self, db_manager):
+        benchmark = QueryBenchmark(db_manager, repeat=1)
+        counts = benchmark.load_synthetic_history(self.SCALE)
+        timings = benchmark.run()
+
+        conn = duckdb.connect(str(db_manager.database_path), read_only=True)
+        try:
+            growth = conn.execute(
+                "SELECT COUNT(*), arg_max(core_count, analysis_date) "
+                "FROM v_ecosystem_growth"
+            ).fetchone()
+            weekly = conn.execute(
+                "SELECT COUNT(*) FROM v_extension_star_trends_weekly"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+        assert counts["analysis_runs"] == 20
+        assert counts["extension_availability_history"] > 0
+        assert growth == (20, 3)
+        assert weekly > 0
+        # The BM25 search needs the fts extension and its index
+        assert [t.name for t in timings if t.error] == (
+            [] if fts_installed() else ["search_extensions"]
+        )
+        names = {t.name for t in timings}
+        assert {"v_ecosystem_growth", "trending_extensions[weekly]"} <= names
+        assert all(len(t.seconds) == 1 for t in timings if not t.error)
+
+    def test_synthetic_history_needs_an_empty_database(self, db_manager):
+        conn = db_manager._connect()
+        try:
+            conn.execute("INSERT INTO analysis_runs (run_timestamp) VALUES (now())")
+        finally:
+            conn.close()
+
+        with pytest.raises(ValueError):
+            QueryBenchmark(db_manager).load_synthetic_history(self.SCALE)
+
+    def test_compare_flags_slowdowns_and_new_failures(self, db_manager, tmp_path):
+        def results(seconds, error=None):
+            return {
+                "results": [
+                    {"kind": "view", "name": name, "median_seconds": s, "error": e}
+                    for name, s, e in [
+                        ("v_steady", 0.1, None),
+                        ("v_slower", seconds, None),
+                        ("v_noise", 0.001 * seconds / 0.1, None),
+                        ("v_broken", None if error else 0.1, error),
+                    ]
+                ]
+            }
+
+        benchmark = QueryBenchmark(db_manager)
+        written = benchmark.write_results(tmp_path / "baseline.json", [])
+        assert written["results"] == []
+
+        regressions = QueryBenchmark.compare(results(0.3, "boom"), results(0.1))
+
+        # New failures first, then the largest slowdown; noise never regresses
+        assert [(r["name"], r["slowdown"]) for r in regressions] == [
+            ("v_broken", None),
+            ("v_slower", pytest.approx(3.0)),
+        ]
+        assert QueryBenchmark.compare(results(0.1), results(0.1)) == []
+
+
+def search_documents(database_path):
+    conn = duckdb.connect(str(database_path))
+    try:
+        return conn.execute(
+            "SELECT extension_name, readme, updated_at FROM extension_documents "
+            "ORDER BY extension_name"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def with_readme(result, readme):
+    h3 = result.community_extensions[0]
+    h3.metadata["deprecation_analysis"] = {"readme_content": readme}
+    return result
+
+
+class TestExtensionSearch:
+    """Test the extension search documents and their index."""
+
+    README = "# h3-duckdb\n\nGeospatial indexing of points into a hexagon grid."
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_readme_and_description_matches(self, db_manager):
+        await db_manager.save_analysis(with_readme(make_analysis_result(), self.README))
+
+        with ExtensionQueries.open(db_manager) as queries:
+            readme_match = queries.search_extensions("GEOSPATIAL grid")
+            topic_match = queries.search_extensions("geo", limit=1)
+            name_match = queries.search_extensions("json")
+            no_match = queries.search_extensions("spreadsheet")
+
+        assert [row[:3] for row in readme_match] == [
+            ("h3", "community", "Hexagonal indexing")
+        ]
+        assert [row[0] for row in topic_match] == ["h3"]
+        assert [row[0] for row in name_match] == ["json"]
+        assert no_match == []
+
+    @pytest.mark.asyncio
+    async def test_only_changed_documents_are_rewritten(self, db_manager):
+        first, same, changed = make_runs(TestTrendRollups.RUNS[:3])
+        await db_manager.save_analysis(with_readme(first, self.README))
+        # A run that fetched no README keeps the last one
+        await db_manager.save_analysis(same)
+        unchanged = search_documents(db_manager.database_path)
+        changed.community_extensions[0].description = "H3 hexagonal grid indexing"
+        await db_manager.save_analysis(changed)
+        documents = search_documents(db_manager.database_path)
+
+        assert unchanged[1] == ("h3", self.README, first.analysis_timestamp)
+        assert documents[1] == ("h3", self.README, changed.analysis_timestamp)
+        assert [doc for doc in documents if doc[0] != "h3"] == [
+            doc for doc in unchanged if doc[0] != "h3"
+        ]
+
+    @pytest.mark.skipif(not fts_installed(), reason="fts extension not installed")
+    @pytest.mark.asyncio
+    async def test_full_text_index_ranks_by_bm25(self, db_manager):
+        await db_manager.save_analysis(with_readme(make_analysis_result(), self.README))
+        assert db_manager.build_search_index() == 4
+
+        with ExtensionQueries.open(db_manager) as queries:
+            indexed = queries.has_search_index()
+            ranked = queries.search_extensions("hexagon grid")
+
+        assert indexed
+        assert [row[0] for row in ranked] == ["h3"]
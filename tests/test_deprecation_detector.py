@@ -0,0 +1,105 @@
+"""
+Tests for the deprecation detector used by community extension analysis.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from detect_deprecated_extensions import (  # noqa: E402
+    INDICATOR_SCANNER,
+    KeywordScanner,
+    RepositoryCache,
+)
+
+
+class TestKeywordScanner:
+    """Test single-pass keyword indicator scanning."""
+
+    def test_scan_reports_every_class(self):
+        text = "This extension is deprecated.\nIt was experimental but is now stable."
+        found = INDICATOR_SCANNER.scan(text, "readme")
+
+        assert [i["keyword"] for i in found["deprecation"]] == ["deprecated"]
+        assert [i["keyword"] for i in found["warning"]] == ["experimental"]
+        assert [i["keyword"] for i in found["active"]] == ["stable"]
+        assert found["deprecation"][0] == {
+            "keyword": "deprecated",
+            "source": "readme",
+            "context": "This extension is deprecated.",
+        }
+
+    def test_overlapping_keywords_are_all_found(self):
+        found = INDICATOR_SCANNER.scan("No longer maintained", "repo_description")
+
+        assert [i["keyword"] for i in found["deprecation"]] == [
+            "no longer maintained"
+        ]
+        assert [i["keyword"] for i in found["active"]] == ["maintained"]
+
+    def test_prefix_keywords_share_a_position(self):
+        scanner = KeywordScanner({"a": ["test"], "b": ["testing"]})
+        found = scanner.scan("Testing only", "readme")
+
+        assert [i["keyword"] for i in found["a"]] == ["test"]
+        assert [i["keyword"] for i in found["b"]] == ["testing"]
+
+    def test_context_windows_do_not_overlap_and_are_capped(self):
+        scanner = KeywordScanner({"warning": ["beta"]}, context_chars=5)
+        text = "beta beta " + "x" * 20 + " beta" + "\nbeta\nbeta"
+        contexts = [i["context"] for i in scanner.scan(text, "readme")["warning"]]
+
+        # Same windows as re.findall(r".{0,5}beta.{0,5}", text)[:3]
+        assert contexts == ["beta beta xxxx", "xxxx beta", "beta"]
+
+    def test_empty_text(self):
+        assert INDICATOR_SCANNER.scan("", "readme") == {
+            "deprecation": [],
+            "warning": [],
+            "active": [],
+        }
+
+
+class TestRepositoryCache:
+    """Test the indexed repository cache."""
+
+    def test_set_and_get_many(self, tmp_path):
+        cache = RepositoryCache(cache_dir=tmp_path, cache_days=1)
+        cache.set_many({"a": {"x": 1}, "b": "_not_found"})
+        cache.set("c", [1, 2])
+
+        assert cache.get("a") == {"x": 1}
+        assert cache.get_many(["b", "c", "missing"]) == {
+            "b": "_not_found",
+            "c": [1, 2],
+        }
+        assert cache.get_stats()["entry_count"] == 3
+
+    def test_expired_entries_are_ignored_and_cleaned(self, tmp_path):
+        cache = RepositoryCache(cache_dir=tmp_path, cache_days=1)
+        cache.set("old", "value")
+        with cache.conn:
+            cache.conn.execute(
+                "UPDATE cache_entries SET stored_at = stored_at - 2 * 86400"
+            )
+
+        assert cache.get("old") is None
+
+        reopened = RepositoryCache(cache_dir=tmp_path, cache_days=1)
+        assert reopened.get_stats()["entry_count"] == 0
+
+    def test_preload_serves_later_gets(self, tmp_path):
+        cache = RepositoryCache(cache_dir=tmp_path, cache_days=1)
+        cache.set_many({"a": 1, "b": 2})
+
+        assert cache.preload(["a", "b"]) == 2
+        cache.conn.close()  # preloaded entries no longer need the database
+        assert cache.get("a") == 1
+        assert cache.get("b") == 2
+
+    def test_disabled_cache(self, tmp_path):
+        cache = RepositoryCache(cache_dir=tmp_path, enabled=False)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert cache.get_stats() == {"enabled": False}
@@ -0,0 +1,139 @@
+"""
+Tests for SQL-side deprecation scoring over persisted signals.
+
+The deprecation_scores view must reproduce DeprecationDetector's Python
+scoring so that stored history can be re-scored without rescanning READMEs.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import duckdb
+import pytest
+
+from src.analyzers.base import AnalysisResult, ExtensionInfo
+from src.analyzers.database_manager import DatabaseManager
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from detect_deprecated_extensions import DeprecationDetector  # noqa: E402
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    config = SimpleNamespace(
+        project_root=PROJECT_ROOT,
+        database_path=tmp_path / "extensions.duckdb",
+        ensure_directories=lambda: None,
+    )
+    return DatabaseManager(config)
+
+
+def _indicators(keyword, count):
+    return [
+        {"keyword": keyword, "source": "readme", "context": f"... {keyword} ..."}
+    ] * count
+
+
+def _analysis(archived=False, days_since_push=None, deprecation=0, warning=0, active=0):
+    now = datetime.now()
+    last_push = (
+        (now - timedelta(days=days_since_push)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if days_since_push is not None
+        else None
+    )
+    return {
+        "repository": "https://github.com/example/ext",
+        "repository_archived": archived,
+        "last_push": last_push,
+        "deprecation_indicators": _indicators("deprecated", deprecation),
+        "warning_indicators": _indicators("experimental", warning),
+        "active_indicators": _indicators("stable", active),
+    }
+
+
+SAMPLE_ANALYSES = {
+    "archived": _analysis(archived=True, active=1),
+    "likely": _analysis(deprecation=3),
+    "possibly": _analysis(deprecation=1, warning=1, days_since_push=400),
+    "review": _analysis(warning=2, days_since_push=200),
+    "monitor": _analysis(warning=1, days_since_push=30),
+    "active": _analysis(warning=1, active=2),
+    "empty": _analysis(),
+}
+
+
+class TestDeprecationScoreView:
+    """Test that SQL scoring matches the Python detector."""
+
+    @pytest.mark.asyncio
+    async def test_view_matches_python_scoring(self, db_manager):
+        db_manager.create_schema()
+        result = AnalysisResult(
+            core_extensions=[],
+            community_extensions=[
+                ExtensionInfo(
+                    name=name,
+                    type="community",
+                    metadata={"deprecation_analysis": analysis},
+                )
+                for name, analysis in SAMPLE_ANALYSES.items()
+            ],
+        )
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            db_manager._save_deprecation_signals(conn, result)
+            scores = {
+                name: (score, recommendation)
+                for name, score, recommendation in conn.execute(
+                    "SELECT extension_name, deprecation_score, recommendation "
+                    "FROM current_deprecation_scores"
+                ).fetchall()
+            }
+        finally:
+            conn.close()
+
+        detector = DeprecationDetector()
+        for name, analysis in SAMPLE_ANALYSES.items():
+            expected = dict(analysis)
+            expected["deprecation_score"] = detector._calculate_deprecation_score(
+                expected
+            )
+            assert scores[name] == (
+                expected["deprecation_score"],
+                detector._get_recommendation(expected),
+            ), name
+
+    @pytest.mark.asyncio
+    async def test_changed_weights_rescore_history(self, db_manager):
+        db_manager.create_schema()
+        result = AnalysisResult(
+            core_extensions=[],
+            community_extensions=[
+                ExtensionInfo(
+                    name="ext",
+                    type="community",
+                    metadata={"deprecation_analysis": _analysis(warning=2)},
+                )
+            ],
+        )
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            db_manager._save_deprecation_signals(conn, result)
+            conn.execute(
+                "UPDATE deprecation_score_weights SET weight = 4.0 "
+                "WHERE signal = 'warning'"
+            )
+            score, recommendation = conn.execute(
+                "SELECT deprecation_score, recommendation FROM deprecation_scores"
+            ).fetchone()
+        finally:
+            conn.close()
+
+        assert score == 8.0
+        assert recommendation == "LIKELY DEPRECATED - High confidence"
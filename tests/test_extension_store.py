@@ -0,0 +1,95 @@
+"""
+Tests for the local content-addressed extension binary store.
+"""
+
+import gzip
+
+import httpx
+import pytest
+
+from src.analyzers.extension_store import ExtensionBinaryStore
+
+BINARY = b"\x00duckdb extension binary\x00" * 10
+
+
+def make_client(requests_seen, etag='"abc"'):
+    """Client serving one gzipped binary and honouring If-None-Match."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if not request.url.path.endswith("/json.duckdb_extension.gz"):
+            return httpx.Response(404)
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            content=gzip.compress(BINARY),
+            headers={"etag": etag, "last-modified": "Mon, 01 Sep 2025 00:00:00 GMT"},
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestExtensionBinaryStore:
+    """Test downloading, revalidating and locating stored binaries."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_stores_decompressed_binary_in_repository_layout(
+        self, tmp_path
+    ):
+        store = ExtensionBinaryStore(tmp_path)
+        requests_seen = []
+        async with make_client(requests_seen) as client:
+            stored = await store.fetch(client, "1.3.2", "linux_amd64", "json")
+
+        assert (
+            requests_seen[0].url.path == "/v1.3.2/linux_amd64/json.duckdb_extension.gz"
+        )
+        assert (
+            stored.path
+            == tmp_path / "repository/v1.3.2/linux_amd64/json.duckdb_extension"
+        )
+        assert stored.path.read_bytes() == BINARY
+        assert stored.etag == '"abc"'
+        assert (tmp_path / "blobs" / stored.sha256).exists()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_etag_is_not_downloaded_again(self, tmp_path):
+        store = ExtensionBinaryStore(tmp_path)
+        requests_seen = []
+        async with make_client(requests_seen) as client:
+            first = await store.fetch(client, "1.3.2", "linux_amd64", "json")
+            second = await store.fetch(client, "1.3.2", "linux_amd64", "json")
+
+        assert requests_seen[1].headers["if-none-match"] == '"abc"'
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_identical_binaries_share_one_blob(self, tmp_path):
+        store = ExtensionBinaryStore(tmp_path)
+        async with make_client([]) as client:
+            await store.fetch(client, "1.3.2", "linux_amd64", "json")
+            await store.fetch(client, "1.3.2", "linux_arm64", "json")
+
+        assert len(list((tmp_path / "blobs").iterdir())) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_extension(self, tmp_path):
+        store = ExtensionBinaryStore(tmp_path)
+        async with make_client([]) as client:
+            assert await store.fetch(client, "1.3.2", "linux_amd64", "nope") is None
+
+        assert store.install_sql("1.3.2", "linux_amd64", "nope") == "INSTALL nope"
+
+    @pytest.mark.asyncio
+    async def test_index_survives_reopen(self, tmp_path):
+        store = ExtensionBinaryStore(tmp_path)
+        async with make_client([]) as client:
+            await store.fetch(client, "v1.3.2", "linux_amd64", "json")
+        store._save_index()
+
+        reopened = ExtensionBinaryStore(tmp_path)
+        assert reopened.get("1.3.2", "linux_amd64", "json") is not None
+        assert reopened.install_sql("1.3.2", "linux_amd64", "json") == (
+            f"INSTALL json FROM '{(tmp_path / 'repository').resolve().as_posix()}'"
+        )
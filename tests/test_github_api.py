@@ -0,0 +1,91 @@
+"""
+Tests for the GitHub API client's README fetches.
+"""
+
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from aiolimiter import AsyncLimiter
+
+from conf.config import Config
+from src.analyzers.github_api import GitHubAPIClient
+
+README_URL = "https://api.github.com/repos/isaacbrodsky/h3-duckdb/readme"
+
+
+@pytest.fixture
+def github_client(tmp_path):
+    config = Config()
+    config.cache_dir = tmp_path
+    client = GitHubAPIClient(config)
+    # Tests make back-to-back requests
+    client.rate_limiter = AsyncLimiter(max_rate=100, time_period=1)
+    yield client
+    client.cache.close()
+
+
+def respond(status_code, content=b"", **headers):
+    """Build a transport answering every request the same way."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            status_code,
+            content=content,
+            headers={"x-ratelimit-remaining": "4000", **headers},
+        )
+
+    return httpx.MockTransport(handler), requests
+
+
+def cache_readme(github_client, data, age_hours=2):
+    headers = {**github_client.headers, "Accept": "application/vnd.github.raw"}
+    cache_key = github_client.get_cache_key(README_URL, headers)
+    github_client.cache.set(
+        cache_key, (datetime.now() - timedelta(hours=age_hours), data)
+    )
+
+
+class TestGetReadme:
+    """Test README fetches and their rate limit bookkeeping."""
+
+    @pytest.mark.asyncio
+    async def test_ok_returns_raw_text(self, github_client):
+        transport, requests = respond(200, b"# H3\n" * 10, etag='"v1"')
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            text = await github_client.get_readme(
+                client, "isaacbrodsky/h3-duckdb", max_bytes=8
+            )
+            cached = await github_client.get_readme(client, "isaacbrodsky/h3-duckdb")
+
+        assert text == cached == "# H3\n# H"
+        assert len(requests) == 1
+        assert requests[0].headers["Accept"] == "application/vnd.github.raw"
+        assert github_client.last_rate_limit_remaining == 4000
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_cached_text(self, github_client):
+        cache_readme(github_client, {"text": "# H3", "etag": '"v1"'})
+        transport, requests = respond(304)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            text = await github_client.get_readme(client, "isaacbrodsky/h3-duckdb")
+
+        assert text == "# H3"
+        assert requests[0].headers["If-None-Match"] == '"v1"'
+        assert github_client.last_rate_limit_remaining == 4000
+
+    @pytest.mark.asyncio
+    async def test_missing_readme_is_cached_as_none(self, github_client):
+        transport, requests = respond(404)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            text = await github_client.get_readme(client, "isaacbrodsky/h3-duckdb")
+            cached = await github_client.get_readme(client, "isaacbrodsky/h3-duckdb")
+
+        assert text is None and cached is None
+        assert len(requests) == 1
+        assert github_client.last_rate_limit_remaining == 4000
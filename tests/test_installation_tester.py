@@ -7,11 +7,18 @@ extension installation testing and special cases like jemalloc.
 
 import asyncio
 import platform
+import sys
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from pathlib import Path
 
-from src.analyzers.installation_tester import InstallationTester, InstallationTestResult
+from src.analyzers.extension_store import ExtensionBinaryStore
+from src.analyzers.installation_tester import (
+    ExtensionTestWorker,
+    InstallationTester,
+    InstallationTestResult,
+    WorkerCrashedError,
+)
 
 
 class TestInstallationTester:
@@ -128,6 +135,10 @@ class TestExtensionTesting:
     def setup_method(self):
         """Set up test fixtures."""
         self.tester = InstallationTester()
+        # Workers are covered by TestExtensionTestWorker; stub them out here
+        self.worker = Mock()
+        self.worker.run_job = AsyncMock()
+        self.tester._get_worker = AsyncMock(return_value=self.worker)
 
     @pytest.mark.asyncio
     async def test_test_extensions_batch_with_special_case(self):
@@ -218,41 +229,41 @@ class TestExtensionTesting:
     async def test_test_single_extension_timeout(self):
         """Test that single extension testing handles timeouts properly."""
         extension_name = 'slow_extension'
-        
-        # Create a mock process that times out
-        mock_process = Mock()
-        mock_process.communicate = AsyncMock()
-        mock_process.communicate.side_effect = asyncio.TimeoutError()
-        mock_process.kill = Mock()
-        mock_process.wait = AsyncMock()
-        
-        with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            with patch('tempfile.TemporaryDirectory'):
-                with patch('pathlib.Path.write_text'):
-                    result = await self.tester._test_single_extension_with_uv(extension_name)
-        
+        self.worker.run_job.side_effect = asyncio.TimeoutError()
+
+        result = await self.tester._test_single_extension_with_uv(extension_name)
+
         assert result.extension_name == extension_name
         assert result.success is False
         assert "timed out" in result.error_message
-        mock_process.kill.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_test_single_extension_success(self):
         """Test successful single extension testing."""
         extension_name = 'test_extension'
-        
-        # Mock successful process execution
-        mock_stdout = '{"success": true, "install_time": 0.1, "load_time": 0.05, "total_time": 0.15, "error_message": null, "python_version": "3.13", "duckdb_version_used": "1.1.3", "test_environment": "uv"}'
-        
-        mock_process = Mock()
-        mock_process.communicate = AsyncMock(return_value=(mock_stdout.encode(), b''))
-        mock_process.returncode = 0
-        
-        with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            with patch('tempfile.TemporaryDirectory'):
-                with patch('pathlib.Path.write_text'):
-                    result = await self.tester._test_single_extension_with_uv(extension_name)
-        
+        self.worker.run_job.return_value = {
+            "job_id": 1,
+            "success": True,
+            "install_time": 0.1,
+            "load_time": 0.05,
+            "total_time": 0.15,
+            "error_message": None,
+            "python_version": "3.13",
+            "duckdb_version_used": "1.1.3",
+            "test_environment": "uv",
+        }
+
+        result = await self.tester._test_single_extension_with_uv(
+            extension_name, timeout_seconds=30
+        )
+
+        self.worker.run_job.assert_awaited_once_with(
+            extension_name,
+            self.tester._get_test_query(extension_name),
+            30,
+            extension_repository=None,
+            benchmark_runs=None,
+        )
         assert result.extension_name == extension_name
         assert result.success is True
         assert result.install_time == 0.1
@@ -263,23 +274,28 @@ class TestExtensionTesting:
 
     @pytest.mark.asyncio
     async def test_test_single_extension_process_failure(self):
-        """Test single extension testing with process failure."""
+        """Test single extension testing with a crashed worker."""
         extension_name = 'failing_extension'
-        
-        # Mock failed process execution
-        mock_process = Mock()
-        mock_process.communicate = AsyncMock(return_value=(b'', b'Process failed with error'))
-        mock_process.returncode = 1
-        
-        with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            with patch('tempfile.TemporaryDirectory'):
-                with patch('pathlib.Path.write_text'):
-                    result = await self.tester._test_single_extension_with_uv(extension_name)
-        
+        self.worker.run_job.side_effect = WorkerCrashedError(
+            "Test worker crashed: Process failed with error"
+        )
+
+        result = await self.tester._test_single_extension_with_uv(extension_name)
+
         assert result.extension_name == extension_name
         assert result.success is False
         assert "Process failed with error" in result.error_message
 
+    @pytest.mark.asyncio
+    async def test_test_single_extension_environment_failure(self):
+        """Test single extension testing when the environment cannot be built."""
+        self.tester._get_worker.side_effect = RuntimeError("uv not found")
+
+        result = await self.tester._test_single_extension_with_uv('json')
+
+        assert result.success is False
+        assert result.error_message == "Environment setup failed: uv not found"
+
     def test_test_script_template_content(self):
         """Test that the test script template contains required components."""
         template = self.tester.test_script_template
@@ -290,7 +306,12 @@ class TestExtensionTesting:
         assert 'import time' in template
         
         # Check for main test function
-        assert 'def test_extension(extension_name, test_query=None):' in template
+        assert (
+            'def test_extension(extension_name, test_query=None, '
+            'extension_directory=None, extension_repository=None, '
+            'benchmark_runs=None):' in template
+        )
+        assert 'def run_worker():' in template
         
         # Check for DuckDB operations
         assert 'duckdb.connect(' in template
@@ -352,4 +373,303 @@ class TestInstallationTestResult:
         assert result.install_time is None
         assert result.load_time is None
         assert result.total_time == 0.0
-        assert result.error_message == 'Extension failed to install'
\ No newline at end of file
+        assert result.error_message == 'Extension failed to install'
+
+
+class TestEnvironmentCache:
+    """Test per-version environment caching."""
+
+    @pytest.mark.asyncio
+    async def test_environment_built_once_per_version(self, tmp_path):
+        """Test that an environment is built once and reused for each version."""
+        tester = InstallationTester(env_cache_dir=tmp_path)
+        setup_commands = []
+
+        async def fake_setup(cmd):
+            setup_commands.append(cmd)
+            if "-c" in cmd:
+                return '{"duckdb_version": "1.1.3", "platform": "linux_amd64"}'
+            return ""
+
+        with patch.object(tester, '_run_setup_command', side_effect=fake_setup):
+            first = await tester._ensure_environment("1.1.3")
+            second = await tester._ensure_environment("1.1.3")
+            other = await tester._ensure_environment("1.2.0")
+
+        assert first == second
+        assert first != other
+        assert (first / ".ready").exists()
+        assert (first / "test_extension.py").read_text() == tester.test_script_template
+        # uv venv, uv pip install and the platform probe for each version
+        assert len(setup_commands) == 6
+        assert "duckdb==1.1.3" in setup_commands[1]
+        assert tester._environment_info(first)["platform"] == "linux_amd64"
+
+    @pytest.mark.asyncio
+    async def test_failed_build_is_not_cached(self, tmp_path):
+        """Test that a failed build leaves no environment behind."""
+        tester = InstallationTester(env_cache_dir=tmp_path)
+
+        with patch.object(
+            tester, '_run_setup_command', side_effect=RuntimeError("no such version")
+        ):
+            with pytest.raises(RuntimeError):
+                await tester._ensure_environment("0.0.0")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_environment_dir_is_content_addressed(self, tmp_path):
+        """Test that the environment key changes with the test script."""
+        tester = InstallationTester(env_cache_dir=tmp_path)
+        original = tester._environment_dir("1.1.3")
+
+        tester.test_script_template += "\n# changed\n"
+
+        assert tester._environment_dir("1.1.3") != original
+        assert tester._environment_dir("1.1.3").name.startswith("duckdb-1.1.3-")
+
+
+class TestExtensionTestWorker:
+    """Test the JSON-lines worker protocol against a real worker process."""
+
+    def _make_worker(self, tmp_path, script, max_jobs=50):
+        (tmp_path / "test_extension.py").write_text(script)
+        return ExtensionTestWorker(tmp_path, Path(sys.executable), max_jobs=max_jobs)
+
+    @pytest.mark.asyncio
+    async def test_worker_serves_jobs_with_isolated_extension_directories(
+        self, tmp_path
+    ):
+        """Test that one process serves several jobs, each in its own directory."""
+        duckdb = pytest.importorskip("duckdb")
+        script = InstallationTester().test_script_template.replace(
+            'result["job_id"] = job["job_id"]',
+            'result["job_id"] = job["job_id"]\n'
+            '        result["pid"] = os.getpid()\n'
+            '        result["extension_directory"] = job["extension_directory"]',
+        )
+        worker = self._make_worker(tmp_path, script)
+        try:
+            first = await worker.run_job("json", "SELECT 1", 60)
+            second = await worker.run_job("json", None, 60)
+        finally:
+            await worker.close()
+
+        # INSTALL may fail without network access; the protocol must still work
+        assert first["duckdb_version_used"] == duckdb.__version__
+        assert first["test_query_used"] == "SELECT 1"
+        assert first["job_id"] == 1 and second["job_id"] == 2
+        assert first["pid"] == second["pid"]
+        assert first["extension_directory"] != second["extension_directory"]
+        assert not Path(first["extension_directory"]).exists()
+        assert not worker.is_running
+
+    @pytest.mark.asyncio
+    async def test_worker_recycled_after_max_jobs(self, tmp_path):
+        """Test that the worker process is replaced after max_jobs jobs."""
+        script = (
+            "import json, os, sys\n"
+            "print(json.dumps({'ready': True}), flush=True)\n"
+            "for line in sys.stdin:\n"
+            "    job = json.loads(line)\n"
+            "    print(json.dumps({'job_id': job['job_id'], 'pid': os.getpid()}), flush=True)\n"
+        )
+        worker = self._make_worker(tmp_path, script, max_jobs=2)
+        try:
+            pids = [(await worker.run_job("ext", None, 10))["pid"] for _ in range(3)]
+        finally:
+            await worker.close()
+
+        assert pids[0] == pids[1]
+        assert pids[2] != pids[1]
+
+    @pytest.mark.asyncio
+    async def test_worker_crash_is_reported_and_recovered(self, tmp_path):
+        """Test that a crashing job raises and the next job gets a new worker."""
+        script = (
+            "import json, os, sys\n"
+            "print(json.dumps({'ready': True}), flush=True)\n"
+            "for line in sys.stdin:\n"
+            "    job = json.loads(line)\n"
+            "    if job['extension_name'] == 'crash':\n"
+            "        sys.stderr.write('segfault in LOAD\\n')\n"
+            "        sys.stderr.flush()\n"
+            "        os._exit(1)\n"
+            "    print(json.dumps({'job_id': job['job_id'], 'success': True}), flush=True)\n"
+        )
+        worker = self._make_worker(tmp_path, script)
+        try:
+            with pytest.raises(WorkerCrashedError, match="segfault in LOAD"):
+                await worker.run_job("crash", None, 10)
+            assert (await worker.run_job("ok", None, 10))["success"] is True
+        finally:
+            await worker.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_killed_on_timeout(self, tmp_path):
+        """Test that a job exceeding its timeout kills the worker."""
+        script = (
+            "import json, sys, time\n"
+            "print(json.dumps({'ready': True}), flush=True)\n"
+            "for line in sys.stdin:\n"
+            "    time.sleep(30)\n"
+        )
+        worker = self._make_worker(tmp_path, script)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await worker.run_job("slow", None, 0.5)
+            assert not worker.is_running
+        finally:
+            await worker.close()
+
+
+class TestParallelExecution:
+    """Test the parallel worker pool used for compatibility matrices."""
+
+    @pytest.mark.asyncio
+    async def test_matrix_runs_pairs_in_parallel(self):
+        """Test that pairs run concurrently, bounded by max_workers."""
+        tester = InstallationTester(max_workers=3)
+        running = 0
+        peak = 0
+
+        async def fake_test(extension_name, duckdb_pypi_version="", **_kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return InstallationTestResult(
+                extension_name=extension_name,
+                success=True,
+                install_time=0.01,
+                load_time=0.01,
+                functional_test_time=None,
+                total_time=0.05,
+                error_message=None,
+                python_version='3.13',
+                duckdb_version_used='unknown',
+                test_environment='uv',
+            )
+
+        pairs = [(version, ext) for version in ('1.2.2', '1.3.2') for ext in 'abcde']
+        with patch.object(tester, '_test_single_extension_with_uv', side_effect=fake_test):
+            results = await tester.test_compatibility_matrix(pairs, timeout_seconds=10)
+
+        assert peak == 3
+        assert [(r.duckdb_version_used, r.extension_name) for r in results] == pairs
+
+    @pytest.mark.asyncio
+    async def test_matrix_skips_pairs_after_budget(self):
+        """Test that pairs not started within the runtime budget are skipped."""
+        tester = InstallationTester(max_workers=1)
+        seen_timeouts = []
+
+        async def fake_test(extension_name, duckdb_pypi_version="", timeout_seconds=0):
+            seen_timeouts.append(timeout_seconds)
+            await asyncio.sleep(0.3)
+            return Mock(extension_name=extension_name)
+
+        pairs = [('1.3.2', ext) for ext in 'abc']
+        with patch.object(tester, '_test_single_extension_with_uv', side_effect=fake_test):
+            results = await tester.test_compatibility_matrix(
+                pairs, timeout_seconds=120, max_runtime_seconds=0.5
+            )
+
+        assert results[0] is not None and results[1] is not None
+        assert results[2] is None
+        # Tests starting near the deadline only get the remaining budget
+        assert all(t <= 1 for t in seen_timeouts)
+
+    @pytest.mark.asyncio
+    async def test_pool_retires_idle_workers_of_other_versions(self, tmp_path):
+        """Test that live workers never exceed max_workers across versions."""
+        tester = InstallationTester(env_cache_dir=tmp_path, max_workers=2)
+
+        async def fake_env(version=""):
+            return tmp_path / f"env-{version}"
+
+        with patch.object(tester, '_ensure_environment', side_effect=fake_env):
+            a = await tester._get_worker("1.2.2")
+            b = await tester._get_worker("1.2.2")
+            tester._return_worker(a)
+            tester._return_worker(b)
+
+            # Same version reuses an idle worker
+            reused = await tester._get_worker("1.2.2")
+            assert reused in (a, b)
+            tester._return_worker(reused)
+
+            c = await tester._get_worker("1.3.2")
+
+        live = tester._busy_workers + sum(len(w) for w in tester._idle_workers.values())
+        assert live == 2
+        assert c.env_dir.name == "env-1.3.2"
+        assert len(tester._idle_workers["env-1.2.2"]) == 1
+
+
+class TestBinaryPrefetch:
+    """Test downloading extension binaries into the store before a run."""
+
+    @pytest.mark.asyncio
+    async def test_community_binaries_fetched_from_community_repository(
+        self, tmp_path
+    ):
+        """Test that each binary is fetched from the repository serving it."""
+        store = ExtensionBinaryStore(tmp_path)
+        tester = InstallationTester(env_cache_dir=tmp_path, binary_store=store)
+        fetched = {}
+
+        async def fake_artifact_keys(pairs):
+            return {pair: (pair[0], 'linux_amd64', pair[1]) for pair in pairs}
+
+        async def fake_fetch(client, duckdb_version, platform_name, name,
+                             repository='core'):
+            fetched[name] = store.remote_url(
+                duckdb_version, platform_name, name, repository
+            )
+            return None
+
+        pairs = [('1.3.2', 'json'), ('1.3.2', 'h3')]
+        with patch.object(tester, '_artifact_keys', side_effect=fake_artifact_keys), \
+                patch.object(store, 'fetch', side_effect=fake_fetch):
+            await tester.prefetch_binaries(pairs, community_extensions=['h3'])
+
+        assert fetched == {
+            'json': 'http://extensions.duckdb.org/v1.3.2/linux_amd64/json.duckdb_extension.gz',
+            'h3': 'http://community-extensions.duckdb.org/v1.3.2/linux_amd64/h3.duckdb_extension.gz',
+        }
+
+
+class TestBenchmarkMode:
+    """Test load-performance benchmarking in the worker script."""
+
+    def _template_namespace(self):
+        namespace = {"__name__": "benchmark_template"}
+        exec(InstallationTester().test_script_template, namespace)
+        return namespace
+
+    def test_percentile_uses_nearest_rank(self):
+        percentile = self._template_namespace()["percentile"]
+        values = [0.5, 0.1, 0.4, 0.2, 0.3]
+
+        assert percentile(values, 0.50) == 0.3
+        assert percentile(values, 0.95) == 0.5
+        assert percentile([0.7], 0.95) == 0.7
+
+    def test_benchmark_times_repeated_loads(self):
+        """Test that LOAD and the test query are timed for every run."""
+        pytest.importorskip("duckdb")
+        benchmark_extension = self._template_namespace()["benchmark_extension"]
+
+        # json is built into the Python package, so no download is needed
+        metrics = benchmark_extension("json", "SELECT json_valid('{}')", {}, 5)
+
+        assert metrics["benchmark_runs"] == 5
+        assert 0 <= metrics["load_time_p50"] <= metrics["load_time_p95"]
+        assert metrics["functional_test_time_p50"] is not None
+
+    def test_benchmark_mode_uses_one_process_per_test(self):
+        """Test that benchmarks are not skewed by earlier tests in the same worker."""
+        assert InstallationTester(benchmark_runs=10).max_jobs_per_worker == 1
+        assert InstallationTester().max_jobs_per_worker == 50
@@ -0,0 +1,155 @@
+"""
+Tests for data-driven GitHub issue classification.
+
+These tests verify that the rules loaded from conf/issue_classification.toml
+classify issues the same way at fetch time (Python) and when stored issues are
+reclassified in DuckDB (SQL).
+"""
+
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import duckdb
+import pytest
+
+from src.analyzers.database_manager import DatabaseManager
+from src.analyzers.github_issues_tracker import GitHubIssuesTracker
+from src.analyzers.issue_classification import IssueClassificationRules
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def rules():
+    return IssueClassificationRules(PROJECT_ROOT / "conf")
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    config = SimpleNamespace(
+        project_root=PROJECT_ROOT,
+        database_path=tmp_path / "extensions.duckdb",
+        ensure_directories=lambda: None,
+    )
+    return DatabaseManager(config)
+
+
+SAMPLE_ISSUES = [
+    # (title, body, labels)
+    ("Cannot load spatial on macOS arm64", "INSTALL works but LOAD fails", []),
+    ("Extension missing for windows", "HTTP 404 when downloading", ["bug"]),
+    ("Typo in docs", "minor documentation improvement", ["enhancement"]),
+    ("Build broken with cmake", None, ["question", "high priority"]),
+    ("Question about usage", "How do I query this?", []),
+]
+
+
+class TestIssueClassificationRules:
+    """Test rule evaluation in Python."""
+
+    def test_first_matching_issue_type_wins(self, rules):
+        text = rules.issue_text("Failed to load on linux", "")
+        assert rules.classify_issue_type(text) == "installation"
+
+    def test_unmatched_issue_is_other(self, rules):
+        assert rules.classify_issue_type("how do i query this?") == "other"
+
+    def test_labels_take_precedence_over_content(self, rules):
+        text = rules.issue_text("Crash when querying", "")
+        assert rules.determine_severity(text, ["enhancement"]) == "low"
+        assert rules.determine_severity(text, []) == "high"
+
+    def test_keywords_are_case_insensitive(self, rules):
+        text = rules.issue_text("Got HTTP 403 from server", "")
+        assert rules.classify_issue_type(text) == "availability"
+
+    def test_extract_platforms(self, rules):
+        text = rules.issue_text("Apple Silicon", "fails on darwin")
+        assert rules.extract_platforms(text) == {"osx_amd64", "osx_arm64"}
+
+    def test_tracker_loads_rules_from_config_dir(self, tmp_path):
+        (tmp_path / "issue_classification.toml").write_text(
+            '[issue_types]\ninstallation = ["LOAD"]\n'
+        )
+        client = SimpleNamespace(config=SimpleNamespace(config_dir=tmp_path))
+
+        tracker = GitHubIssuesTracker(client)
+
+        assert tracker.classification_rules.rules_file.parent == tmp_path
+        assert tracker.classification_rules.issue_type_keywords == {
+            "installation": ["load"]
+        }
+
+    def test_missing_rules_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            IssueClassificationRules(tmp_path)
+
+    def test_invalid_rules_file_raises(self, tmp_path):
+        (tmp_path / "issue_classification.toml").write_text("[issue_types\n")
+        with pytest.raises(ValueError, match="Invalid issue classification rules"):
+            IssueClassificationRules(tmp_path)
+
+
+class TestSQLReclassification:
+    """Test that the SQL pass reproduces the Python classification."""
+
+    def test_reclassify_matches_python(self, rules, db_manager):
+        db_manager.create_schema()
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            db_manager._insert_rows(
+                conn,
+                "insert_github_issue.sql",
+                "github_issue_rows",
+                db_manager.GITHUB_ISSUE_COLUMNS,
+                [
+                    (
+                        number,
+                        title,
+                        body,
+                        "open",
+                        datetime(2025, 1, 1),
+                        datetime(2025, 1, 2),
+                        None,
+                        labels,
+                        ["spatial"],
+                        [],
+                        "stale",
+                        "stale",
+                        f"https://github.com/duckdb/duckdb/issues/{number}",
+                        datetime(2025, 1, 3),
+                    )
+                    for number, (title, body, labels) in enumerate(
+                        SAMPLE_ISSUES, start=1
+                    )
+                ],
+            )
+        finally:
+            conn.close()
+
+        assert db_manager.reclassify_github_issues(rules) == len(SAMPLE_ISSUES)
+
+        conn = duckdb.connect(str(db_manager.database_path))
+        try:
+            stored = conn.execute(
+                "SELECT issue_number, issue_type, severity, platforms "
+                "FROM github_issues_history ORDER BY issue_number"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        for (number, issue_type, severity, platforms), (title, body, labels) in zip(
+            stored, SAMPLE_ISSUES
+        ):
+            text = rules.issue_text(title, body)
+            assert issue_type == rules.classify_issue_type(text), number
+            assert severity == rules.determine_severity(text, labels), number
+            assert set(platforms) == rules.extract_platforms(text), number
+
+    def test_reclassify_refuses_empty_rules(self, db_manager, tmp_path):
+        (tmp_path / "issue_classification.toml").write_text("# no rules yet\n")
+        db_manager.create_schema()
+
+        with pytest.raises(ValueError, match="Refusing to reclassify"):
+            db_manager.reclassify_github_issues(IssueClassificationRules(tmp_path))
@@ -0,0 +1,143 @@
+"""
+Tests for the analysis orchestrator's compatibility and report stages.
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from conf.config import Config
+from src.analyzers.base import ExtensionInfo
+from src.analyzers.compatibility_scheduler import (
+    CompatibilityCandidate,
+    ScheduledTest,
+)
+from src.analyzers.installation_tester import (
+    InstallationTester,
+    InstallationTestResult,
+)
+from src.analyzers.orchestrator import AnalysisOrchestrator
+
+from .test_database_manager import make_analysis_result
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Project configuration with every directory under tmp_path."""
+    config = Config()
+    config.cache_dir = tmp_path / "cache"
+    config.reports_dir = tmp_path / "reports"
+    config.data_dir = tmp_path / "data"
+    config.database_path = config.data_dir / "extensions.duckdb"
+    for directory in (config.cache_dir, config.reports_dir, config.data_dir):
+        directory.mkdir()
+    return config
+
+
+@pytest.fixture
+def orchestrator(config):
+    return AnalysisOrchestrator(config)
+
+
+class TestCompatibilityBudget:
+    """Test that the compatibility runtime budget covers the whole run."""
+
+    @pytest.mark.asyncio
+    async def test_scheduling_counts_against_budget(self, orchestrator):
+        scheduled = [
+            ScheduledTest(CompatibilityCandidate("1.3.2", name), ["untested"])
+            for name in ("json", "parquet", "icu")
+        ]
+        budgets = []
+
+        async def slow_schedule(*_args):
+            await asyncio.sleep(0.3)  # building environments, HEAD requests
+            return scheduled, []
+
+        async def run_matrix(pairs, *, max_runtime_seconds, **_kwargs):
+            budgets.append(max_runtime_seconds)
+            # The budget ran out after the first pair
+            passed = InstallationTestResult(
+                extension_name=pairs[0][1],
+                success=True,
+                install_time=0.1,
+                load_time=0.05,
+                functional_test_time=None,
+                total_time=0.2,
+                error_message=None,
+                python_version="3.12",
+                duckdb_version_used="1.3.2",
+                test_environment="uv",
+            )
+            return [passed, None, None]
+
+        with (
+            patch.object(
+                orchestrator, "_schedule_compatibility_tests", side_effect=slow_schedule
+            ),
+            patch.object(
+                InstallationTester, "test_compatibility_matrix", side_effect=run_matrix
+            ),
+            patch.object(InstallationTester, "close", AsyncMock()),
+            patch.object(orchestrator.database_manager, "save_compatibility_results"),
+        ):
+            summary = await orchestrator.run_version_compatibility_tests(
+                [
+                    ExtensionInfo(name=test.candidate.extension_name, type="core")
+                    for test in scheduled
+                ],
+                [],
+                max_runtime_seconds=1,
+                min_duckdb_version="1.3.0",
+                max_extensions=10,
+                duckdb_versions=["1.3.2"],
+            )
+
+        assert len(budgets) == 1 and budgets[0] <= 0.75
+        assert summary["attempted_pairs_count"] == 3
+        assert summary["completed_pairs_count"] == 1
+        assert summary["summary"]["skipped_pairs_time_limit"] == 2
+
+
+class TestReportStage:
+    """Test report generation from a saved analysis."""
+
+    @pytest.mark.asyncio
+    async def test_generate_reports_times_each_format(self, orchestrator, config):
+        # Community extensions only, so no core docs URLs are discovered
+        result = make_analysis_result()
+        result.core_extensions = []
+        await orchestrator.database_manager.save_analysis(result)
+
+        reports = await orchestrator.generate_reports(
+            result, ["markdown", "csv", "excel", "pdf"]
+        )
+
+        assert set(reports) == {"markdown", "csv", "excel"}
+        assert all(Path(path).exists() for path in reports.values())
+        assert (config.reports_dir / "latest.md").exists()
+        assert result.trend_data["summary"]["total_extensions"] == 2
+        assert set(result.report_timings) == {"markdown", "csv", "excel"}
+        assert all(seconds >= 0 for seconds in result.report_timings.values())
+
+    @pytest.mark.asyncio
+    async def test_dataset_failure_keeps_other_formats(self, orchestrator):
+        result = make_analysis_result()
+        result.url_validation_results = {
+            "h3_docs": {"url": "https://duckdb.org/h3", "status": "OK"}
+        }
+
+        with patch.object(
+            orchestrator.report_generator,
+            "build_dataset",
+            side_effect=RuntimeError("docs index unavailable"),
+        ):
+            reports = await orchestrator.generate_reports(
+                result, ["markdown", "csv", "url_validation_csv"]
+            )
+
+        assert set(reports) == {"url_validation_csv"}
+        assert Path(reports["url_validation_csv"]).exists()
+        assert set(result.report_timings) == {"url_validation_csv"}
@@ -0,0 +1,146 @@
+"""
+Tests for the extension rows shared by every report format.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.analyzers.base import AnalysisResult, ExtensionInfo
+from src.analyzers.extension_metadata import ExtensionMetadata
+from src.analyzers.report_dataset import TABLE_COLUMNS, ReportDataset
+from src.analyzers.report_generator import ReportGenerator
+
+from .test_database_manager import ANALYSIS_TIME, make_analysis_result
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONFIG_DIR = PROJECT_ROOT / "conf"
+
+
+def build(result=None, **kwargs):
+    return ReportDataset.build(
+        result or make_analysis_result(),
+        metadata=ExtensionMetadata(CONFIG_DIR),
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def report_generator(tmp_path):
+    config = SimpleNamespace(
+        project_root=PROJECT_ROOT,
+        config_dir=CONFIG_DIR,
+        reports_dir=tmp_path,
+        ensure_directories=lambda: None,
+    )
+    return ReportGenerator(config)
+
+
+class TestReportDataset:
+    """Test the derived report fields."""
+
+    def test_derives_core_fields(self):
+        core = build(core_docs_urls={"json": "https://duckdb.org/json"}).extensions(
+            "core"
+        )
+        json, parquet = core.itertuples()
+
+        # Both ages count back from the analysis timestamp, 2025-06-01 12:00:
+        # json's last commit was 2025-05-20 10:00, DuckDB's release 2025-05-21
+        assert (json.last_push_days, json.last_push_estimated) == (12, False)
+        assert (parquet.last_push_days, parquet.last_push_estimated) == (11, True)
+        assert (json.repository, json.repo_url) == (
+            "duckdb/duckdb",
+            "https://github.com/duckdb/duckdb",
+        )
+        assert json.docs_url == "https://duckdb.org/json"
+        assert pd.isna(parquet.docs_url)
+        assert (json.status, json.stage, json.language) == ("ongoing", "Stable", "C++")
+        assert json.description == "JSON data format support and functions"
+        assert parquet.description == "Apache Parquet columnar format support"
+        assert pd.isna(parquet.stars)
+
+    def test_core_description_fallbacks(self):
+        result = make_analysis_result()
+        result.core_extensions = [
+            ExtensionInfo(name="fts", type="core"),
+            ExtensionInfo(name="tpch", type="core", description="TPC-H data"),
+            ExtensionInfo(name="newext", type="core"),
+        ]
+
+        descriptions = build(result).extensions("core")["description"].tolist()
+
+        assert descriptions == [
+            "Full-text search functionality",  # from extensions_metadata.toml
+            "TPC-H data",
+            "Core DuckDB extension: newext",
+        ]
+
+    def test_derives_community_fields(self):
+        h3, broken = build().extensions("community").itertuples()
+
+        assert (h3.status, h3.last_push_days, h3.stars) == ("ongoing", 2, 200)
+        assert h3.docs_url.endswith("/h3.html")
+        assert h3.topics == ["geo"]
+        assert (broken.raw_status, broken.status) == ("❌ Error", "unknown")
+        assert pd.isna(broken.description) and pd.isna(broken.stars)
+        assert broken.language == "N/A"
+        assert pd.isna(broken.repository) and pd.isna(broken.last_push_days)
+
+    def test_table_has_report_columns(self):
+        table = build().table()
+
+        assert list(table.columns) == list(TABLE_COLUMNS.values())
+        assert table["Type"].tolist() == ["Core", "Core", "Community", "Community"]
+        assert table.loc[1, "Stars"] == "N/A"
+        assert table.loc[3, "Repository"] == "N/A"
+        assert table.loc[3, "Stars"] == 0
+        assert table.loc[3, "Description"] == "No description"
+
+    def test_template_records_are_plain_values(self):
+        records = build().template_records("community")
+
+        assert [record["name"] for record in records] == ["h3", "broken"]
+        assert records[0]["stars"] == 200 and type(records[0]["stars"]) is int
+        assert records[1]["last_push_days"] is None
+        assert records[1]["repository"] is None
+        assert records[1]["stars"] == 0
+        assert records[1]["description"] == "No description available"
+
+    def test_empty_result(self):
+        dataset = build(
+            AnalysisResult(
+                core_extensions=[],
+                community_extensions=[],
+                duckdb_version="v1.3.0",
+                duckdb_release_date=None,
+                analysis_timestamp=ANALYSIS_TIME,
+            )
+        )
+
+        assert dataset.table().empty
+        assert dataset.template_records("core") == []
+
+
+class TestReportWriters:
+    """Test the report formats reading one shared dataset."""
+
+    @pytest.mark.asyncio
+    async def test_formats_share_dataset(self, report_generator):
+        result = make_analysis_result()
+        dataset = build(result)
+
+        csv = pd.read_csv(await report_generator.generate_csv(result, dataset))
+        excel = pd.read_excel(await report_generator.generate_excel(result, dataset))
+        markdown = await report_generator.generate_markdown(result, dataset)
+
+        assert csv["Extension"].tolist() == ["json", "parquet", "h3", "broken"]
+        assert excel["Last Push Days"].tolist()[:3] == [12, 11, 2]
+        assert "| 2 | **h3** | [isaacbrodsky/h3-duckdb]" in markdown
+        assert "✅ Active | 2 days ago | 200" in markdown
+        assert "| ✅ Active | 12 days ago | — | C++ | JSON data format" in markdown
+        assert "| ✅ Active | ~11 days ago |" in markdown
+        assert "| ❌ Issues | Unknown | N/A | N/A | No description |" in markdown
+        assert "- **Active Extensions**: 1 (50.0%)" in markdown